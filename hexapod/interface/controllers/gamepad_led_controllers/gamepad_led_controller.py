@@ -8,13 +8,14 @@ using inheritance to support different controller types.
 from __future__ import annotations
 from typing import TYPE_CHECKING
 import logging
-import time
-import threading
-import math
 from enum import Enum
 from abc import ABC, abstractmethod
 
-from hexapod.utils import rename_thread
+from hexapod.interface.controllers.gamepad_led_controllers.gamepad_led_writer import (
+    ColorCurve,
+    GamepadLEDWriter,
+    sine_blend_colors,
+)
 
 if TYPE_CHECKING:
     from typing import Optional, Tuple, Dict, Any
@@ -56,8 +57,11 @@ class BaseGamepadLEDController(ABC):
         self.is_connected: bool = False
         self.current_color: GamepadLEDColor = GamepadLEDColor.BLUE
         self.brightness: float = 1.0  # 0.0 to 1.0
-        self.animation_thread: Optional[threading.Thread] = None
-        self.animation_running: bool = False
+        # Single writer of all colors; the lambda lets subclasses and tests
+        # replace _set_color_internal
+        self.led_writer: GamepadLEDWriter = GamepadLEDWriter(
+            lambda r, g, b: self._set_color_internal(r, g, b)
+        )
 
     @abstractmethod
     def _connect_controller(self) -> bool:
@@ -101,7 +105,7 @@ class BaseGamepadLEDController(ABC):
             g = max(0, min(255, int(g * self.brightness)))
             b = max(0, min(255, int(b * self.brightness)))
 
-            success = self._set_color_internal(r, g, b)
+            success = self.led_writer.write((r, g, b))
 
             return success
 
@@ -135,7 +139,7 @@ class BaseGamepadLEDController(ABC):
             g = max(0, min(255, int(g * self.brightness)))
             b = max(0, min(255, int(b * self.brightness)))
 
-            success = self._set_color_internal(r, g, b)
+            success = self.led_writer.write((r, g, b))
 
             return success
 
@@ -180,42 +184,10 @@ class BaseGamepadLEDController(ABC):
         Returns:
             True if animation started successfully, False otherwise
         """
-        if not self.is_connected:
-            return False
-
-        if self.animation_running:
-            self.stop_animation()
-
-        self.animation_running = True
-        self.animation_thread = threading.Thread(
-            target=self._pulse_animation, args=(color, duration, cycles), daemon=True
+        # Sine wave from off to the full color: fade in and out
+        return self._play_curve(
+            GamepadLEDColor.BLACK.rgb, color.rgb, 60, 1.0, duration, cycles, color
         )
-        self.animation_thread.start()
-        return True
-
-    def _pulse_animation(
-        self, color: GamepadLEDColor, duration: float, cycles: int
-    ) -> None:
-        """Internal method for pulse animation."""
-        rename_thread(threading.current_thread(), "GamepadLEDPulseAnimation")
-        cycle_count = 0
-
-        while self.animation_running and (cycles == 0 or cycle_count < cycles):
-            # Use sine wave for smooth pulse effect
-            # One complete sine wave cycle for fade in and out
-            steps = 60  # Much more steps for smoother animation
-
-            for i in range(steps):
-                if not self.animation_running:
-                    break
-                # Use sine wave: 0 to π for fade in, π to 2π for fade out
-                angle = (i / steps) * 2 * math.pi
-                # Convert sine wave to brightness (0 to 1)
-                brightness = (1 + math.sin(angle)) / 2
-                self.set_color(color, brightness)
-                time.sleep(duration / steps)
-
-            cycle_count += 1
 
     def pulse_two_colors(
         self,
@@ -236,61 +208,10 @@ class BaseGamepadLEDController(ABC):
         Returns:
             True if animation started successfully, False otherwise
         """
-        if not self.is_connected:
-            return False
-
-        if self.animation_running:
-            self.stop_animation()
-
-        self.animation_running = True
-        self.animation_thread = threading.Thread(
-            target=self._pulse_two_colors_animation,
-            args=(color1, color2, duration, cycles),
-            daemon=True,
+        # Sine wave for smooth transition: color1 -> color2 -> color1
+        return self._play_curve(
+            color1.rgb, color2.rgb, 60, self.brightness, duration, cycles
         )
-        self.animation_thread.start()
-        return True
-
-    def _pulse_two_colors_animation(
-        self,
-        color1: GamepadLEDColor,
-        color2: GamepadLEDColor,
-        duration: float,
-        cycles: int,
-    ) -> None:
-        """Internal method for two-color pulse animation."""
-        rename_thread(threading.current_thread(), "GamepadLEDTwoColorPulseAnimation")
-        cycle_count = 0
-
-        # Get RGB values for both colors
-        rgb1 = color1.rgb
-        rgb2 = color2.rgb
-
-        while self.animation_running and (cycles == 0 or cycle_count < cycles):
-            # Use sine wave for smooth transition between colors
-            # One complete sine wave cycle for color1 -> color2 -> color1
-            steps = 60  # Much more steps for smoother animation
-
-            for i in range(steps):
-                if not self.animation_running:
-                    break
-                # Use sine wave: 0 to 2π for complete color transition cycle
-                angle = (i / steps) * 2 * math.pi
-                # Convert sine wave to interpolation factor (0 to 1)
-                # This creates a smooth transition: color1 -> color2 -> color1
-                factor = (1 + math.sin(angle)) / 2
-
-                # Interpolate between the two colors
-                interp_rgb = (
-                    int(rgb1[0] + (rgb2[0] - rgb1[0]) * factor),
-                    int(rgb1[1] + (rgb2[1] - rgb1[1]) * factor),
-                    int(rgb1[2] + (rgb2[2] - rgb1[2]) * factor),
-                )
-
-                self.set_color_rgb(interp_rgb)
-                time.sleep(duration / steps)
-
-            cycle_count += 1
 
     def breathing_animation(
         self, color: GamepadLEDColor, duration: float = 2.0, cycles: int = 1
@@ -303,52 +224,56 @@ class BaseGamepadLEDController(ABC):
             duration: Duration of each breath cycle in seconds
             cycles: Number of breath cycles (0 for infinite)
 
+        Returns:
+            True if animation started successfully, False otherwise
+        """
+        # More steps for even smoother breathing
+        return self._play_curve(
+            GamepadLEDColor.BLACK.rgb, color.rgb, 80, 1.0, duration, cycles, color
+        )
+
+    def _play_curve(
+        self,
+        rgb1: Tuple[int, int, int],
+        rgb2: Tuple[int, int, int],
+        steps: int,
+        brightness: float,
+        duration: float,
+        cycles: int,
+        color: Optional[GamepadLEDColor] = None,
+    ) -> bool:
+        """
+        Play a sine blend between two colors on the LED writer.
+
+        Args:
+            rgb1: Color at the bottom of the wave
+            rgb2: Color at the top of the wave
+            steps: Number of colors per cycle
+            brightness: Brightness applied to the blended colors
+            duration: Duration of each cycle in seconds
+            cycles: Number of cycles (0 for infinite)
+            color: Color the animation shows, stored as the current color
+
         Returns:
             True if animation started successfully, False otherwise
         """
         if not self.is_connected:
             return False
 
-        if self.animation_running:
-            self.stop_animation()
-
-        self.animation_running = True
-        self.animation_thread = threading.Thread(
-            target=self._breathing_animation,
-            args=(color, duration, cycles),
-            daemon=True,
-        )
-        self.animation_thread.start()
+        if color is not None:
+            self.current_color = color
+        colors = sine_blend_colors(rgb1, rgb2, steps, brightness)
+        self.led_writer.play(ColorCurve(colors, duration, cycles))
         return True
 
-    def _breathing_animation(
-        self, color: GamepadLEDColor, duration: float, cycles: int
-    ) -> None:
-        """Internal method for breathing animation."""
-        cycle_count = 0
-
-        while self.animation_running and (cycles == 0 or cycle_count < cycles):
-            # Use sine wave for smooth breathing effect
-            # One complete sine wave cycle for breathe in and out
-            steps = 80  # More steps for even smoother breathing
-
-            for i in range(steps):
-                if not self.animation_running:
-                    break
-                # Use sine wave: 0 to 2π for complete breath cycle
-                angle = (i / steps) * 2 * math.pi
-                # Convert sine wave to brightness (0 to 1)
-                brightness = (1 + math.sin(angle)) / 2
-                self.set_color(color, brightness)
-                time.sleep(duration / steps)
-
-            cycle_count += 1
+    @property
+    def animation_running(self) -> bool:
+        """Return True while an animation is playing."""
+        return self.led_writer.is_playing
 
     def stop_animation(self) -> None:
-        """Stop any running animation."""
-        self.animation_running = False
-        if self.animation_thread and self.animation_thread.is_alive():
-            self.animation_thread.join(timeout=1.0)
+        """Stop any running animation, keeping its current color."""
+        self.led_writer.stop_curve()
 
     def get_available_colors(self) -> Dict[str, Tuple[int, int, int]]:
         """
@@ -389,3 +314,4 @@ class BaseGamepadLEDController(ABC):
                 logger.exception(f"Error during LED controller cleanup: {e}")
             finally:
                 self.is_connected = False
+        self.led_writer.stop()
@@ -0,0 +1,304 @@
+"""
+Rate-limited writer for gamepad LED colors.
+
+Every lightbar color sent to a DualSense becomes a full HID output report, which
+shares the Bluetooth link with the input reports of the sticks and buttons. The
+``GamepadLEDWriter`` is the only place colors are sent from. It never sends more than
+``max_rate`` reports per second, drops colors equal to the one already shown, and
+coalesces colors set faster than that into the most recent one.
+
+Animations are ``ColorCurve`` tables of colors computed once per parameter set. The
+writer plays a curve from its own thread, picking the frame due at each report and
+quantizing it, so frames finer than the report rate or than a visible color change
+cost no reports.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from functools import lru_cache
+import threading
+import time
+import math
+
+from hexapod.utils import rename_thread
+from hexapod.interface import get_custom_logger
+
+if TYPE_CHECKING:
+    from typing import Optional, Tuple, Callable
+
+    RGB = Tuple[int, int, int]
+
+logger = get_custom_logger("interface_logger")
+
+COLOR_CURVE_CACHE_SIZE: int = 32  # Curves kept computed
+
+
+@dataclass(frozen=True)
+class ColorCurve:
+    """
+    Precomputed color animation.
+
+    Attributes:
+        colors (Tuple[RGB, ...]): Colors of one cycle, shown for equal time slices.
+        duration (float): Seconds per cycle.
+        cycles (int): Number of cycles to play (0 for infinite).
+    """
+
+    colors: Tuple[RGB, ...]
+    duration: float
+    cycles: int = 0
+
+    @property
+    def frame_interval(self) -> float:
+        """Seconds each color of the curve is shown."""
+        return self.duration / len(self.colors)
+
+    def color_at(self, elapsed: float) -> Tuple[RGB, bool]:
+        """
+        Return the color of the curve after some time.
+
+        Args:
+            elapsed (float): Seconds since the curve started.
+
+        Returns:
+            Tuple[RGB, bool]: The color, and True once all cycles were played; a
+            finished curve stays on its last color.
+        """
+        index = int(elapsed / self.frame_interval)
+        if self.cycles and index >= self.cycles * len(self.colors):
+            return self.colors[-1], True
+        return self.colors[index % len(self.colors)], False
+
+
+@lru_cache(maxsize=COLOR_CURVE_CACHE_SIZE)
+def sine_blend_colors(
+    rgb1: RGB, rgb2: RGB, steps: int, brightness: float = 1.0
+) -> Tuple[RGB, ...]:
+    """
+    Return one sine wave cycle blending from the middle of two colors to each of them.
+
+    Step i uses the factor (1 + sin(2 * pi * i / steps)) / 2 between rgb1 and rgb2,
+    then applies the brightness.
+
+    Args:
+        rgb1 (RGB): Color at factor 0.
+        rgb2 (RGB): Color at factor 1.
+        steps (int): Number of colors in the cycle.
+        brightness (float): Brightness applied to the blended colors (0.0 to 1.0).
+
+    Returns:
+        Tuple[RGB, ...]: The colors of the cycle.
+    """
+    colors = []
+    for i in range(steps):
+        factor = (1 + math.sin((i / steps) * 2 * math.pi)) / 2
+        colors.append(
+            tuple(
+                max(0, min(255, int(int(a + (b - a) * factor) * brightness)))
+                for a, b in zip(rgb1, rgb2)
+            )
+        )
+    return tuple(colors)
+
+
+class GamepadLEDWriter(threading.Thread):
+    """
+    Single writer of gamepad LED colors with a maximum report rate.
+
+    Static colors are sent at once if the rate allows it, otherwise the writer thread
+    sends the latest of them as soon as it does. Curves are played by the writer
+    thread, started on first use.
+
+    Attributes:
+        min_interval (float): Minimum seconds between two reports.
+        quantum (int): Step curve colors are rounded to before they are compared.
+        stop_event (threading.Event): Event to signal the writer to stop.
+        reports_sent (int): Colors sent to the controller.
+        reports_skipped (int): Colors not sent because they were already shown.
+    """
+
+    DEFAULT_MAX_RATE: float = 30.0  # Reports per second while animating
+    DEFAULT_QUANTUM: int = 4  # Below the steps the eye tells apart on the lightbar
+
+    def __init__(
+        self,
+        write: Callable[[int, int, int], bool],
+        max_rate: float = DEFAULT_MAX_RATE,
+        quantum: int = DEFAULT_QUANTUM,
+    ) -> None:
+        """
+        Initialize the writer. Its thread is started when first needed.
+
+        Args:
+            write (Callable[[int, int, int], bool]): Sends one color to the
+                controller and returns True on success.
+            max_rate (float): Maximum reports per second.
+            quantum (int): Step curve colors are rounded to (1 to disable).
+
+        Raises:
+            ValueError: If max_rate or quantum is not positive.
+        """
+        super().__init__(daemon=True)
+        rename_thread(self, "GamepadLEDWriter")
+        if max_rate <= 0:
+            raise ValueError(f"LED report rate must be positive, got {max_rate}.")
+        if quantum < 1:
+            raise ValueError(f"LED color quantum must be positive, got {quantum}.")
+
+        self.min_interval: float = 1.0 / max_rate
+        self.quantum: int = quantum
+        self.stop_event: threading.Event = threading.Event()
+        self.reports_sent: int = 0
+        self.reports_skipped: int = 0
+        self._write = write
+        self._lock = threading.RLock()
+        self._wake = threading.Event()
+        self._curve: Optional[ColorCurve] = None
+        self._curve_start: float = 0.0
+        self._pending: Optional[RGB] = None
+        self._shown: Optional[RGB] = None
+        self._last_report: Optional[float] = None
+
+    @property
+    def is_playing(self) -> bool:
+        """Return True while a curve is being played."""
+        return self._curve is not None
+
+    def write(self, rgb: RGB, now: Optional[float] = None) -> bool:
+        """
+        Show a static color, stopping any curve.
+
+        Args:
+            rgb (RGB): The color.
+            now (Optional[float]): time.monotonic() of the call; the current time if
+                None.
+
+        Returns:
+            bool: False if sending the color failed; True if it was sent, was
+            already shown or will be sent once the report rate allows.
+        """
+        with self._lock:
+            self._curve = None
+            return self._submit(rgb, time.monotonic() if now is None else now)
+
+    def play(self, curve: ColorCurve, now: Optional[float] = None) -> None:
+        """
+        Play a curve from its first color, replacing any running one.
+
+        Args:
+            curve (ColorCurve): The curve to play.
+            now (Optional[float]): time.monotonic() the curve starts at; the current
+                time if None.
+        """
+        with self._lock:
+            self._curve = curve
+            self._curve_start = time.monotonic() if now is None else now
+            self._pending = None
+            self._wake_thread()
+
+    def stop_curve(self) -> None:
+        """Stop the running curve, keeping its current color shown."""
+        with self._lock:
+            self._curve = None
+
+    def invalidate(self) -> None:
+        """Send the next color even if it is already shown, e.g. after reconnecting."""
+        with self._lock:
+            self._shown = None
+
+    def render(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        Send the color currently due, if the report rate allows it.
+
+        Args:
+            now (Optional[float]): time.monotonic() of the tick; the current time if
+                None.
+
+        Returns:
+            Optional[float]: Seconds until the next color may be due, or None if
+            nothing is left to send.
+        """
+        with self._lock:
+            if now is None:
+                now = time.monotonic()
+            if self._curve is not None:
+                curve = self._curve
+                rgb, finished = curve.color_at(now - self._curve_start)
+                if finished:
+                    self._curve = None
+                self._submit(self._quantize(rgb), now)
+                if self._curve is not None:
+                    return max(self.min_interval, curve.frame_interval)
+            elif self._pending is not None:
+                self._submit(self._pending, now)
+
+            if self._pending is not None:
+                return self._wait_time(now)
+            return None
+
+    def _submit(self, rgb: RGB, now: float) -> bool:
+        """
+        Send a color unless it is shown already, or defer it past the rate limit.
+
+        Args:
+            rgb (RGB): The color.
+            now (float): time.monotonic() of the call.
+
+        Returns:
+            bool: False if sending the color failed, True otherwise.
+        """
+        if rgb == self._shown:
+            self._pending = None
+            self.reports_skipped += 1
+            return True
+        if self._wait_time(now) > 0:
+            # Sent by the writer thread, unless a newer color replaces it first
+            self._pending = rgb
+            self._wake_thread()
+            return True
+
+        self._pending = None
+        self._last_report = now
+        self.reports_sent += 1
+        success = self._write(*rgb)
+        self._shown = rgb if success else None
+        return success
+
+    def _wait_time(self, now: float) -> float:
+        """Return the seconds until the report rate allows the next report."""
+        if self._last_report is None:
+            return 0.0
+        return self._last_report + self.min_interval - now
+
+    def _quantize(self, rgb: RGB) -> RGB:
+        """Round a color to the quantum, so invisible changes are not sent."""
+        q = self.quantum
+        return tuple(min(255, round(value / q) * q) for value in rgb)
+
+    def _wake_thread(self) -> None:
+        """Start the writer thread on first use and wake it up."""
+        if self.ident is None and not self.stop_event.is_set():
+            self.start()
+        self._wake.set()
+
+    def run(self) -> None:
+        """Send due colors until stopped, sleeping while there is nothing to send."""
+        while not self.stop_event.is_set():
+            self._wake.clear()
+            try:
+                delay = self.render()
+            except Exception as e:
+                logger.exception(f"Gamepad LED color could not be sent: {e}")
+                delay = self.min_interval
+            self._wake.wait(delay)
+
+    def stop(self) -> None:
+        """Stop the writer thread and wait for it to finish."""
+        with self._lock:
+            self._curve = None
+            self._pending = None
+        self.stop_event.set()
+        self._wake.set()
+        if self.is_alive():
+            self.join(timeout=1.0)
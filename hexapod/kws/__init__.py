@@ -1,5 +1,21 @@
+from .capture_ring import CaptureRing, RingCursor
+from .capture_hub import CaptureHub, SharedCaptureRing
+from .recording_writer import RecordingWriter
 from .recorder import Recorder
+from .vad_gate import VoiceActivityGate
+from .channel_selector import ChannelSelector
 from .intent_dispatcher import IntentDispatcher
 from .voice_control import VoiceControl
 
-__all__ = ["Recorder", "IntentDispatcher", "VoiceControl"]
+__all__ = [
+    "CaptureRing",
+    "RingCursor",
+    "CaptureHub",
+    "SharedCaptureRing",
+    "RecordingWriter",
+    "Recorder",
+    "VoiceActivityGate",
+    "ChannelSelector",
+    "IntentDispatcher",
+    "VoiceControl",
+]
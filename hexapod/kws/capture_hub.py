@@ -0,0 +1,454 @@
+"""
+Capture hub reading the microphone array once for every audio consumer.
+
+The hub runs in its own process and owns the ReSpeaker capture. Its PyAudio callback
+copies each buffer into a ``SharedCaptureRing`` in shared memory and wakes up the main
+process over a pipe, where Picovoice and the recorder read the ring through ordinary
+``RingCursor`` instances. A thread of the hub process also writes the frames to a named
+pipe that ODAS reads through its ``file`` raw interface, so localization runs next to
+keyword spotting and the device is never reopened when ODAS starts or stops.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from multiprocessing import shared_memory
+from pathlib import Path
+import multiprocessing
+import tempfile
+import threading
+import errno
+import os
+import re
+
+import numpy as np
+
+from hexapod.kws.capture_ring import CaptureRing
+from hexapod.interface import get_custom_logger
+
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any, List
+    from multiprocessing.connection import Connection
+    from hexapod.kws.capture_ring import RingCursor
+
+logger = get_custom_logger("kws_logger")
+
+DEFAULT_ODAS_FIFO_PATH = Path(tempfile.gettempdir()) / "hexapod_capture_hub.raw"
+DEFAULT_ODAS_CONFIG_TEMPLATE = (
+    Path(__file__).resolve().parent.parent / "odas" / "config" / "local_odas.cfg"
+)
+
+
+class SharedCaptureRing(CaptureRing):
+    """
+    Capture ring whose samples and counters live in shared memory.
+
+    The process that creates the ring owns the shared memory block and unlinks it; other
+    processes attach to it by name. Only the samples, the frame counter and the overflow
+    counter are shared. Conditions and cursors stay local to each process, so a process
+    reading the ring has to call ``notify`` when the writer reports new frames.
+    """
+
+    def __init__(
+        self,
+        channels: int,
+        frames_per_buffer: int = 512,
+        capacity_buffers: int = 64,
+        name: Optional[str] = None,
+    ) -> None:
+        """
+        Create a shared ring, or attach to an existing one.
+
+        Args:
+            channels (int): Number of interleaved input channels.
+            frames_per_buffer (int): Frames delivered per input callback.
+            capacity_buffers (int): Capacity of the ring in input buffers.
+            name (Optional[str]): Name of the shared memory block to attach to, None
+                to create a new block.
+
+        Raises:
+            ValueError: If a size is not positive.
+        """
+        if channels <= 0 or frames_per_buffer <= 0 or capacity_buffers <= 0:
+            raise ValueError(
+                "channels, frames_per_buffer and capacity_buffers must be positive"
+            )
+
+        self.channels = channels
+        self.frames_per_buffer = frames_per_buffer
+        self.capacity: int = frames_per_buffer * capacity_buffers
+        header_bytes = 2 * np.dtype(np.int64).itemsize
+        size = header_bytes + self.capacity * channels * np.dtype(np.int16).itemsize
+        self.owner: bool = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=size)
+        # Frames written and input overflows, updated by the writer process
+        self._header = np.ndarray((2,), dtype=np.int64, buffer=self.shm.buf)
+        self.buffer = np.ndarray(
+            (self.capacity, channels),
+            dtype=np.int16,
+            buffer=self.shm.buf,
+            offset=header_bytes,
+        )
+        if self.owner:
+            self._header[:] = 0
+        self.condition = threading.Condition()
+        self.closed: bool = False
+        self._cursors: List[RingCursor] = []
+
+    @property
+    def name(self) -> str:
+        """Return the name of the shared memory block."""
+        return self.shm.name
+
+    @property
+    def written(self) -> int:
+        """Return the number of frames written since the ring was created."""
+        return int(self._header[0])
+
+    @written.setter
+    def written(self, value: int) -> None:
+        self._header[0] = value
+
+    @property
+    def input_overflows(self) -> int:
+        """Return the number of input buffers captured with an overflow."""
+        return int(self._header[1])
+
+    @input_overflows.setter
+    def input_overflows(self, value: int) -> None:
+        self._header[1] = value
+
+    def notify(self) -> None:
+        """Wake up the consumers of this process after another process wrote frames."""
+        with self.condition:
+            self.condition.notify_all()
+
+    def release(self) -> None:
+        """Detach from the shared memory block and unlink it if this process owns it."""
+        # Views into the block must be dropped before it can be closed
+        self._header = np.zeros(2, dtype=np.int64)
+        self.buffer = np.zeros((0, self.channels), dtype=np.int16)
+        try:
+            self.shm.close()
+        except BufferError:
+            logger.warning(f"Shared ring {self.name} still referenced, not detached")
+        if self.owner:
+            self.shm.unlink()
+
+
+def write_odas_config(
+    fifo_path: Path,
+    output_path: Path,
+    template_path: Path = DEFAULT_ODAS_CONFIG_TEMPLATE,
+) -> Path:
+    """
+    Write an ODAS configuration reading the raw input from the hub's named pipe.
+
+    The raw input interface of the template, the ReSpeaker sound card, is replaced by a
+    ``file`` interface on the pipe; everything else, including the 32-bit sample format
+    the hub writes, is kept.
+
+    Args:
+        fifo_path (Path): Named pipe the hub writes to.
+        output_path (Path): Configuration file to write.
+        template_path (Path): ODAS configuration reading the sound card.
+
+    Returns:
+        Path: The written configuration file.
+
+    Raises:
+        ValueError: If the template has no raw input interface.
+    """
+    template = template_path.read_text()
+    interface = (
+        f'interface: {{\n        type = "file";\n        path = "{fifo_path}";\n    }}'
+    )
+    config, count = re.subn(
+        r"(raw:\s*\{.*?)interface:\s*\{.*?\}",
+        lambda match: match.group(1) + interface,
+        template,
+        count=1,
+        flags=re.DOTALL,
+    )
+    if count == 0:
+        raise ValueError(f"No raw input interface in {template_path}")
+    output_path.write_text(config)
+    return output_path
+
+
+def _feed_odas(ring: CaptureRing, fifo_path: Path, stop_event: threading.Event) -> None:
+    """
+    Write the captured frames to the ODAS named pipe while ODAS reads it.
+
+    Runs in the hub process. The pipe is reopened whenever ODAS exits, and audio
+    captured while ODAS is not running is skipped. The writer reads through its own
+    cursor, so a stalled ODAS loses frames instead of delaying the capture.
+
+    Args:
+        ring (CaptureRing): Ring filled by the capture callback.
+        fifo_path (Path): Named pipe ODAS reads its raw input from.
+        stop_event (threading.Event): Event stopping the writer.
+    """
+    cursor = ring.cursor("odas")
+    while not stop_event.is_set():
+        try:
+            fd = os.open(fifo_path, os.O_WRONLY | os.O_NONBLOCK)
+        except OSError as e:
+            if e.errno != errno.ENXIO:
+                logger.error(f"Cannot open ODAS pipe {fifo_path}: {e}")
+            # ENXIO: ODAS is not reading the pipe yet
+            stop_event.wait(0.2)
+            continue
+
+        logger.info(f"ODAS connected to capture hub pipe {fifo_path}")
+        os.set_blocking(fd, True)
+        cursor.skip_to_latest()
+        try:
+            while not stop_event.is_set():
+                frames = cursor.read(ring.frames_per_buffer, timeout=0.5)
+                if frames is None:
+                    continue
+                # ODAS reads 32-bit samples like the S32_LE sound card stream
+                os.write(fd, (frames.astype("<i4") << 16).tobytes())
+        except BrokenPipeError:
+            logger.info("ODAS disconnected from capture hub pipe")
+        finally:
+            os.close(fd)
+    cursor.close()
+
+
+def run_capture_process(
+    ring_name: str,
+    channels: int,
+    frames_per_buffer: int,
+    capacity_buffers: int,
+    sample_rate: int,
+    device_index: int,
+    odas_fifo_path: Optional[Path],
+    wakeup: Connection,
+    ready_event: Any,
+    stop_event: Any,
+) -> None:  # pragma: no cover
+    """
+    Capture the microphone array into the shared ring until stopped.
+
+    Entry point of the hub process.
+
+    Args:
+        ring_name (str): Name of the shared ring to attach to.
+        channels (int): Number of input channels.
+        frames_per_buffer (int): Frames per input buffer.
+        capacity_buffers (int): Capacity of the ring in input buffers.
+        sample_rate (int): Sample rate in Hz.
+        device_index (int): PyAudio input device index.
+        odas_fifo_path (Optional[Path]): Named pipe feeding ODAS, None for no ODAS feed.
+        wakeup (Connection): Pipe end notified after every captured buffer.
+        ready_event (multiprocessing.Event): Set once the capture runs.
+        stop_event (multiprocessing.Event): Set to stop the capture.
+    """
+    import pyaudio
+
+    ring = SharedCaptureRing(channels, frames_per_buffer, capacity_buffers, ring_name)
+    # Never block the audio callback on a main process that does not read
+    os.set_blocking(wakeup.fileno(), False)
+
+    def callback(
+        in_data: bytes, frame_count: int, time_info: Any, status_flags: int
+    ) -> tuple:
+        ring.write(in_data, status_flags)
+        try:
+            wakeup.send_bytes(b"")
+        except (BlockingIOError, BrokenPipeError):
+            pass
+        return None, pyaudio.paContinue
+
+    pa = pyaudio.PyAudio()
+    stream = pa.open(
+        rate=sample_rate,
+        format=pyaudio.paInt16,
+        channels=channels,
+        input=True,
+        input_device_index=device_index,
+        frames_per_buffer=frames_per_buffer,
+        stream_callback=callback,
+    )
+
+    feeder_stop = threading.Event()
+    feeder: Optional[threading.Thread] = None
+    if odas_fifo_path is not None:
+        feeder = threading.Thread(
+            target=_feed_odas,
+            args=(ring, odas_fifo_path, feeder_stop),
+            name="ODASFeeder",
+            daemon=True,
+        )
+        feeder.start()
+
+    ready_event.set()
+    try:
+        stop_event.wait()
+    finally:
+        stream.stop_stream()
+        stream.close()
+        pa.terminate()
+        feeder_stop.set()
+        ring.close()
+        if feeder is not None:
+            feeder.join(timeout=1.0)
+        ring.release()
+
+
+class CaptureHub:
+    """
+    Owns the microphone array in a separate process and shares its frames.
+
+    Consumers of the main process read ``ring`` through cursors exactly as they read
+    VoiceControl's own capture ring. ODAS reads the same frames from the named pipe
+    configured by ``odas_config_path``.
+    """
+
+    START_TIMEOUT = 5.0  # Max seconds to wait for the capture to start
+    STOP_TIMEOUT = 2.0  # Max seconds to wait for the capture process to exit
+
+    def __init__(
+        self,
+        device_index: int,
+        channels: int = 8,
+        sample_rate: int = 16000,
+        frames_per_buffer: int = 512,
+        capacity_buffers: int = 64,
+        odas_fifo_path: Optional[Path] = DEFAULT_ODAS_FIFO_PATH,
+    ) -> None:
+        """
+        Initialize the hub. Capture starts with ``start``.
+
+        Args:
+            device_index (int): PyAudio input device index of the microphone array.
+            channels (int): Number of input channels.
+            sample_rate (int): Sample rate in Hz.
+            frames_per_buffer (int): Frames per input buffer.
+            capacity_buffers (int): Capacity of the shared ring in input buffers.
+            odas_fifo_path (Optional[Path]): Named pipe feeding ODAS, None to capture
+                for the main process only.
+        """
+        self.device_index = device_index
+        self.channels = channels
+        self.sample_rate = sample_rate
+        self.frames_per_buffer = frames_per_buffer
+        self.capacity_buffers = capacity_buffers
+        self.odas_fifo_path = odas_fifo_path
+        self.odas_config_path: Optional[Path] = None
+        self.ring: Optional[SharedCaptureRing] = None
+        self.process: Optional[multiprocessing.process.BaseProcess] = None
+        self._context = multiprocessing.get_context("spawn")
+        self._stop_event: Optional[Any] = None
+        self._wakeup: Optional[Connection] = None
+        self._notifier: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Return whether the capture process is alive."""
+        return self.process is not None and self.process.is_alive()
+
+    def start(self) -> None:
+        """
+        Start the capture process and the thread waking up local consumers.
+
+        Raises:
+            RuntimeError: If the capture did not start in time.
+        """
+        self.ring = SharedCaptureRing(
+            self.channels, self.frames_per_buffer, self.capacity_buffers
+        )
+        if self.odas_fifo_path is not None:
+            if not self.odas_fifo_path.exists():
+                os.mkfifo(self.odas_fifo_path)
+            self.odas_config_path = write_odas_config(
+                self.odas_fifo_path, self.odas_fifo_path.with_suffix(".cfg")
+            )
+
+        self._wakeup, wakeup_sender = self._context.Pipe(duplex=False)
+        ready_event = self._context.Event()
+        self._stop_event = self._context.Event()
+        self.process = self._context.Process(
+            target=run_capture_process,
+            args=(
+                self.ring.name,
+                self.channels,
+                self.frames_per_buffer,
+                self.capacity_buffers,
+                self.sample_rate,
+                self.device_index,
+                self.odas_fifo_path,
+                wakeup_sender,
+                ready_event,
+                self._stop_event,
+            ),
+            name="CaptureHub",
+            daemon=True,
+        )
+        self.process.start()
+        wakeup_sender.close()
+
+        self._notifier = threading.Thread(
+            target=self._notify_consumers, name="CaptureHubNotifier", daemon=True
+        )
+        self._notifier.start()
+
+        if not ready_event.wait(self.START_TIMEOUT):
+            self.stop()
+            raise RuntimeError(
+                f"Capture hub did not start within {self.START_TIMEOUT} s"
+            )
+        logger.info(
+            f"Capture hub started on device {self.device_index}, shared ring "
+            f"{self.ring.name}"
+        )
+
+    def _notify_consumers(self) -> None:
+        """Wake up the consumers of the main process whenever frames are captured."""
+        wakeup, ring = self._wakeup, self.ring
+        try:
+            while True:
+                wakeup.recv_bytes()
+                # Coalesce the wakeups queued while the consumers were busy
+                while wakeup.poll():
+                    wakeup.recv_bytes()
+                ring.notify()
+        except (EOFError, OSError):
+            # The capture process exited
+            ring.close()
+
+    def stop(self) -> None:
+        """Stop the capture process and release the shared ring."""
+        if self._stop_event is not None:
+            self._stop_event.set()
+        if self.process is not None:
+            self.process.join(self.STOP_TIMEOUT)
+            if self.process.is_alive():
+                logger.warning("Capture hub did not stop, terminating it")
+                self.process.terminate()
+                self.process.join()
+            self.process = None
+        if self._notifier is not None:
+            self._notifier.join(self.STOP_TIMEOUT)
+            self._notifier = None
+        if self._wakeup is not None:
+            self._wakeup.close()
+            self._wakeup = None
+        if self.ring is not None:
+            self.ring.close()
+            self.ring.release()
+            self.ring = None
+        logger.info("Capture hub stopped")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return whether the hub runs and the shared ring counters.
+
+        Returns:
+            Dict[str, Any]: Running state and the ring statistics of this process.
+        """
+        return {
+            "running": self.running,
+            "ring": self.ring.stats() if self.ring is not None else None,
+        }
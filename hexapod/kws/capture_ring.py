@@ -0,0 +1,254 @@
+"""
+Multichannel capture ring shared by the consumers of the microphone array.
+
+The PyAudio input callback copies each buffer once into a preallocated
+(frames, channels) int16 ring. Consumers such as Picovoice and the recorder read from
+the ring through their own cursors and get NumPy views into it, so a single channel is
+a strided view and nothing is allocated or copied per frame on the always-on path.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import threading
+
+import numpy as np
+
+from hexapod.interface import get_custom_logger
+
+if TYPE_CHECKING:
+    from typing import Optional, List, Union, Dict, Any
+
+logger = get_custom_logger("kws_logger")
+
+
+class RingCursor:
+    """
+    Read position of one consumer of a capture ring.
+
+    Positions count frames since the ring was created. A cursor that falls more than
+    the ring capacity behind the writer has lost audio; it skips ahead to the oldest
+    frame still in the ring and counts an overrun.
+    """
+
+    def __init__(self, ring: CaptureRing, name: str, position: int) -> None:
+        """
+        Initialize the cursor. Use ``CaptureRing.cursor`` to create cursors.
+
+        Args:
+            ring (CaptureRing): Ring to read from.
+            name (str): Consumer name used in logs.
+            position (int): First frame to read.
+        """
+        self.ring = ring
+        self.name = name
+        self.position: int = position
+        self.overruns: int = 0
+        self.dropped_frames: int = 0
+
+    @property
+    def available(self) -> int:
+        """Return the number of frames written but not read yet."""
+        return self.ring.written - self.position
+
+    def read(
+        self, frames: int, timeout: Optional[float] = None
+    ) -> Optional[np.ndarray]:
+        """
+        Return the next frames, waiting until they are captured.
+
+        The returned array is a view into the ring when the frames do not wrap around
+        its end, which is always the case for reads of the ring's buffer size. It stays
+        valid until the writer laps it, i.e. for the capacity of the ring minus the
+        frames read; consumers keeping audio longer must copy it.
+
+        Args:
+            frames (int): Number of frames to read, at most the ring capacity.
+            timeout (Optional[float]): Maximum time to wait in seconds, None waits
+                indefinitely.
+
+        Returns:
+            Optional[np.ndarray]: Audio of shape (frames, channels), or None if the
+            frames were not captured within the timeout or the ring was closed.
+        """
+        ring = self.ring
+        with ring.condition:
+            if not ring.condition.wait_for(
+                lambda: ring.written - self.position >= frames or ring.closed,
+                timeout,
+            ):
+                return None
+            if ring.written - self.position < frames:
+                return None
+            oldest = ring.written - ring.capacity
+            if self.position < oldest:
+                lost = oldest - self.position
+                self.overruns += 1
+                self.dropped_frames += lost
+                self.position = oldest
+                logger.warning(
+                    f"Capture ring consumer {self.name} fell behind, {lost} frames lost"
+                )
+            start = self.position
+            self.position += frames
+
+        return ring.view(start, frames)
+
+    def skip_to_latest(self) -> None:
+        """Move the cursor to the newest captured frame, discarding unread audio."""
+        self.position = self.ring.written
+
+    def close(self) -> None:
+        """Stop tracking this cursor in the ring statistics."""
+        self.ring.remove_cursor(self)
+
+
+class CaptureRing:
+    """
+    Preallocated multichannel ring buffer filled by an audio input callback.
+
+    There is one writer, the audio callback, and any number of cursors. The writer
+    never waits for the consumers; slow consumers detect that audio they did not read
+    yet was overwritten when they read again.
+    """
+
+    def __init__(
+        self,
+        channels: int,
+        frames_per_buffer: int = 512,
+        capacity_buffers: int = 64,
+        dtype: Union[str, np.dtype] = np.int16,
+    ) -> None:
+        """
+        Initialize the ring.
+
+        Args:
+            channels (int): Number of interleaved input channels.
+            frames_per_buffer (int): Frames delivered per input callback.
+            capacity_buffers (int): Capacity of the ring in input buffers.
+            dtype (Union[str, np.dtype]): Sample type of the input.
+
+        Raises:
+            ValueError: If a size is not positive.
+        """
+        if channels <= 0 or frames_per_buffer <= 0 or capacity_buffers <= 0:
+            raise ValueError(
+                "channels, frames_per_buffer and capacity_buffers must be positive"
+            )
+
+        self.channels = channels
+        self.frames_per_buffer = frames_per_buffer
+        self.capacity: int = frames_per_buffer * capacity_buffers
+        self.buffer = np.zeros((self.capacity, channels), dtype=dtype)
+        self.condition = threading.Condition()
+        self.written: int = 0
+        self.closed: bool = False
+        self.input_overflows: int = 0
+        self._cursors: List[RingCursor] = []
+
+    def write(self, data: Any, status: int = 0) -> None:
+        """
+        Copy one input buffer into the ring and wake up the consumers.
+
+        Args:
+            data (Any): Interleaved samples as bytes or any buffer object.
+            status (int): Input status flags of the callback; non-zero flags are
+                counted as input overflows.
+        """
+        samples = np.frombuffer(data, dtype=self.buffer.dtype)
+        frames = len(samples) // self.channels
+        samples = samples[: frames * self.channels].reshape(frames, self.channels)
+        if frames > self.capacity:
+            samples = samples[-self.capacity :]
+            frames = self.capacity
+
+        with self.condition:
+            start = self.written % self.capacity
+            first = min(frames, self.capacity - start)
+            self.buffer[start : start + first] = samples[:first]
+            self.buffer[: frames - first] = samples[first:]
+            self.written += frames
+            if status:
+                self.input_overflows += 1
+            self.condition.notify_all()
+
+    def view(self, start: int, frames: int) -> np.ndarray:
+        """
+        Return captured frames by absolute position.
+
+        Args:
+            start (int): Position of the first frame.
+            frames (int): Number of frames.
+
+        Returns:
+            np.ndarray: A view into the ring, or a copy if the frames wrap around.
+        """
+        offset = start % self.capacity
+        if offset + frames <= self.capacity:
+            return self.buffer[offset : offset + frames]
+        return np.concatenate(
+            (self.buffer[offset:], self.buffer[: offset + frames - self.capacity])
+        )
+
+    def cursor(self, name: str, position: Optional[int] = None) -> RingCursor:
+        """
+        Create a cursor for a new consumer.
+
+        Args:
+            name (str): Consumer name used in logs and statistics.
+            position (Optional[int]): First frame to read, e.g. to include audio
+                captured just before. Defaults to the next frame to be captured.
+
+        Returns:
+            RingCursor: Cursor reading from the ring.
+        """
+        with self.condition:
+            if position is None:
+                position = self.written
+            position = min(max(position, self.written - self.capacity, 0), self.written)
+            cursor = RingCursor(self, name, position)
+            self._cursors.append(cursor)
+        return cursor
+
+    def remove_cursor(self, cursor: RingCursor) -> None:
+        """
+        Stop tracking a cursor.
+
+        Args:
+            cursor (RingCursor): Cursor to remove.
+        """
+        with self.condition:
+            if cursor in self._cursors:
+                self._cursors.remove(cursor)
+
+    def close(self) -> None:
+        """Wake up all waiting consumers; reads return None once no frames are left."""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    def open(self) -> None:
+        """Accept reads again after ``close``, e.g. when capture restarts."""
+        with self.condition:
+            self.closed = False
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the capture and per-consumer overrun counters.
+
+        Returns:
+            Dict[str, Any]: Frames written, input overflows and, per cursor, its lag,
+            overruns and dropped frames.
+        """
+        with self.condition:
+            return {
+                "written": self.written,
+                "input_overflows": self.input_overflows,
+                "cursors": {
+                    cursor.name: {
+                        "lag": self.written - cursor.position,
+                        "overruns": cursor.overruns,
+                        "dropped_frames": cursor.dropped_frames,
+                    }
+                    for cursor in self._cursors
+                },
+            }
@@ -0,0 +1,280 @@
+"""
+Microphone channel selection for the keyword spotter.
+
+The ReSpeaker 6-mic array delivers 8 channels: the six microphones on channels 0-5
+and the playback loopback on channels 6 and 7. A speaker on the far side of the board
+from microphone 1 is heard worse on channel 0, so instead of always passing channel 0
+to Picovoice, ``ChannelSelector`` picks the microphone with the best signal-to-noise
+ratio for every frame, with hysteresis so the choice does not flicker. When ODAS has
+recently reported the direction of the dominant sound source, the six microphones are
+combined with a delay-and-sum beam steered at it instead. Either way Picovoice still
+sees a single channel, so no extra Porcupine or Rhino instances are needed.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import math
+import time
+
+import numpy as np
+
+from hexapod.interface import get_custom_logger
+
+if TYPE_CHECKING:
+    from typing import Optional, Tuple, Dict, Any
+
+logger = get_custom_logger("kws_logger")
+
+# Microphone positions (x, y) in meters, in channel order, as in the ODAS configs
+RESPEAKER6_MIC_POSITIONS = (
+    (-0.0232, +0.0401),
+    (+0.0232, +0.0401),
+    (+0.0463, +0.0000),
+    (+0.0232, -0.0401),
+    (-0.0232, -0.0401),
+    (-0.0463, +0.0000),
+)
+SPEED_OF_SOUND = 343.0
+# Level assigned to digital silence, in dB
+SILENCE_LEVEL_DB = -120.0
+
+
+class ChannelSelector:
+    """
+    Picks or beamforms the microphone channel passed to the keyword spotter.
+
+    Each microphone keeps its own noise floor, which follows quiet frames quickly and
+    louder ones slowly; the SNR of a frame is its level above that floor. The selected
+    channel only changes when another microphone is ``hysteresis_db`` better and the
+    current one has been held for ``min_hold_frames``. A direction of arrival passed
+    to ``steer`` switches to the delay-and-sum beam until it is older than
+    ``doa_max_age``.
+    """
+
+    def __init__(
+        self,
+        mic_positions: Tuple[Tuple[float, float], ...] = RESPEAKER6_MIC_POSITIONS,
+        sample_rate: int = 16000,
+        frame_length: int = 512,
+        hysteresis_db: float = 3.0,
+        min_hold_frames: int = 16,
+        noise_adaptation: float = 0.02,
+        beamforming: bool = True,
+        doa_max_age: float = 10.0,
+    ) -> None:
+        """
+        Initialize the selector.
+
+        Args:
+            mic_positions (Tuple[Tuple[float, float], ...]): (x, y) position of the
+                microphone on each of the first channels, in meters.
+            sample_rate (int): Sample rate of the audio in Hz.
+            frame_length (int): Samples per frame.
+            hysteresis_db (float): SNR advantage another channel needs before the
+                selection switches to it, in dB.
+            min_hold_frames (int): Frames a selected channel is kept at least.
+            noise_adaptation (float): Rate at which the noise floors rise towards
+                louder frames, per frame.
+            beamforming (bool): Steer a delay-and-sum beam at the last direction of
+                arrival passed to ``steer``.
+            doa_max_age (float): Seconds a direction of arrival is used for.
+
+        Raises:
+            ValueError: If no microphone positions are given.
+        """
+        if not mic_positions:
+            raise ValueError("At least one microphone position is required")
+
+        self.sample_rate = sample_rate
+        self.frame_length = frame_length
+        self.hysteresis_db = hysteresis_db
+        self.min_hold_frames = min_hold_frames
+        self.noise_adaptation = noise_adaptation
+        self.beamforming = beamforming
+        self.doa_max_age = doa_max_age
+
+        self.positions: np.ndarray = np.asarray(mic_positions, dtype=np.float64)
+        self.mics: int = len(self.positions)
+
+        # Largest delay between two microphones, in samples, plus interpolation
+        aperture = np.max(np.linalg.norm(self.positions, axis=1)) * 2
+        self._pad: int = int(math.ceil(aperture / SPEED_OF_SOUND * sample_rate)) + 1
+
+        # Buffers reused for every frame
+        self._work = np.zeros((frame_length, self.mics), dtype=np.float32)
+        self._history = np.zeros((self._pad + frame_length, self.mics), np.float32)
+        self._beam = np.zeros(frame_length, dtype=np.float32)
+        self._output = np.zeros(frame_length, dtype=np.int16)
+        self._columns = np.arange(self.mics)
+
+        # Direction of arrival, written by the ODAS thread as one tuple
+        self._doa: Optional[Tuple[float, float]] = None
+        self._steered_azimuth: Optional[float] = None
+        self._indices: Tuple[np.ndarray, np.ndarray] = (
+            np.zeros((frame_length, self.mics), dtype=np.intp),
+        ) * 2
+        self._weights: Tuple[np.ndarray, np.ndarray] = (
+            np.zeros(self.mics, np.float32),
+        ) * 2
+
+        self.reset()
+
+    @property
+    def beam_active(self) -> bool:
+        """Return True if the beam is steered at a recent direction of arrival."""
+        return self._beam_azimuth() is not None
+
+    def reset(self) -> None:
+        """Forget the noise floors and the selection, e.g. after audio was paused."""
+        self.noise_floor_db: Optional[np.ndarray] = None
+        self.snr_db: np.ndarray = np.zeros(self.mics)
+        self.selected_channel: int = 0
+        self.switches: int = 0
+        self.frames_total: int = 0
+        self.frames_beamformed: int = 0
+        self._held_frames: int = 0
+        self._history.fill(0)
+
+    def steer(
+        self, azimuth: Optional[float], timestamp: Optional[float] = None
+    ) -> None:
+        """
+        Set the direction of arrival of the speaker.
+
+        Safe to call from another thread.
+
+        Args:
+            azimuth (Optional[float]): Azimuth in degrees in the ODAS frame, or None
+                to stop beamforming.
+            timestamp (Optional[float]): time.monotonic() of the estimate, defaults
+                to now.
+        """
+        if azimuth is None:
+            self._doa = None
+        else:
+            now = time.monotonic() if timestamp is None else timestamp
+            self._doa = (azimuth % 360, now)
+
+    def channel_levels(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Return the level of every microphone channel of a frame.
+
+        Args:
+            frames (np.ndarray): int16 frame of shape (frame_length, channels).
+
+        Returns:
+            np.ndarray: Level of each microphone channel in dBFS.
+        """
+        np.copyto(self._work, frames[:, : self.mics], casting="unsafe")
+        self._work *= 1.0 / 32768.0
+        energy = np.einsum("ij,ij->j", self._work, self._work) / len(self._work)
+        with np.errstate(divide="ignore"):
+            levels = 10.0 * np.log10(energy)
+        return np.maximum(levels, SILENCE_LEVEL_DB)
+
+    def process(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Return the single channel to pass to the keyword spotter for a frame.
+
+        Args:
+            frames (np.ndarray): int16 frame of shape (frame_length, channels).
+
+        Returns:
+            np.ndarray: int16 samples of the selected channel, a view into
+            ``frames``, or the beam output, which is reused by the next call.
+        """
+        self.frames_total += 1
+        self._update_selection(self.channel_levels(frames))
+
+        # The history keeps the end of the previous frame for the inter-mic delays
+        self._history[: self._pad] = self._history[-self._pad :]
+        self._history[self._pad :] = self._work
+
+        azimuth = self._beam_azimuth()
+        if azimuth is None:
+            return frames[:, self.selected_channel]
+
+        self.frames_beamformed += 1
+        if azimuth != self._steered_azimuth:
+            self._set_delays(azimuth)
+        first, second = self._indices
+        first_weight, second_weight = self._weights
+        np.einsum(
+            "ij,j->i", self._history[first, self._columns], first_weight, out=self._beam
+        )
+        self._beam += np.einsum(
+            "ij,j->i", self._history[second, self._columns], second_weight
+        )
+        self._beam *= 32768.0
+        np.clip(self._beam, -32768, 32767, out=self._beam)
+        np.copyto(self._output, self._beam, casting="unsafe")
+        return self._output
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the selector statistics.
+
+        Returns:
+            Dict[str, Any]: Frames processed and beamformed, channel switches and the
+            currently selected channel.
+        """
+        return {
+            "frames_total": self.frames_total,
+            "frames_beamformed": self.frames_beamformed,
+            "switches": self.switches,
+            "selected_channel": self.selected_channel,
+        }
+
+    def _beam_azimuth(self) -> Optional[float]:
+        """Return the azimuth to steer the beam at, or None to select a channel."""
+        doa = self._doa
+        if (
+            not self.beamforming
+            or doa is None
+            or time.monotonic() - doa[1] > self.doa_max_age
+        ):
+            return None
+        return doa[0]
+
+    def _update_selection(self, levels: np.ndarray) -> None:
+        """Track the noise floors and switch channels with hysteresis."""
+        if self.noise_floor_db is None:
+            self.noise_floor_db = levels.copy()
+            return
+
+        # Fall quickly to quieter frames, rise slowly with louder ones
+        rate = np.where(levels < self.noise_floor_db, 0.5, self.noise_adaptation)
+        self.noise_floor_db += rate * (levels - self.noise_floor_db)
+        self.snr_db = levels - self.noise_floor_db
+
+        self._held_frames += 1
+        best = int(np.argmax(self.snr_db))
+        if (
+            best != self.selected_channel
+            and self._held_frames >= self.min_hold_frames
+            and self.snr_db[best] - self.snr_db[self.selected_channel]
+            >= self.hysteresis_db
+        ):
+            logger.debug(
+                f"Switching microphone channel {self.selected_channel} -> {best} "
+                f"(SNR {self.snr_db[best]:.1f} dB)"
+            )
+            self.selected_channel = best
+            self.switches += 1
+            self._held_frames = 0
+
+    def _set_delays(self, azimuth: float) -> None:
+        """Precompute the interpolated delay-and-sum taps for a direction."""
+        radians = math.radians(azimuth)
+        direction = np.array([math.cos(radians), math.sin(radians)])
+        # Microphones closer to the source hear it earlier and are delayed more
+        advance = self.positions @ direction / SPEED_OF_SOUND * self.sample_rate
+        delays = advance - advance.min()
+        whole = np.floor(delays).astype(np.intp)
+        fraction = (delays - whole).astype(np.float32)
+
+        samples = np.arange(self.frame_length)[:, None] + self._pad
+        self._indices = (samples - whole, samples - whole - 1)
+        self._weights = ((1 - fraction) / self.mics, fraction / self.mics)
+        self._steered_azimuth = azimuth
+        logger.debug(f"Beam steered to {azimuth:.0f} degrees")
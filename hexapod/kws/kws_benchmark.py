@@ -0,0 +1,707 @@
+#!/usr/bin/env python3
+
+"""
+Offline keyword spotting benchmark over labeled recordings.
+
+Runs every WAV file of a corpus directory through the frame pipeline of
+``VoiceControl``: framing into Picovoice frames, channel selection of multichannel
+recordings, the voice-activity gate and Picovoice itself. Files are processed in
+parallel on a process pool, each worker with its own engine. The JSON report contains
+the real-time factor, the distribution of per-frame processing times, the wake word
+detection latency relative to the labeled onsets and the intent accuracy.
+
+Labels are read from ``labels.json`` in the corpus directory, mapping the path of a
+recording relative to the corpus to its label::
+
+    {
+        "walk_forward.wav": {"wake_word_onset": 1.25, "intent": "move"},
+        "kitchen_noise.wav": {"wake_word_onset": null}
+    }
+
+``wake_word_onset`` is the time in seconds the wake word starts, or null for
+recordings without it; ``intent`` is the expected intent, or null if the command
+should not be understood. Without a Picovoice access key a deterministic stub engine
+is used instead, which makes the benchmark usable in CI; see ``StubPicovoice``.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+import argparse
+import json
+import time
+import wave
+import os
+
+import numpy as np
+
+from hexapod.interface import get_custom_logger
+from hexapod.kws.channel_selector import ChannelSelector, RESPEAKER6_MIC_POSITIONS
+from hexapod.kws.vad_gate import VoiceActivityGate
+
+if TYPE_CHECKING:
+    from typing import Optional, List, Dict, Any, Callable, Sequence, Tuple, Union
+
+logger = get_custom_logger("kws_logger")
+
+SAMPLE_RATE = 16000
+LABELS_FILE = "labels.json"
+DEFAULT_KEYWORD_PATH = (
+    Path(__file__).resolve().parent / "porcupine" / "hexapod_en_raspberry-pi_v3_0_0.ppn"
+)
+DEFAULT_CONTEXT_PATH = (
+    Path(__file__).resolve().parent / "rhino" / "hexapod_en_raspberry-pi_v3_0_0.rhn"
+)
+# Intents of the stub engine, selected by the frequency of the command tone
+STUB_INTENTS = ("help", "system_status", "wake_up", "sleep", "stop", "hello")
+
+
+@dataclass
+class StubInference:
+    """Inference result of the stub engine, shaped like Picovoice's."""
+
+    is_understood: bool
+    intent: Optional[str] = None
+    slots: Dict[str, str] = field(default_factory=dict)
+
+
+class StubPicovoice:
+    """
+    Deterministic stand-in for Picovoice for benchmark runs without an access key.
+
+    A burst of ``wake_word_frames`` consecutive frames above ``activity_level_db`` is
+    the wake word. After it ends, the next burst is the command: once it is followed
+    by ``endpoint_frames`` quiet frames, the frequency of its strongest tone selects
+    the intent, ``STUB_INTENTS[round(frequency / tone_step_hz) - 1]``. Test corpora
+    can thus be synthesized from tones, and results do not depend on the Picovoice
+    models or license.
+    """
+
+    frame_length = 512
+
+    def __init__(
+        self,
+        wake_word_callback: Callable[[], None],
+        inference_callback: Callable[[StubInference], None],
+        intents: Sequence[str] = STUB_INTENTS,
+        sample_rate: int = SAMPLE_RATE,
+        activity_level_db: float = -30.0,
+        wake_word_frames: int = 8,
+        endpoint_frames: int = 8,
+        intent_timeout: float = 3.0,
+        tone_step_hz: float = 250.0,
+    ) -> None:
+        """
+        Initialize the stub engine.
+
+        Args:
+            wake_word_callback (Callable[[], None]): Called when the wake word is
+                detected.
+            inference_callback (Callable[[StubInference], None]): Called with the
+                inference after a wake word.
+            intents (Sequence[str]): Intents selected by the command tone.
+            sample_rate (int): Sample rate of the audio in Hz.
+            activity_level_db (float): Level above which a frame is active, in dBFS.
+            wake_word_frames (int): Active frames that make up the wake word.
+            endpoint_frames (int): Quiet frames that end a command.
+            intent_timeout (float): Seconds after the wake word without a command
+                before the inference is not understood.
+            tone_step_hz (float): Frequency spacing of the intent tones in Hz.
+        """
+        self.wake_word_callback = wake_word_callback
+        self.inference_callback = inference_callback
+        self.intents = tuple(intents)
+        self.sample_rate = sample_rate
+        self.activity_level_db = activity_level_db
+        self.wake_word_frames = wake_word_frames
+        self.endpoint_frames = endpoint_frames
+        self.intent_timeout_frames = int(
+            intent_timeout * sample_rate / self.frame_length
+        )
+        self.tone_step_hz = tone_step_hz
+        self._spectrum = np.zeros(self.frame_length // 2 + 1)
+        self._listen_for_wake_word()
+
+    def process(self, pcm: Sequence[int]) -> None:
+        """
+        Process one frame of 16-bit audio.
+
+        Args:
+            pcm (Sequence[int]): ``frame_length`` samples.
+        """
+        samples = np.asarray(pcm, dtype=np.float64) / 32768.0
+        level = 10.0 * np.log10(max(np.mean(samples * samples), 1e-12))
+        active = level > self.activity_level_db
+
+        if not self._awaiting_intent:
+            self._active_frames = self._active_frames + 1 if active else 0
+            if self._active_frames == self.wake_word_frames:
+                self._awaiting_intent = True
+                self._in_wake_word = True
+                self.wake_word_callback()
+            return
+
+        self._frames_since_wake_word += 1
+        if self._in_wake_word:
+            # The rest of the wake word burst is not part of the command
+            self._in_wake_word = active
+        elif active:
+            self._spectrum += np.abs(np.fft.rfft(samples))
+            self._command_frames += 1
+            self._quiet_frames = 0
+        elif self._command_frames:
+            self._quiet_frames += 1
+            if self._quiet_frames >= self.endpoint_frames:
+                self._infer()
+                return
+
+        if self._frames_since_wake_word >= self.intent_timeout_frames:
+            self._infer()
+
+    def delete(self) -> None:
+        """Release the engine; nothing to release for the stub."""
+
+    def _listen_for_wake_word(self) -> None:
+        """Reset the state to waiting for the next wake word."""
+        self._awaiting_intent = False
+        self._in_wake_word = False
+        self._active_frames = 0
+        self._frames_since_wake_word = 0
+        self._command_frames = 0
+        self._quiet_frames = 0
+        self._spectrum.fill(0.0)
+
+    def _infer(self) -> None:
+        """Report the intent of the command tone."""
+        inference = StubInference(is_understood=False)
+        if self._command_frames:
+            peak = int(np.argmax(self._spectrum[1:])) + 1
+            frequency = peak * self.sample_rate / self.frame_length
+            index = int(round(frequency / self.tone_step_hz)) - 1
+            if 0 <= index < len(self.intents):
+                inference = StubInference(True, self.intents[index])
+        self._listen_for_wake_word()
+        self.inference_callback(inference)
+
+
+@dataclass
+class EngineConfig:
+    """
+    Keyword engine used by the benchmark workers.
+
+    Attributes:
+        access_key (Optional[str]): Picovoice access key; without one the stub engine
+            is used.
+        keyword_path (Path): Porcupine keyword file.
+        context_path (Path): Rhino context file.
+        porcupine_sensitivity (float): Wake word sensitivity, as in VoiceControl.
+        rhino_sensitivity (float): Intent sensitivity, as in VoiceControl.
+    """
+
+    access_key: Optional[str] = None
+    keyword_path: Path = DEFAULT_KEYWORD_PATH
+    context_path: Path = DEFAULT_CONTEXT_PATH
+    porcupine_sensitivity: float = 0.75
+    rhino_sensitivity: float = 0.25
+
+    @property
+    def name(self) -> str:
+        """Return the engine name used in the report."""
+        return "picovoice" if self.access_key else "stub"
+
+
+def create_engine(
+    config: EngineConfig,
+    wake_word_callback: Callable[[], None],
+    inference_callback: Callable[[Any], None],
+) -> Any:
+    """
+    Create a Picovoice engine, or the stub engine without an access key.
+
+    Args:
+        config (EngineConfig): Engine configuration.
+        wake_word_callback (Callable[[], None]): Wake word callback.
+        inference_callback (Callable[[Any], None]): Inference callback.
+
+    Returns:
+        Any: Engine with ``frame_length``, ``process(pcm)`` and ``delete()``.
+    """
+    if not config.access_key:
+        return StubPicovoice(wake_word_callback, inference_callback)
+
+    from picovoice import Picovoice
+
+    return Picovoice(
+        access_key=config.access_key,
+        keyword_path=str(config.keyword_path),
+        wake_word_callback=wake_word_callback,
+        context_path=str(config.context_path),
+        inference_callback=inference_callback,
+        porcupine_sensitivity=config.porcupine_sensitivity,
+        rhino_sensitivity=config.rhino_sensitivity,
+    )
+
+
+@dataclass
+class RecordingLabel:
+    """
+    Expected result for one recording.
+
+    Attributes:
+        wake_word_onset (Optional[float]): Start of the wake word in seconds, or None
+            if the recording contains no wake word.
+        intent (Optional[str]): Expected intent, None if it should not be understood.
+        check_intent (bool): Whether the label states an intent at all.
+    """
+
+    wake_word_onset: Optional[float] = None
+    intent: Optional[str] = None
+    check_intent: bool = False
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> RecordingLabel:
+        """Create a label from its ``labels.json`` entry."""
+        return cls(data.get("wake_word_onset"), data.get("intent"), "intent" in data)
+
+
+@dataclass
+class FileResult:
+    """
+    Benchmark result of one recording.
+
+    Attributes:
+        file (str): Recording path relative to the corpus.
+        channels (int): Channels of the recording.
+        audio_seconds (float): Duration of the processed audio.
+        processing_seconds (float): Time spent processing its frames.
+        frames (int): Picovoice frames read from the recording.
+        frames_processed (int): Frames passed to the engine by the gate.
+        frame_times_ms (List[float]): Processing time of every frame.
+        wake_word_times (List[float]): Audio time of each wake word detection.
+        intents (List[Optional[str]]): Inferred intents, None if not understood.
+        label (Optional[RecordingLabel]): Expected result, if labeled.
+    """
+
+    file: str
+    channels: int
+    audio_seconds: float
+    processing_seconds: float
+    frames: int
+    frames_processed: int
+    frame_times_ms: List[float] = field(default_factory=list)
+    wake_word_times: List[float] = field(default_factory=list)
+    intents: List[Optional[str]] = field(default_factory=list)
+    label: Optional[RecordingLabel] = None
+
+    @property
+    def wake_word_latency(self) -> Optional[float]:
+        """Return seconds from the labeled onset to the first detection after it."""
+        if self.label is None or self.label.wake_word_onset is None:
+            return None
+        onset = self.label.wake_word_onset
+        detections = [t for t in self.wake_word_times if t >= onset]
+        return detections[0] - onset if detections else None
+
+    @property
+    def false_alarms(self) -> int:
+        """Return the detections before the labeled onset, or all without a wake word."""
+        if self.label is None:
+            return 0
+        onset = self.label.wake_word_onset
+        if onset is None:
+            return len(self.wake_word_times)
+        return sum(1 for t in self.wake_word_times if t < onset)
+
+    @property
+    def intent_correct(self) -> Optional[bool]:
+        """Return whether the first inference matches the labeled intent."""
+        if self.label is None or not self.label.check_intent:
+            return None
+        inferred = self.intents[0] if self.intents else None
+        return inferred == self.label.intent
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the result without the per-frame times as a dictionary."""
+        return {
+            "file": self.file,
+            "channels": self.channels,
+            "audio_seconds": self.audio_seconds,
+            "processing_seconds": self.processing_seconds,
+            "frames": self.frames,
+            "frames_processed": self.frames_processed,
+            "wake_word_times": self.wake_word_times,
+            "wake_word_onset": self.label.wake_word_onset if self.label else None,
+            "wake_word_latency_ms": _milliseconds(self.wake_word_latency),
+            "false_alarms": self.false_alarms,
+            "intents": self.intents,
+            "expected_intent": (
+                self.label.intent if self.label and self.label.check_intent else None
+            ),
+            "intent_correct": self.intent_correct,
+        }
+
+
+@dataclass
+class BenchmarkReport:
+    """
+    Results of a benchmark run over a corpus.
+
+    Attributes:
+        results (List[FileResult]): Per-file results in corpus order.
+        elapsed_seconds (float): Wall time of the whole run.
+        workers (int): Number of worker processes used.
+        engine (str): "picovoice" or "stub".
+        frame_length (int): Samples per frame.
+    """
+
+    results: List[FileResult] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    workers: int = 1
+    engine: str = "stub"
+    frame_length: int = StubPicovoice.frame_length
+
+    @property
+    def audio_seconds(self) -> float:
+        """Return the total duration of the processed audio."""
+        return sum(result.audio_seconds for result in self.results)
+
+    @property
+    def realtime_factor(self) -> float:
+        """Return how many times faster than real time the corpus was processed."""
+        return self.audio_seconds / max(self.elapsed_seconds, 1e-9)
+
+    @property
+    def single_core_realtime_factor(self) -> float:
+        """Return how many times faster than real time one worker processes audio."""
+        processing = sum(result.processing_seconds for result in self.results)
+        return self.audio_seconds / max(processing, 1e-9)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the report with the aggregated metrics as a dictionary."""
+        frame_times = np.concatenate(
+            [np.asarray(r.frame_times_ms, dtype=np.float64) for r in self.results]
+            or [np.zeros(0)]
+        )
+        wake_word_labeled = [
+            r
+            for r in self.results
+            if r.label is not None and r.label.wake_word_onset is not None
+        ]
+        latencies = [
+            r.wake_word_latency
+            for r in wake_word_labeled
+            if r.wake_word_latency is not None
+        ]
+        intent_checks = [
+            r.intent_correct for r in self.results if r.intent_correct is not None
+        ]
+
+        return {
+            "engine": self.engine,
+            "files": len(self.results),
+            "workers": self.workers,
+            "audio_seconds": self.audio_seconds,
+            "elapsed_seconds": self.elapsed_seconds,
+            "realtime_factor": self.realtime_factor,
+            "single_core_realtime_factor": self.single_core_realtime_factor,
+            "frames": sum(r.frames for r in self.results),
+            "frames_processed": sum(r.frames_processed for r in self.results),
+            "frame_budget_ms": self.frame_length / SAMPLE_RATE * 1000.0,
+            "frame_time_ms": _distribution(frame_times),
+            "wake_word": {
+                "labeled": len(wake_word_labeled),
+                "detected": len(latencies),
+                "missed": len(wake_word_labeled) - len(latencies),
+                "false_alarms": sum(r.false_alarms for r in self.results),
+                "latency_ms": _distribution(np.asarray(latencies) * 1000.0),
+            },
+            "intent": {
+                "labeled": len(intent_checks),
+                "correct": sum(intent_checks),
+                "accuracy": (
+                    sum(intent_checks) / len(intent_checks) if intent_checks else None
+                ),
+            },
+            "results": [result.as_dict() for result in self.results],
+        }
+
+
+def _milliseconds(seconds: Optional[float]) -> Optional[float]:
+    """Convert seconds to milliseconds, keeping None."""
+    return None if seconds is None else seconds * 1000.0
+
+
+def _distribution(values: np.ndarray) -> Optional[Dict[str, float]]:
+    """Return the mean, percentiles and maximum of values, or None if empty."""
+    if values.size == 0:
+        return None
+    p50, p90, p99 = np.percentile(values, [50, 90, 99])
+    return {
+        "mean": float(values.mean()),
+        "p50": float(p50),
+        "p90": float(p90),
+        "p99": float(p99),
+        "max": float(values.max()),
+    }
+
+
+def read_recording(path: Union[str, Path]) -> np.ndarray:
+    """
+    Read a 16 kHz 16-bit WAV file.
+
+    Args:
+        path (Union[str, Path]): WAV file, mono or multichannel.
+
+    Returns:
+        np.ndarray: Samples of shape (samples, channels).
+
+    Raises:
+        ValueError: If the file is not 16-bit or not sampled at 16 kHz.
+    """
+    with wave.open(str(path), "rb") as wf:
+        if wf.getsampwidth() != 2:
+            raise ValueError(f"{path} must be 16-bit")
+        if wf.getframerate() != SAMPLE_RATE:
+            raise ValueError(f"{path} must be sampled at {SAMPLE_RATE} Hz")
+        channels = wf.getnchannels()
+        data = wf.readframes(wf.getnframes())
+    return np.frombuffer(data, dtype=np.int16).reshape(-1, channels)
+
+
+def benchmark_file(
+    path: Path,
+    name: str,
+    label: Optional[RecordingLabel] = None,
+    engine_config: Optional[EngineConfig] = None,
+    use_vad_gate: bool = True,
+    use_channel_selector: bool = True,
+) -> FileResult:
+    """
+    Run one recording through the VoiceControl frame pipeline.
+
+    Recordings with at least as many channels as the ReSpeaker has microphones go
+    through the channel selector, others use their first channel.
+
+    Args:
+        path (Path): WAV recording.
+        name (str): Name of the recording in the report.
+        label (Optional[RecordingLabel]): Expected result.
+        engine_config (Optional[EngineConfig]): Engine to run, defaults to the stub.
+        use_vad_gate (bool): Pass frames through the voice-activity gate.
+        use_channel_selector (bool): Select the best microphone of multichannel
+            recordings instead of the first channel.
+
+    Returns:
+        FileResult: Timings, detections and inferences of the recording.
+    """
+    engine_config = engine_config or EngineConfig()
+    samples = read_recording(path)
+    channels = samples.shape[1]
+    wake_word_times: List[float] = []
+    intents: List[Optional[str]] = []
+    current_frame = 0
+    gate: Optional[VoiceActivityGate] = None
+
+    def wake_word_callback() -> None:
+        wake_word_times.append((current_frame + 1) * frame_length / SAMPLE_RATE)
+        if gate is not None:
+            gate.hold_open()
+
+    def inference_callback(inference: Any) -> None:
+        intents.append(inference.intent if inference.is_understood else None)
+        if gate is not None:
+            gate.release()
+
+    engine = create_engine(engine_config, wake_word_callback, inference_callback)
+    try:
+        frame_length = engine.frame_length
+        count = len(samples) // frame_length
+        # Frames of shape (frame_length, channels), like the capture ring returns
+        frames = samples[: count * frame_length].reshape(count, frame_length, channels)
+        selector = (
+            ChannelSelector(sample_rate=SAMPLE_RATE, frame_length=frame_length)
+            if use_channel_selector and channels >= len(RESPEAKER6_MIC_POSITIONS)
+            else None
+        )
+        if use_vad_gate:
+            gate = VoiceActivityGate(SAMPLE_RATE, frame_length)
+        frame_times = np.zeros(count)
+        frames_processed = 0
+
+        for current_frame in range(count):
+            start = time.perf_counter()
+            pcm = (
+                frames[current_frame, :, 0]
+                if selector is None
+                else selector.process(frames[current_frame])
+            )
+            forwarded = [pcm] if gate is None else gate.process(pcm)
+            for gated_pcm in forwarded:
+                engine.process(gated_pcm)
+            frame_times[current_frame] = time.perf_counter() - start
+            frames_processed += len(forwarded)
+    finally:
+        engine.delete()
+
+    return FileResult(
+        file=name,
+        channels=channels,
+        audio_seconds=count * frame_length / SAMPLE_RATE,
+        processing_seconds=float(frame_times.sum()),
+        frames=count,
+        frames_processed=frames_processed,
+        frame_times_ms=(frame_times * 1000.0).tolist(),
+        wake_word_times=wake_word_times,
+        intents=intents,
+        label=label,
+    )
+
+
+def _benchmark_job(arguments: tuple) -> FileResult:
+    """Benchmark one recording in a worker process."""
+    return benchmark_file(*arguments)
+
+
+def load_labels(labels_file: Path) -> Dict[str, RecordingLabel]:
+    """
+    Read the labels of a corpus.
+
+    Args:
+        labels_file (Path): JSON file mapping recording paths to labels.
+
+    Returns:
+        Dict[str, RecordingLabel]: Labels by recording path relative to the corpus.
+    """
+    with open(labels_file, "r", encoding="utf-8") as f:
+        return {
+            name: RecordingLabel.from_dict(data) for name, data in json.load(f).items()
+        }
+
+
+def run_benchmark(
+    corpus_dir: Path,
+    labels_file: Optional[Path] = None,
+    engine_config: Optional[EngineConfig] = None,
+    max_workers: Optional[int] = None,
+    use_vad_gate: bool = True,
+    use_channel_selector: bool = True,
+) -> BenchmarkReport:
+    """
+    Benchmark all WAV recordings below a corpus directory.
+
+    Each file is processed in a worker process with its own engine. Per-frame times
+    are only comparable to the live pipeline with no more workers than idle cores.
+
+    Args:
+        corpus_dir (Path): Directory searched recursively for WAV files.
+        labels_file (Optional[Path]): Labels, defaults to ``labels.json`` in the
+            corpus directory if it exists.
+        engine_config (Optional[EngineConfig]): Engine to run, defaults to the stub.
+        max_workers (Optional[int]): Worker processes, defaults to the CPU count.
+            With one worker or one file the recordings are processed in this process.
+        use_vad_gate (bool): Pass frames through the voice-activity gate.
+        use_channel_selector (bool): Select the best microphone of multichannel
+            recordings.
+
+    Returns:
+        BenchmarkReport: Per-file results and aggregated metrics.
+    """
+    engine_config = engine_config or EngineConfig()
+    labels_file = labels_file or corpus_dir / LABELS_FILE
+    labels = load_labels(labels_file) if labels_file.exists() else {}
+
+    jobs: List[Tuple[Any, ...]] = []
+    for path in sorted(corpus_dir.rglob("*.wav")):
+        name = path.relative_to(corpus_dir).as_posix()
+        jobs.append(
+            (
+                path,
+                name,
+                labels.get(name),
+                engine_config,
+                use_vad_gate,
+                use_channel_selector,
+            )
+        )
+    workers = min(max_workers or os.cpu_count() or 1, max(len(jobs), 1))
+    logger.info(
+        f"Benchmarking {len(jobs)} recordings ({len(labels)} labeled) with "
+        f"{workers} workers and the {engine_config.name} engine"
+    )
+
+    start_time = time.perf_counter()
+    if workers == 1:
+        results = [_benchmark_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_benchmark_job, jobs))
+
+    return BenchmarkReport(
+        results=results,
+        elapsed_seconds=time.perf_counter() - start_time,
+        workers=workers,
+        engine=engine_config.name,
+        frame_length=StubPicovoice.frame_length,
+    )
+
+
+def main() -> None:  # pragma: no cover
+    """Benchmark the keyword spotting pipeline on a corpus and print a JSON report."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark wake word and intent recognition on a directory of labeled WAV recordings"
+    )
+    parser.add_argument("corpus_dir", type=Path, help="Directory of WAV recordings")
+    parser.add_argument(
+        "--labels",
+        type=Path,
+        default=None,
+        help=f"Labels JSON file (default: {LABELS_FILE} in the corpus directory)",
+    )
+    parser.add_argument(
+        "--access-key", help="Picovoice access key; without it the stub engine is used"
+    )
+    parser.add_argument("--keyword-path", type=Path, default=DEFAULT_KEYWORD_PATH)
+    parser.add_argument("--context-path", type=Path, default=DEFAULT_CONTEXT_PATH)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--no-vad-gate", action="store_true", help="Pass every frame to the engine"
+    )
+    parser.add_argument(
+        "--no-channel-selector",
+        action="store_true",
+        help="Always use the first channel of multichannel recordings",
+    )
+    parser.add_argument(
+        "--output", type=Path, default=None, help="Write the report to this file"
+    )
+    args = parser.parse_args()
+
+    report = run_benchmark(
+        args.corpus_dir,
+        args.labels,
+        EngineConfig(
+            access_key=args.access_key,
+            keyword_path=args.keyword_path,
+            context_path=args.context_path,
+        ),
+        max_workers=args.workers,
+        use_vad_gate=not args.no_vad_gate,
+        use_channel_selector=not args.no_channel_selector,
+    )
+
+    output = json.dumps(report.as_dict(), indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        args.output.write_text(output + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -3,20 +3,23 @@ RecordingPvRecorder - A drop-in replacement for PvRecorder with recording capabi
 
 This class provides the same interface as PvRecorder but adds the ability to record audio
 while processing it with Picovoice. It maintains compatibility with the existing VoiceControl class.
+Recorded audio is streamed to disk by a background writer thread, so memory use does not
+depend on the recording length.
 """
 
 from __future__ import annotations
 from typing import TYPE_CHECKING
 import time
 import threading
-import wave
 from pathlib import Path
 import logging
 
 from hexapod.interface import get_custom_logger
+from hexapod.kws.recording_writer import RecordingWriter, flac_available
 
 if TYPE_CHECKING:
-    from typing import Optional, List
+    from typing import Optional, Union
+    import numpy as np
 
 logger = get_custom_logger("kws_logger")
 
@@ -34,27 +37,63 @@ class Recorder:
     CHANNELS = 8
     FORMAT = "paInt16"
 
-    def __init__(self, recordings_dir: Optional[Path] = None):
+    def __init__(
+        self, recordings_dir: Optional[Path] = None, file_format: str = "wav"
+    ) -> None:
         """
         Initialize the Recorder.
 
         Args:
             recordings_dir (Path, optional): Directory to save recordings.
                                            Defaults to DEFAULT_RECORDINGS_DIR.
+            file_format (str): "wav" or "flac". FLAC needs the optional soundfile
+                package; without it recordings fall back to WAV.
         """
         self.recordings_dir = recordings_dir or self.DEFAULT_RECORDINGS_DIR
         self.recordings_dir.mkdir(parents=True, exist_ok=True)
 
+        if file_format == "flac" and not flac_available():
+            logger.warning("soundfile is not installed, recording WAV instead of FLAC")
+            file_format = "wav"
+        self.file_format = file_format
+
         # Recording state
         self.is_recording = False
         self.is_continuous_recording = False
-        self.recording_frames: List[bytes] = []
+        self.recording_frame_count = 0
         self.recording_start_time: Optional[float] = None
         self.recording_audio_record_start_time: Optional[float] = None
         self.recording_audio_record_number = 1
         self.recording_base_filename: Optional[str] = None
+        self.recording_path: Optional[Path] = None
         self.recording_timer: Optional[threading.Timer] = None
 
+        # Writer thread, started with the first recording
+        self.writer: Optional[RecordingWriter] = None
+        self._lock = threading.RLock()
+        self._frame_size = 2 * self.CHANNELS  # 16-bit samples
+        self._audio_record_frames = int(self.AUDIO_RECORD_DURATION * self.SAMPLE_RATE)
+
+    def _ensure_writer(self) -> RecordingWriter:
+        """Start the writer thread if it is not running."""
+        if self.writer is None or not self.writer.is_alive():
+            self.writer = RecordingWriter(
+                self.SAMPLE_RATE, self.CHANNELS, self.file_format
+            )
+            self.writer.start()
+        return self.writer
+
+    def _open_recording_file(self) -> None:
+        """Open the file for the current recording or audio record."""
+        if self.is_continuous_recording:
+            filename = f"{self.recording_base_filename}_{self.recording_audio_record_number:03d}"
+        else:
+            filename = str(self.recording_base_filename)
+        self.recording_path = self.recordings_dir / f"{filename}.{self.file_format}"
+        self.recording_frame_count = 0
+        self.recording_audio_record_start_time = time.time()
+        self._ensure_writer().open_file(self.recording_path)
+
     def start_recording(
         self, filename: Optional[str] = None, duration: Optional[float] = None
     ) -> str:
@@ -68,27 +107,27 @@ class Recorder:
         Returns:
             str: The base filename where recording will be saved
         """
-        # If already recording, save current recording and start new one
-        if self.is_recording:
-            logger.info(
-                "Recording already in progress - saving current recording and starting new one"
-            )
-            self.stop_recording()
+        with self._lock:
+            # If already recording, save current recording and start new one
+            if self.is_recording:
+                logger.info(
+                    "Recording already in progress - saving current recording and starting new one"
+                )
+                self.stop_recording()
 
-        # Generate base filename
-        if filename:
-            self.recording_base_filename = filename
-        else:
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            self.recording_base_filename = timestamp
+            # Generate base filename
+            if filename:
+                self.recording_base_filename = filename
+            else:
+                timestamp = time.strftime("%Y%m%d_%H%M%S")
+                self.recording_base_filename = timestamp
 
-        # Start recording
-        self.recording_frames = []
-        self.recording_start_time = time.time()
-        self.recording_audio_record_start_time = time.time()
-        self.recording_audio_record_number = 1
-        self.is_recording = True
-        self.is_continuous_recording = duration is None or duration <= 0
+            # Start recording
+            self.recording_start_time = time.time()
+            self.recording_audio_record_number = 1
+            self.is_continuous_recording = duration is None or duration <= 0
+            self._open_recording_file()
+            self.is_recording = True
 
         # Set up auto-stop timer if duration specified
         if duration and duration > 0:
@@ -96,93 +135,65 @@ class Recorder:
             self.recording_timer.daemon = True
             self.recording_timer.start()
             logger.info(
-                f"Started recording to: {self.recording_base_filename}.wav (auto-stop in {duration}s)"
+                f"Started recording to: {self.recording_path.name} (auto-stop in {duration}s)"
             )
         else:
             self.recording_timer = None
             logger.info(
-                f"Started continuous recording to: {self.recording_base_filename}_001.wav (15-min audio records)"
+                f"Started continuous recording to: {self.recording_path.name} ({self.AUDIO_RECORD_DURATION // 60}-min audio records)"
             )
 
         return self.recording_base_filename
 
-    def add_audio_frame(self, audio_data: bytes) -> None:
+    def add_audio_frame(self, audio_data: Union[bytes, np.ndarray]) -> None:
         """
         Add an audio frame to the current recording.
 
+        The audio is handed to the writer thread; this never waits for the disk.
+
         Args:
-            audio_data (bytes): Raw audio data to add to recording
+            audio_data (Union[bytes, np.ndarray]): Raw audio data to add to recording,
+                as bytes or interleaved int16 frames. Arrays are copied, so views into
+                the capture ring can be passed.
         """
-        if not self.is_recording:
-            return
-
-        self.recording_frames.append(audio_data)
-
-        # Check if we need to save an audio record (for continuous recordings)
-        if (
-            self.is_continuous_recording
-            and self.recording_audio_record_start_time is not None
-        ):
-            current_time = time.time()
-            audio_record_duration = (
-                current_time - self.recording_audio_record_start_time
-            )
-
-            if audio_record_duration >= self.AUDIO_RECORD_DURATION:
+        with self._lock:
+            if not self.is_recording:
+                return
+
+            data = bytes(audio_data)
+            self.writer.write(data)
+            self.recording_frame_count += len(data) // self._frame_size
+
+            # Check if we need to save an audio record (for continuous recordings)
+            if (
+                self.is_continuous_recording
+                and self.recording_frame_count >= self._audio_record_frames
+            ):
                 logger.info(
-                    f"Audio record {self.recording_audio_record_number} duration reached ({audio_record_duration:.1f}s), saving..."
+                    f"Audio record {self.recording_audio_record_number} duration reached ({self.recording_frame_count / self.SAMPLE_RATE:.1f}s), saving..."
                 )
                 self._save_recording_audio_record()
 
     def _save_recording_audio_record(self) -> str:
         """
-        Save the current recording audio record and start a new one.
+        Finish the current recording audio record and start a new one.
+
+        The writer thread patches the header and closes the file in the background,
+        so the audio thread is not held up by the disk.
 
         Returns:
-            str: Path to the saved audio record file
+            str: Path to the finished audio record file
         """
-        if not self.recording_frames:
-            logger.warning("No audio frames to save in audio record")
-            return ""
-
-        # Generate audio record filename
-        audio_record_filename = f"{self.recording_base_filename}_{self.recording_audio_record_number:03d}.wav"
-        recording_path = self.recordings_dir / audio_record_filename
-
-        try:
-            with wave.open(str(recording_path), "wb") as wf:
-                wf.setnchannels(self.CHANNELS)
-                wf.setsampwidth(2)  # 16-bit = 2 bytes
-                wf.setframerate(self.SAMPLE_RATE)
-                wf.writeframes(b"".join(self.recording_frames))
-
-            if self.recording_audio_record_start_time is not None:
-                audio_record_duration = (
-                    time.time() - self.recording_audio_record_start_time
-                )
-            else:
-                audio_record_duration = 0.0
-            file_size = recording_path.stat().st_size
-            file_size_mb = file_size / (1024 * 1024)
-            if file_size_mb >= 1024:
-                file_size_str = f"{file_size_mb/1024:.1f} GB"
-            else:
-                file_size_str = f"{file_size_mb:.1f} MB"
-            logger.user_info(
-                f"Audio record {self.recording_audio_record_number} saved: {recording_path} (Duration: {audio_record_duration:.1f}s, Size: {file_size_str})"
-            )
+        with self._lock:
+            if not self.recording_frame_count:
+                logger.warning("No audio frames to save in audio record")
+                return ""
 
-            # Reset for next audio record
-            self.recording_frames = []
-            self.recording_audio_record_start_time = time.time()
+            recording_path = self.recording_path
             self.recording_audio_record_number += 1
-
+            self._open_recording_file()
             return str(recording_path)
 
-        except Exception as e:
-            logger.error(f"Failed to save recording audio record: {e}")
-            return ""
-
     def stop_recording(self) -> str:
         """
         Stop recording and save the audio file.
@@ -190,58 +201,45 @@ class Recorder:
         Returns:
             str: Path to the last saved recording file, or empty string if no recording was active
         """
-        if not self.is_recording:
-            logger.warning("No recording in progress")
-            return ""
-
-        # Cancel auto-stop timer if it exists
-        if self.recording_timer:
-            self.recording_timer.cancel()
-            self.recording_timer = None
+        with self._lock:
+            if not self.is_recording:
+                logger.warning("No recording in progress")
+                return ""
+
+            # Cancel auto-stop timer if it exists
+            if self.recording_timer:
+                self.recording_timer.cancel()
+                self.recording_timer = None
+
+            self.is_recording = False
+            if self.recording_start_time is not None:
+                total_duration = time.time() - self.recording_start_time
+            else:
+                total_duration = 0.0
 
-        self.is_recording = False
-        if self.recording_start_time is not None:
-            total_duration = time.time() - self.recording_start_time
-        else:
-            total_duration = 0.0
+            closed = self.writer.request_close() if self.writer is not None else None
+            self.recording_path = None
+            is_continuous = self.is_continuous_recording
+            audio_record_number = self.recording_audio_record_number
 
-        # Save final audio record if there are frames
+        # Wait for the writer to flush and close the last file without holding the
+        # lock, so the audio thread is not held up meanwhile
         last_saved_file = ""
-        if self.recording_frames:
-            if self.is_continuous_recording:
-                # For continuous recording, save as final audio record
-                last_saved_file = self._save_recording_audio_record()
+        recorded = closed.result() if closed is not None else None
+        if recorded is not None:
+            if recorded.frames:
+                last_saved_file = str(recorded.path)
             else:
-                # For duration-based recording, save as single file
-                try:
-                    recording_path = (
-                        self.recordings_dir / f"{self.recording_base_filename}.wav"
-                    )
-
-                    with wave.open(str(recording_path), "wb") as wf:
-                        wf.setnchannels(self.CHANNELS)
-                        wf.setsampwidth(2)  # 16-bit = 2 bytes
-                        wf.setframerate(self.SAMPLE_RATE)
-                        wf.writeframes(b"".join(self.recording_frames))
-
-                    file_size = recording_path.stat().st_size
-                    file_size_mb = file_size / (1024 * 1024)
-                    if file_size_mb >= 1024:
-                        file_size_str = f"{file_size_mb/1024:.1f} GB"
-                    else:
-                        file_size_str = f"{file_size_mb:.1f} MB"
-                    logger.user_info(
-                        f"Recording finished and saved: {recording_path} (Duration: {total_duration:.1f}s, Size: {file_size_str})"
-                    )
-                    last_saved_file = str(recording_path)
-
-                except Exception as e:
-                    logger.error(f"Failed to save recording: {e}")
-                    return ""
+                recorded.path.unlink(missing_ok=True)
+
+        if not is_continuous and last_saved_file:
+            logger.user_info(
+                f"Recording finished and saved: {last_saved_file} (Duration: {total_duration:.1f}s)"
+            )
 
         # Log summary for continuous recordings
-        if self.is_continuous_recording:
-            total_audio_records = self.recording_audio_record_number - 1
+        if is_continuous:
+            total_audio_records = audio_record_number - (0 if last_saved_file else 1)
             logger.user_info(
                 f"Continuous recording finished. Total duration: {total_duration:.1f}s, Total audio records: {total_audio_records}"
             )
@@ -271,7 +269,9 @@ class Recorder:
             "total_duration": duration,
             "current_audio_record_duration": audio_record_duration,
             "current_audio_record_number": self.recording_audio_record_number,
-            "frame_count": len(self.recording_frames) if self.recording_frames else 0,
+            "frame_count": self.recording_frame_count if self.is_recording else 0,
+            "file_format": self.file_format,
+            "dropped_buffers": self.writer.dropped_buffers if self.writer else 0,
         }
 
     def cleanup(self) -> None:
@@ -284,3 +284,7 @@ class Recorder:
         if self.recording_timer:
             self.recording_timer.cancel()
             self.recording_timer = None
+
+        if self.writer is not None:
+            self.writer.stop()
+            self.writer = None
@@ -0,0 +1,316 @@
+"""
+Background writer streaming recorded audio to disk.
+
+The audio thread hands each captured buffer to ``RecordingWriter.write``, which only
+puts it on the writer queue. The writer thread appends the buffers to an open WAV or
+FLAC file, so the memory used by a recording does not grow with its length. WAV
+headers are patched while writing and when a file is closed, so a file cut short by
+a crash or power loss stays readable up to the last header update.
+
+Only audio buffers count against ``max_pending_buffers``. Opening and closing files
+always gets a place in the queue, so rotating or stopping a recording never waits
+for the disk to catch up.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from types import ModuleType
+from dataclasses import dataclass
+from pathlib import Path
+from concurrent.futures import Future
+import threading
+import queue
+import wave
+
+from hexapod.interface import get_custom_logger
+from hexapod.utils import rename_thread
+
+if TYPE_CHECKING:
+    from typing import Optional, Tuple, Any
+
+logger = get_custom_logger("kws_logger")
+
+FILE_FORMATS = ("wav", "flac")
+
+
+@dataclass
+class RecordedFile:
+    """A recording file closed by the writer."""
+
+    path: Path
+    frames: int
+    sample_rate: int
+
+    @property
+    def duration(self) -> float:
+        """Return the recorded audio duration in seconds."""
+        return self.frames / self.sample_rate
+
+
+def _soundfile() -> Optional[ModuleType]:
+    """Return soundfile if it is installed, otherwise None."""
+    try:
+        import soundfile
+    except ImportError:
+        return None
+    # Test environments replace unavailable modules with stand-ins
+    return soundfile if isinstance(soundfile, ModuleType) else None
+
+
+def flac_available() -> bool:
+    """
+    Check whether FLAC recordings can be written.
+
+    Returns:
+        bool: True if the optional soundfile package is installed.
+    """
+    return _soundfile() is not None
+
+
+def format_file_size(size: int) -> str:
+    """
+    Format a file size for log messages.
+
+    Args:
+        size (int): Size in bytes.
+
+    Returns:
+        str: Size in MB, or in GB from 1 GB on.
+    """
+    size_mb = size / (1024 * 1024)
+    if size_mb >= 1024:
+        return f"{size_mb / 1024:.1f} GB"
+    return f"{size_mb:.1f} MB"
+
+
+class _WavSink:
+    """Appends 16-bit frames to a WAV file."""
+
+    def __init__(self, path: Path, sample_rate: int, channels: int) -> None:
+        self._file = open(path, "wb")
+        self._wav = wave.open(self._file, "wb")
+        self._wav.setnchannels(channels)
+        self._wav.setsampwidth(2)  # 16-bit = 2 bytes
+        self._wav.setframerate(sample_rate)
+
+    def write(self, data: bytes) -> None:
+        # Appends without seeking back to the header
+        self._wav.writeframesraw(data)
+
+    def update_header(self) -> None:
+        # Writing no frames patches the header to the data written so far
+        self._wav.writeframes(b"")
+        self._file.flush()
+
+    def close(self) -> None:
+        # Patches the header; the file object is ours to close
+        self._wav.close()
+        self._file.close()
+
+
+class _FlacSink:
+    """Encodes 16-bit frames to a FLAC file with soundfile."""
+
+    def __init__(self, path: Path, sample_rate: int, channels: int) -> None:
+        self._file = _soundfile().SoundFile(
+            str(path),
+            mode="w",
+            samplerate=sample_rate,
+            channels=channels,
+            format="FLAC",
+            subtype="PCM_16",
+        )
+
+    def write(self, data: bytes) -> None:
+        self._file.buffer_write(data, dtype="int16")
+
+    def update_header(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class RecordingWriter(threading.Thread):
+    """
+    Thread writing 16-bit interleaved audio to one recording file at a time.
+
+    Files are opened, written and closed in the order the calls were made. ``write``
+    never blocks: when the disk falls behind by more than ``max_pending_buffers``,
+    buffers are dropped and counted instead of queuing without bound. Opening and
+    closing files never blocks either; only ``close_file`` waits, for the close.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        channels: int,
+        file_format: str = "wav",
+        max_pending_buffers: int = 256,
+        header_update_interval: float = 5.0,
+    ) -> None:
+        """
+        Initialize the writer thread.
+
+        Args:
+            sample_rate (int): Sample rate of the recorded audio in Hz.
+            channels (int): Number of interleaved channels.
+            file_format (str): "wav" or "flac"; FLAC requires the soundfile package.
+            max_pending_buffers (int): Maximum number of buffers waiting to be written.
+            header_update_interval (float): Recorded seconds between WAV header
+                updates.
+
+        Raises:
+            ValueError: If the file format is unknown.
+            RuntimeError: If FLAC is requested but soundfile is not installed.
+        """
+        super().__init__(daemon=True)
+        rename_thread(self, "RecordingWriter")
+
+        if file_format not in FILE_FORMATS:
+            raise ValueError(
+                f"Unknown recording format {file_format!r}, expected one of {FILE_FORMATS}"
+            )
+        if file_format == "flac" and not flac_available():
+            raise RuntimeError(
+                "FLAC recordings require soundfile. Install with: pip install soundfile"
+            )
+
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.file_format = file_format
+        self.header_update_frames: int = int(header_update_interval * sample_rate)
+        self.dropped_buffers: int = 0
+        self.last_file: Optional[RecordedFile] = None
+        self._frame_size: int = 2 * channels
+        # Unbounded; audio buffers are limited by the slots instead
+        self._queue: queue.Queue[Tuple[str, Any]] = queue.Queue()
+        self._buffer_slots = threading.Semaphore(max_pending_buffers)
+        self._sink: Any = None
+        self._path: Optional[Path] = None
+        self._frames: int = 0
+        self._frames_since_header: int = 0
+
+    @property
+    def extension(self) -> str:
+        """Return the file extension of the recordings, including the dot."""
+        return f".{self.file_format}"
+
+    def open_file(self, path: Path) -> None:
+        """
+        Start a new recording file, closing the current one.
+
+        Args:
+            path (Path): Path of the new file.
+        """
+        self._queue.put_nowait(("open", path))
+
+    def write(self, data: bytes) -> bool:
+        """
+        Queue audio for the current file without blocking.
+
+        Args:
+            data (bytes): Interleaved 16-bit frames.
+
+        Returns:
+            bool: False if the buffer was dropped because the writer fell behind.
+        """
+        if not self._buffer_slots.acquire(blocking=False):
+            self.dropped_buffers += 1
+            if self.dropped_buffers == 1 or self.dropped_buffers % 100 == 0:
+                logger.warning(
+                    f"Recording writer fell behind, {self.dropped_buffers} buffers dropped"
+                )
+            return False
+        self._queue.put_nowait(("data", data))
+        return True
+
+    def request_close(self) -> Future:
+        """
+        Close the current file once the audio queued before is written, without
+        waiting.
+
+        Returns:
+            Future: Resolves to the closed RecordedFile, or None if no file was open
+            or closing it failed.
+        """
+        closed: Future = Future()
+        self._queue.put_nowait(("close", closed))
+        return closed
+
+    def close_file(self, wait: bool = True) -> Optional[RecordedFile]:
+        """
+        Close the current file once the audio queued before is written.
+
+        Args:
+            wait (bool): Wait until the file is closed.
+
+        Returns:
+            Optional[RecordedFile]: The closed file when waiting, or None if no file
+            was open or when not waiting.
+        """
+        closed = self.request_close()
+        return closed.result() if wait else None
+
+    def stop(self) -> None:
+        """Close the current file and stop the thread."""
+        if self.is_alive():
+            self._queue.put_nowait(("stop", None))
+            self.join()
+
+    def run(self) -> None:
+        """Write queued audio until stopped."""
+        while True:
+            command, argument = self._queue.get()
+            try:
+                if command == "data":
+                    self._buffer_slots.release()
+                    self._write(argument)
+                elif command == "open":
+                    self._close()
+                    self._open(argument)
+                elif command == "close":
+                    self.last_file = None
+                    self.last_file = self._close()
+                    argument.set_result(self.last_file)
+                elif command == "stop":
+                    self._close()
+                    return
+            except Exception as e:
+                logger.error(f"Recording writer error: {e}")
+                if command == "close" and not argument.done():
+                    argument.set_result(None)
+
+    def _open(self, path: Path) -> None:
+        """Open a recording file. Called on the writer thread."""
+        sink_class = _FlacSink if self.file_format == "flac" else _WavSink
+        self._sink = sink_class(path, self.sample_rate, self.channels)
+        self._path = path
+        self._frames = self._frames_since_header = 0
+        logger.debug(f"Recording to {path}")
+
+    def _write(self, data: bytes) -> None:
+        """Append audio to the open file. Called on the writer thread."""
+        if self._sink is None:
+            return
+        self._sink.write(data)
+        frames = len(data) // self._frame_size
+        self._frames += frames
+        self._frames_since_header += frames
+        if self._frames_since_header >= self.header_update_frames:
+            self._sink.update_header()
+            self._frames_since_header = 0
+
+    def _close(self) -> Optional[RecordedFile]:
+        """Finalize the open file, if any. Called on the writer thread."""
+        if self._sink is None:
+            return None
+        sink, path = self._sink, self._path
+        self._sink = self._path = None
+        sink.close()
+        recorded = RecordedFile(path, self._frames, self.sample_rate)
+        logger.user_info(
+            f"Audio record saved: {path} (Duration: {recorded.duration:.1f}s, "
+            f"Size: {format_file_size(path.stat().st_size)})"
+        )
+        return recorded
@@ -0,0 +1,423 @@
+"""
+Voice-activity gate in front of the keyword spotter.
+
+Most of the time the microphones pick up silence or steady background noise, and
+running Porcupine on it costs CPU around the clock. ``VoiceActivityGate`` classifies
+each frame with two cheap vectorized features, its level relative to an adaptive noise
+floor and its zero-crossing rate, and only forwards frames while voice-like activity is
+present. A hangover keeps the gate open through short pauses, and a pre-roll of the
+frames before the gate opened is forwarded first, so the start of a wake word spoken
+into silence is not cut off.
+
+Run ``python -m hexapod.kws.vad_gate`` on recorded WAV files to see the fraction of
+frames the gate skips and, with a Picovoice access key, the wake word recall compared
+to running Porcupine on every frame.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+import argparse
+import json
+import math
+import wave
+
+import numpy as np
+
+from hexapod.interface import get_custom_logger
+
+if TYPE_CHECKING:
+    from typing import Optional, List, Tuple, Dict, Any, Callable, Iterable, Union
+
+logger = get_custom_logger("kws_logger")
+
+FULL_SCALE = 32768.0
+# Level assigned to digital silence, in dBFS
+SILENCE_LEVEL_DB = -120.0
+
+
+class VoiceActivityGate:
+    """
+    Energy and zero-crossing voice-activity detector with hangover and pre-roll.
+
+    A frame is voice-like when its level is ``threshold_db`` above the noise floor and
+    above ``min_level_db``, and its zero-crossing rate is at most
+    ``max_zero_crossing_rate``, which rejects hiss and other broadband noise. The noise
+    floor follows quiet frames quickly and louder ones slowly, so a lasting change of
+    the background noise closes the gate again after a while.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        frame_length: int = 512,
+        threshold_db: float = 9.0,
+        min_level_db: float = -65.0,
+        max_zero_crossing_rate: float = 0.35,
+        hangover: float = 0.6,
+        pre_roll: float = 0.5,
+        noise_adaptation: float = 0.05,
+    ) -> None:
+        """
+        Initialize the gate.
+
+        Args:
+            sample_rate (int): Sample rate of the audio in Hz.
+            frame_length (int): Samples per frame.
+            threshold_db (float): Level above the noise floor that counts as
+                activity, in dB.
+            min_level_db (float): Minimum level that counts as activity, in dBFS.
+            max_zero_crossing_rate (float): Highest zero crossings per sample of a
+                voice-like frame.
+            hangover (float): Time the gate stays open after the last voice-like
+                frame, in seconds.
+            pre_roll (float): Audio before the gate opens that is forwarded with the
+                first voice-like frame, in seconds.
+            noise_adaptation (float): Rate at which the noise floor rises towards
+                louder non-voice frames, per frame.
+        """
+        self.sample_rate = sample_rate
+        self.frame_length = frame_length
+        self.threshold_db = threshold_db
+        self.min_level_db = min_level_db
+        self.max_zero_crossing_rate = max_zero_crossing_rate
+        self.noise_adaptation = noise_adaptation
+        self.hangover_frames: int = math.ceil(hangover * sample_rate / frame_length)
+        self.pre_roll_frames: int = math.ceil(pre_roll * sample_rate / frame_length)
+
+        self._pre_roll = np.zeros(
+            (max(self.pre_roll_frames, 1), frame_length), np.int16
+        )
+        self._work = np.empty(frame_length, dtype=np.float32)
+        self.reset()
+
+        self.frames_total: int = 0
+        self.frames_forwarded: int = 0
+        self.activations: int = 0
+
+    @property
+    def skipped_fraction(self) -> float:
+        """Return the fraction of frames that were not forwarded."""
+        if not self.frames_total:
+            return 0.0
+        return 1.0 - self.frames_forwarded / self.frames_total
+
+    def reset(self) -> None:
+        """Close the gate and forget the noise floor and the pre-roll."""
+        self.is_open: bool = False
+        self.noise_floor_db: Optional[float] = None
+        self._held: bool = False
+        self._hangover_left: int = 0
+        self._pre_roll_count: int = 0
+        self._pre_roll_next: int = 0
+
+    def hold_open(self) -> None:
+        """Forward every frame until ``release``, e.g. while Rhino listens."""
+        self._held = True
+
+    def release(self) -> None:
+        """End ``hold_open``; the gate closes after the hangover."""
+        self._held = False
+
+    def frame_features(self, frame: np.ndarray) -> Tuple[float, float]:
+        """
+        Compute the level and zero-crossing rate of a frame.
+
+        Args:
+            frame (np.ndarray): Mono int16 samples, possibly a strided view.
+
+        Returns:
+            Tuple[float, float]: Level in dBFS and zero crossings per sample.
+        """
+        samples = self._work[: len(frame)]
+        np.copyto(samples, frame, casting="unsafe")
+        power = float(np.dot(samples, samples)) / (len(samples) * FULL_SCALE**2)
+        level = 10.0 * math.log10(power) if power > 0 else SILENCE_LEVEL_DB
+        signs = np.signbit(samples)
+        crossings = np.count_nonzero(signs[1:] != signs[:-1])
+        return level, crossings / max(len(samples) - 1, 1)
+
+    def is_voice_like(self, level: float, zero_crossing_rate: float) -> bool:
+        """
+        Classify a frame and update the noise floor.
+
+        Args:
+            level (float): Frame level in dBFS.
+            zero_crossing_rate (float): Zero crossings per sample.
+
+        Returns:
+            bool: True if the frame looks like voice.
+        """
+        if self.noise_floor_db is None:
+            self.noise_floor_db = level
+            return False
+
+        voice = (
+            level >= self.noise_floor_db + self.threshold_db
+            and level >= self.min_level_db
+            and zero_crossing_rate <= self.max_zero_crossing_rate
+        )
+        if level < self.noise_floor_db:
+            self.noise_floor_db += 0.5 * (level - self.noise_floor_db)
+        else:
+            rate = self.noise_adaptation * (0.1 if voice else 1.0)
+            self.noise_floor_db += rate * (level - self.noise_floor_db)
+        return voice
+
+    def process(self, frame: np.ndarray) -> List[np.ndarray]:
+        """
+        Pass one frame through the gate.
+
+        Args:
+            frame (np.ndarray): Mono int16 samples of ``frame_length``.
+
+        Returns:
+            List[np.ndarray]: Frames to forward to the keyword spotter in order: none
+            while the gate is closed, the pre-roll and the frame when it opens, the
+            frame while it is open. Pre-roll frames are views of an internal buffer
+            that stay valid until the gate closes again.
+        """
+        self.frames_total += 1
+        voice = self.is_voice_like(*self.frame_features(frame))
+
+        if voice or self._held:
+            self._hangover_left = self.hangover_frames
+            if self.is_open:
+                forwarded = [frame]
+            else:
+                self.is_open = True
+                self.activations += 1
+                forwarded = self._drain_pre_roll() + [frame]
+        elif self.is_open and self._hangover_left > 0:
+            self._hangover_left -= 1
+            forwarded = [frame]
+        else:
+            self.is_open = False
+            self._push_pre_roll(frame)
+            forwarded = []
+
+        self.frames_forwarded += len(forwarded)
+        return forwarded
+
+    def _push_pre_roll(self, frame: np.ndarray) -> None:
+        """Keep a copy of a skipped frame in the pre-roll ring."""
+        if not self.pre_roll_frames:
+            return
+        self._pre_roll[self._pre_roll_next] = frame
+        self._pre_roll_next = (self._pre_roll_next + 1) % self.pre_roll_frames
+        self._pre_roll_count = min(self._pre_roll_count + 1, self.pre_roll_frames)
+
+    def _drain_pre_roll(self) -> List[np.ndarray]:
+        """Return the buffered pre-roll frames oldest first and empty the ring."""
+        count = self._pre_roll_count
+        start = (self._pre_roll_next - count) % max(self.pre_roll_frames, 1)
+        frames = [
+            self._pre_roll[(start + i) % self.pre_roll_frames] for i in range(count)
+        ]
+        self._pre_roll_count = 0
+        return frames
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the gate counters.
+
+        Returns:
+            Dict[str, Any]: Frames seen and forwarded, skipped fraction, activations
+            and the current noise floor.
+        """
+        return {
+            "frames_total": self.frames_total,
+            "frames_forwarded": self.frames_forwarded,
+            "skipped_fraction": self.skipped_fraction,
+            "activations": self.activations,
+            "noise_floor_db": self.noise_floor_db,
+        }
+
+
+@dataclass
+class GateEvaluation:
+    """Frames skipped by the gate and wake word recall over a set of recordings."""
+
+    files: List[str] = field(default_factory=list)
+    frames_total: int = 0
+    frames_forwarded: int = 0
+    detections_ungated: Optional[int] = None
+    detections_gated: Optional[int] = None
+    detections_kept: Optional[int] = None
+
+    @property
+    def skipped_fraction(self) -> float:
+        """Return the fraction of frames the gate kept from the keyword spotter."""
+        if not self.frames_total:
+            return 0.0
+        return 1.0 - self.frames_forwarded / self.frames_total
+
+    @property
+    def recall(self) -> Optional[float]:
+        """Return the fraction of ungated detections still found behind the gate."""
+        if not self.detections_ungated:
+            return None
+        return self.detections_kept / self.detections_ungated
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the evaluation including the derived metrics as a dictionary."""
+        result = asdict(self)
+        result["skipped_fraction"] = self.skipped_fraction
+        result["recall"] = self.recall
+        return result
+
+
+def read_wav_frames(path: Union[str, Path], frame_length: int) -> np.ndarray:
+    """
+    Read a 16-bit WAV file as frames of its first channel.
+
+    Args:
+        path (Union[str, Path]): WAV file.
+        frame_length (int): Samples per frame; a trailing partial frame is dropped.
+
+    Returns:
+        np.ndarray: Array of shape (frames, frame_length).
+
+    Raises:
+        ValueError: If the file is not 16-bit.
+    """
+    with wave.open(str(path), "rb") as wf:
+        if wf.getsampwidth() != 2:
+            raise ValueError(f"{path} must be 16-bit")
+        channels = wf.getnchannels()
+        samples = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+    mono = samples[::channels]
+    count = len(mono) // frame_length
+    return mono[: count * frame_length].reshape(count, frame_length)
+
+
+def evaluate_gate(
+    wav_files: Iterable[Union[str, Path]],
+    create_detector: Optional[Callable[[], Any]] = None,
+    frame_length: int = 512,
+    **gate_options: Any,
+) -> GateEvaluation:
+    """
+    Run recordings through the gate and optionally compare wake word detections.
+
+    Each file starts with a fresh gate and fresh detectors. A detection behind the gate
+    counts as kept up to the number of detections without the gate in the same file.
+
+    Args:
+        wav_files (Iterable[Union[str, Path]]): 16 kHz 16-bit WAV files.
+        create_detector (Optional[Callable[[], Any]]): Factory of a detector with
+            Porcupine's ``process(pcm) -> int`` and ``delete()``. Without one only the
+            skipped frames are measured.
+        frame_length (int): Samples per frame.
+        **gate_options (Any): Options of ``VoiceActivityGate``.
+
+    Returns:
+        GateEvaluation: Aggregated results.
+    """
+    evaluation = GateEvaluation()
+    if create_detector is not None:
+        evaluation.detections_ungated = 0
+        evaluation.detections_gated = 0
+        evaluation.detections_kept = 0
+
+    for path in wav_files:
+        frames = read_wav_frames(path, frame_length)
+        gate = VoiceActivityGate(frame_length=frame_length, **gate_options)
+        ungated = gated = 0
+        detectors = (create_detector(), create_detector()) if create_detector else None
+        try:
+            for frame in frames:
+                forwarded = gate.process(frame)
+                if detectors is None:
+                    continue
+                ungated += detectors[0].process(frame) >= 0
+                for pcm in forwarded:
+                    gated += detectors[1].process(pcm) >= 0
+        finally:
+            if detectors is not None:
+                for detector in detectors:
+                    detector.delete()
+
+        evaluation.files.append(str(path))
+        evaluation.frames_total += gate.frames_total
+        evaluation.frames_forwarded += gate.frames_forwarded
+        if detectors is not None:
+            evaluation.detections_ungated += ungated
+            evaluation.detections_gated += gated
+            evaluation.detections_kept += min(gated, ungated)
+        logger.info(
+            f"{path}: {gate.skipped_fraction:.1%} of {gate.frames_total} frames skipped"
+            + (f", {gated}/{ungated} detections" if detectors is not None else "")
+        )
+
+    return evaluation
+
+
+def main() -> None:  # pragma: no cover
+    """Evaluate the voice-activity gate on WAV recordings."""
+    default_keyword = (
+        Path(__file__).resolve().parent
+        / "porcupine"
+        / "hexapod_en_raspberry-pi_v3_0_0.ppn"
+    )
+    parser = argparse.ArgumentParser(
+        description="Measure the frames skipped by the voice-activity gate and the wake word recall on WAV files"
+    )
+    parser.add_argument(
+        "inputs", nargs="+", help="WAV files or directories containing WAV files"
+    )
+    parser.add_argument(
+        "--access-key", help="Picovoice access key; enables the recall measurement"
+    )
+    parser.add_argument(
+        "--keyword-path",
+        type=Path,
+        default=default_keyword,
+        help="Porcupine keyword file",
+    )
+    parser.add_argument("--threshold-db", type=float, default=9.0)
+    parser.add_argument("--hangover", type=float, default=0.6)
+    parser.add_argument("--pre-roll", type=float, default=0.5)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    wav_files: List[Path] = []
+    for item in map(Path, args.inputs):
+        wav_files.extend(sorted(item.glob("*.wav")) if item.is_dir() else [item])
+
+    create_detector = None
+    if args.access_key:
+        import pvporcupine
+
+        def create_detector() -> Any:
+            return pvporcupine.create(
+                access_key=args.access_key, keyword_paths=[str(args.keyword_path)]
+            )
+
+    evaluation = evaluate_gate(
+        wav_files,
+        create_detector,
+        threshold_db=args.threshold_db,
+        hangover=args.hangover,
+        pre_roll=args.pre_roll,
+    )
+
+    if args.json:
+        print(json.dumps(evaluation.as_dict(), indent=2))
+        return
+    print(f"Files:            {len(evaluation.files)}")
+    print(
+        f"Frames skipped:   {evaluation.skipped_fraction:.1%} of {evaluation.frames_total}"
+    )
+    if evaluation.recall is not None:
+        print(
+            f"Wake word recall: {evaluation.recall:.1%} "
+            f"({evaluation.detections_kept}/{evaluation.detections_ungated})"
+        )
+    elif create_detector is not None:
+        print("Wake word recall: no detections without the gate")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
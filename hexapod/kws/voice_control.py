@@ -10,24 +10,30 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 import logging
 import threading
-import time
 from pathlib import Path
-import numpy as np
 import pyaudio
 import contextlib
 import os
 
 from picovoice import Picovoice
 
-from hexapod.kws import IntentDispatcher, Recorder
+from hexapod.kws import (
+    CaptureRing,
+    ChannelSelector,
+    IntentDispatcher,
+    Recorder,
+    VoiceActivityGate,
+)
 from hexapod.task_interface import TaskInterface
 from hexapod.lights import ColorRGB
 from hexapod.utils import rename_thread
 from hexapod.interface import get_custom_logger
 
 if TYPE_CHECKING:
-    from typing import Optional, Callable, Any, List
+    from typing import Optional, Callable, Any, List, Tuple
     from hexapod.task_interface.tasks import Task
+    from hexapod.task_interface import AudioDeviceLease
+    from hexapod.kws import CaptureHub
 
 # Configure logger
 logger = get_custom_logger("kws_logger")
@@ -44,7 +50,10 @@ class VoiceControl(threading.Thread):
     SAMPLE_RATE = 16000
     CHANNELS = 8
     CHUNK_SIZE = 512
+    CAPTURE_RING_BUFFERS = 64  # about 2 s of audio at 512 frames per buffer
     FORMAT = "paInt16"
+    AUDIO_CONSUMER = "voice_control"  # Name of the audio device lease
+    AUDIO_ACQUIRE_TIMEOUT = 10.0  # Max seconds to wait for ODAS to hand the device back
 
     def __init__(
         self,
@@ -57,6 +66,9 @@ class VoiceControl(threading.Thread):
         rhino_sensitivity: Optional[float] = None,
         print_context: bool = False,
         recordings_dir: Optional[Path] = None,
+        use_vad_gate: bool = False,
+        use_channel_selector: bool = False,
+        capture_hub: Optional[CaptureHub] = None,
     ) -> None:
         """
         Initialize the VoiceControl thread.
@@ -71,6 +83,14 @@ class VoiceControl(threading.Thread):
             rhino_sensitivity (float, optional): Sensitivity for intent recognition.
             print_context (bool): Whether to print context information.
             recordings_dir (Optional[Path]): Directory for saving recordings (default: data/audio/recordings)
+            use_vad_gate (bool): Only pass frames with voice activity to Picovoice
+                (default: False).
+            use_channel_selector (bool): Pass the best microphone, or a beam steered at
+                the last ODAS direction of arrival, to Picovoice instead of channel 0
+                (default: False).
+            capture_hub (Optional[CaptureHub]): Started capture hub to read the
+                microphone array from instead of opening it, so voice control keeps
+                listening while ODAS runs.
         """
         super().__init__(daemon=True)
         rename_thread(self, "VoiceControl")
@@ -100,6 +120,15 @@ class VoiceControl(threading.Thread):
         # Initialize audio recorder
         self.audio_recorder = Recorder(recordings_dir)
 
+        # Capture ring filled by the PyAudio callback, or shared by the capture hub, and
+        # read by Picovoice and the recorder
+        self.capture_hub = capture_hub
+        self.capture_ring: CaptureRing = (
+            capture_hub.ring
+            if capture_hub is not None
+            else CaptureRing(self.CHANNELS, self.CHUNK_SIZE, self.CAPTURE_RING_BUFFERS)
+        )
+
         # Determine device index: use external if specified, else auto-detect ReSpeaker 6
         auto_device_index = device_index
         if device_index is None or device_index == -1:
@@ -131,6 +160,22 @@ class VoiceControl(threading.Thread):
         # Store Picovoice frame length for audio processing
         self.frame_length = self.picovoice.frame_length
 
+        # Best microphone or beam passed to Picovoice, steered by ODAS when available
+        self.channel_selector: Optional[ChannelSelector] = (
+            ChannelSelector(
+                sample_rate=self.SAMPLE_RATE, frame_length=self.frame_length
+            )
+            if use_channel_selector
+            else None
+        )
+
+        # Voice-activity gate keeping silence and steady noise away from Porcupine
+        self.vad_gate: Optional[VoiceActivityGate] = (
+            VoiceActivityGate(self.SAMPLE_RATE, self.frame_length)
+            if use_vad_gate
+            else None
+        )
+
         self.context = self.picovoice.context_info
         self.task_interface.set_task_complete_callback(self.on_task_complete)
         # Task interface interrupted flag
@@ -146,6 +191,13 @@ class VoiceControl(threading.Thread):
         self.audio_thread: Optional[threading.Thread] = None
         self.audio_stop_event = threading.Event()
 
+        # The microphone array is leased through the task interface broker; a task
+        # that needs it wakes the control loop instead of waiting for its next poll
+        self.audio_device_broker = self.task_interface.audio_device_broker
+        self.audio_lease: Optional[AudioDeviceLease] = None
+        self._state_changed = threading.Event()
+        self.audio_device_broker.register(self.AUDIO_CONSUMER, self._state_changed.set)
+
         if self.print_context:
             self.print_context_info()
 
@@ -213,7 +265,15 @@ class VoiceControl(threading.Thread):
         return -1
 
     def _initialize_audio(self) -> None:
-        """Initialize PyAudio and audio stream."""
+        """Lease the audio device, then initialize PyAudio and audio stream."""
+        if self.capture_hub is not None:
+            # The hub process owns the device, only follow its ring again
+            self.capture_ring.open()
+            return
+
+        self.audio_lease = self.audio_device_broker.acquire(
+            self.AUDIO_CONSUMER, timeout=self.AUDIO_ACQUIRE_TIMEOUT, preempt=False
+        )
         try:
             # Suppress ALSA warnings by redirecting stderr at file descriptor level
             with self._suppress_alsa_warnings():
@@ -224,82 +284,122 @@ class VoiceControl(threading.Thread):
             )
             logger.info(f"Using audio device: {device_info['name']}")
 
-            frames_per_buffer = 512
-
-            # Open stream - use 8 channels for ReSpeaker, extract first channel for Picovoice
+            # Open stream in callback mode - use 8 channels for ReSpeaker, PortAudio
+            # delivers each buffer to the capture ring without a blocking read
+            self.capture_ring.open()
             self.audio_stream = self.pyaudio_instance.open(
-                rate=16000,
+                rate=self.SAMPLE_RATE,
                 format=pyaudio.paInt16,
-                channels=8,  # ReSpeaker has 8 channels
+                channels=self.CHANNELS,  # ReSpeaker has 8 channels
                 input=True,
                 input_device_index=self.device_index,
-                frames_per_buffer=frames_per_buffer,
+                frames_per_buffer=self.CHUNK_SIZE,
+                stream_callback=self._audio_callback,
             )
 
             logger.debug(
-                f"Audio stream opened successfully with frames_per_buffer={frames_per_buffer}"
+                f"Audio stream opened successfully with frames_per_buffer={self.CHUNK_SIZE}"
             )
 
         except Exception as e:
             logger.error(f"Failed to initialize audio: {e}")
+            self._release_audio_device()
             raise
 
+    def _release_audio_device(self) -> None:
+        """Hand the audio device back to the broker once the stream is closed."""
+        if self.audio_lease is not None:
+            self.audio_lease.release()
+            self.audio_lease = None
+
+    def _audio_callback(
+        self, in_data: bytes, frame_count: int, time_info: Any, status_flags: int
+    ) -> tuple:
+        """
+        PyAudio input callback storing each captured buffer in the capture ring.
+
+        Args:
+            in_data (bytes): Interleaved 8-channel audio.
+            frame_count (int): Number of frames in the buffer.
+            time_info (Any): Stream timing information.
+            status_flags (int): PortAudio input status flags.
+
+        Returns:
+            tuple: No output data and the flag to keep the stream running.
+        """
+        self.capture_ring.write(in_data, status_flags)
+        return None, pyaudio.paContinue
+
     def _audio_processor(self) -> None:
         """Process audio in separate thread."""
         logger.debug("Audio processing thread started")
 
+        # Each consumer follows the capture ring with its own cursor
+        picovoice_cursor = self.capture_ring.cursor("picovoice")
+        recorder_cursor = None
+
         try:
             while not self.audio_stop_event.is_set():
                 # Only process audio if not paused and resources are available
                 if (
-                    not self.pause_event.is_set()
-                    and self.audio_stream
-                    and self.picovoice
+                    self.pause_event.is_set()
+                    or not self.audio_stream
+                    or not self.picovoice
                 ):
-                    try:
-                        # Read audio data directly from PyAudio stream
-                        data = self.audio_stream.read(512, exception_on_overflow=False)
-
-                        # Store for recording if active
-                        if self.audio_recorder.is_recording:
-                            self.audio_recorder.add_audio_frame(data)
-
-                        # Convert to numpy array
-                        audio_array = np.frombuffer(data, dtype=np.int16)
-
-                        # Extract first channel for Picovoice (8-channel to single channel)
-                        if len(audio_array) >= 8:
-                            first_channel = audio_array[::8]  # Take first channel
-                        else:
-                            first_channel = audio_array
-
-                        # Process with Picovoice
-                        # If more data than Picovoice needs, process in chunks
-                        if len(first_channel) >= self.frame_length:
-                            # Process the exact frame length that Picovoice expects
-                            pcm_data = first_channel[: self.frame_length].astype(
-                                np.int16
+                    self.audio_stop_event.wait(0.01)
+                    continue
+
+                try:
+                    # Wait for the next Picovoice frame, shape (frame_length, 8)
+                    frames = picovoice_cursor.read(self.frame_length, timeout=0.1)
+                    if frames is None:
+                        continue
+
+                    # Store for recording if active
+                    if self.audio_recorder.is_recording:
+                        if recorder_cursor is None:
+                            recorder_cursor = self.capture_ring.cursor(
+                                "recorder",
+                                position=picovoice_cursor.position - len(frames),
                             )
-                            self.picovoice.process(pcm_data)
-                        else:
-                            # If we have less data, pad with zeros (shouldn't happen with 512 frames)
-                            pcm_data = np.zeros(self.frame_length, dtype=np.int16)
-                            pcm_data[: len(first_channel)] = first_channel.astype(
-                                np.int16
+                        while recorder_cursor.available >= self.CHUNK_SIZE:
+                            self.audio_recorder.add_audio_frame(
+                                recorder_cursor.read(self.CHUNK_SIZE, timeout=0)
                             )
-                            self.picovoice.process(pcm_data)
-                    except Exception as e:
-                        logger.error(f"Audio processing error: {e}")
-                        # Brief pause on error to prevent tight error loops
-                        time.sleep(0.01)
-                else:
-                    # If paused or resources not available, just sleep briefly
-                    time.sleep(0.01)
+                    elif recorder_cursor is not None:
+                        recorder_cursor.close()
+                        recorder_cursor = None
+
+                    # Process the selected microphone or beam; without a selector the
+                    # first channel, a strided view into the ring
+                    if self.channel_selector is None:
+                        pcm = frames[:, 0]
+                    else:
+                        pcm = self.channel_selector.process(frames)
+                    if self.vad_gate is None:
+                        self.picovoice.process(pcm)
+                    else:
+                        for gated_pcm in self.vad_gate.process(pcm):
+                            self.picovoice.process(gated_pcm)
+                except Exception as e:
+                    logger.error(f"Audio processing error: {e}")
+                    # Brief pause on error to prevent tight error loops
+                    self.audio_stop_event.wait(0.01)
 
         except Exception as e:
             logger.error(f"Audio processing thread error: {e}")
         finally:
-            logger.debug("Audio processing thread finished")
+            picovoice_cursor.close()
+            if recorder_cursor is not None:
+                recorder_cursor.close()
+            logger.debug(
+                f"Audio processing thread finished, capture stats: "
+                f"{self.capture_ring.stats()}"
+            )
+            if self.channel_selector is not None:
+                logger.debug(f"Channel selector stats: {self.channel_selector.stats()}")
+            if self.vad_gate is not None:
+                logger.debug(f"Voice-activity gate stats: {self.vad_gate.stats()}")
 
     def _cleanup_audio(self) -> None:
         """Clean up audio resources."""
@@ -308,6 +408,7 @@ class VoiceControl(threading.Thread):
             if self.audio_thread and self.audio_thread.is_alive():
                 logger.debug("Stopping audio processing thread")
                 self.audio_stop_event.set()
+                self.capture_ring.close()
                 self.audio_thread.join()
                 self.audio_thread = None
 
@@ -321,6 +422,7 @@ class VoiceControl(threading.Thread):
                     logger.warning(f"Error closing audio stream: {e}")
                 finally:
                     self.audio_stream = None
+            self._release_audio_device()
 
             if self.pyaudio_instance:
                 self.pyaudio_instance = None
@@ -341,6 +443,10 @@ class VoiceControl(threading.Thread):
         logger.user_info("[wake word]")
         self.task_interface.lights_handler.listen_intent()
 
+        # Rhino needs every frame, including the silence that ends the command
+        if self.vad_gate is not None:
+            self.vad_gate.hold_open()
+
         current_task = getattr(self.task_interface, "task", None)
         if current_task is not None:
             self.task_interface_interrupted = True
@@ -367,6 +473,9 @@ class VoiceControl(threading.Thread):
         }
         logger.user_info(f"Inference Result: {log_data}")
 
+        if self.vad_gate is not None:
+            self.vad_gate.release()
+
         if inference.is_understood:
             self.intent_dispatcher.dispatch(inference.intent, inference.slots)
         else:
@@ -447,7 +556,8 @@ class VoiceControl(threading.Thread):
 
                 # Main thread just handles pause/unpause logic
                 # Audio processing happens in separate thread
-                time.sleep(0.1)
+                self._state_changed.wait(0.1)
+                self._state_changed.clear()
 
         except Exception as e:
             logger.exception(f"Unexpected error: {e}")
@@ -458,6 +568,7 @@ class VoiceControl(threading.Thread):
                 self.audio_recorder.cleanup()
 
                 self._cleanup_audio()
+                self.audio_device_broker.unregister(self.AUDIO_CONSUMER)
                 if self.picovoice is not None:
                     self.picovoice.delete()
                     self.picovoice = None
@@ -476,6 +587,7 @@ class VoiceControl(threading.Thread):
             if self.audio_thread and self.audio_thread.is_alive():
                 logger.debug("Stopping audio processing thread")
                 self.audio_stop_event.set()
+                self.capture_ring.close()
                 self.audio_thread.join()
                 self.audio_thread = None
 
@@ -489,6 +601,8 @@ class VoiceControl(threading.Thread):
                     logger.warning(f"Error closing audio stream during pause: {e}")
                 finally:
                     self.audio_stream = None
+            # Hand the device over as soon as it is closed
+            self._release_audio_device()
 
             if self.pyaudio_instance:
                 try:
@@ -541,6 +655,10 @@ class VoiceControl(threading.Thread):
                     porcupine_sensitivity=self.porcupine_sensitivity,
                     rhino_sensitivity=self.rhino_sensitivity,
                 )
+            if self.vad_gate is not None:
+                self.vad_gate.reset()
+            if self.channel_selector is not None:
+                self.channel_selector.reset()
             self.pause_event.clear()
             logger.user_info("Voice control unpaused")
             self.task_interface.lights_handler.listen_wakeword()
@@ -579,6 +697,20 @@ class VoiceControl(threading.Thread):
         """
         return self.audio_recorder.get_recording_status()
 
+    def update_doa(self, dominant_source: Optional[Tuple[int, float]]) -> None:
+        """
+        Steer the microphone beam at the dominant ODAS sound source.
+
+        Matches the ODASDoASSLProcessor dominant source listener signature. When the
+        source is lost, the last direction is kept until it is too old to be used.
+
+        Args:
+            dominant_source (Optional[Tuple[int, float]]): (source ID, azimuth in
+                degrees), or None when no source is tracked.
+        """
+        if self.channel_selector is not None and dominant_source is not None:
+            self.channel_selector.steer(dominant_source[1])
+
     def stop(self) -> None:
         """Signal the thread to stop."""
         self.stop_event.set()
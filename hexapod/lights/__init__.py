@@ -1,5 +1,13 @@
 from .apa102 import APA102
 from .lights import ColorRGB, Lights
+from .compositor import LightsCompositor, LightsLayer
 from .lights_interaction_handler import LightsInteractionHandler
 
-__all__ = ["APA102", "ColorRGB", "Lights", "LightsInteractionHandler"]
+__all__ = [
+    "APA102",
+    "ColorRGB",
+    "Lights",
+    "LightsCompositor",
+    "LightsInteractionHandler",
+    "LightsLayer",
+]
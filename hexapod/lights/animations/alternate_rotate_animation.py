@@ -5,7 +5,8 @@ from hexapod.lights.animations import Animation
 from hexapod.lights import ColorRGB
 
 if TYPE_CHECKING:
-    from hexapod.lights import Lights
+    from typing import Generator, Optional, Tuple
+    from hexapod.lights import LightsLayer
 
 
 class AlternateRotateAnimation(Animation):
@@ -19,9 +20,11 @@ class AlternateRotateAnimation(Animation):
         positions (int): The number of positions to rotate.
     """
 
+    TABLE_PARAMS = ("color_even", "color_odd", "delay", "positions")
+
     def __init__(
         self,
-        lights: Lights,
+        lights: LightsLayer,
         color_even: ColorRGB = ColorRGB.INDIGO,
         color_odd: ColorRGB = ColorRGB.GOLDEN,
         delay: float = 0.25,
@@ -31,7 +34,7 @@ class AlternateRotateAnimation(Animation):
         Initialize the AlternateRotateAnimation object.
 
         Args:
-            lights (Lights): The Lights object to control the LEDs.
+            lights (LightsLayer): The layer the animation draws into.
             color_even (ColorRGB): The color for even indexed LEDs.
             color_odd (ColorRGB): The color for odd indexed LEDs.
             delay (float): The delay between rotations.
@@ -44,20 +47,32 @@ class AlternateRotateAnimation(Animation):
         self.positions: int = positions
 
     @override
-    def execute_animation(self) -> None:
+    def cycle(self) -> Tuple[int, Optional[int]]:
+        """
+        Return the step counts of the animation cycle for the frame table.
+
+        Returns:
+            Tuple[int, int]: One step per LED to fill the strip, then one rotation
+            around it.
+        """
+        return self.lights.num_led, self.lights.num_led
+
+    @override
+    def execute_animation(self) -> Generator[float, None, None]:
         """
         Run the animation logic.
+
+        Yields:
+            float: Seconds to wait before the next step.
         """
         for i in range(self.lights.num_led):
-            if self.stop_event.wait(self.delay):
-                return
+            yield self.delay
 
             color = self.color_even if i % 2 == 0 else self.color_odd
             self.lights.set_color(color, led_index=i)
 
         while not self.stop_event.is_set():
             for _ in range(self.positions):
-                if self.stop_event.wait(self.delay):
-                    return
+                yield self.delay
 
                 self.lights.rotate(1)
@@ -1,69 +1,138 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
 import logging
 import threading
 import abc
 
-from hexapod.lights import Lights
-from hexapod.utils import rename_thread
+from hexapod.lights.animations.frame_table import compile_frame_table
 from hexapod.interface import get_custom_logger
 
+if TYPE_CHECKING:
+    from typing import Optional, Generator, Tuple
+    from hexapod.lights import LightsLayer
+    from hexapod.lights.animations.frame_table import FrameTable
+
 logger = get_custom_logger("lights_logger")
 
 
-class Animation(threading.Thread, abc.ABC):
+class Animation(abc.ABC):
     """
-    Abstract base class for animations using Lights.
+    Abstract base class for animations played by the LightsCompositor.
+
+    An animation is a generator of frames: ``execute_animation`` draws into the
+    animation's layer and yields the seconds until its next step. The compositor
+    advances all running animations from its single render loop.
+
+    Deterministic animations list their constructor arguments in ``TABLE_PARAMS``
+    and return their step counts from ``cycle()``. They are then rendered once into
+    a cached FrameTable and played back from it instead of being drawn live.
 
     Attributes:
-        lights (Lights): The Lights object to control the LEDs.
+        lights (LightsLayer): The layer the animation draws into.
         stop_event (threading.Event): Event to signal the animation to stop.
     """
 
-    def __init__(self, lights: Lights) -> None:
+    # Constructor arguments identifying a frame table, or None to always draw live
+    TABLE_PARAMS: Optional[Tuple[str, ...]] = None
+
+    def __init__(self, lights: LightsLayer) -> None:
         """
-        Initialize the Animation thread and sets up necessary attributes.
+        Initialize the Animation and sets up necessary attributes.
 
         Args:
-            lights (Lights): The Lights object to control the LEDs.
+            lights (LightsLayer): The layer the animation draws into.
         """
-        super().__init__(daemon=True)
-        rename_thread(self, self.__class__.__name__)
-
-        self.lights: Lights = lights
+        self.lights: LightsLayer = lights
         self.stop_event: threading.Event = threading.Event()
+        self._steps: Optional[Generator[float, None, None]] = None
         logger.debug(f"{self.__class__.__name__} initialized successfully.")
 
+    @property
+    def is_running(self) -> bool:
+        """Return True while the animation has steps left and was not stopped."""
+        return self._steps is not None and not self.stop_event.is_set()
+
     def start(self) -> None:
         """
-        Start the animation in a separate thread.
-        Clears the stop event and initiates the thread's run method.
+        Prepare the animation for stepping.
+        Clears the stop event and creates the frame generator, playing back the
+        frame table if the animation has one.
         """
         self.stop_event.clear()
-        super().start()
+        table = self.frame_table()
+        if table is not None:
+            self._steps = table.play(self.lights)
+        else:
+            self._steps = self.execute_animation()
+
+    def cycle(self) -> Optional[Tuple[int, Optional[int]]]:
+        """
+        Return the step counts of the animation cycle for the frame table.
+
+        Returns:
+            Optional[Tuple[int, Optional[int]]]: Steps before the cycle starts and
+            steps in the cycle, None for the latter if the animation ends on its own;
+            None if the animation is drawn live.
+        """
+        return None
+
+    def frame_table(self) -> Optional[FrameTable]:
+        """
+        Return the cached frame table for the current parameters.
+
+        Returns:
+            Optional[FrameTable]: The table, or None if the animation is drawn live.
+        """
+        if self.TABLE_PARAMS is None:
+            return None
+        params = tuple((name, getattr(self, name)) for name in self.TABLE_PARAMS)
+        return compile_frame_table(type(self), self.lights.num_led, params)
+
+    def step(self) -> Optional[float]:
+        """
+        Advance the animation by one step.
+
+        Returns:
+            Optional[float]: Seconds until the next step, or None once the animation
+            finished or was stopped.
+        """
+        if self._steps is None or self.stop_event.is_set():
+            return None
+        try:
+            return next(self._steps)
+        except StopIteration:
+            self._steps = None
+            return None
 
     def run(self) -> None:
         """
-        Execute the animation.
+        Play the animation on the calling thread until it finishes or is stopped.
+
+        Waits on the stop event between steps; used where no compositor renders the
+        layer, e.g. to test an animation on its own.
         """
-        self.execute_animation()
+        for delay in self.execute_animation():
+            if self.stop_event.wait(delay):
+                return
 
     @abc.abstractmethod
-    def execute_animation(self) -> None:
+    def execute_animation(self) -> Generator[float, None, None]:
         """
         Execute the animation logic.
 
         This method should be overridden by subclasses to define specific animation behaviors.
+
+        Yields:
+            float: Seconds to wait before the next step.
         """
         pass
 
     def stop_animation(self) -> None:
         """
-        Signals the animation to stop and joins the thread.
+        Signals the animation to stop.
 
-        Sets the stop_event to notify the thread to terminate.
-        If the thread is alive, it forcefully stops the thread.
+        The compositor stops stepping it on its next tick.
         """
         logger.debug(f"Stopping animation: {self.__class__.__name__}")
         self.stop_event.set()
-        if self.is_alive():
-            logger.debug(f"Animation {self.__class__.__name__} forcefully stopping.")
-            self.join()
+        self._steps = None
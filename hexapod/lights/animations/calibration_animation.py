@@ -5,8 +5,8 @@ from hexapod.lights.animations import Animation
 from hexapod.lights import ColorRGB
 
 if TYPE_CHECKING:
-    from typing import Dict
-    from hexapod.lights import Lights
+    from typing import Dict, Generator
+    from hexapod.lights import LightsLayer
 
 
 class CalibrationAnimation(Animation):
@@ -21,7 +21,7 @@ class CalibrationAnimation(Animation):
 
     def __init__(
         self,
-        lights: Lights,
+        lights: LightsLayer,
         calibration_status: Dict[int, str],
         leg_to_led: Dict[int, int],
         refresh_delay: float = 1.0,
@@ -30,7 +30,7 @@ class CalibrationAnimation(Animation):
         Initialize the CalibrationAnimation.
 
         Args:
-            lights (Lights): The Lights object to control the LEDs.
+            lights (LightsLayer): The layer the animation draws into.
             calibration_status (Dict[int, str]): Current calibration status of each leg.
             leg_to_led (Dict[int, int]): Mapping from leg indices to LED indices.
             refresh_delay (float): The interval between updates.
@@ -41,9 +41,12 @@ class CalibrationAnimation(Animation):
         self.refresh_delay: float = refresh_delay
 
     @override
-    def execute_animation(self) -> None:
+    def execute_animation(self) -> Generator[float, None, None]:
         """
         Run the animation logic.
+
+        Yields:
+            float: Seconds to wait before the next step.
         """
         while not self.stop_event.is_set():
             status_color_map = {
@@ -59,5 +62,4 @@ class CalibrationAnimation(Animation):
                 if color is None:
                     raise ValueError(f"Invalid calibration status: {status}")
                 self.lights.set_color(color, led_index=led_index)
-            if self.stop_event.wait(self.refresh_delay):
-                return
+            yield self.refresh_delay
@@ -1,13 +1,40 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, override, Optional
+from functools import lru_cache
 import math
 
 from hexapod.lights.animations import Animation
 from hexapod.lights import ColorRGB
+from hexapod.utils import LatestValue
 
 if TYPE_CHECKING:
-    from typing import Dict
-    from hexapod.lights import Lights
+    from typing import Dict, Generator, Tuple, FrozenSet
+    from hexapod.lights import LightsLayer
+
+AZIMUTH_STEPS: int = 360  # Entries of the azimuth to LED table, one per degree
+
+
+@lru_cache(maxsize=None)
+def azimuth_led_table(num_led: int) -> Tuple[FrozenSet[int], ...]:
+    """
+    Return the LEDs lit for each whole degree of azimuth.
+
+    Args:
+        num_led (int): The number of LEDs in the ring.
+
+    Returns:
+        Tuple[FrozenSet[int], ...]: For each degree 0-359, the main LED facing the
+        direction and its two neighbours.
+    """
+    table = []
+    for degree in range(AZIMUTH_STEPS):
+        # Adjust angle to match hexapod orientation (front at pi/2)
+        angle = (math.pi / 2 - math.radians(degree)) % (2 * math.pi)
+        main_index = int((angle / (2 * math.pi)) * num_led) % num_led
+        left_index = (main_index - 1) % num_led
+        right_index = (main_index + 1) % num_led
+        table.append(frozenset((main_index, left_index, right_index)))
+    return tuple(table)
 
 
 class DirectionOfArrivalAnimation(Animation):
@@ -15,16 +42,24 @@ class DirectionOfArrivalAnimation(Animation):
     Animation that visualizes Direction of Arrival (DoA) data using LEDs.
     The LEDs light up based on the calculated direction of sound sources.
     Each source (up to 4) gets a different color to distinguish between multiple sources.
+    LEDs away from the sources stay transparent, so the animation can be stacked as an
+    overlay on top of another animation.
+
+    The azimuths are read from a LatestValue slot the ODAS processor publishes into,
+    so the processor never calls into the animation. Azimuths are quantized to whole
+    degrees and mapped to LEDs through a precomputed table; the layer is repainted
+    only when the resulting LED assignment changes.
 
     Attributes:
         base_color (ColorRGB): The default color for active sound sources.
         refresh_delay (float): The interval between updates.
         source_colors (list[ColorRGB]): List of distinct colors for different sources.
+        sources (LatestValue): Slot holding the tracked source azimuths (degrees).
     """
 
     def __init__(
         self,
-        lights: Lights,
+        lights: LightsLayer,
         refresh_delay: float = 0.1,
         source_colors: list[ColorRGB] = [
             ColorRGB.TEAL,  # First source
@@ -32,21 +67,34 @@ class DirectionOfArrivalAnimation(Animation):
             ColorRGB.YELLOW,  # Third source
             ColorRGB.LIME,  # Fourth source
         ],
+        sources: Optional[LatestValue] = None,
     ) -> None:
         """
         Initialize the DirectionOfArrivalAnimation object.
 
         Args:
-            lights (Lights): The Lights object to control the LEDs.
+            lights (LightsLayer): The layer the animation draws into.
             refresh_delay (float): The interval between updates.
             source_colors (list[ColorRGB]): List of colors for different sound sources.
                 Defaults to [TEAL, INDIGO, YELLOW, LIME].
+            sources (LatestValue, optional): Slot publishing the tracked source
+                azimuths. A new empty slot is used if not given.
         """
         super().__init__(lights)
         self.refresh_delay: float = refresh_delay
         self.tracked_sources: Dict[int, Dict] = {}
         self.active_leds: set[int] = set()  # Keep track of currently lit LEDs
         self.source_colors: list[ColorRGB] = source_colors
+        self.sources: LatestValue = sources if sources is not None else LatestValue({})
+
+    @property
+    def azimuths(self) -> Dict[int, float]:
+        """The most recently published source azimuths (degrees)."""
+        return self.sources.value or {}
+
+    @azimuths.setter
+    def azimuths(self, azimuths: Dict[int, float]) -> None:
+        self.sources.publish(azimuths)
 
     def update_sources(self, azimuths: Dict[int, float]) -> None:
         """
@@ -55,52 +103,63 @@ class DirectionOfArrivalAnimation(Animation):
         Args:
             azimuths (Dict[int, float]): Dictionary of tracked sound sources with their azimuths (degrees).
         """
-        self.azimuths = azimuths
+        self.sources.publish(azimuths)
 
     def _get_led_indices_from_azimuth(self, azimuth: float) -> set[int]:
         """
         Convert azimuth (degrees) to a set of LED indices, including adjacent LEDs.
 
         Args:
-            azimuth (float): Azimuth angle in degrees (0-360).
+            azimuth (float): Azimuth angle in degrees, rounded to a whole degree.
 
         Returns:
             set[int]: Set of LED indices to light up (main direction and adjacent LEDs).
         """
-        angle = math.radians(azimuth)
-        # Adjust angle to match hexapod orientation (front at pi/2)
-        angle = (math.pi / 2 - angle) % (2 * math.pi)
-        main_index = int((angle / (2 * math.pi)) * self.lights.num_led)
-        left_index = (main_index - 1) % self.lights.num_led
-        right_index = (main_index + 1) % self.lights.num_led
-        return {main_index, left_index, right_index}
+        table = azimuth_led_table(self.lights.num_led)
+        return set(table[round(azimuth) % AZIMUTH_STEPS])
+
+    def _assign_leds(self, azimuths: Dict[int, float]) -> Dict[int, ColorRGB]:
+        """
+        Map each LED lit by the sources to the color of its source.
+
+        Args:
+            azimuths (Dict[int, float]): Source azimuths (degrees).
+
+        Returns:
+            Dict[int, ColorRGB]: Color of each lit LED; later sources win on overlap.
+        """
+        table = azimuth_led_table(self.lights.num_led)
+        assignment: Dict[int, ColorRGB] = {}
+        for i, azimuth in enumerate(azimuths.values()):
+            # Get color for this source (cycle through colors if more than 4 sources)
+            color = self.source_colors[i % len(self.source_colors)]
+            for led_index in table[round(azimuth) % AZIMUTH_STEPS]:
+                assignment[led_index] = color
+        return assignment
 
     @override
-    def execute_animation(self) -> None:
+    def execute_animation(self) -> Generator[float, None, None]:
         """
         Run the animation logic.
+
+        Yields:
+            float: Seconds to wait before the next step.
         """
+        seen_version: Optional[int] = None
+        painted: Optional[Dict[int, ColorRGB]] = None
         while not self.stop_event.is_set():
-            # Clear all LEDs first
-            self.lights.clear()
-
-            # Keep track of currently active LEDs
-            current_active_leds: set[int] = set()
-
-            # Light up LEDs for tracked sources
-            for i, (source_id, azimuth) in enumerate(
-                getattr(self, "azimuths", {}).items()
-            ):
-                # Get color for this source (cycle through colors if more than 4 sources)
-                color = self.source_colors[i % len(self.source_colors)]
-                led_indices = self._get_led_indices_from_azimuth(azimuth)
-                for led_index in led_indices:
-                    self.lights.set_color(color, led_index=led_index)
-                    current_active_leds.add(led_index)
-
-            # Update the set of active LEDs
-            self.active_leds = current_active_leds
+            version, azimuths = self.sources.read()
+            if version != seen_version:
+                seen_version = version
+                assignment = self._assign_leds(azimuths or {})
+
+                # Repaint only when the sources moved to other LEDs
+                if assignment != painted:
+                    self.lights.clear()
+                    for led_index, color in assignment.items():
+                        self.lights.set_color(color, led_index=led_index)
+                    painted = assignment
+                    self.active_leds = set(assignment)
 
             # Wait for the next update
-            if self.stop_event.wait(self.refresh_delay):
-                return
+            yield self.refresh_delay
@@ -0,0 +1,140 @@
+"""
+Precomputed frame tables for deterministic animations.
+
+Pulses, wheels and rotations draw the same frames over and over, recomputing color
+interpolations and wheel colors on every step. An animation that declares its cycle
+is instead rendered once into a ``FrameTable``: its own ``execute_animation`` is run
+on a scratch layer and the pixels and delay of every step are recorded, so playback
+draws exactly the frames the live animation would. Playback only loads a recorded
+row into the animation's layer, which makes the per-step cost constant.
+
+Tables are cached per animation class, parameter set and LED count with LRU
+eviction, so restarting an animation, or playing one with the same parameters again,
+reuses the table.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from functools import lru_cache
+
+from hexapod.lights.compositor import LightsLayer
+
+if TYPE_CHECKING:
+    from typing import Optional, Tuple, Type, Any, Generator
+    from hexapod.lights.animations import Animation
+
+    RGB = Tuple[int, int, int]
+    Row = Tuple[Optional[RGB], ...]
+
+FRAME_TABLE_CACHE_SIZE: int = 32  # Parameter sets kept compiled
+MAX_TABLE_STEPS: int = 4096  # Guards against animations that never end their cycle
+
+
+@dataclass(frozen=True)
+class FrameTable:
+    """
+    Recorded steps of an animation.
+
+    Attributes:
+        rows (Tuple[Row, ...]): Pixels of the layer at each step, None for transparent.
+        delays (Tuple[Optional[float], ...]): Seconds until the next step, None for
+            the final frame of an animation that ends.
+        loop_start (Optional[int]): Step the playback returns to after the last one,
+            or None if the animation ends.
+    """
+
+    rows: Tuple[Row, ...]
+    delays: Tuple[Optional[float], ...]
+    loop_start: Optional[int]
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def play(self, layer: LightsLayer) -> Generator[float, None, None]:
+        """
+        Load the recorded frames into a layer, step by step.
+
+        Args:
+            layer (LightsLayer): The layer to draw into.
+
+        Yields:
+            float: Seconds to wait before the next step.
+        """
+        step = 0
+        while step < len(self.rows):
+            layer.load(self.rows[step])
+            delay = self.delays[step]
+            if delay is None:
+                return
+            yield delay
+            step += 1
+            if step == len(self.rows) and self.loop_start is not None:
+                step = self.loop_start
+
+
+def record_frame_table(animation: Animation) -> FrameTable:
+    """
+    Run an animation on its own layer and record one cycle of it.
+
+    The animation must be freshly created and drawing into a layer that is not
+    shown; its steps are consumed.
+
+    Args:
+        animation (Animation): Animation declaring its cycle.
+
+    Returns:
+        FrameTable: The recorded steps.
+
+    Raises:
+        ValueError: If the animation declares no cycle or does not end within
+            MAX_TABLE_STEPS steps.
+    """
+    cycle = animation.cycle()
+    if cycle is None:
+        raise ValueError(f"{animation.__class__.__name__} does not declare a cycle.")
+    intro, loop = cycle
+    total = intro + loop if loop is not None else MAX_TABLE_STEPS
+
+    layer = animation.lights
+    rows, delays = [], []
+    steps = animation.execute_animation()
+    for delay in steps:
+        rows.append(tuple(layer.pixels))
+        delays.append(delay)
+        if len(rows) == total:
+            break
+    else:
+        # The animation ended; its last drawing stays shown
+        rows.append(tuple(layer.pixels))
+        delays.append(None)
+        loop = None
+    steps.close()
+
+    if loop is None and delays[-1] is not None:
+        raise ValueError(
+            f"{animation.__class__.__name__} did not end within {MAX_TABLE_STEPS} steps."
+        )
+    return FrameTable(tuple(rows), tuple(delays), intro if loop else None)
+
+
+@lru_cache(maxsize=FRAME_TABLE_CACHE_SIZE)
+def compile_frame_table(
+    animation_class: Type[Animation],
+    num_led: int,
+    params: Tuple[Tuple[str, Any], ...],
+) -> FrameTable:
+    """
+    Return the frame table of an animation, recording it on first use.
+
+    Args:
+        animation_class (Type[Animation]): Class of the animation.
+        num_led (int): The number of LEDs.
+        params (Tuple[Tuple[str, Any], ...]): Constructor arguments as hashable
+            (name, value) pairs.
+
+    Returns:
+        FrameTable: The cached table.
+    """
+    animation = animation_class(LightsLayer(num_led), **dict(params))
+    return record_frame_table(animation)
@@ -5,7 +5,8 @@ from hexapod.lights.animations import Animation
 from hexapod.lights import ColorRGB
 
 if TYPE_CHECKING:
-    from hexapod.lights import Lights
+    from typing import Generator, Optional, Tuple
+    from hexapod.lights import LightsLayer
 
 
 class OppositeRotateAnimation(Animation):
@@ -24,15 +25,19 @@ class OppositeRotateAnimation(Animation):
 
     FORWARD: int = 1
     BACKWARD: int = -1
+    TABLE_PARAMS = ("interval", "color")
 
     def __init__(
-        self, lights: Lights, interval: float = 0.1, color: ColorRGB = ColorRGB.WHITE
+        self,
+        lights: LightsLayer,
+        interval: float = 0.1,
+        color: ColorRGB = ColorRGB.WHITE,
     ) -> None:
         """
         Initialize the OppositeRotateAnimation object.
 
         Args:
-            lights (Lights): The Lights object to control the LEDs.
+            lights (LightsLayer): The layer the animation draws into.
             interval (float): Time interval between LED updates.
             color (ColorRGB): ColorRGB of the LEDs.
         """
@@ -42,16 +47,30 @@ class OppositeRotateAnimation(Animation):
         self.direction: int = self.FORWARD
 
     @override
-    def execute_animation(self) -> None:
+    def cycle(self) -> Tuple[int, Optional[int]]:
+        """
+        Return the step counts of the animation cycle for the frame table.
+
+        Returns:
+            Tuple[int, int]: One step before the first LED, then two sweeps, one in
+            each direction, that bring the LEDs back to the start.
+        """
+        sweep_steps = (self.lights.num_led + 1) // 2 + 1
+        return 1, 2 * sweep_steps
+
+    @override
+    def execute_animation(self) -> Generator[float, None, None]:
         """
         Run the animation logic.
+
+        Yields:
+            float: Seconds to wait before the next step.
         """
         num_leds = self.lights.num_led
         start_index = 0
         while not self.stop_event.is_set():
             # Light up the starting LED
-            if self.stop_event.wait(self.interval):
-                return
+            yield self.interval
 
             self.lights.clear()
             self.lights.set_color(self.color, led_index=start_index)
@@ -59,8 +78,7 @@ class OppositeRotateAnimation(Animation):
             # Fork into two LEDs moving in opposite directions
             max_offset = (num_leds + 1) // 2  # Handles even and odd numbers of LEDs
             for offset in range(1, max_offset):
-                if self.stop_event.wait(self.interval):
-                    return
+                yield self.interval
 
                 index1 = (start_index + offset * self.direction) % num_leds
                 index2 = (start_index - offset * self.direction) % num_leds
@@ -74,8 +92,7 @@ class OppositeRotateAnimation(Animation):
             self.lights.clear()
             self.lights.set_color(self.color, led_index=end_index)
 
-            if self.stop_event.wait(self.interval):
-                return
+            yield self.interval
 
             # Switch direction and update starting index
             self.direction = (
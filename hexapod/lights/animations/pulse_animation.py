@@ -5,7 +5,8 @@ from hexapod.lights.animations import Animation
 from hexapod.lights import ColorRGB
 
 if TYPE_CHECKING:
-    from hexapod.lights import Lights
+    from typing import Generator, Optional, Tuple
+    from hexapod.lights import LightsLayer
 
 
 class PulseAnimation(Animation):
@@ -18,9 +19,11 @@ class PulseAnimation(Animation):
         pulse_speed (float): The speed of the pulse.
     """
 
+    TABLE_PARAMS = ("base_color", "pulse_color", "pulse_speed")
+
     def __init__(
         self,
-        lights: Lights,
+        lights: LightsLayer,
         base_color: ColorRGB = ColorRGB.BLUE,
         pulse_color: ColorRGB = ColorRGB.RED,
         pulse_speed: float = 0.3,
@@ -29,7 +32,7 @@ class PulseAnimation(Animation):
         Initialize the PulseAnimation object.
 
         Args:
-            lights (Lights): The Lights object to control the LEDs.
+            lights (LightsLayer): The layer the animation draws into.
             base_color (ColorRGB): The base color.
             pulse_color (ColorRGB): The pulse color.
             pulse_speed (float): The speed of the pulse.
@@ -40,17 +43,28 @@ class PulseAnimation(Animation):
         self.pulse_speed: float = pulse_speed
 
     @override
-    def execute_animation(self) -> None:
+    def cycle(self) -> Tuple[int, Optional[int]]:
+        """
+        Return the step counts of the animation cycle for the frame table.
+
+        Returns:
+            Tuple[int, int]: One step before the first color, then base and pulse color.
+        """
+        return 1, 2
+
+    @override
+    def execute_animation(self) -> Generator[float, None, None]:
         """
         Run the animation logic.
+
+        Yields:
+            float: Seconds to wait before the next step.
         """
         while not self.stop_event.is_set():
-            if self.stop_event.wait(self.pulse_speed):
-                return
+            yield self.pulse_speed
 
             self.lights.set_color(self.base_color)
 
-            if self.stop_event.wait(self.pulse_speed):
-                return
+            yield self.pulse_speed
 
             self.lights.set_color(self.pulse_color)
@@ -5,7 +5,8 @@ from hexapod.lights.animations import Animation
 from hexapod.lights import ColorRGB
 
 if TYPE_CHECKING:
-    from hexapod.lights import Lights
+    from typing import Generator, Optional, Tuple
+    from hexapod.lights import LightsLayer
 
 
 class PulseSmoothlyAnimation(Animation):
@@ -18,9 +19,11 @@ class PulseSmoothlyAnimation(Animation):
         pulse_speed (float): The speed of the pulse.
     """
 
+    TABLE_PARAMS = ("base_color", "pulse_color", "pulse_speed")
+
     def __init__(
         self,
-        lights: Lights,
+        lights: LightsLayer,
         base_color: ColorRGB = ColorRGB.BLUE,
         pulse_color: ColorRGB = ColorRGB.GREEN,
         pulse_speed: float = 0.05,
@@ -29,7 +32,7 @@ class PulseSmoothlyAnimation(Animation):
         Initialize the PulseSmoothlyAnimation object.
 
         Args:
-            lights (Lights): The Lights object to control the LEDs.
+            lights (LightsLayer): The layer the animation draws into.
             base_color (ColorRGB): The base color.
             pulse_color (ColorRGB): The pulse color.
             pulse_speed (float): The speed of the pulse.
@@ -40,16 +43,29 @@ class PulseSmoothlyAnimation(Animation):
         self.pulse_speed: float = pulse_speed
 
     @override
-    def execute_animation(self) -> None:
+    def cycle(self) -> Tuple[int, Optional[int]]:
+        """
+        Return the step counts of the animation cycle for the frame table.
+
+        Returns:
+            Tuple[int, int]: One step before the first color, then 20 steps towards
+            the pulse color and 20 back.
+        """
+        return 1, 40
+
+    @override
+    def execute_animation(self) -> Generator[float, None, None]:
         """
         Run the animation logic.
+
+        Yields:
+            float: Seconds to wait before the next step.
         """
         base_rgb = self.base_color.rgb
         pulse_rgb = self.pulse_color.rgb
         while not self.stop_event.is_set():
             for i in range(0, 100, 5):
-                if self.stop_event.wait(self.pulse_speed):
-                    return
+                yield self.pulse_speed
 
                 interp_rgb = (
                     int(base_rgb[0] + (pulse_rgb[0] - base_rgb[0]) * i / 100),
@@ -59,8 +75,7 @@ class PulseSmoothlyAnimation(Animation):
                 self.lights.set_color_rgb(interp_rgb)
 
             for i in range(100, 0, -5):
-                if self.stop_event.wait(self.pulse_speed):
-                    return
+                yield self.pulse_speed
 
                 interp_rgb = (
                     int(base_rgb[0] + (pulse_rgb[0] - base_rgb[0]) * i / 100),
@@ -8,7 +8,8 @@ from hexapod.interface import get_custom_logger
 
 if TYPE_CHECKING:
     from typing import Optional
-    from hexapod.lights import Lights
+    from typing import Generator, Optional, Tuple
+    from hexapod.lights import LightsLayer
 
 logger = get_custom_logger("lights_logger")
 
@@ -23,9 +24,11 @@ class WheelAnimation(Animation):
         interval (float): The interval between changing colors.
     """
 
+    TABLE_PARAMS = ("use_rainbow", "color", "interval")
+
     def __init__(
         self,
-        lights: Lights,
+        lights: LightsLayer,
         use_rainbow: bool = True,
         color: Optional[ColorRGB] = None,
         interval: float = 0.2,
@@ -34,7 +37,7 @@ class WheelAnimation(Animation):
         Initialize the WheelAnimation object.
 
         Args:
-            lights (Lights): The Lights object to control the LEDs.
+            lights (LightsLayer): The layer the animation draws into.
             use_rainbow (bool): Whether to use rainbow colors.
             color (Optional[ColorRGB]): The color to use if not using rainbow colors.
             interval (float): The interval between changing colors.
@@ -51,14 +54,26 @@ class WheelAnimation(Animation):
         self.interval: float = interval
 
     @override
-    def execute_animation(self) -> None:
+    def cycle(self) -> Tuple[int, Optional[int]]:
+        """
+        Return the step counts of the animation cycle for the frame table.
+
+        Returns:
+            Tuple[int, int]: One step before the first LED, then one per LED.
+        """
+        return 1, self.lights.num_led
+
+    @override
+    def execute_animation(self) -> Generator[float, None, None]:
         """
         Run the animation logic.
+
+        Yields:
+            float: Seconds to wait before the next step.
         """
         while not self.stop_event.is_set():
             for i in range(self.lights.num_led):
-                if self.stop_event.wait(self.interval):
-                    return
+                yield self.interval
 
                 if self.use_rainbow:
                     rgb = self.lights.get_wheel_color(
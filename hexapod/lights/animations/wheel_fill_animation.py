@@ -8,7 +8,8 @@ from hexapod.interface import get_custom_logger
 
 if TYPE_CHECKING:
     from typing import Optional
-    from hexapod.lights import Lights
+    from typing import Generator, Optional, Tuple
+    from hexapod.lights import LightsLayer
 
 logger = get_custom_logger("lights_logger")
 
@@ -23,9 +24,11 @@ class WheelFillAnimation(Animation):
         interval (float): The interval between filling LEDs.
     """
 
+    TABLE_PARAMS = ("use_rainbow", "color", "interval")
+
     def __init__(
         self,
-        lights: Lights,
+        lights: LightsLayer,
         use_rainbow: bool = True,
         color: Optional[ColorRGB] = None,
         interval: float = 1,
@@ -34,7 +37,7 @@ class WheelFillAnimation(Animation):
         Initialize the WheelFillAnimation object.
 
         Args:
-            lights (Lights): The Lights object to control the LEDs.
+            lights (LightsLayer): The layer the animation draws into.
             use_rainbow (bool): Whether to use rainbow colors.
             color (Optional[ColorRGB]): The color to use if not using rainbow colors.
             interval (float): The interval between filling LEDs.
@@ -51,13 +54,25 @@ class WheelFillAnimation(Animation):
         self.interval: float = interval
 
     @override
-    def execute_animation(self) -> None:
+    def cycle(self) -> Tuple[int, Optional[int]]:
+        """
+        Return the step counts of the animation cycle for the frame table.
+
+        Returns:
+            Tuple[int, None]: One step per LED; the fill ends on its own.
+        """
+        return self.lights.num_led, None
+
+    @override
+    def execute_animation(self) -> Generator[float, None, None]:
         """
         Run the animation logic.
+
+        Yields:
+            float: Seconds to wait before the next step.
         """
         for i in range(self.lights.num_led):
-            if self.stop_event.wait(self.interval):
-                return
+            yield self.interval
 
             if self.use_rainbow:
                 rgb = self.lights.get_wheel_color(int(256 / self.lights.num_led * i))
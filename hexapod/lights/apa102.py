@@ -10,7 +10,8 @@ Features:
 - Global and per-pixel brightness control
 - Multiple color channel orderings (RGB, RBG, GRB, etc.)
 - Color wheel functionality for smooth transitions
-- Efficient SPI communication with hardware acceleration
+- Vectorized updates of many pixels at once
+- One SPI transfer per frame, skipped when the frame did not change
 
 Hardware Requirements:
 - Raspberry Pi or compatible single-board computer
@@ -19,6 +20,7 @@ Hardware Requirements:
 
 Dependencies:
 - spidev: For SPI communication (Linux only)
+- numpy: For vectorized pixel updates
 - math: For brightness calculations
 """
 
@@ -26,10 +28,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from math import ceil
 
+import numpy as np
 import spidev
 
 if TYPE_CHECKING:
-    import List, Union
+    from typing import List, Optional, Sequence, Union
 
 RGB_MAP = {
     "rgb": [3, 2, 1],
@@ -48,6 +51,7 @@ class APA102:
     Public methods are:
      - set_pixel
      - set_pixel_rgb
+     - set_pixels
      - show
      - clear_strip
      - cleanup
@@ -132,7 +136,19 @@ class APA102:
         # Limit the brightness to the maximum if it's set higher
         self.global_brightness: int = min(global_brightness, self.MAX_BRIGHTNESS)
 
-        self.leds: List[int] = [self.LED_START, 0, 0, 0] * self.num_led  # Pixel buffer
+        # Pixel buffer of 4 bytes per LED, with a NumPy view for vectorized updates
+        self.leds: bytearray = bytearray([self.LED_START, 0, 0, 0] * self.num_led)
+        self.pixels: np.ndarray = np.frombuffer(self.leds, dtype=np.uint8).reshape(
+            self.num_led, 4
+        )
+        # Column of each pixel byte holding red, green and blue
+        self._channels: np.ndarray = np.array(self.rgb)
+        # Pixel bytes 1-3 as indices into (red, green, blue)
+        self._byte_order: List[int] = [self.rgb.index(i) for i in (1, 2, 3)]
+        self._start_frame: bytes = bytes(4)
+        # At least num_led/2 extra clock cycles for the data to reach the last LED
+        self._end_frame: bytes = b"\xff" * max(4, (self.num_led + 15) // 16)
+        self._shown: Optional[bytes] = None  # LED data of the last transfer
         if spidev is None:
             raise ImportError("spidev module is required but not available")
         self.spi = spidev.SpiDev()  # Init the SPI device
@@ -186,8 +202,7 @@ class APA102:
     def clear_strip(self) -> None:
         """Turns off the strip and shows the result right away."""
 
-        for led in range(self.num_led):
-            self.set_pixel(led, 0, 0, 0)
+        self.set_pixels(range(self.num_led), (0, 0, 0))
         self.show()
 
     def set_pixel(
@@ -209,29 +224,77 @@ class APA102:
         Raises:
             ValueError: If color values are not integers between 0 and 255.
         """
-        if not all(
-            isinstance(val, int) and 0 <= val <= 255 for val in [red, green, blue]
-        ):
-            raise ValueError("red, green, and blue must be integers between 0 and 255.")
+        color = (red, green, blue)
+        try:
+            # bytes() rejects anything but integers between 0 and 255
+            channels = bytes(color[i] for i in self._byte_order)
+        except (TypeError, ValueError):
+            raise ValueError(
+                "red, green, and blue must be integers between 0 and 255."
+            ) from None
 
         if led_num < 0:
             return  # Pixel is invisible, so ignore
         if led_num >= self.num_led:
             return  # again, invisible
 
+        start_index = 4 * led_num
+        self.leds[start_index] = self._led_start(bright_percent)
+        self.leds[start_index + 1 : start_index + 4] = channels
+
+    def set_pixels(
+        self,
+        indices: Union[Sequence[int], np.ndarray],
+        rgb_array: Union[Sequence[Sequence[int]], np.ndarray],
+        bright_percent: int = 100,
+    ) -> None:
+        """Set the color of many pixels at once.
+
+        The vectorized counterpart of set_pixel: the pixels are only written to the
+        pixel buffer and indices outside the strip are ignored.
+
+        Args:
+            indices (Sequence[int] | np.ndarray): LED indices (0-based).
+            rgb_array (Sequence[Sequence[int]] | np.ndarray): One (red, green, blue)
+                row per index, or a single color for all of them.
+            bright_percent (int, optional): Brightness percentage (0-100). Defaults to 100.
+
+        Raises:
+            ValueError: If color values are not integers between 0 and 255, or the
+                colors do not match the indices.
+        """
+        indices = np.asarray(indices, dtype=np.intp).reshape(-1)
+        rgb = np.asarray(rgb_array)
+        if rgb.size and (
+            not np.issubdtype(rgb.dtype, np.integer) or rgb.min() < 0 or rgb.max() > 255
+        ):
+            raise ValueError("red, green, and blue must be integers between 0 and 255.")
+        try:
+            rgb = np.broadcast_to(rgb, (len(indices), 3))
+        except ValueError:
+            raise ValueError(
+                f"Expected one RGB color or {len(indices)} of them, got shape {rgb.shape}."
+            ) from None
+
+        visible = (indices >= 0) & (indices < self.num_led)
+        rows = indices[visible]
+        self.pixels[rows, 0] = self._led_start(bright_percent)
+        self.pixels[rows[:, None], self._channels] = rgb[visible]
+
+    def _led_start(self, bright_percent: int) -> int:
+        """Return the first byte of an LED frame for a brightness percentage.
+
+        Args:
+            bright_percent (int): Brightness percentage (0-100).
+
+        Returns:
+            int: Three "1" bits followed by the 5 brightness bits.
+        """
         # Calculate pixel brightness as a percentage of the
         # defined global_brightness. Round up to nearest integer
         # as we expect some brightness unless set to 0
         brightness = int(ceil(bright_percent * self.global_brightness / 100.0))
-
-        # LED startframe is three "1" bits, followed by 5 brightness bits
-        ledstart = (brightness & 0b00011111) | self.LED_START
-
-        start_index = 4 * led_num
-        self.leds[start_index] = ledstart
-        self.leds[start_index + self.rgb[0]] = red
-        self.leds[start_index + self.rgb[1]] = green
-        self.leds[start_index + self.rgb[2]] = blue
+        return (brightness & 0b00011111) | self.LED_START
 
     def set_pixel_rgb(
         self, led_num: int, rgb_color: int, bright_percent: int = 100
@@ -274,23 +337,27 @@ class APA102:
         Args:
             positions (int, optional): Number of positions to rotate. Defaults to 1.
         """
-        cutoff = 4 * (positions % self.num_led)
-        self.leds = self.leds[cutoff:] + self.leds[:cutoff]
+        # Rolled in place, the buffer is shared with the NumPy view
+        self.pixels[:] = np.roll(self.pixels, -positions, axis=0)
 
-    def show(self) -> None:
+    def show(self, force: bool = False) -> bool:
         """Send the content of the pixel buffer to the strip.
 
-        Transmits all LED data via SPI to update the physical LED strip.
-        Note: More than 1024 LEDs requires more than one xfer operation.
+        The start frame, the LED frames and the end frame go out in a single
+        writebytes2 call, which splits transfers larger than the spidev buffer
+        itself. Nothing is sent if the buffer did not change since the last show.
+
+        Args:
+            force (bool, optional): Send the frame even if unchanged. Defaults to False.
+
+        Returns:
+            bool: True if the frame was sent.
         """
-        self.clock_start_frame()
-        # xfer2 kills the list, unfortunately. So it must be copied first
-        # SPI takes up to 4096 Integers. So we are fine for up to 1024 LEDs.
-        data = list(self.leds)
-        while data:
-            self.spi.xfer2(data[:32])
-            data = data[32:]
-        self.clock_end_frame()
+        if not force and self._shown is not None and self.leds == self._shown:
+            return False
+        self.spi.writebytes2(self._start_frame + self.leds + self._end_frame)
+        self._shown = bytes(self.leds)
+        return True
 
     def cleanup(self) -> None:
         """Release the SPI device.
@@ -0,0 +1,376 @@
+"""
+Single render loop for the LED strip.
+
+Animations do not drive the APA102 strip themselves. Each one draws into its own
+``LightsLayer`` and is advanced by the ``LightsCompositor``, one thread rendering at a
+fixed frame rate. Every tick the compositor steps the animations that are due, blends
+their layers from the bottom up over black and sends the result to the strip in one
+SPI frame, only when it differs from the frame already shown. Overlays such as the
+direction of arrival animation are stacked on top of the running animation and leave
+the pixels they do not draw transparent.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import threading
+import time
+
+from hexapod.lights.lights import ColorRGB, Lights
+from hexapod.utils import rename_thread
+from hexapod.interface import get_custom_logger
+
+if TYPE_CHECKING:
+    from typing import Optional, Tuple, List, Sequence
+    from hexapod.lights.animations import Animation
+
+    RGB = Tuple[int, int, int]
+    Frame = Tuple[RGB, ...]
+
+logger = get_custom_logger("lights_logger")
+
+
+class LightsLayer:
+    """
+    Pixel canvas an animation draws into instead of the hardware.
+
+    Offers the drawing methods of Lights. Pixels that are cleared or never set are
+    transparent and show the layers below.
+
+    Attributes:
+        num_led (int): The number of LEDs.
+        opacity (float): Opacity of the drawn pixels over the layers below (0-1).
+        pixels (List[Optional[Tuple[int, int, int]]]): RGB value of each LED, or
+            None for transparent.
+    """
+
+    get_wheel_color = staticmethod(Lights.get_wheel_color)
+
+    def __init__(self, num_led: int, opacity: float = 1.0) -> None:
+        """
+        Initialize a transparent layer.
+
+        Args:
+            num_led (int): The number of LEDs.
+            opacity (float): Opacity of the drawn pixels over the layers below (0-1).
+
+        Raises:
+            ValueError: If the opacity is outside 0-1.
+        """
+        if not 0.0 <= opacity <= 1.0:
+            raise ValueError(f"Layer opacity {opacity} must be between 0 and 1.")
+        self.num_led: int = num_led
+        self.opacity: float = opacity
+        self.pixels: List[Optional[RGB]] = [None] * num_led
+
+    def set_color(
+        self,
+        color: ColorRGB,
+        num_led: Optional[int] = None,
+        led_index: Optional[int] = None,
+    ) -> None:
+        """
+        Set the color of the LEDs using the ColorRGB enum.
+
+        Args:
+            color (ColorRGB): The color enum member to set.
+            num_led (int, optional): The number of LEDs to set.
+            led_index (int, optional): The index of the LED to set.
+
+        Raises:
+            ValueError: If the color is not a ColorRGB member or the LED index is out
+                of range.
+        """
+        if not isinstance(color, ColorRGB):
+            raise ValueError(
+                f"Invalid color: {color}. Available colors: {', '.join([c.name for c in ColorRGB])}"
+            )
+        self.set_color_rgb(color.rgb, num_led=num_led, led_index=led_index)
+
+    def set_color_rgb(
+        self,
+        rgb_tuple: Tuple[int, int, int],
+        num_led: Optional[int] = None,
+        led_index: Optional[int] = None,
+    ) -> None:
+        """
+        Set the color of the LEDs using an RGB tuple.
+
+        Args:
+            rgb_tuple (tuple): The RGB values.
+            num_led (int, optional): The number of LEDs to set.
+            led_index (int, optional): The index of the LED to set.
+
+        Raises:
+            ValueError: If the LED index is out of range or RGB values are invalid.
+        """
+        if not (
+            isinstance(rgb_tuple, tuple)
+            and len(rgb_tuple) == 3
+            and all(isinstance(val, int) and 0 <= val <= 255 for val in rgb_tuple)
+        ):
+            raise ValueError(
+                f"Invalid RGB tuple: {rgb_tuple}. Must be a tuple of three integers between 0 and 255."
+            )
+
+        if led_index is not None:
+            if not 0 <= led_index < self.num_led:
+                raise ValueError(f"LED index {led_index} is out of range.")
+            self.pixels[led_index] = rgb_tuple
+        else:
+            if num_led is None:
+                num_led = self.num_led
+            for i in range(num_led):
+                self.pixels[i] = rgb_tuple
+
+    def rotate(self, positions: int = 1) -> None:
+        """
+        Rotate the pixels by the specified number of positions, like Lights.rotate.
+
+        Args:
+            positions (int): Number of positions to rotate. Positive values rotate
+                            forward, negative values rotate backward.
+        """
+        cutoff = positions % self.num_led
+        self.pixels = self.pixels[cutoff:] + self.pixels[:cutoff]
+
+    def load(self, pixels: Sequence[Optional[RGB]]) -> None:
+        """
+        Replace all pixels with a precomputed frame.
+
+        Args:
+            pixels (Sequence[Optional[Tuple[int, int, int]]]): RGB value of each LED,
+                or None for transparent.
+        """
+        self.pixels[:] = pixels
+
+    def clear(
+        self, led_indices: Optional[List[int]] = None, count: Optional[int] = None
+    ) -> None:
+        """
+        Make the specified LEDs transparent. If no indices are provided, clear all LEDs.
+        If count is provided, clear the specified number of LEDs from the start.
+
+        Args:
+            led_indices (list, optional): List of LED indices to clear.
+            count (int, optional): Number of LEDs to clear from the start.
+        """
+        if led_indices is not None:
+            leds_to_clear = led_indices
+        elif count is not None:
+            leds_to_clear = list(range(count))
+        else:
+            leds_to_clear = list(range(self.num_led))
+        for i in leds_to_clear:
+            self.pixels[i] = None
+
+
+class _Layer:
+    """Layer on the compositor stack with the animation drawing into it."""
+
+    __slots__ = ("canvas", "animation", "due")
+
+    def __init__(self, canvas: LightsLayer, animation: Optional[Animation]) -> None:
+        self.canvas = canvas
+        self.animation = animation
+        # time.monotonic() of the next animation step; None once nothing is left to do
+        self.due: Optional[float] = 0.0 if animation is not None else None
+
+
+class LightsCompositor(threading.Thread):
+    """
+    Render loop composing the animation layers into the LED strip at a fixed rate.
+
+    Attributes:
+        lights (Lights): The Lights object owning the APA102 driver.
+        frame_interval (float): Seconds between ticks.
+        stop_event (threading.Event): Event to signal the loop to stop.
+        ticks (int): Number of rendered ticks.
+        frames_shown (int): Number of frames sent to the strip.
+    """
+
+    DEFAULT_FPS: float = 40.0  # Divides the 50 ms steps of the quickest animations
+
+    def __init__(self, lights: Lights, fps: float = DEFAULT_FPS) -> None:
+        """
+        Initialize the compositor. Call start() to run the render loop.
+
+        Args:
+            lights (Lights): The Lights object owning the APA102 driver.
+            fps (float): Frames per second of the render loop.
+
+        Raises:
+            ValueError: If fps is not positive.
+        """
+        super().__init__(daemon=True)
+        rename_thread(self, "LightsCompositor")
+        if fps <= 0:
+            raise ValueError(f"Compositor fps must be positive, got {fps}.")
+
+        self.lights: Lights = lights
+        self.frame_interval: float = 1.0 / fps
+        self.stop_event: threading.Event = threading.Event()
+        self.ticks: int = 0
+        self.frames_shown: int = 0
+        self._lock = threading.RLock()
+        self._layers: List[_Layer] = []
+        self._frame: Optional[Frame] = None
+        logger.debug(f"LightsCompositor initialized at {fps} fps.")
+
+    @property
+    def animations(self) -> List[Animation]:
+        """Return the animations on the stack from the bottom up."""
+        with self._lock:
+            return [
+                layer.animation for layer in self._layers if layer.animation is not None
+            ]
+
+    def play(self, animation: Animation) -> None:
+        """
+        Start an animation on top of the stack. It is first stepped on the next tick.
+
+        Args:
+            animation (Animation): Animation drawing into its own LightsLayer.
+        """
+        with self._lock:
+            animation.start()
+            self._layers.append(_Layer(animation.lights, animation))
+        logger.debug(f"Playing {animation.__class__.__name__} on the compositor.")
+
+    def add_layer(self, layer: LightsLayer) -> None:
+        """
+        Put a static layer on top of the stack.
+
+        Args:
+            layer (LightsLayer): Layer shown as drawn.
+        """
+        with self._lock:
+            self._layers.append(_Layer(layer, None))
+
+    def remove(self, animation: Animation) -> None:
+        """
+        Stop an animation and remove its layer from the stack.
+
+        Args:
+            animation (Animation): Animation to remove.
+        """
+        with self._lock:
+            animation.stop_animation()
+            self._layers = [
+                layer for layer in self._layers if layer.animation is not animation
+            ]
+
+    def clear(self) -> None:
+        """Stop all animations and remove every layer, leaving the strip dark."""
+        with self._lock:
+            for layer in self._layers:
+                if layer.animation is not None:
+                    layer.animation.stop_animation()
+            self._layers = []
+
+    def invalidate(self) -> None:
+        """Send the next frame even if unchanged, e.g. after a brightness change."""
+        with self._lock:
+            self._frame = None
+
+    def render(self, now: Optional[float] = None) -> bool:
+        """
+        Step the due animations and send the composed frame if it changed.
+
+        Args:
+            now (Optional[float]): time.monotonic() of the tick; the current time if
+                None.
+
+        Returns:
+            bool: True if a frame was sent to the strip.
+        """
+        with self._lock:
+            if now is None:
+                now = time.monotonic()
+            self.ticks += 1
+            for layer in self._layers:
+                if layer.due is not None and layer.due <= now:
+                    self._advance(layer, now)
+
+            frame = self._compose()
+            if frame == self._frame:
+                return False
+            driver = self.lights.driver
+            driver.set_pixels(range(len(frame)), frame)
+            driver.show()
+            self._frame = frame
+            self.frames_shown += 1
+            return True
+
+    def _advance(self, layer: _Layer, now: float) -> None:
+        """
+        Step the animation of a layer and schedule its next step.
+
+        Steps keep their cadence while the loop keeps up and are rescheduled from now
+        after a stall, so a late tick never triggers a burst of catch-up steps.
+
+        Args:
+            layer (_Layer): Layer whose animation is due.
+            now (float): time.monotonic() of the tick.
+        """
+        animation = layer.animation
+        try:
+            delay = animation.step()
+        except Exception as e:
+            logger.exception(f"{animation.__class__.__name__} failed: {e}")
+            delay = None
+
+        if delay is None:
+            # Finished animations keep showing their last frame
+            layer.due = None
+        else:
+            due = layer.due + delay
+            layer.due = due if due > now else now + delay
+
+    def _compose(self) -> Frame:
+        """
+        Blend the layers from the bottom up over black.
+
+        Returns:
+            Frame: RGB value of every LED.
+        """
+        frame: List[RGB] = [ColorRGB.BLACK.rgb] * self.lights.num_led
+        for layer in self._layers:
+            opacity = layer.canvas.opacity
+            for i, pixel in enumerate(layer.canvas.pixels):
+                if pixel is None:
+                    continue
+                if opacity >= 1.0:
+                    frame[i] = pixel
+                else:
+                    below = frame[i]
+                    frame[i] = (
+                        round(below[0] + (pixel[0] - below[0]) * opacity),
+                        round(below[1] + (pixel[1] - below[1]) * opacity),
+                        round(below[2] + (pixel[2] - below[2]) * opacity),
+                    )
+        return tuple(frame)
+
+    def run(self) -> None:
+        """
+        Render one tick per frame interval until stopped.
+
+        Ticks that fall behind are dropped rather than rendered back to back.
+        """
+        next_tick = time.monotonic()
+        while not self.stop_event.is_set():
+            try:
+                self.render()
+            except Exception as e:
+                logger.exception(f"LED frame could not be rendered: {e}")
+
+            next_tick += self.frame_interval
+            now = time.monotonic()
+            if next_tick < now:
+                next_tick = now
+            self.stop_event.wait(next_tick - now)
+
+    def stop(self) -> None:
+        """Stop the render loop and wait for it to finish."""
+        self.stop_event.set()
+        if self.is_alive():
+            self.join()
@@ -220,7 +220,8 @@ class Lights:
         self.driver.rotate(positions)
         self.driver.show()
 
-    def get_wheel_color(self, wheel_pos: int) -> Tuple[int, int, int]:
+    @staticmethod
+    def get_wheel_color(wheel_pos: int) -> Tuple[int, int, int]:
         """
         Get a color from a color wheel; Green -> Red -> Blue -> Green.
 
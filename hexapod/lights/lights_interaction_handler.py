@@ -3,13 +3,14 @@ from typing import TYPE_CHECKING
 import logging
 from functools import wraps
 
-from hexapod.lights import Lights, ColorRGB
+from hexapod.lights import Lights, ColorRGB, LightsCompositor, LightsLayer
 import hexapod.lights.animations as animations
 from hexapod.interface import get_custom_logger
 
 if TYPE_CHECKING:
     from typing import Callable, Any, Optional, Dict
     from hexapod.lights.animations import Animation
+    from hexapod.utils import LatestValue
 
 logger = get_custom_logger("lights_logger")
 
@@ -18,8 +19,12 @@ class LightsInteractionHandler:
     """
     A class to handle interactions with the Lights object, including animations.
 
+    Animations are played by a single LightsCompositor render loop, each drawing into
+    its own LightsLayer.
+
     Attributes:
         lights (Lights): The Lights object to control the LEDs.
+        compositor (LightsCompositor): The render loop driving the LEDs.
         animation (Animation): The current animation being played.
         leg_to_led (dict): Mapping from leg indices to LED indices.
     """
@@ -32,20 +37,35 @@ class LightsInteractionHandler:
             leg_to_led (dict): Mapping from leg indices to LED indices.
         """
         self.lights: Lights = Lights()
+        self.compositor: LightsCompositor = LightsCompositor(self.lights)
+        self.compositor.start()
         self.animation: Optional[Animation] = None
         self.leg_to_led = leg_to_led
         logger.info("LightsInteractionHandler initialized successfully.")
 
     def stop_animation(self) -> None:
         """
-        Stop any running animation and reset the animation attribute.
+        Stop any running animation, clear the compositor layers and reset the
+        animation attribute.
         """
         if hasattr(self, "animation") and self.animation:
             logger.info(f"Stopping currently running animation {self.animation}")
-            self.animation.stop_animation()
             self.animation = None
         else:
             logger.info("No active animation to stop.")
+        self.compositor.clear()
+
+    def _layer(self, opacity: float = 1.0) -> LightsLayer:
+        """
+        Create a transparent layer covering all LEDs.
+
+        Args:
+            opacity (float): Opacity of the layer over the layers below (0-1).
+
+        Returns:
+            LightsLayer: The new layer.
+        """
+        return LightsLayer(self.lights.num_led, opacity=opacity)
 
     @staticmethod
     def anim(method: Callable[..., Any]) -> Callable[..., Any]:
@@ -54,7 +74,8 @@ class LightsInteractionHandler:
 
         This decorator ensures that the decorated method properly initializes and sets the
         `self.animation` attribute. After the method execution, it verifies that the
-        `self.animation` attribute is set and starts the animation. If the `animation`
+        `self.animation` attribute is set and plays the animation on top of the
+        compositor layers. If the `animation`
         attribute is not set, it logs an error and raises an `AttributeError`.
 
         Args:
@@ -81,7 +102,7 @@ class LightsInteractionHandler:
                 logger.debug(
                     f"'{method.__name__}' successfully set animation attribute: {self.animation}"
                 )
-                self.animation.start()
+                self.compositor.play(self.animation)
 
                 return result
             except Exception as e:
@@ -93,11 +114,23 @@ class LightsInteractionHandler:
     def off(self) -> None:
         """
         Turn off the lights and stop any running animation.
+
+        The dark frame is sent right away instead of on the next compositor tick.
         """
         self.stop_animation()
-        self.lights.clear()
+        self.compositor.render()
         logger.debug("Lights turned off.")
 
+    def cleanup(self) -> None:
+        """
+        Stop the compositor render loop and turn off the lights.
+
+        Call this on shutdown; animations cannot be played afterwards.
+        """
+        self.compositor.stop()
+        self.off()
+        logger.debug("Lights handler cleaned up.")
+
     def set_single_color(
         self, color: ColorRGB, led_index: Optional[int] = None
     ) -> None:
@@ -109,12 +142,14 @@ class LightsInteractionHandler:
             led_index (int, optional): The index of the LED to set. If None, sets all LEDs.
         """
         self.off()
+        layer = self._layer()
         if led_index is not None:
-            self.lights.set_color(color, led_index=led_index)
+            layer.set_color(color, led_index=led_index)
             logger.debug(f"LED {led_index} set to {color.name}.")
         else:
-            self.lights.set_color(color)
+            layer.set_color(color)
             logger.debug(f"All LEDs set to {color.name}.")
+        self.compositor.add_layer(layer)
 
     def set_brightness(self, brightness: int) -> None:
         """
@@ -124,6 +159,7 @@ class LightsInteractionHandler:
             brightness (int): The brightness level (0-100).
         """
         self.lights.set_brightness(brightness)
+        self.compositor.invalidate()
         logger.info(f"Brightness set to {brightness}%.")
 
     @anim
@@ -143,7 +179,7 @@ class LightsInteractionHandler:
         """
         self.off()
         self.animation = animations.WheelFillAnimation(
-            lights=self.lights,
+            lights=self._layer(),
             use_rainbow=use_rainbow,
             color=color if color else ColorRGB.WHITE,
             interval=interval,
@@ -166,7 +202,7 @@ class LightsInteractionHandler:
         """
         self.off()
         self.animation = animations.PulseSmoothlyAnimation(
-            lights=self.lights,
+            lights=self._layer(),
             base_color=base_color,
             pulse_color=pulse_color,
             pulse_speed=pulse_speed,
@@ -189,7 +225,10 @@ class LightsInteractionHandler:
         """
         self.off()
         self.animation = animations.AlternateRotateAnimation(
-            lights=self.lights, color_even=color_even, color_odd=color_odd, delay=delay
+            lights=self._layer(),
+            color_even=color_even,
+            color_odd=color_odd,
+            delay=delay,
         )
 
     @anim
@@ -203,7 +242,7 @@ class LightsInteractionHandler:
         """
         self.off()
         self.animation = animations.OppositeRotateAnimation(
-            lights=self.lights,
+            lights=self._layer(),
             interval=interval,
             color=color,
         )
@@ -218,7 +257,7 @@ class LightsInteractionHandler:
         """
         self.off()
         self.animation = animations.PulseAnimation(
-            lights=self.lights,
+            lights=self._layer(),
             base_color=ColorRGB.BLUE,
             pulse_color=ColorRGB.RED,
             pulse_speed=pulse_speed,
@@ -234,7 +273,10 @@ class LightsInteractionHandler:
         """
         self.off()
         self.animation = animations.WheelFillAnimation(
-            lights=self.lights, use_rainbow=False, color=ColorRGB.RED, interval=interval
+            lights=self._layer(),
+            use_rainbow=False,
+            color=ColorRGB.RED,
+            interval=interval,
         )
 
     @anim
@@ -249,7 +291,7 @@ class LightsInteractionHandler:
         """
         self.off()
         self.animation = animations.CalibrationAnimation(
-            lights=self.lights,
+            lights=self._layer(),
             calibration_status=calibration_status,
             leg_to_led=self.leg_to_led,
         )
@@ -273,6 +315,9 @@ class LightsInteractionHandler:
             ColorRGB.YELLOW,  # Third source
             ColorRGB.LIME,  # Fourth source
         ],
+        overlay: bool = False,
+        opacity: float = 1.0,
+        sources: Optional[LatestValue] = None,
     ) -> None:
         """
         Start the direction of arrival animation to visualize sound source locations.
@@ -281,10 +326,19 @@ class LightsInteractionHandler:
             refresh_delay (float): The interval between updates.
             source_colors (list[ColorRGB]): List of colors for different sound sources.
                 Defaults to [TEAL, INDIGO, YELLOW, LIME].
-        """
-        self.off()
+            overlay (bool): Stack the sources on top of the running animation instead
+                of replacing it.
+            opacity (float): Opacity of the sources over the animation below (0-1).
+            sources (LatestValue, optional): Slot the tracked source azimuths are
+                published into, e.g. ODASDoASSLProcessor.doa_sources.
+        """
+        if not overlay:
+            self.off()
         self.animation = animations.DirectionOfArrivalAnimation(
-            lights=self.lights, refresh_delay=refresh_delay, source_colors=source_colors
+            lights=self._layer(opacity),
+            refresh_delay=refresh_delay,
+            source_colors=source_colors,
+            sources=sources,
         )
 
     @anim
@@ -299,7 +353,7 @@ class LightsInteractionHandler:
         """
         self.off()
         self.animation = animations.WheelFillAnimation(
-            lights=self.lights,
+            lights=self._layer(),
             use_rainbow=False,
             color=ColorRGB.TEAL,
             interval=interval,
@@ -322,7 +376,7 @@ class LightsInteractionHandler:
         """
         self.off()
         self.animation = animations.PulseSmoothlyAnimation(
-            lights=self.lights,
+            lights=self._layer(),
             base_color=base_color,
             pulse_color=pulse_color,
             pulse_speed=pulse_speed,
@@ -345,5 +399,8 @@ class LightsInteractionHandler:
         """
         self.off()
         self.animation = animations.WheelAnimation(
-            lights=self.lights, use_rainbow=use_rainbow, color=color, interval=interval
+            lights=self._layer(),
+            use_rainbow=use_rainbow,
+            color=color,
+            interval=interval,
         )
@@ -10,7 +10,7 @@ import threading
 from pathlib import Path
 
 from hexapod.config import Config, create_config_parser
-from hexapod.kws import VoiceControl
+from hexapod.kws import VoiceControl, CaptureHub
 from hexapod.task_interface import TaskInterface
 from hexapod.robot import PredefinedPosition
 from hexapod.interface import setup_logging, clean_logs, get_custom_logger
@@ -84,7 +84,7 @@ def shutdown_cleanup(
     Stops all running threads and performs necessary cleanup operations:
     - Stops and joins voice control thread
     - Stops and joins manual controller thread
-    - Cleans up task interface resources
+    - Cleans up task interface resources and stops the capture hub, if any
     - Logs thread status for debugging
 
     Args:
@@ -104,6 +104,8 @@ def shutdown_cleanup(
         logger.debug("Manual controller thread joined")
     if task_interface:
         task_interface.cleanup()
+        if task_interface.capture_hub:
+            task_interface.capture_hub.stop()
     logger.user_info("Exiting...")
 
     for thread in threading.enumerate():
@@ -185,6 +187,21 @@ Example usage:
     parser.add_argument(
         "--print-context", action="store_true", help="Print context information."
     )
+    parser.add_argument(
+        "--capture-hub",
+        action="store_true",
+        help="Capture the microphone array in a separate process shared by voice control and ODAS, so voice commands stay available during ODAS tasks.",
+    )
+    parser.add_argument(
+        "--vad-gate",
+        action="store_true",
+        help="Only pass frames with voice activity to the wake word engine.",
+    )
+    parser.add_argument(
+        "--channel-selector",
+        action="store_true",
+        help="Pass the best microphone, or a beam steered at the last ODAS direction of arrival, to the wake word engine instead of channel 0.",
+    )
 
     return parser
 
@@ -230,12 +247,21 @@ def create_application_components(
     )
     context_path = package_dir / "kws" / "rhino" / "hexapod_en_raspberry-pi_v3_0_0.rhn"
 
+    capture_hub = None
+    if args.capture_hub:
+        capture_hub = CaptureHub(device_index=VoiceControl.find_respeaker6_index())
+        capture_hub.start()
+        task_interface.set_capture_hub(capture_hub)
+
     voice_control = VoiceControl(
         keyword_path=keyword_path,
         context_path=context_path,
         access_key=config.get_picovoice_key(),
         task_interface=task_interface,
         device_index=-1,  # Auto-detect ReSpeaker 6
+        use_vad_gate=args.vad_gate,
+        use_channel_selector=args.channel_selector,
+        capture_hub=capture_hub,
     )
 
     task_interface.set_voice_control(voice_control)
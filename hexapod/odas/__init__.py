@@ -1,5 +1,39 @@
-# from .odas_audio_processor import ODASAudioProcessor #resampy, llvmlite, numba -> LLMV 15 installation needed
+from .odas_audio_processor import ODASAudioProcessor
 from .odas_doa_ssl_processor import ODASDoASSLProcessor
+from .potential_sources_buffer import PotentialSourcesBuffer
+from .tracked_sources_history import TrackedSourcesHistory
+from .odas_session_capture import ODASSessionRecorder, read_session
+from .odas_session_replay import ODASSessionReplayer, run_replay_benchmark
+from .raw_audio_tail_reader import RawAudioTailReader
+from .streaming_resampler import StreamingResampler, resample
+from .multi_channel_keyword_spotter import MultiChannelKeywordSpotter
+from .raw_stream_transport import (
+    RawStreamTransport,
+    SFTPTransport,
+    LocalFileTransport,
+    TCPTransport,
+)
+from .jitter_buffer import JitterBuffer
+from .odas_to_picovoice_wav import convert_odas_to_wav, convert_odas_files
 
-# __all__ = ["ODASAudioProcessor", "ODASDoASSLProcessor"] #resampy, llvmlite, numba -> LLMV 15 installation needed
-__all__ = ["ODASDoASSLProcessor"]
+__all__ = [
+    "ODASAudioProcessor",
+    "ODASDoASSLProcessor",
+    "PotentialSourcesBuffer",
+    "TrackedSourcesHistory",
+    "ODASSessionRecorder",
+    "read_session",
+    "ODASSessionReplayer",
+    "run_replay_benchmark",
+    "RawAudioTailReader",
+    "StreamingResampler",
+    "resample",
+    "MultiChannelKeywordSpotter",
+    "RawStreamTransport",
+    "SFTPTransport",
+    "LocalFileTransport",
+    "TCPTransport",
+    "JitterBuffer",
+    "convert_odas_to_wav",
+    "convert_odas_files",
+]
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+
+"""
+Adaptive jitter buffer for streamed ODAS audio playback.
+
+Audio arrives from the transport in bursts and is consumed by the output device at a
+fixed rate. ``JitterBuffer`` keeps the samples in between in a fixed-size ring, holds
+the fill level near a target latency by resampling each output block by up to a few
+percent, drops the oldest audio when a burst overshoots the target far, and never
+grows beyond a hard capacity, so playback stays near-live during long sessions.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from dataclasses import dataclass, asdict
+import threading
+
+import numpy as np
+
+from hexapod.interface import get_custom_logger
+
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+logger = get_custom_logger("odas_logger")
+
+
+@dataclass
+class JitterBufferStats:
+    """Fill level and event counters of a jitter buffer."""
+
+    latency: float
+    target_latency: float
+    underruns: int
+    overruns: int
+    dropped_samples: int
+    stretch_ratio: float
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        return asdict(self)
+
+
+class JitterBuffer:
+    """
+    Bounded single-producer, single-consumer buffer of mono float32 samples.
+
+    ``write`` is called by the streaming thread and ``read`` by the audio callback;
+    neither blocks beyond a short lock. After an underrun the buffer outputs silence
+    until it is filled to the target latency again. While playing, the smoothed fill
+    level steers a resampling ratio proportional to its deviation from the target, up
+    to ``max_stretch``: a buffer running full is played slightly faster, one running
+    low slightly slower. A fill level above ``drop_latency`` is cut back to the target
+    at once, and data beyond the capacity of ``max_latency`` overwrites the oldest
+    samples.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        target_latency: float = 0.1,
+        max_latency: float = 1.0,
+        drop_latency: Optional[float] = None,
+        max_stretch: float = 0.02,
+        tolerance: float = 0.2,
+        smoothing: float = 0.05,
+    ) -> None:
+        """
+        Initialize the jitter buffer.
+
+        Args:
+            sample_rate (int): Sample rate of the audio in Hz.
+            target_latency (float): Fill level to hold, in seconds.
+            max_latency (float): Hard capacity of the buffer, in seconds.
+            drop_latency (Optional[float]): Fill level above which old audio is
+                dropped, in seconds. Defaults to twice the target latency.
+            max_stretch (float): Maximum relative resampling of an output block.
+            tolerance (float): Relative deviation from the target tolerated without
+                resampling.
+            smoothing (float): Weight of the newest fill level in its moving average.
+
+        Raises:
+            ValueError: If the latencies are not positive and increasing.
+        """
+        if drop_latency is None:
+            drop_latency = min(2 * target_latency, max_latency)
+        if not 0 < target_latency <= drop_latency <= max_latency:
+            raise ValueError(
+                "Latencies must satisfy 0 < target_latency <= drop_latency <= max_latency"
+            )
+
+        self.sample_rate = sample_rate
+        self.target_latency = target_latency
+        self.max_latency = max_latency
+        self.drop_latency = drop_latency
+        self.max_stretch = max_stretch
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+
+        self.capacity: int = int(max_latency * sample_rate)
+        self._target: int = int(target_latency * sample_rate)
+        self._drop: int = int(drop_latency * sample_rate)
+        self._ring = np.zeros(self.capacity, dtype=np.float32)
+        self._lock = threading.Lock()
+        self._start: int = 0
+        self._fill: int = 0
+        self._smoothed_fill: float = 0.0
+        self._primed: bool = False
+
+        self.underruns: int = 0
+        self.overruns: int = 0
+        self.dropped_samples: int = 0
+        self.stretch_ratio: float = 0.0
+
+    @property
+    def latency(self) -> float:
+        """Return the audio currently buffered, in seconds."""
+        return self._fill / self.sample_rate
+
+    def __len__(self) -> int:
+        return self._fill
+
+    def clear(self) -> None:
+        """Drop all buffered audio and wait for the target fill level again."""
+        with self._lock:
+            self._start = self._fill = 0
+            self._primed = False
+            self.stretch_ratio = 0.0
+
+    def write(self, samples: np.ndarray) -> None:
+        """
+        Append samples, overwriting the oldest ones when the capacity is exceeded.
+
+        Args:
+            samples (np.ndarray): Mono audio samples.
+        """
+        samples = np.asarray(samples, dtype=np.float32)
+        count = len(samples)
+        if not count:
+            return
+
+        with self._lock:
+            overflow = self._fill + count - self.capacity
+            if overflow > 0:
+                self.overruns += 1
+                self.dropped_samples += overflow
+                if count > self.capacity:
+                    samples = samples[-self.capacity :]
+                    count = self.capacity
+                self._discard(max(self._fill + count - self.capacity, 0))
+
+            end = (self._start + self._fill) % self.capacity
+            first = min(count, self.capacity - end)
+            self._ring[end : end + first] = samples[:first]
+            self._ring[: count - first] = samples[first:]
+            self._fill += count
+
+    def read(self, frames: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Take one output block from the buffer.
+
+        Args:
+            frames (int): Number of output samples.
+            out (Optional[np.ndarray]): Array of ``frames`` samples to fill in place,
+                e.g. the mono column of the output device buffer.
+
+        Returns:
+            np.ndarray: The output block, padded with silence on an underrun.
+        """
+        if out is None:
+            out = np.zeros(frames, dtype=np.float32)
+
+        with self._lock:
+            if not self._primed:
+                if self._fill < max(self._target, frames):
+                    out[:] = 0
+                    return out
+                self._primed = True
+                self._smoothed_fill = float(self._fill)
+
+            if self._fill > self._drop:
+                excess = self._fill - self._target
+                self._discard(excess)
+                self.dropped_samples += excess
+                self._smoothed_fill = float(self._fill)
+
+            self._smoothed_fill += self.smoothing * (self._fill - self._smoothed_fill)
+            error = (self._smoothed_fill - self._target) / self._target
+            if abs(error) > self.tolerance:
+                self.stretch_ratio = float(
+                    np.clip(
+                        error * self.max_stretch, -self.max_stretch, self.max_stretch
+                    )
+                )
+            else:
+                self.stretch_ratio = 0.0
+
+            needed = int(round(frames * (1.0 + self.stretch_ratio)))
+            if self._fill < needed:
+                needed = frames
+            if self._fill < needed:
+                available = self._fill
+                out[:available] = self._take(available)
+                out[available:] = 0
+                self._primed = False
+                self.underruns += 1
+                return out
+
+            block = self._take(needed)
+
+        if needed == frames:
+            out[:] = block
+        else:
+            out[:] = np.interp(
+                np.linspace(0.0, needed - 1, frames), np.arange(needed), block
+            )
+        return out
+
+    def _take(self, count: int) -> np.ndarray:
+        """Remove and return the oldest samples. The lock must be held."""
+        end = self._start + count
+        if end <= self.capacity:
+            block = self._ring[self._start : end].copy()
+        else:
+            block = np.concatenate(
+                (self._ring[self._start :], self._ring[: end - self.capacity])
+            )
+        self._discard(count)
+        return block
+
+    def _discard(self, count: int) -> None:
+        """Drop the oldest samples. The lock must be held."""
+        self._start = (self._start + count) % self.capacity
+        self._fill -= count
+
+    def stats(self) -> JitterBufferStats:
+        """
+        Return the current fill level and event counters.
+
+        Returns:
+            JitterBufferStats: Snapshot of the buffer state.
+        """
+        with self._lock:
+            return JitterBufferStats(
+                latency=self._fill / self.sample_rate,
+                target_latency=self.target_latency,
+                underruns=self.underruns,
+                overruns=self.overruns,
+                dropped_samples=self.dropped_samples,
+                stretch_ratio=self.stretch_ratio,
+            )
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+
+"""
+Wake word detection on every ODAS separated source channel.
+
+ODAS writes one separated audio channel per tracked source slot to ``separated.raw``.
+``MultiChannelKeywordSpotter`` takes the multichannel frames read from that file,
+demultiplexes the channels of active sources in one pass, resamples each of them to
+16 kHz and runs one Porcupine instance per channel on a worker pool. Channels whose slot
+holds no tracked source are gated off, so the CPU cost scales with the number of
+talkers. Detections carry the channel and the tracked source, so the direction of the
+speaker is known.
+
+Typical wiring next to the DoA/SSL processor::
+
+    reader = ODASAudioProcessor(odas_dir, source_file="separated.raw")
+    spotter = MultiChannelKeywordSpotter(
+        porcupine_engine_factory(access_key, [keyword_path]), on_detection
+    )
+    reader.set_frame_callback(spotter.process_frame)
+    doa_processor.add_tracked_frame_listener(spotter.update_sources)
+    reader.start()
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, NamedTuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import threading
+import argparse
+import time
+import sys
+
+import numpy as np
+import pvporcupine
+
+from hexapod.interface import get_custom_logger
+from hexapod.odas.streaming_resampler import StreamingResampler
+
+if TYPE_CHECKING:
+    from typing import Optional, Callable, Dict, List, Sequence, Any
+
+
+logger = get_custom_logger("odas_logger")
+
+
+class KeywordDetection(NamedTuple):
+    """A wake word heard on one separated channel."""
+
+    channel: int
+    keyword_index: int
+    source: Optional[Dict[str, Any]]
+    timestamp: float
+
+
+def porcupine_engine_factory(
+    access_key: str,
+    keyword_paths: List[Path],
+    sensitivities: Optional[List[float]] = None,
+) -> Callable[[], Any]:
+    """
+    Create a factory for Porcupine instances with the given keywords.
+
+    Args:
+        access_key (str): Picovoice access key.
+        keyword_paths (List[Path]): Keyword model files.
+        sensitivities (Optional[List[float]]): Sensitivity per keyword.
+
+    Returns:
+        Callable[[], Any]: Function creating a new Porcupine instance.
+    """
+
+    def create() -> Any:
+        return pvporcupine.create(
+            access_key=access_key,
+            keyword_paths=[str(path) for path in keyword_paths],
+            sensitivities=sensitivities,
+        )
+
+    return create
+
+
+class MultiChannelKeywordSpotter:
+    """
+    Runs a keyword engine on each active ODAS separated channel.
+
+    ``process_frame`` is called with (samples, channels) int16 frames, e.g. as the frame
+    callback of ``ODASAudioProcessor``; ``update_sources`` with the tracked source slots
+    of each ODAS tracked frame. A channel is active while its slot holds a source with a
+    non-zero ID and for ``hangover`` seconds after, so the end of a command is not cut
+    off. Engines are created the first time their channel becomes active and reused.
+    """
+
+    def __init__(
+        self,
+        engine_factory: Callable[[], Any],
+        on_detection: Callable[[KeywordDetection], None],
+        sample_rate: int = 44100,
+        channels: int = 4,
+        target_sample_rate: int = 16000,
+        max_workers: Optional[int] = None,
+        hangover: float = 1.0,
+        gate_idle_channels: bool = True,
+    ) -> None:
+        """
+        Initialize the spotter.
+
+        Args:
+            engine_factory (Callable[[], Any]): Creates one keyword engine with
+                Porcupine's ``frame_length``, ``process`` and ``delete``, e.g. from
+                ``porcupine_engine_factory``.
+            on_detection (Callable[[KeywordDetection], None]): Called for each wake word.
+            sample_rate (int): Sample rate of the separated audio.
+            channels (int): Number of separated channels (tracked source slots).
+            target_sample_rate (int): Sample rate expected by the engines.
+            max_workers (Optional[int]): Worker threads, defaults to one per channel.
+            hangover (float): Seconds a channel stays active after its source is gone.
+            gate_idle_channels (bool): Skip channels without a tracked source. When
+                disabled all channels are always processed.
+        """
+        self.engine_factory = engine_factory
+        self.on_detection = on_detection
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.target_sample_rate = target_sample_rate
+        self.hangover = hangover
+        self.gate_idle_channels = gate_idle_channels
+
+        self.frames_processed: List[int] = [0] * channels
+        self._engines: List[Any] = [None] * channels
+        # Channels whose engine could not be created are skipped from then on
+        self._disabled: List[bool] = [False] * channels
+        self._resamplers: List[Optional[StreamingResampler]] = [None] * channels
+        self._pending: List[np.ndarray] = [
+            np.zeros(0, dtype=np.int16) for _ in range(channels)
+        ]
+        self._sources: List[Optional[Dict[str, Any]]] = [None] * channels
+        self._last_active: List[float] = [float("-inf")] * channels
+        self._sources_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers or channels,
+            thread_name_prefix="KeywordSpotter",
+        )
+
+    def update_sources(self, slots: Sequence[Optional[Dict[str, Any]]]) -> None:
+        """
+        Update which channels hold a tracked source.
+
+        Args:
+            slots (Sequence[Optional[Dict[str, Any]]]): Tracked sources in ODAS slot
+                order; slot i is separated channel i. Empty slots have ID 0 or None.
+        """
+        now = time.monotonic()
+        with self._sources_lock:
+            for channel in range(min(len(slots), self.channels)):
+                source = slots[channel]
+                if source and source.get("id", 0) > 0:
+                    self._sources[channel] = source
+                    self._last_active[channel] = now
+
+    def active_channels(self, now: Optional[float] = None) -> List[int]:
+        """
+        Return the channels currently passed to the keyword engines.
+
+        Args:
+            now (Optional[float]): Monotonic time to evaluate, defaults to now.
+
+        Returns:
+            List[int]: Active channel indices.
+        """
+        if not self.gate_idle_channels:
+            return list(range(self.channels))
+        if now is None:
+            now = time.monotonic()
+        with self._sources_lock:
+            return [
+                channel
+                for channel in range(self.channels)
+                if now - self._last_active[channel] <= self.hangover
+            ]
+
+    def process_frame(self, samples: np.ndarray) -> None:
+        """
+        Feed one multichannel frame and run the engines of the active channels.
+
+        Blocks until the engines processed all complete frames of this call, so frames
+        of one channel are always processed in order. The samples may be a temporary
+        view; nothing keeps a reference to them.
+
+        Args:
+            samples (np.ndarray): Interleaved int16 audio of shape (samples, channels).
+        """
+        active = self.active_channels()
+        for channel in range(self.channels):
+            if channel not in active and self._resamplers[channel] is not None:
+                # Gone idle: drop its audio so it restarts cleanly when active again
+                self._resamplers[channel] = None
+                self._pending[channel] = np.zeros(0, dtype=np.int16)
+        if not active:
+            return
+
+        # Demultiplex all active channels at once into contiguous rows
+        demultiplexed = samples.T[active]
+
+        jobs = []
+        for channel, audio in zip(active, demultiplexed):
+            engine = self._engine(channel)
+            if engine is None:
+                continue
+            resampled = self._resamplers[channel].process(audio)
+            pending = np.concatenate(
+                (
+                    self._pending[channel],
+                    np.clip(np.rint(resampled), -32768, 32767).astype(np.int16),
+                )
+            )
+            count = len(pending) // engine.frame_length
+            self._pending[channel] = pending[count * engine.frame_length :]
+            if count:
+                frames = pending[: count * engine.frame_length].reshape(count, -1)
+                jobs.append((channel, engine, frames))
+
+        if len(jobs) == 1:
+            results = [self._run_engine(*jobs[0])]
+        else:
+            futures = [self._pool.submit(self._run_engine, *job) for job in jobs]
+            results = [future.result() for future in futures]
+
+        for channel, keyword_indices in zip((job[0] for job in jobs), results):
+            for keyword_index in keyword_indices:
+                self._report(channel, keyword_index)
+
+    def _engine(self, channel: int) -> Any:
+        """
+        Return the engine of a channel, creating it and its resampler on demand.
+
+        A channel whose engine cannot be created is disabled, so the factory is not
+        retried on every frame.
+        """
+        if self._disabled[channel]:
+            return None
+        if self._engines[channel] is None:
+            try:
+                self._engines[channel] = self.engine_factory()
+            except Exception as e:
+                self._disabled[channel] = True
+                logger.error(
+                    f"Cannot create keyword engine for channel {channel}, "
+                    f"channel disabled: {e}"
+                )
+                return None
+        if self._resamplers[channel] is None:
+            self._resamplers[channel] = StreamingResampler(
+                self.sample_rate, self.target_sample_rate
+            )
+        return self._engines[channel]
+
+    def _run_engine(self, channel: int, engine: Any, frames: np.ndarray) -> List[int]:
+        """Process frames of one channel in order and return the detected keywords."""
+        detected = []
+        for frame in frames:
+            keyword_index = engine.process(frame)
+            if keyword_index >= 0:
+                detected.append(keyword_index)
+        self.frames_processed[channel] += len(frames)
+        return detected
+
+    def _report(self, channel: int, keyword_index: int) -> None:
+        """Pass a detection with its tracked source to the callback."""
+        with self._sources_lock:
+            source = self._sources[channel]
+        source_id = source.get("id") if source is not None else None
+        logger.info(
+            f"Keyword {keyword_index} detected on channel {channel} (source {source_id})"
+        )
+        try:
+            self.on_detection(
+                KeywordDetection(channel, keyword_index, source, time.time())
+            )
+        except Exception as e:
+            logger.error(f"Keyword detection callback error: {e}")
+
+    def close(self) -> None:
+        """Stop the worker pool and release all engines."""
+        self._pool.shutdown(wait=True)
+        for channel, engine in enumerate(self._engines):
+            if engine is not None:
+                try:
+                    engine.delete()
+                except Exception as e:
+                    logger.warning(f"Error deleting keyword engine {channel}: {e}")
+                self._engines[channel] = None
+
+
+def main() -> None:  # pragma: no cover
+    """Spot wake words on all channels of a running ODAS instance."""
+    from hexapod.odas.odas_audio_processor import ODASAudioProcessor
+
+    parser = argparse.ArgumentParser(
+        description="Detect wake words on every ODAS separated channel"
+    )
+    parser.add_argument(
+        "--odas-dir",
+        type=Path,
+        default=Path("data/audio/odas"),
+        help="Directory ODAS writes separated.raw to (default: data/audio/odas)",
+    )
+    parser.add_argument(
+        "--access-key",
+        required=True,
+        help="Picovoice access key",
+    )
+    parser.add_argument(
+        "--keyword-path",
+        type=Path,
+        default=Path(__file__).parent.parent
+        / "kws"
+        / "porcupine"
+        / "hexapod_en_raspberry-pi_v3_0_0.ppn",
+        help="Porcupine keyword file",
+    )
+    parser.add_argument(
+        "--channels",
+        type=int,
+        default=4,
+        help="Number of separated channels (default: 4)",
+    )
+    args = parser.parse_args()
+
+    def on_detection(detection: KeywordDetection) -> None:
+        print(f"Wake word on channel {detection.channel}")
+
+    # Without the tracked stream there is no activity information, listen everywhere
+    spotter = MultiChannelKeywordSpotter(
+        porcupine_engine_factory(args.access_key, [args.keyword_path]),
+        on_detection,
+        channels=args.channels,
+        gate_idle_channels=False,
+    )
+    reader = ODASAudioProcessor(
+        args.odas_dir, channels=args.channels, source_file="separated.raw"
+    )
+    reader.set_frame_callback(spotter.process_frame)
+    reader.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        reader.stop()
+        spotter.close()
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,10 +12,11 @@ import logging
 import threading
 from pathlib import Path
 import numpy as np
-import resampy
 import time
 
 from hexapod.interface import get_custom_logger
+from hexapod.odas.raw_audio_tail_reader import RawAudioTailReader
+from hexapod.odas.streaming_resampler import StreamingResampler
 
 if TYPE_CHECKING:
     from typing import Optional, Callable
@@ -40,6 +41,8 @@ class ODASAudioProcessor:
         target_channels: int = 1,  # Picovoice's required channel count
         selected_channel: int = 0,  # Which channel to use from the array
         frame_length: int = 512,  # Picovoice's frame length
+        ring_frames: int = 64,
+        source_file: str = "postfiltered.raw",
     ):
         """
         Initialize the ODAS audio processor.
@@ -49,18 +52,22 @@ class ODASAudioProcessor:
             sample_rate (int): Sample rate of the audio files
             channels (int): Number of channels in the audio files
             buffer_size (int): Size of audio buffer in bytes
-            check_interval (float): Interval in seconds to check for new audio data
+            check_interval (float): Maximum time in seconds to wait for new audio data
             target_sample_rate (int): Target sample rate for Picovoice (default: 16000)
             target_channels (int): Target number of channels for Picovoice (default: 1)
             selected_channel (int): Which channel to use from the array (default: 0)
             frame_length (int): Number of samples per frame (default: 512)
+            ring_frames (int): Capacity of the read ring buffer in frames (default: 64)
+            source_file (str): ODAS output file to read, "postfiltered.raw" or
+                "separated.raw" (default: "postfiltered.raw")
         """
         print(f"Initializing ODASAudioProcessor with directory: {odas_dir}")
         self.odas_dir = odas_dir
-        self.audio_file = self.odas_dir / "postfiltered.raw"
+        self.audio_file = self.odas_dir / source_file
         print(f"Audio file path: {self.audio_file}")
 
         self.audio_callback: Optional[Callable[[np.ndarray], None]] = None
+        self.frame_callback: Optional[Callable[[np.ndarray], None]] = None
         self.running = False
         self.thread: Optional[threading.Thread] = None
 
@@ -73,13 +80,19 @@ class ODASAudioProcessor:
         self.buffer_size = buffer_size
         self.check_interval = check_interval
         self.frame_length = frame_length
+        self.ring_frames = ring_frames
+        self.bytes_per_frame = 2 * channels * frame_length
 
         # Calculate resampling ratio
         self.resample_ratio = target_sample_rate / sample_rate
 
-        # Track last file size for reading new data
-        self._last_file_size = 0
-        self._buffer = bytearray()
+        # Resampler keeps its filter state across frames; resampled samples wait in
+        # _sample_buffer until a full frame_length frame is available
+        self._resampler = StreamingResampler(sample_rate, target_sample_rate)
+        self._sample_buffer = np.zeros(0, dtype=np.int16)
+
+        # Tail reader following the audio file while reading is running
+        self._reader: Optional[RawAudioTailReader] = None
 
         print(
             f"Initialized with sample_rate={sample_rate}, channels={channels}, "
@@ -95,6 +108,19 @@ class ODASAudioProcessor:
         """
         self.audio_callback = callback
 
+    def set_frame_callback(self, callback: Callable[[np.ndarray], None]) -> None:
+        """
+        Set the callback function to receive raw multichannel frames.
+
+        The callback gets a read-only int16 array of shape (frame_length, channels) that
+        is a view into the reader's ring buffer. It is only valid during the call, so
+        the callback must copy any data it keeps.
+
+        Args:
+            callback (Callable[[np.ndarray], None]): Function to call with each frame
+        """
+        self.frame_callback = callback
+
     def start(self) -> None:
         """
         Start reading audio from ODAS and feeding it to the callback.
@@ -103,6 +129,8 @@ class ODASAudioProcessor:
             return
 
         self.running = True
+        self._resampler.reset()
+        self._sample_buffer = np.zeros(0, dtype=np.int16)
         self.thread = threading.Thread(target=self._read_audio, daemon=True)
         self.thread.start()
         logger.info("Started ODAS voice input reading")
@@ -120,11 +148,16 @@ class ODASAudioProcessor:
         """
         Convert audio data from ODAS format to Picovoice format.
 
+        The selected channel is fed to the streaming resampler, so consecutive calls
+        form one continuous signal. Frames of exactly frame_length samples are returned
+        as soon as enough resampled audio is available.
+
         Args:
-            audio_data (bytes): Raw audio data from ODAS
+            audio_data (bytes): Raw audio data from ODAS, any bytes-like object
 
         Returns:
-            np.ndarray: Converted audio data in Picovoice format
+            np.ndarray: Converted audio data in Picovoice format, None until a full
+            frame is available
         """
         # Convert bytes to numpy array
         audio_array = np.frombuffer(audio_data, dtype=np.int16)
@@ -132,109 +165,90 @@ class ODASAudioProcessor:
         # Reshape to separate channels
         audio_array = audio_array.reshape(-1, self.source_channels)
 
-        # Select the desired channel
-        mono_audio = audio_array[:, self.selected_channel]
+        # Select the desired channel and resample it to the target rate
+        resampled_audio = self._resampler.process(audio_array[:, self.selected_channel])
 
-        # Calculate the target number of samples after resampling
-        # We need to maintain the frame length of 512 samples at 16000Hz
-        # So we need to resample to get exactly 512 samples
-        target_samples = self.frame_length
-        source_samples = int(
-            target_samples * (self.source_sample_rate / self.target_sample_rate)
+        # Convert to 16-bit PCM
+        resampled_audio = np.clip(np.rint(resampled_audio), -32768, 32767)
+        self._sample_buffer = np.concatenate(
+            [self._sample_buffer, resampled_audio.astype(np.int16)]
         )
 
-        # Ensure we have enough samples
-        if len(mono_audio) < source_samples:
-            # Instead of returning zeros, accumulate samples until we have enough
-            if not hasattr(self, "_sample_buffer"):
-                self._sample_buffer = np.array([], dtype=np.int16)
+        return self._next_frame()
 
-            self._sample_buffer = np.concatenate([self._sample_buffer, mono_audio])
-
-            if len(self._sample_buffer) < source_samples:
-                return None
-
-            # Take exactly the number of samples we need
-            mono_audio = self._sample_buffer[:source_samples]
-            self._sample_buffer = self._sample_buffer[source_samples:]
-
-        # Take exactly the number of samples we need
-        mono_audio = mono_audio[:source_samples]
-
-        # Resample to target sample rate
-        resampled_audio = resampy.resample(
-            mono_audio, self.source_sample_rate, self.target_sample_rate
-        )
-
-        # Ensure we have exactly the target number of samples
-        if len(resampled_audio) > target_samples:
-            resampled_audio = resampled_audio[:target_samples]
-        elif len(resampled_audio) < target_samples:
-            resampled_audio = np.pad(
-                resampled_audio, (0, target_samples - len(resampled_audio))
-            )
+    def _next_frame(self) -> Optional[np.ndarray]:
+        """
+        Take one frame of frame_length samples from the resampled audio.
 
-        # Convert to 16-bit PCM
-        resampled_audio = np.clip(resampled_audio, -32768, 32767).astype(np.int16)
+        Returns:
+            np.ndarray: Next frame, None if not enough samples are buffered
+        """
+        if len(self._sample_buffer) < self.frame_length:
+            return None
 
-        return np.asarray(resampled_audio)
+        frame = self._sample_buffer[: self.frame_length]
+        self._sample_buffer = self._sample_buffer[self.frame_length :]
+        return frame
 
     def _read_audio(self) -> None:
         """
-        Internal method to read audio from ODAS and feed it to the callback.
+        Internal method to read audio from ODAS and feed it to the callbacks.
+
+        The audio file is kept open and followed like ``tail -f``: available frames are
+        processed straight from the reader's ring buffer and the thread then sleeps until
+        the file changes or check_interval expires.
         """
         try:
             print(f"Starting to read audio from {self.audio_file}")
-            print(
-                f"Initial file size: {self.audio_file.stat().st_size if self.audio_file.exists() else 'File does not exist'}"
+            reader = RawAudioTailReader(
+                self.audio_file, self.bytes_per_frame, ring_frames=self.ring_frames
             )
-
-            while self.running:
-                try:
-                    if not self.audio_file.exists():
-                        logger.warning(f"ODAS audio file not found: {self.audio_file}")
+            self._reader = reader
+            missing_logged = False
+
+            try:
+                while self.running:
+                    try:
+                        processed = False
+                        for frame in reader.frames():
+                            processed = True
+                            self._process_frame(frame)
+                            if not self.running:
+                                break
+
+                        if not reader.is_open and not missing_logged:
+                            logger.warning(
+                                f"ODAS audio file not found: {self.audio_file}"
+                            )
+                            missing_logged = True
+                        if not processed:
+                            reader.wait(self.check_interval)
+
+                    except Exception as e:
+                        logger.error(f"Error reading audio: {e}")
                         time.sleep(self.check_interval)
                         continue
-
-                    current_size = self.audio_file.stat().st_size
-
-                    if current_size > self._last_file_size:
-                        # Read new audio data
-                        with open(self.audio_file, "rb") as f:
-                            f.seek(self._last_file_size)
-                            new_data = f.read(current_size - self._last_file_size)
-
-                            if new_data:
-                                # Add new data to buffer
-                                self._buffer.extend(new_data)
-
-                                # Calculate bytes per frame (2 bytes per sample * number of channels)
-                                bytes_per_frame = (
-                                    2 * self.source_channels * self.frame_length
-                                )
-
-                                # Process complete frames
-                                while len(self._buffer) >= bytes_per_frame:
-                                    # Extract one frame
-                                    frame_data = bytes(self._buffer[:bytes_per_frame])
-                                    self._buffer = self._buffer[bytes_per_frame:]
-
-                                    if self.audio_callback is not None:
-                                        # Convert audio format and feed to callback
-                                        converted_audio = self._convert_audio(
-                                            frame_data
-                                        )
-                                        if converted_audio is not None:
-                                            self.audio_callback(converted_audio)
-
-                        self._last_file_size = current_size
-
-                    time.sleep(self.check_interval)
-
-                except Exception as e:
-                    logger.error(f"Error reading audio: {e}")
-                    time.sleep(self.check_interval)
-                    continue
+            finally:
+                reader.close()
+                self._reader = None
 
         except Exception as e:
             logger.error(f"Fatal error in ODAS audio reading: {e}")
+
+    def _process_frame(self, frame: memoryview) -> None:
+        """
+        Feed one raw frame to the callbacks.
+
+        Args:
+            frame (memoryview): Interleaved int16 samples of one frame
+        """
+        if self.frame_callback is not None:
+            samples = np.frombuffer(frame, dtype=np.int16)
+            self.frame_callback(samples.reshape(-1, self.source_channels))
+
+        if self.audio_callback is not None:
+            # Convert audio format and feed to callback
+            converted_audio = self._convert_audio(frame)
+            while converted_audio is not None:
+                self.audio_callback(converted_audio)
+                converted_audio = self._next_frame()
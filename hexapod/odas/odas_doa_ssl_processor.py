@@ -7,12 +7,13 @@ Handles Direction of Arrival (DoA) and Sound Source Localization (SSL) data proc
 
 from __future__ import annotations
 from typing import TYPE_CHECKING
+import asyncio
+from collections import deque
 import socket
 import struct
 import json
 import time
 import threading
-from datetime import datetime
 import logging
 import subprocess
 from pathlib import Path
@@ -21,10 +22,17 @@ import sys
 import math
 
 from hexapod.interface import setup_logging, get_custom_logger
-from hexapod.utils import rename_thread
+from hexapod.utils import LatestValue
+from hexapod.odas.potential_sources_buffer import PotentialSourcesBuffer
+from hexapod.odas.session_log_writer import SessionLogWriter
+from hexapod.odas.odas_session_capture import ODASSessionRecorder
+from hexapod.odas.tracked_sources_history import (
+    TrackedSourcesHistory,
+    angular_distance,
+)
 
 if TYPE_CHECKING:
-    from typing import Optional, List, TextIO, Any, Dict
+    from typing import Optional, List, Set, Any, Dict, Callable, Tuple, Deque
     from hexapod.lights import LightsInteractionHandler
 
 logger = get_custom_logger("odas_logger")
@@ -36,9 +44,21 @@ class ODASDoASSLProcessor:
     Handles sound source tracking, processing, and visualization.
     """
 
+    STOP_POLL_INTERVAL: float = 0.1  # Seconds between checks of the external stop event
+    # Azimuth change that triggers a notification
+    DOMINANT_SOURCE_CHANGE_DEG: float = 5.0
+    LOOP_STOP_TIMEOUT: float = 2.0  # Seconds close() waits for the event loop to exit
+    # ODAS stdout lines that report the processing threads are running
+    ODAS_READY_MARKERS: Tuple[str, ...] = ("Launch threads",)
+    # ODAS configuration reading the ReSpeaker sound card
+    DEFAULT_CONFIG_PATH: Path = Path(__file__).parent / "config" / "local_odas.cfg"
+
     class DataManager:
         """
         Manages data-related operations including directory management, file handling, and logging.
+
+        Source frames are logged as compact JSONL records through background
+        SessionLogWriter instances, so logging never blocks the ODAS receive path.
         """
 
         def __init__(
@@ -46,8 +66,18 @@ class ODASDoASSLProcessor:
             processor: "ODASDoASSLProcessor",
             odas_logs_dir: Optional[Path] = None,
             odas_data_dir: Optional[Path] = None,
+            log_writer_config: Optional[Dict[str, Any]] = None,
         ) -> None:
-            """Initialize the data manager."""
+            """
+            Initialize the data manager.
+
+            Args:
+                processor (ODASDoASSLProcessor): The owning processor.
+                odas_logs_dir (Optional[Path]): Directory of the session logs.
+                odas_data_dir (Optional[Path]): Directory of the ODAS audio data.
+                log_writer_config (Optional[Dict[str, Any]]): Batching and rotation
+                    settings passed to each SessionLogWriter.
+            """
             self.processor = processor
             self.odas_logs_dir: Path = (
                 odas_logs_dir
@@ -57,9 +87,10 @@ class ODASDoASSLProcessor:
                 odas_data_dir
                 or Path(__file__).parent.parent.parent / "data" / "audio" / "odas"
             )
-            self.log_files: List[TextIO] = []
-            self.tracked_log: Optional[TextIO] = None
-            self.potential_log: Optional[TextIO] = None
+            self.log_writer_config: Dict[str, Any] = log_writer_config or {}
+            self.log_files: List[SessionLogWriter] = []
+            self.tracked_log: Optional[SessionLogWriter] = None
+            self.potential_log: Optional[SessionLogWriter] = None
             logger.debug(
                 f"DataManager initialized with directories: {self.odas_logs_dir}, {self.odas_data_dir}"
             )
@@ -70,10 +101,10 @@ class ODASDoASSLProcessor:
                 # Setup logging directories and files
                 self.odas_logs_dir.mkdir(parents=True, exist_ok=True)
                 self.tracked_log = self._open_log_file(
-                    self.odas_logs_dir / "tracked.log"
+                    self.odas_logs_dir / "tracked.jsonl"
                 )
                 self.potential_log = self._open_log_file(
-                    self.odas_logs_dir / "potential.log"
+                    self.odas_logs_dir / "potential.jsonl"
                 )
 
                 # Setup ODAS data directories
@@ -85,17 +116,17 @@ class ODASDoASSLProcessor:
                 # Fallback to current directory for logs if setup fails
                 self.odas_logs_dir = Path(__file__).parent
                 self.tracked_log = self._open_log_file(
-                    self.odas_logs_dir / "tracked.log"
+                    self.odas_logs_dir / "tracked.jsonl"
                 )
                 self.potential_log = self._open_log_file(
-                    self.odas_logs_dir / "potential.log"
+                    self.odas_logs_dir / "potential.jsonl"
                 )
                 logger.warning("Falling back to current directory for logs")
 
-        def _open_log_file(self, path: Path) -> TextIO:
-            """Open a log file and add it to the list of managed log files."""
+        def _open_log_file(self, path: Path) -> SessionLogWriter:
+            """Open a session log writer and add it to the list of managed log files."""
             try:
-                log_file: TextIO = open(path, "w")
+                log_file = SessionLogWriter(path, **self.log_writer_config)
                 self.log_files.append(log_file)
                 logger.debug(f"Opened log file: {path}")
                 return log_file
@@ -106,6 +137,9 @@ class ODASDoASSLProcessor:
                     def write(self, *args: Any, **kwargs: Any) -> None:
                         pass
 
+                    def write_record(self, *args: Any, **kwargs: Any) -> None:
+                        pass
+
                     def flush(self, *args: Any, **kwargs: Any) -> None:
                         pass
 
@@ -114,27 +148,24 @@ class ODASDoASSLProcessor:
 
                 return DummyFile()  # type: ignore
 
-        def log(
+        def log_frame(
             self,
-            message: str,
-            log_file: Optional[TextIO] = None,
-            print_to_console: bool = False,
+            sources: List[Dict[str, Any]],
+            log_file: Optional[SessionLogWriter] = None,
         ) -> None:
-            """Log a message to console and optionally to a specific log file."""
-            if not self.processor.running:
-                return
-
-            timestamp: str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            log_message: str = f"[{timestamp}] {message}\n"
+            """
+            Queue one ODAS frame as a single compact JSONL record.
 
-            if print_to_console:
-                print(log_message, end="")
+            Args:
+                sources (List[Dict[str, Any]]): Sources of the frame as decoded from JSON.
+                log_file (Optional[SessionLogWriter]): Session log of the frame's stream.
+            """
+            if not self.processor.running or log_file is None or not sources:
+                return
 
             try:
-                if log_file:
-                    log_file.write(log_message)
-                    log_file.flush()
-            except:
+                log_file.write_record({"timestamp": time.time(), "sources": sources})
+            except Exception:
                 pass
 
         def close(self) -> None:
@@ -150,8 +181,15 @@ class ODASDoASSLProcessor:
     class GUIManager:
         """
         Manages GUI-related operations including connection handling and data forwarding.
+
+        Frames are forwarded through a bounded outbound queue per GUI client. A sender
+        coroutine per client drains its queue with non-blocking sends, so a slow or stalled
+        GUI never holds up source processing; when a client lags behind, the oldest queued
+        frames are dropped and counted.
         """
 
+        CLIENT_TYPES = ("tracked", "potential")
+
         def __init__(
             self,
             processor: "ODASDoASSLProcessor",
@@ -161,6 +199,7 @@ class ODASDoASSLProcessor:
             forward_to_gui: bool = True,
             gui_tracked_sources_socket: Optional[socket.socket] = None,
             gui_potential_sources_socket: Optional[socket.socket] = None,
+            max_queued_frames: int = 16,
         ) -> None:
             """Initialize the GUI manager."""
             self.processor = processor
@@ -174,9 +213,21 @@ class ODASDoASSLProcessor:
                 gui_potential_sources_socket
             )
             self.forward_to_gui: bool = forward_to_gui
+            self.max_queued_frames: int = max_queued_frames
+            self.sent_frames: Dict[str, int] = {ct: 0 for ct in self.CLIENT_TYPES}
+            self.dropped_frames: Dict[str, int] = {ct: 0 for ct in self.CLIENT_TYPES}
+            self._outbound: Dict[str, Deque[bytes]] = {
+                ct: deque() for ct in self.CLIENT_TYPES
+            }
+            self._frame_available: Dict[str, asyncio.Event] = {}
+            self._sender_tasks: List[asyncio.Task] = []
 
         def connect(self) -> None:
-            """Connect to the remote GUI station."""
+            """Connect to the remote GUI station.
+
+            The sockets are connected in blocking mode with a short timeout and then
+            switched to non-blocking mode so that they can be driven by the event loop.
+            """
             try:
                 # Create socket with timeout
                 self.gui_tracked_sources_socket = socket.socket(
@@ -195,6 +246,9 @@ class ODASDoASSLProcessor:
                     (self.gui_host, self.gui_potential_sources_port)
                 )
 
+                self.gui_tracked_sources_socket.setblocking(False)
+                self.gui_potential_sources_socket.setblocking(False)
+
                 logger.odas_user_info(f"Connected to GUI at {self.gui_host}")
             except socket.timeout:
                 logger.error("GUI connection timeout")
@@ -226,18 +280,88 @@ class ODASDoASSLProcessor:
                 logger.warning("Disabling GUI forwarding...")
                 self.forward_to_gui = False
 
+        def _get_socket(self, client_type: str) -> Optional[socket.socket]:
+            """Return the GUI socket for a client type, if connected."""
+            if client_type == "tracked":
+                return self.gui_tracked_sources_socket
+            if client_type == "potential":
+                return self.gui_potential_sources_socket
+            return None
+
         def forward_data(self, data: bytes, client_type: str) -> None:
-            """Forward data to the GUI station."""
-            try:
-                if client_type == "tracked" and self.gui_tracked_sources_socket:
-                    self.gui_tracked_sources_socket.send(data)
-                elif client_type == "potential" and self.gui_potential_sources_socket:
-                    self.gui_potential_sources_socket.send(data)
-            except (BrokenPipeError, ConnectionResetError):
-                logger.error("GUI connection lost. Attempting to reconnect...")
-                self.handle_disconnection()
-            except Exception as e:
-                logger.error(f"GUI forward error: {str(e)}")
+            """Queue data for the GUI station without blocking.
+
+            If the client's queue is full, the oldest queued frame is dropped.
+            """
+            queue = self._outbound.get(client_type)
+            if queue is None or self._get_socket(client_type) is None:
+                return
+
+            if len(queue) >= self.max_queued_frames:
+                queue.popleft()
+                self.dropped_frames[client_type] += 1
+            queue.append(data)
+
+            frame_available = self._frame_available.get(client_type)
+            if frame_available is not None:
+                frame_available.set()
+
+        async def _send_loop(self, client_type: str) -> None:
+            """Drain a client's outbound queue with non-blocking sends.
+
+            ``sock_sendall`` resumes partial writes whenever the socket becomes writable,
+            so a frame is always sent completely and the GUI stream stays framed.
+            """
+            loop = asyncio.get_running_loop()
+            queue = self._outbound[client_type]
+            frame_available = self._frame_available[client_type]
+
+            while True:
+                await frame_available.wait()
+                frame_available.clear()
+
+                while queue:
+                    gui_socket = self._get_socket(client_type)
+                    if gui_socket is None:
+                        queue.clear()
+                        break
+                    frame = queue.popleft()
+                    try:
+                        await loop.sock_sendall(gui_socket, frame)
+                        self.sent_frames[client_type] += 1
+                    except (BrokenPipeError, ConnectionResetError):
+                        logger.error("GUI connection lost. Attempting to reconnect...")
+                        queue.clear()
+                        # Reconnecting blocks on connect(), keep it off the event loop
+                        await loop.run_in_executor(None, self.handle_disconnection)
+                    except Exception as e:
+                        logger.error(f"GUI forward error: {str(e)}")
+
+        def start_senders(self) -> None:
+            """Start one sender coroutine per GUI client on the running event loop."""
+            for client_type in self.CLIENT_TYPES:
+                self._frame_available[client_type] = asyncio.Event()
+                self._sender_tasks.append(
+                    asyncio.create_task(self._send_loop(client_type))
+                )
+                if self._outbound[client_type]:
+                    self._frame_available[client_type].set()
+
+        async def stop_senders(self) -> None:
+            """Cancel the sender coroutines and log forwarding statistics."""
+            for task in self._sender_tasks:
+                task.cancel()
+            await asyncio.gather(*self._sender_tasks, return_exceptions=True)
+            self._sender_tasks.clear()
+            self._frame_available.clear()
+
+            for client_type in self.CLIENT_TYPES:
+                if self.dropped_frames[client_type]:
+                    logger.warning(
+                        f"GUI {client_type} forwarding dropped "
+                        f"{self.dropped_frames[client_type]} of "
+                        f"{self.dropped_frames[client_type] + self.sent_frames[client_type]} frames"
+                    )
 
         def close(self) -> None:
             """Close all GUI connections."""
@@ -251,7 +375,13 @@ class ODASDoASSLProcessor:
         debug_mode: bool = True,
         gui_config: Optional[Dict[str, Any]] = None,
         data_config: Optional[Dict[str, Any]] = None,
+        potential_sources_config: Optional[Dict[str, Any]] = None,
+        tracked_history_config: Optional[Dict[str, Any]] = None,
         stop_event: Optional[threading.Event] = None,
+        session_capture_path: Optional[Path] = None,
+        connect_timeout: float = 10.0,
+        first_frame_timeout: float = 5.0,
+        config_path: Optional[Path] = None,
     ) -> None:
         """
         Initialize the ODAS DoA/SSL processor with configuration parameters.
@@ -263,28 +393,66 @@ class ODASDoASSLProcessor:
             debug_mode (bool): Whether to enable debug mode.
             gui_config (Optional[Dict[str, Any]]): Configuration for GUI manager.
             data_config (Optional[Dict[str, Any]]): Configuration for data manager.
+            potential_sources_config (Optional[Dict[str, Any]]): Capacity and retention
+                window of the potential sources buffer.
+            tracked_history_config (Optional[Dict[str, Any]]): History length and
+                smoothing windows of the tracked sources history.
             stop_event (Optional[threading.Event]): Event to signal stopping the ODAS process.
+            session_capture_path (Optional[Path]): If set, all received frames are
+                captured to this file for later replay.
+            connect_timeout (float): Seconds after spawning ODAS within which both
+                streams are expected to connect before a warning is logged.
+            first_frame_timeout (float): Seconds after both connections within which
+                the first frame is expected before a warning is logged.
+            config_path (Optional[Path]): ODAS configuration file, by default
+                ``config/local_odas.cfg`` reading the ReSpeaker sound card.
         """
+        self.config_path: Path = config_path or self.DEFAULT_CONFIG_PATH
         self.host: str = "127.0.0.1"
         self.tracked_sources_port: int = tracked_sources_port
         self.potential_sources_port: int = potential_sources_port
         self.tracked_sources_server: Optional[socket.socket] = None
         self.potential_sources_server: Optional[socket.socket] = None
         self.running: bool = True
-        self.threads: List[threading.Thread] = []
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._shutdown_event: Optional[asyncio.Event] = None
+        self._loop_stopped: threading.Event = threading.Event()
+        self._client_tasks: Set[asyncio.Task] = set()
         self.odas_process: Optional[subprocess.Popen] = None
         self.stop_event: Optional[threading.Event] = stop_event
 
+        # Startup readiness: set once ODAS connected both streams and sent the first
+        # frame, or reported readiness on stdout
+        self.connect_timeout: float = connect_timeout
+        self.first_frame_timeout: float = first_frame_timeout
+        self.ready_event: threading.Event = threading.Event()
+        self.startup_latencies: Dict[str, float] = {}
+        self._startup_time: Optional[float] = None
+        self._startup_events: Dict[str, asyncio.Event] = {}
+
         # Initialize managers
         self.data_manager = self.DataManager(self, **(data_config or {}))
         self.gui_manager = self.GUIManager(self, **(gui_config or {}))
         self.data_manager.setup()
+        self.session_recorder: Optional[ODASSessionRecorder] = (
+            ODASSessionRecorder(session_capture_path) if session_capture_path else None
+        )
 
         # Initialize LED visualization using the provided lights handler
         self.lights_handler = lights_handler
         self.tracked_sources: Dict[int, Dict] = {}
-        self.potential_sources: Dict[int, Dict] = {}
+        self.potential_sources = PotentialSourcesBuffer(
+            **(potential_sources_config or {})
+        )
         self.sources_lock: threading.Lock = threading.Lock()
+        self.tracked_history = TrackedSourcesHistory(**(tracked_history_config or {}))
+        self._dominant_source: Optional[Tuple[int, float]] = None
+        self._dominant_source_listeners: List[
+            Callable[[Optional[Tuple[int, float]]], None]
+        ] = []
+        self._tracked_frame_listeners: List[Callable[[List[Dict]], None]] = []
+        # Latest tracked azimuths, read by the DoA animation at its own refresh rate
+        self.doa_sources: LatestValue = LatestValue({})
 
         # Debug mode and display control
         self.debug_mode: bool = debug_mode
@@ -292,7 +460,7 @@ class ODASDoASSLProcessor:
         self.initial_connection_made: bool = False
 
     def _process_json_data(
-        self, data: bytes, client_type: str, log_file: TextIO
+        self, data: bytes, client_type: str, log_file: SessionLogWriter
     ) -> None:
         """Process JSON data from ODAS and update sources.
 
@@ -307,22 +475,22 @@ class ODASDoASSLProcessor:
             json_objects = []
             start = 0
 
-            # Extract all JSON objects from the data
+            # Extract all innermost JSON objects from the data. Pairing each closing
+            # brace with the nearest opening brace skips the {"timeStamp", "src": [...]}
+            # wrapper of ODAS frames, so the first source slot is not lost.
             while True:
-                start_brace = json_str.find("{", start)
-                if start_brace == -1:
-                    break
-                end_brace = json_str.find("}", start_brace)
+                end_brace = json_str.find("}", start)
                 if end_brace == -1:
                     break
-                json_obj = json_str[start_brace : end_brace + 1]
-                if json_obj:
-                    json_objects.append(json_obj)
-                    start = end_brace
-                else:
-                    break
+                start_brace = json_str.rfind("{", start, end_brace)
+                if start_brace != -1:
+                    json_objects.append(json_str[start_brace : end_brace + 1])
+                start = end_brace + 1
 
             all_sources: Dict[int, Dict] = {}
+            potential_sources: List[Dict] = []
+            # Tracked sources in ODAS slot order, including empty slots
+            tracked_slots: List[Dict] = []
 
             # Process each JSON object
             for json_obj in json_objects:
@@ -330,25 +498,30 @@ class ODASDoASSLProcessor:
                     source_data = json.loads(json_obj)
 
                     if client_type == "tracked":
+                        tracked_slots.append(source_data)
                         source_id = source_data.get("id", 0)
                         if source_id > 0:
                             all_sources[source_id] = source_data
-                            self.data_manager.log(f"Tracked source detected:", log_file)
-                            self.data_manager.log(
-                                json.dumps(source_data, indent=2), log_file
-                            )
                     else:
-                        source_id = len(self.potential_sources)
-                        with self.sources_lock:
-                            self.potential_sources[source_id] = source_data
-                        self.data_manager.log(f"Potential source detected:", log_file)
-                        self.data_manager.log(
-                            json.dumps(source_data, indent=2), log_file
-                        )
+                        potential_sources.append(source_data)
 
                 except json.JSONDecodeError as e:
                     continue
 
+            # Log the whole frame as one record on the background writer
+            self.data_manager.log_frame(
+                (
+                    list(all_sources.values())
+                    if client_type == "tracked"
+                    else potential_sources
+                ),
+                log_file,
+            )
+
+            # Store all potential sources of the frame in one write to the ring buffer
+            if potential_sources:
+                self.potential_sources.extend_from_sources(potential_sources)
+
             # For tracked sources, limit to top 4 by activity
             if client_type == "tracked":
                 if len(all_sources) > 4:
@@ -364,62 +537,67 @@ class ODASDoASSLProcessor:
                 with self.sources_lock:
                     self.tracked_sources = active_sources
 
-                if self.debug_mode:
-                    self._print_debug_info(active_sources)
+                # Hand the azimuths to the DoA animation without calling into it
+                self.doa_sources.publish(self._sources_azimuths(active_sources))
 
-            # Update visualization
-            with self.sources_lock:
-                tracked_sources_copy = dict(self.tracked_sources)
+                self.tracked_history.update(active_sources)
+                self._update_dominant_source()
+                self._notify_tracked_frame(tracked_slots)
 
-            if self.lights_handler.animation is not None and hasattr(
-                self.lights_handler.animation, "update_sources"
-            ):
-                azimuths = self.get_tracked_sources_azimuths()
-                self.lights_handler.animation.update_sources(azimuths)
+                if self.debug_mode:
+                    self._print_debug_info(active_sources)
 
         except Exception as e:
             logger.error(f"Error processing JSON data: {str(e)}")
 
-    def handle_odas_data(self, client_socket: socket.socket, client_type: str) -> None:
+    async def handle_odas_data(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        client_type: str,
+    ) -> None:
         """Handle data from a connected client.
 
-        This method:
+        This coroutine runs on the processor's event loop and:
         1. Receives data from the ODAS process
-        2. Processes the JSON data containing sound source information
-        3. Updates the visualization
-        4. Forwards data to GUI if enabled
+        2. Forwards data to GUI if enabled
+        3. Processes the JSON data containing sound source information
+        4. Updates the visualization
 
         The data format is:
         - 4 bytes: size of the following data
         - N bytes: JSON data containing sound source information
 
         Args:
-            client_socket: The socket connected to the ODAS process
+            reader: Stream reader connected to the ODAS process
+            writer: Stream writer of the same connection, closed on exit
             client_type: Either "tracked" or "potential" to identify the data type
         """
-        log_file: Optional[TextIO] = (
+        log_file: Optional[SessionLogWriter] = (
             self.data_manager.tracked_log
             if client_type == "tracked"
             else self.data_manager.potential_log
         )
 
-        while self.running and (not self.stop_event or not self.stop_event.is_set()):
-            try:
-                # Set a timeout to allow checking stop conditions
-                client_socket.settimeout(1.0)
+        client_task = asyncio.current_task()
+        if client_task is not None:
+            self._client_tasks.add(client_task)
+        logger.debug(f"ODAS {client_type} sources client connected")
+        self._mark_startup_phase(f"{client_type}_connected")
 
+        try:
+            while self.running:
                 # Receive the size of the incoming data
-                size_bytes: bytes = client_socket.recv(4)
-                if not size_bytes:
-                    break
+                size_bytes: bytes = await reader.readexactly(4)
 
                 # Convert size bytes to integer
                 size: int = struct.unpack("I", size_bytes)[0]
 
                 # Receive the actual data
-                data: bytes = client_socket.recv(size)
-                if not data:
-                    break
+                data: bytes = await reader.readexactly(size)
+
+                if self.session_recorder is not None:
+                    self.session_recorder.record(client_type, data)
 
                 # Forward data to GUI if enabled
                 if self.gui_manager.forward_to_gui:
@@ -428,15 +606,23 @@ class ODASDoASSLProcessor:
                 # Process the received data
                 if log_file is not None:
                     self._process_json_data(data, client_type, log_file)
-
-            except socket.timeout:
-                continue
-            except (ConnectionResetError, BrokenPipeError):
-                break
-            except Exception as e:
-                if self.running:
-                    logger.error(f"ODAS data handler error: {str(e)}")
-                break
+                self._mark_startup_phase("first_frame")
+
+        except (
+            asyncio.IncompleteReadError,
+            ConnectionResetError,
+            BrokenPipeError,
+            asyncio.CancelledError,
+        ):
+            pass
+        except Exception as e:
+            if self.running:
+                logger.error(f"ODAS data handler error: {str(e)}")
+        finally:
+            if client_task is not None:
+                self._client_tasks.discard(client_task)
+            writer.close()
+            logger.debug(f"ODAS {client_type} sources client disconnected")
 
     def start_server(self, port: int, data_type: str = "unknown") -> socket.socket:
         """Start a TCP server on the specified port.
@@ -466,16 +652,112 @@ class ODASDoASSLProcessor:
         """
         Return a dictionary mapping source_id to azimuth (in degrees) for all current tracked sources.
         Azimuth is calculated from x, y coordinates as in _get_direction, but as a float (0-360).
+        Safe to call from any thread while the event loop is running.
         """
-        azimuths = {}
+        # Take a snapshot under the lock so callers on other threads never block the
+        # event loop for longer than a dict copy.
         with self.sources_lock:
-            for sid, src in self.tracked_sources.items():
-                x = src.get("x", 0)
-                y = src.get("y", 0)
-                azimuth = (math.degrees(math.atan2(y, x)) + 360) % 360
-                azimuths[sid] = azimuth
+            tracked_sources = dict(self.tracked_sources)
+
+        return self._sources_azimuths(tracked_sources)
+
+    @staticmethod
+    def _sources_azimuths(sources: Dict[int, Dict]) -> Dict[int, float]:
+        """Return the azimuth (degrees, 0-360) of each source from its x, y coordinates."""
+        azimuths = {}
+        for sid, src in sources.items():
+            x = src.get("x", 0)
+            y = src.get("y", 0)
+            azimuth = (math.degrees(math.atan2(y, x)) + 360) % 360
+            azimuths[sid] = azimuth
         return azimuths
 
+    def get_dominant_source(self) -> Optional[Tuple[int, float]]:
+        """
+        Return the dominant tracked source and its smoothed azimuth.
+
+        The dominant source is chosen by activity and persistence over the tracked
+        sources history. Safe to call from any thread.
+
+        Returns:
+            Optional[Tuple[int, float]]: (source ID, azimuth in degrees), or None.
+        """
+        return self.tracked_history.dominant_source()
+
+    def add_dominant_source_listener(
+        self, listener: Callable[[Optional[Tuple[int, float]]], None]
+    ) -> None:
+        """
+        Register a callback invoked when the dominant source changes.
+
+        The callback runs on the event loop and must not block. It receives the new
+        (source ID, azimuth) tuple, or None when no source is tracked any more.
+
+        Args:
+            listener (Callable): Callback receiving the new dominant source.
+        """
+        self._dominant_source_listeners.append(listener)
+
+    def remove_dominant_source_listener(
+        self, listener: Callable[[Optional[Tuple[int, float]]], None]
+    ) -> None:
+        """Unregister a callback previously added with add_dominant_source_listener."""
+        if listener in self._dominant_source_listeners:
+            self._dominant_source_listeners.remove(listener)
+
+    def add_tracked_frame_listener(
+        self, listener: Callable[[List[Dict]], None]
+    ) -> None:
+        """
+        Register a callback invoked with every tracked sources frame.
+
+        The callback runs on the event loop and must not block. It receives the tracked
+        sources in ODAS slot order, including empty slots with ID 0, so slot i matches
+        channel i of the separated audio.
+
+        Args:
+            listener (Callable): Callback receiving the list of tracked source slots.
+        """
+        self._tracked_frame_listeners.append(listener)
+
+    def remove_tracked_frame_listener(
+        self, listener: Callable[[List[Dict]], None]
+    ) -> None:
+        """Unregister a callback previously added with add_tracked_frame_listener."""
+        if listener in self._tracked_frame_listeners:
+            self._tracked_frame_listeners.remove(listener)
+
+    def _notify_tracked_frame(self, tracked_slots: List[Dict]) -> None:
+        """Pass the slots of a tracked frame to the tracked frame listeners."""
+        for listener in list(self._tracked_frame_listeners):
+            try:
+                listener(tracked_slots)
+            except Exception as e:
+                logger.error(f"Tracked frame listener error: {str(e)}")
+
+    def _update_dominant_source(self) -> None:
+        """Notify listeners if the dominant source or its azimuth changed noticeably."""
+        dominant = self.tracked_history.dominant_source()
+        previous = self._dominant_source
+
+        if dominant is None and previous is None:
+            return
+        if (
+            dominant is not None
+            and previous is not None
+            and dominant[0] == previous[0]
+            and angular_distance(dominant[1], previous[1])
+            < self.DOMINANT_SOURCE_CHANGE_DEG
+        ):
+            return
+
+        self._dominant_source = dominant
+        for listener in list(self._dominant_source_listeners):
+            try:
+                listener(dominant)
+            except Exception as e:
+                logger.error(f"Dominant source listener error: {str(e)}")
+
     def _print_debug_info(self, active_sources: Dict[int, Dict]) -> None:
         """Print active sources in a multi-line format that updates in-place."""
         if not self.debug_mode:
@@ -517,60 +799,10 @@ class ODASDoASSLProcessor:
         # Reset text color
         print("\033[0m", end="", flush=True)
 
-    def accept_and_handle_data(
-        self, server_socket: socket.socket, client_type: str
-    ) -> None:
-        """Accept connections and handle ODAS data in a loop.
-
-        This method runs in a separate thread and:
-        1. Accepts connections from the ODAS process
-        2. Handles data reception and processing
-        3. Manages reconnections if the client disconnects
-
-        The loop is necessary because:
-        - ODAS might disconnect and reconnect
-        - The server needs to be ready to accept new connections
-        - The server needs to stay running to receive continuous data
-
-        Args:
-            server_socket: The TCP server socket to accept connections on
-            client_type: Either "tracked" or "potential" to identify the data type
-        """
-
-        def _accept_connection(
-            server_socket: socket.socket, client_type: str
-        ) -> Optional[socket.socket]:
-            """Accept a connection from a client.
-
-            This is a non-blocking accept with a 1-second timeout.
-            Returns the client socket if a connection is accepted, None otherwise.
-            """
-            try:
-                server_socket.settimeout(1.0)
-                client_socket, address = server_socket.accept()
-                return client_socket
-            except socket.timeout:
-                return None
-            except Exception as e:
-                if self.running:
-                    logger.error(f"Accept error: {str(e)}")
-                return None
-
-        while self.running and (not self.stop_event or not self.stop_event.is_set()):
-            try:
-                client_socket = _accept_connection(server_socket, client_type)
-                if client_socket:
-                    self.handle_odas_data(client_socket, client_type)
-                time.sleep(0.1)  # Small delay to prevent CPU spinning
-            except Exception as e:
-                if self.running:
-                    logger.error(f"Accept/handle error: {str(e)}")
-                time.sleep(1)  # Longer delay after error
-
     def start_odas_process(self) -> None:
         """Start the ODAS process."""
         try:
-            config_path = Path(__file__).parent / "config" / "local_odas.cfg"
+            config_path = self.config_path
             if not config_path.exists():
                 raise FileNotFoundError(f"Config file not found: {config_path}")
 
@@ -579,60 +811,77 @@ class ODASDoASSLProcessor:
                 ["odas", "-c", str(config_path)],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-            )
-
-            monitor_thread = threading.Thread(
-                target=self._monitor_odas_output, daemon=True
             )
-            rename_thread(monitor_thread, "ODASMonitor")
-            monitor_thread.start()
-            logger.debug("Started ODAS monitor thread")
 
         except Exception as e:
             logger.error(f"ODAS start error: {str(e)}")
             self.running = False
 
-    def _monitor_odas_output(self) -> None:
+    def _handle_odas_stdout(self, line: str) -> None:
+        """Log a line of ODAS standard output and react to readiness and connection errors."""
+        logger.odas_user_info(f"ODAS: {line}")
+        if any(marker in line for marker in self.ODAS_READY_MARKERS):
+            self._mark_startup_phase("odas_ready")
+        # Check for connection error and disable GUI forwarding if needed
+        if "Cannot connect to server" in line:
+            logger.warning("ODAS cannot connect to server")
+            self.gui_manager.forward_to_gui = False
+            self.gui_manager._close_sockets()
+
+    def _handle_odas_stderr(self, line: str) -> None:
+        """Log a line of ODAS standard error output."""
+        logger.error(f"ODAS Error: {line}")
+
+    async def _read_odas_pipe(
+        self, reader: asyncio.StreamReader, handler: Callable[[str], None]
+    ) -> None:
+        """Read lines from an ODAS output pipe until EOF and pass them to a handler."""
+        while self.running:
+            line = await reader.readline()
+            if not line:
+                break
+            text = line.decode("utf-8", errors="replace").strip()
+            if text:
+                handler(text)
+
+    async def _monitor_odas_output(self) -> None:
         """Monitor the ODAS process output and log it.
 
-        This method runs in a separate thread and:
-        1. Reads stdout and stderr from the ODAS process
+        This coroutine runs on the processor's event loop and:
+        1. Attaches non-blocking readers to stdout and stderr of the ODAS process
         2. Logs any output or errors
-        3. Continues until the ODAS process terminates or is stopped
+        3. Continues until the ODAS process closes its pipes or the loop is stopped
         """
         if not self.odas_process:
             return
 
+        loop = asyncio.get_running_loop()
+        transports: List[asyncio.BaseTransport] = []
+        readers = []
+
         try:
-            while (
-                self.running
-                and (not self.stop_event or not self.stop_event.is_set())
-                and self.odas_process.poll() is None
+            for pipe, handler in (
+                (self.odas_process.stdout, self._handle_odas_stdout),
+                (self.odas_process.stderr, self._handle_odas_stderr),
             ):
-                stdout = (
-                    self.odas_process.stdout.readline()
-                    if self.odas_process.stdout
-                    else None
-                )
-                stderr = (
-                    self.odas_process.stderr.readline()
-                    if self.odas_process.stderr
-                    else None
+                if pipe is None:
+                    continue
+                reader = asyncio.StreamReader()
+                transport, _ = await loop.connect_read_pipe(
+                    lambda reader=reader: asyncio.StreamReaderProtocol(reader), pipe
                 )
+                transports.append(transport)
+                readers.append(self._read_odas_pipe(reader, handler))
 
-                if stdout:
-                    logger.odas_user_info(f"ODAS: {stdout.strip()}")
-                    # Check for connection error and disable GUI forwarding if needed
-                    if "Cannot connect to server" in stdout:
-                        logger.warning("ODAS cannot connect to server")
-                        self.gui_manager.forward_to_gui = False
-                        self.gui_manager._close_sockets()
-                if stderr:
-                    logger.error(f"ODAS Error: {stderr.strip()}")
+            await asyncio.gather(*readers)
 
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
             logger.error(f"ODAS monitor error: {str(e)}")
+        finally:
+            for transport in transports:
+                transport.close()
 
     def _close_odas_process(self) -> None:
         """Close the ODAS process with graceful termination and fallback to force kill."""
@@ -660,6 +909,170 @@ class ODASDoASSLProcessor:
         finally:
             self.odas_process = None
 
+    async def _wait_for_stop(self) -> None:
+        """Wait until the processor is closed or the external stop event is set.
+
+        The stop event is a ``threading.Event`` owned by the calling task, so it is
+        checked periodically; ``close`` additionally wakes the loop up immediately.
+        """
+        while self.running and (not self.stop_event or not self.stop_event.is_set()):
+            try:
+                await asyncio.wait_for(
+                    self._shutdown_event.wait(), timeout=self.STOP_POLL_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                continue
+
+    def _mark_startup_phase(self, phase: str) -> None:
+        """Record the latency of a startup phase the first time it is reached.
+
+        Args:
+            phase: One of "tracked_connected", "potential_connected", "first_frame"
+                or "odas_ready"
+        """
+        if self._startup_time is None or phase in self.startup_latencies:
+            return
+        self.startup_latencies[phase] = time.monotonic() - self._startup_time
+        event = self._startup_events.get(phase)
+        if event is not None:
+            event.set()
+
+    async def _wait_for_startup_phase(
+        self, phases: Tuple[str, ...], timeout: Optional[float]
+    ) -> bool:
+        """Wait until all given phases are reached or ODAS reports readiness on stdout.
+
+        Args:
+            phases: Startup phases to wait for
+            timeout: Seconds to wait, None to wait indefinitely
+
+        Returns:
+            bool: True if the phases (or ODAS readiness) were reached in time.
+        """
+
+        async def _all_phases() -> None:
+            for phase in phases:
+                await self._startup_events[phase].wait()
+
+        waiters = [
+            asyncio.create_task(_all_phases()),
+            asyncio.create_task(self._startup_events["odas_ready"].wait()),
+        ]
+        try:
+            done, _ = await asyncio.wait(
+                waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        return bool(done)
+
+    async def _await_readiness(self) -> None:
+        """Wait for ODAS to become ready, then switch to the DoA animation.
+
+        ODAS is ready once both streams are connected and the first frame has been
+        processed, or as soon as it reports readiness on stdout. A phase exceeding its
+        timeout is reported and waited for further, since a slow ODAS start is still
+        a valid start.
+        """
+        for name, phases, timeout in (
+            (
+                "connections",
+                ("tracked_connected", "potential_connected"),
+                self.connect_timeout,
+            ),
+            ("first frame", ("first_frame",), self.first_frame_timeout),
+        ):
+            if not await self._wait_for_startup_phase(phases, timeout):
+                logger.warning(
+                    f"ODAS startup: no {name} within {timeout:.1f} s, still waiting"
+                )
+                await self._wait_for_startup_phase(phases, None)
+
+        # Switch to direction of arrival animation once ODAS delivers data
+        self.lights_handler.direction_of_arrival(sources=self.doa_sources)
+        self.ready_event.set()
+
+        logger.odas_user_info(
+            f"ODAS DoA/SSL Processor started: tracked={self.tracked_sources_port}, "
+            f"potential={self.potential_sources_port}, "
+            f"GUI forwarding={'on' if self.gui_manager.forward_to_gui else 'off'}, "
+            f"debug={'on' if self.debug_mode else 'off'}"
+        )
+        logger.info(
+            "ODAS startup latency: "
+            + ", ".join(
+                f"{phase} {latency * 1000:.0f} ms"
+                for phase, latency in sorted(
+                    self.startup_latencies.items(), key=lambda item: item[1]
+                )
+            )
+        )
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until ODAS delivers data or the timeout expires.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait in seconds, None waits forever.
+
+        Returns:
+            bool: True if ODAS is ready, False on timeout.
+        """
+        return self.ready_event.wait(timeout)
+
+    async def _run_event_loop(self) -> None:
+        """Serve both ODAS streams and monitor the ODAS process on a single event loop."""
+        self.loop = asyncio.get_running_loop()
+        self._shutdown_event = asyncio.Event()
+        self._loop_stopped.clear()
+
+        tracked_server = await asyncio.start_server(
+            lambda reader, writer: self.handle_odas_data(reader, writer, "tracked"),
+            sock=self.tracked_sources_server,
+        )
+        potential_server = await asyncio.start_server(
+            lambda reader, writer: self.handle_odas_data(reader, writer, "potential"),
+            sock=self.potential_sources_server,
+        )
+        monitor_task = asyncio.create_task(self._monitor_odas_output())
+        readiness_task: Optional[asyncio.Task] = None
+        if self._startup_time is not None:
+            self._startup_events = {
+                phase: asyncio.Event()
+                for phase in (
+                    "tracked_connected",
+                    "potential_connected",
+                    "first_frame",
+                    "odas_ready",
+                )
+            }
+            # Phases reached before the loop started
+            for phase in self.startup_latencies:
+                if phase in self._startup_events:
+                    self._startup_events[phase].set()
+            readiness_task = asyncio.create_task(self._await_readiness())
+        self.gui_manager.start_senders()
+        logger.debug("Started event loop for data handling")
+
+        try:
+            await self._wait_for_stop()
+        finally:
+            for server in (tracked_server, potential_server):
+                server.close()
+            pending = [monitor_task, *self._client_tasks]
+            if readiness_task is not None:
+                pending.append(readiness_task)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await self.gui_manager.stop_senders()
+            for server in (tracked_server, potential_server):
+                await server.wait_closed()
+            self.loop = None
+            self._loop_stopped.set()
+            logger.debug("Stopped event loop for data handling")
+
     def start(self) -> None:
         """Start the ODAS DoA/SSL processor.
 
@@ -668,13 +1081,14 @@ class ODASDoASSLProcessor:
         2. Starts TCP servers for data reception
         3. Starts the ODAS process (external audio processing)
         4. Connects to GUI if enabled
-        5. Creates and starts worker threads for data handling
-
-        The system uses multiple threads:
-        - Main thread: Controls program flow and cleanup
-        - ODAS monitor thread: Watches ODAS process output
-        - Tracked sources thread: Handles tracked sound source data
-        - Potential sources thread: Handles potential sound source data
+        5. Runs the event loop for data handling until stopped
+        6. Switches to the DoA animation once ODAS is ready (see ``wait_until_ready``)
+
+        All I/O runs on a single asyncio event loop in the calling thread:
+        - Tracked sources server: Handles tracked sound source data
+        - Potential sources server: Handles potential sound source data
+        - ODAS monitor: Watches ODAS process output
+        - GUI forwarding: Relays the raw frames to the GUI station
         """
         try:
             # Show loading animation while initializing
@@ -694,50 +1108,21 @@ class ODASDoASSLProcessor:
             )
 
             # Now start ODAS process
+            self.startup_latencies.clear()
+            self._startup_time = time.monotonic()
             self.start_odas_process()
             if not self.running:
                 return
+            self.startup_latencies["process_started"] = (
+                time.monotonic() - self._startup_time
+            )
 
             if self.gui_manager.forward_to_gui:
                 self.gui_manager.connect()
 
-            # Wait for 1.5 seconds to complete one full loading animation cycle - let servers initialize
-            time.sleep(1.5)
-
-            # Switch to direction of arrival animation once everything is initialized
-            self.lights_handler.direction_of_arrival()
-
-            logger.odas_user_info(
-                f"ODAS DoA/SSL Processor started: tracked={self.tracked_sources_port}, "
-                f"potential={self.potential_sources_port}, "
-                f"GUI forwarding={'on' if self.gui_manager.forward_to_gui else 'off'}, "
-                f"debug={'on' if self.debug_mode else 'off'}"
-            )
-
-            # Create and start worker threads
-            # These threads will handle data reception and processing
-            tracked_thread = threading.Thread(
-                target=self.accept_and_handle_data,
-                args=(self.tracked_sources_server, "tracked"),
-            )
-            potential_thread = threading.Thread(
-                target=self.accept_and_handle_data,
-                args=(self.potential_sources_server, "potential"),
-            )
-
-            # Rename threads for better identification
-            rename_thread(tracked_thread, "ODASTrackedSources")
-            rename_thread(potential_thread, "ODASPotentialSources")
-
-            tracked_thread.start()
-            potential_thread.start()
-            logger.debug("Started worker threads for data handling")
-
-            self.threads.extend([tracked_thread, potential_thread])
-
-            # Wait for threads to complete (they won't unless stopped)
-            for thread in self.threads:
-                thread.join()
+            # Run the event loop until stopped; the loading animation keeps running
+            # until ODAS is ready and the event loop switches to the DoA animation
+            asyncio.run(self._run_event_loop())
 
         except Exception as e:
             logger.error(f"Start error: {e}")
@@ -748,18 +1133,36 @@ class ODASDoASSLProcessor:
         logger.info("Closing ODAS DoA/SSL processor and cleaning up resources")
         self.running = False
 
+        # Wake up the event loop so it can shut down without waiting for the next poll,
+        # and let it release its sockets before they are closed below
+        loop, shutdown_event = self.loop, self._shutdown_event
+        if loop is not None and shutdown_event is not None:
+            try:
+                loop.call_soon_threadsafe(shutdown_event.set)
+                self._loop_stopped.wait(timeout=self.LOOP_STOP_TIMEOUT)
+            except RuntimeError:
+                pass  # Loop already closed
+            loop = self.loop
+
         # Stop the animation through the lights handler
         self.lights_handler.off()
 
-        for socket_obj in [self.tracked_sources_server, self.potential_sources_server]:
-            if socket_obj:
-                try:
-                    socket_obj.close()
-                except:
-                    pass
+        # While the event loop runs it owns the server sockets and closes them itself
+        if loop is None:
+            for socket_obj in [
+                self.tracked_sources_server,
+                self.potential_sources_server,
+            ]:
+                if socket_obj:
+                    try:
+                        socket_obj.close()
+                    except:
+                        pass
 
         # Close all log files through the data manager
         self.data_manager.close()
+        if self.session_recorder is not None:
+            self.session_recorder.close()
 
         # Close GUI connections
         self.gui_manager.close()
@@ -840,6 +1243,11 @@ def main() -> None:  # pragma: no cover
         type=str,
         help="Directory for ODAS data files (default: workspace_root/data/audio/odas)",
     )
+    parser.add_argument(
+        "--capture-session",
+        type=Path,
+        help="Capture the tracked/potential streams to this file for later replay",
+    )
     parser.add_argument(
         "--log-dir", type=Path, default=Path("logs"), help="Directory to store logs"
     )
@@ -889,6 +1297,7 @@ def main() -> None:  # pragma: no cover
         debug_mode=args.debug,
         gui_config=gui_config,
         data_config=data_config,
+        session_capture_path=args.capture_session,
     )
 
     try:
@@ -901,6 +1310,7 @@ def main() -> None:  # pragma: no cover
         )
     finally:
         server.close()
+        lights_handler.cleanup()
 
 
 if __name__ == "__main__":
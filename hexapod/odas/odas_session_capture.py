@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+
+"""
+Capture file format for ODAS tracked/potential source streams.
+
+A capture stores the frames exactly as received from ``odaslive`` together with their
+arrival time, so a session can later be replayed into the DoA/SSL processor without the
+microphone array. The file starts with a magic header followed by one record per frame:
+
+- 8 bytes: little-endian double, seconds since the start of the capture
+- 1 byte: stream (0 = tracked, 1 = potential)
+- 4 bytes: little-endian unsigned payload size
+- N bytes: JSON payload of the frame, without the 4-byte ODAS size header
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, NamedTuple
+from pathlib import Path
+import threading
+import struct
+import time
+
+from hexapod.interface import get_custom_logger
+
+if TYPE_CHECKING:
+    from typing import Optional, Union, Iterator, BinaryIO
+
+logger = get_custom_logger("odas_logger")
+
+CAPTURE_MAGIC = b"ODASCAP1"
+RECORD_HEADER = struct.Struct("<dBI")
+STREAMS = ("tracked", "potential")
+
+
+class CapturedFrame(NamedTuple):
+    """One ODAS frame read from a capture file."""
+
+    timestamp: float
+    client_type: str
+    payload: bytes
+
+
+class ODASSessionRecorder:
+    """
+    Writes ODAS frames to a capture file.
+
+    Frames from the tracked and potential streams share one file and are written in
+    arrival order; ``record`` is thread-safe.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Create the capture file and write its header.
+
+        Args:
+            path (Union[str, Path]): Path of the capture file, overwritten if it exists.
+
+        Raises:
+            OSError: If the capture file cannot be created.
+        """
+        self.path: Path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.frames: int = 0
+        self._file: Optional[BinaryIO] = open(self.path, "wb")
+        self._file.write(CAPTURE_MAGIC)
+        self._start: Optional[float] = None
+        self._lock: threading.Lock = threading.Lock()
+        logger.info(f"Capturing ODAS session to {self.path}")
+
+    def record(
+        self, client_type: str, payload: bytes, timestamp: Optional[float] = None
+    ) -> None:
+        """
+        Append one frame to the capture.
+
+        Args:
+            client_type (str): Either "tracked" or "potential".
+            payload (bytes): JSON payload of the frame.
+            timestamp (Optional[float]): Monotonic arrival time, defaults to now.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        with self._lock:
+            if self._file is None:
+                return
+            if self._start is None:
+                self._start = timestamp
+            self._file.write(
+                RECORD_HEADER.pack(
+                    timestamp - self._start, STREAMS.index(client_type), len(payload)
+                )
+            )
+            self._file.write(payload)
+            self.frames += 1
+
+    def close(self) -> None:
+        """Close the capture file."""
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+        logger.info(f"Captured {self.frames} ODAS frames to {self.path}")
+
+
+def read_session(path: Union[str, Path]) -> Iterator[CapturedFrame]:
+    """
+    Iterate over the frames of a capture file in recorded order.
+
+    A record truncated by an interrupted capture ends the iteration.
+
+    Args:
+        path (Union[str, Path]): Path of the capture file.
+
+    Yields:
+        CapturedFrame: Frames with their time offset, stream and payload.
+
+    Raises:
+        ValueError: If the file is not an ODAS capture.
+    """
+    with open(path, "rb") as capture:
+        if capture.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+            raise ValueError(f"{path} is not an ODAS session capture")
+
+        while True:
+            header = capture.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return
+            timestamp, stream, size = RECORD_HEADER.unpack(header)
+            payload = capture.read(size)
+            if len(payload) < size:
+                logger.warning(f"Truncated frame at the end of {path}")
+                return
+            yield CapturedFrame(timestamp, STREAMS[stream], payload)
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+
+"""
+ODAS session replay engine.
+
+Replays an ODAS session capture (see ``odas_session_capture``) into an
+``ODASDoASSLProcessor`` through local TCP connections that stand in for ``odaslive``.
+Frames can be paced at the recorded rate, N times faster, or sent as fast as possible,
+which allows profiling and regression testing the localization pipeline without the
+microphone array. The benchmark reports processed frames per second, end-to-end latency
+from sending a frame to the end of its processing, and the LED and DoA update rates.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from dataclasses import dataclass, asdict
+from collections import deque
+from pathlib import Path
+import threading
+import tempfile
+import argparse
+import asyncio
+import socket
+import struct
+import time
+import json
+import sys
+
+import numpy as np
+
+from hexapod.interface import get_custom_logger
+from hexapod.odas.odas_doa_ssl_processor import ODASDoASSLProcessor
+from hexapod.odas.odas_session_capture import read_session
+
+if TYPE_CHECKING:
+    from typing import Optional, Union, List, Dict, Any, Callable, Deque
+    from hexapod.odas.odas_session_capture import CapturedFrame
+
+logger = get_custom_logger("odas_logger")
+
+
+class ODASSessionReplayer:
+    """
+    Sends captured frames to the tracked and potential ports like ``odaslive`` does.
+
+    Each stream gets its own TCP connection and frames are sent with the 4-byte size
+    header ODAS uses, in recorded order across both streams.
+    """
+
+    def __init__(
+        self,
+        frames: List[CapturedFrame],
+        host: str = "127.0.0.1",
+        tracked_sources_port: int = 9000,
+        potential_sources_port: int = 9001,
+        speed: Optional[float] = 1.0,
+    ) -> None:
+        """
+        Initialize the replayer.
+
+        Args:
+            frames (List[CapturedFrame]): Frames to replay, e.g. from ``read_session``.
+            host (str): Host of the processor's servers.
+            tracked_sources_port (int): Port of the tracked sources server.
+            potential_sources_port (int): Port of the potential sources server.
+            speed (Optional[float]): Replay speed relative to the capture, None for
+                as fast as possible.
+
+        Raises:
+            ValueError: If speed is not positive.
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive")
+
+        self.frames: List[CapturedFrame] = frames
+        self.host: str = host
+        self.ports: Dict[str, int] = {
+            "tracked": tracked_sources_port,
+            "potential": potential_sources_port,
+        }
+        self.speed: Optional[float] = speed
+        self.frames_sent: int = 0
+        self._sockets: Dict[str, socket.socket] = {}
+
+    def connect(self, timeout: float = 5.0) -> None:
+        """
+        Connect to both source servers.
+
+        Args:
+            timeout (float): Connection timeout in seconds per server.
+        """
+        for client_type, port in self.ports.items():
+            self._sockets[client_type] = socket.create_connection(
+                (self.host, port), timeout=timeout
+            )
+
+    def replay(
+        self,
+        loops: int = 1,
+        on_send: Optional[Callable[[str], None]] = None,
+        stop_event: Optional[threading.Event] = None,
+    ) -> int:
+        """
+        Send all frames, pacing them according to the replay speed.
+
+        Args:
+            loops (int): Number of times the capture is replayed back to back.
+            on_send (Optional[Callable[[str], None]]): Called with the stream name right
+                before each frame is sent.
+            stop_event (Optional[threading.Event]): Event that aborts the replay.
+
+        Returns:
+            int: Number of frames sent.
+        """
+        if not self._sockets:
+            self.connect()
+        if not self.frames:
+            return 0
+
+        # Offset of each loop so that loops follow each other in capture time
+        loop_length = self.frames[-1].timestamp + (
+            self.frames[-1].timestamp / max(len(self.frames) - 1, 1)
+        )
+        start = time.monotonic()
+
+        for loop in range(loops):
+            for frame in self.frames:
+                if stop_event is not None and stop_event.is_set():
+                    return self.frames_sent
+
+                if self.speed is not None:
+                    due = start + (loop * loop_length + frame.timestamp) / self.speed
+                    delay = due - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+
+                if on_send is not None:
+                    on_send(frame.client_type)
+                self._sockets[frame.client_type].sendall(
+                    struct.pack("I", len(frame.payload)) + frame.payload
+                )
+                self.frames_sent += 1
+
+        return self.frames_sent
+
+    def close(self) -> None:
+        """Close both connections."""
+        for client in self._sockets.values():
+            try:
+                client.close()
+            except OSError:
+                pass
+        self._sockets.clear()
+
+
+@dataclass
+class ReplayStats:
+    """
+    Results of a replay benchmark.
+
+    Attributes:
+        frames_sent (int): Frames sent by the replayer.
+        frames_processed (int): Frames fully processed by the processor.
+        duration (float): Seconds from the first frame sent to the last frame processed.
+        fps (float): Processed frames per second.
+        latency_mean_ms (float): Mean send-to-processed latency.
+        latency_p50_ms (float): Median send-to-processed latency.
+        latency_p95_ms (float): 95th percentile send-to-processed latency.
+        latency_max_ms (float): Maximum send-to-processed latency.
+        led_updates (int): Tracked source updates published to the DoA animation.
+        led_update_rate (float): LED animation updates per second.
+        doa_updates (int): Dominant source (DoA) change notifications.
+        doa_update_rate (float): DoA change notifications per second.
+    """
+
+    frames_sent: int
+    frames_processed: int
+    duration: float
+    fps: float
+    latency_mean_ms: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_max_ms: float
+    led_updates: int
+    led_update_rate: float
+    doa_updates: int
+    doa_update_rate: float
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        return asdict(self)
+
+
+class _ReplayLightsHandler:
+    """Minimal lights handler used while replaying without LED hardware."""
+
+    def __init__(self) -> None:
+        self.animation: None = None
+
+    def odas_loading(self) -> None:
+        pass
+
+    def direction_of_arrival(self, **kwargs: Any) -> None:
+        pass
+
+    def off(self) -> None:
+        pass
+
+
+def run_replay_benchmark(
+    session: Union[str, Path, List[CapturedFrame]],
+    speed: Optional[float] = 1.0,
+    loops: int = 1,
+    timeout: float = 10.0,
+    processor_config: Optional[Dict[str, Any]] = None,
+) -> ReplayStats:
+    """
+    Replay a session into a local ODASDoASSLProcessor and measure its performance.
+
+    The processor serves its event loop in a background thread on ephemeral ports and
+    logs into a temporary directory; no ODAS process, GUI or LED hardware is used.
+
+    Args:
+        session (Union[str, Path, List[CapturedFrame]]): Capture file or frames.
+        speed (Optional[float]): Replay speed, None for as fast as possible.
+        loops (int): Number of times the capture is replayed.
+        timeout (float): Seconds to wait for outstanding frames after the replay.
+        processor_config (Optional[Dict[str, Any]]): Extra keyword arguments for the
+            processor, e.g. ``tracked_history_config``.
+
+    Returns:
+        ReplayStats: Measured throughput, latency and update rates.
+    """
+    frames = (
+        list(read_session(session)) if isinstance(session, (str, Path)) else session
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        lights_handler = _ReplayLightsHandler()
+        processor = ODASDoASSLProcessor(
+            lights_handler=lights_handler,  # type: ignore[arg-type]
+            tracked_sources_port=0,
+            potential_sources_port=0,
+            debug_mode=False,
+            gui_config={"forward_to_gui": False},
+            data_config={
+                "odas_logs_dir": Path(temp_dir) / "logs",
+                "odas_data_dir": Path(temp_dir) / "data",
+            },
+            **(processor_config or {}),
+        )
+
+        send_times: Dict[str, Deque[float]] = {
+            "tracked": deque(),
+            "potential": deque(),
+        }
+        latencies: List[float] = []
+        doa_updates = [0]
+        last_processed = [0.0]
+
+        def on_send(client_type: str) -> None:
+            send_times[client_type].append(time.perf_counter())
+
+        # Time each frame from just before it is sent until its processing finished
+        process_json_data = processor._process_json_data
+
+        def timed_process_json_data(data: bytes, client_type: str, log_file) -> None:
+            process_json_data(data, client_type, log_file)
+            last_processed[0] = time.perf_counter()
+            latencies.append(last_processed[0] - send_times[client_type].popleft())
+
+        def on_dominant_source(_dominant) -> None:
+            doa_updates[0] += 1
+
+        processor._process_json_data = timed_process_json_data  # type: ignore[method-assign]
+        processor.add_dominant_source_listener(on_dominant_source)
+
+        processor.tracked_sources_server = processor.start_server(0, "tracked")
+        processor.potential_sources_server = processor.start_server(0, "potential")
+        loop_thread = threading.Thread(
+            target=lambda: asyncio.run(processor._run_event_loop()),
+            name="ODASReplayProcessor",
+            daemon=True,
+        )
+        loop_thread.start()
+
+        replayer = ODASSessionReplayer(
+            frames,
+            host=processor.host,
+            tracked_sources_port=processor.tracked_sources_server.getsockname()[1],
+            potential_sources_port=processor.potential_sources_server.getsockname()[1],
+            speed=speed,
+        )
+        try:
+            replayer.connect()
+            started = time.perf_counter()
+            sent = replayer.replay(loops=loops, on_send=on_send)
+
+            deadline = time.monotonic() + timeout
+            while len(latencies) < sent and time.monotonic() < deadline:
+                time.sleep(0.005)
+        finally:
+            replayer.close()
+            processor.close()
+            loop_thread.join(timeout=5)
+
+    processed = len(latencies)
+    led_updates = processor.doa_sources.version
+    duration = max(last_processed[0] - started, 1e-9) if processed else 0.0
+    latencies_ms = np.array(latencies) * 1000.0 if latencies else np.zeros(1)
+
+    def rate(count: int) -> float:
+        return count / duration if duration else 0.0
+
+    return ReplayStats(
+        frames_sent=sent,
+        frames_processed=processed,
+        duration=duration,
+        fps=rate(processed),
+        latency_mean_ms=float(latencies_ms.mean()),
+        latency_p50_ms=float(np.percentile(latencies_ms, 50)),
+        latency_p95_ms=float(np.percentile(latencies_ms, 95)),
+        latency_max_ms=float(latencies_ms.max()),
+        led_updates=led_updates,
+        led_update_rate=rate(led_updates),
+        doa_updates=doa_updates[0],
+        doa_update_rate=rate(doa_updates[0]),
+    )
+
+
+def main() -> None:  # pragma: no cover
+    """Main entry point for the ODAS session replay benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Replay a captured ODAS session into the DoA/SSL processor"
+    )
+    parser.add_argument(
+        "session",
+        type=Path,
+        help="Capture file recorded with odas_doa_ssl_processor --capture-session",
+    )
+    speed_group = parser.add_mutually_exclusive_group()
+    speed_group.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Replay speed relative to the capture (default: 1.0)",
+    )
+    speed_group.add_argument(
+        "--max-speed",
+        action="store_true",
+        help="Replay as fast as the processor accepts frames",
+    )
+    parser.add_argument(
+        "--loops",
+        type=int,
+        default=1,
+        help="Number of times the capture is replayed (default: 1)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the results as JSON",
+    )
+    args = parser.parse_args()
+
+    try:
+        stats = run_replay_benchmark(
+            args.session,
+            speed=None if args.max_speed else args.speed,
+            loops=args.loops,
+        )
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(stats.as_dict(), indent=2))
+        return
+
+    print(f"Frames:     {stats.frames_processed}/{stats.frames_sent} processed")
+    print(f"Duration:   {stats.duration:.2f} s")
+    print(f"Throughput: {stats.fps:.1f} frames/s")
+    print(
+        f"Latency:    mean {stats.latency_mean_ms:.2f} ms, "
+        f"p50 {stats.latency_p50_ms:.2f} ms, p95 {stats.latency_p95_ms:.2f} ms, "
+        f"max {stats.latency_max_ms:.2f} ms"
+    )
+    print(f"LED:        {stats.led_updates} updates ({stats.led_update_rate:.1f} Hz)")
+    print(f"DoA:        {stats.doa_updates} changes ({stats.doa_update_rate:.1f} Hz)")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,15 +9,97 @@ channel selection, and format conversion for seamless integration with the
 voice control pipeline.
 """
 
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
 import argparse
 import wave
-import numpy as np
 import time
-from pathlib import Path
-import tempfile
 import sys
+import os
+
+import numpy as np
+
+from hexapod.interface import get_custom_logger
+from hexapod.odas.streaming_resampler import resample
+
+if TYPE_CHECKING:
+    from typing import Optional, Union, Sequence, List
+
+logger = get_custom_logger("odas_logger")
+
+PICOVOICE_SAMPLE_RATE = 16000
+
+
+@dataclass
+class ConversionResult:
+    """
+    Result of converting one ODAS raw file.
+
+    Attributes:
+        input_file (Path): Converted raw file.
+        output_file (Path): Written WAV file.
+        audio_seconds (float): Duration of the converted audio.
+        elapsed_seconds (float): Wall time of the conversion.
+    """
+
+    input_file: Path
+    output_file: Path
+    audio_seconds: float
+    elapsed_seconds: float
+
+    @property
+    def realtime_factor(self) -> float:
+        """Return how many times faster than real time the file was converted."""
+        return self.audio_seconds / max(self.elapsed_seconds, 1e-9)
+
+
+@dataclass
+class BatchConversionResult:
+    """
+    Result of converting several ODAS raw files.
+
+    Attributes:
+        results (List[ConversionResult]): Per-file results in input order.
+        elapsed_seconds (float): Wall time of the whole batch.
+        workers (int): Number of worker processes used.
+    """
+
+    results: List[ConversionResult] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    workers: int = 1
+
+    @property
+    def audio_seconds(self) -> float:
+        """Return the total duration of the converted audio."""
+        return sum(result.audio_seconds for result in self.results)
+
+    @property
+    def realtime_factor(self) -> float:
+        """Return how many times faster than real time the batch was converted."""
+        return self.audio_seconds / max(self.elapsed_seconds, 1e-9)
+
+
+def read_odas_raw(input_file: Path, channels: int = 4) -> np.ndarray:
+    """
+    Memory-map an ODAS raw file as interleaved 16-bit samples.
 
-from hexapod.odas.odas_audio_processor import ODASAudioProcessor
+    A trailing incomplete sample frame, e.g. of a recording cut off while ODAS was
+    writing, is ignored.
+
+    Args:
+        input_file (Path): ODAS raw file.
+        channels (int): Number of interleaved channels.
+
+    Returns:
+        np.ndarray: Read-only int16 array of shape (samples, channels).
+    """
+    frames = os.path.getsize(input_file) // (2 * channels)
+    if frames == 0:
+        return np.zeros((0, channels), dtype=np.int16)
+    return np.memmap(input_file, dtype="<i2", mode="r", shape=(frames, channels))
 
 
 def convert_odas_to_wav(
@@ -25,85 +107,125 @@ def convert_odas_to_wav(
     output_file: Path,
     sample_rate: int = 44100,
     channels: int = 4,
-    selected_channel: int = 0,
-) -> None:
+    selected_channel: Union[int, Sequence[int]] = 0,
+    target_sample_rate: int = PICOVOICE_SAMPLE_RATE,
+) -> ConversionResult:
     """
     Convert ODAS raw audio file to WAV format compatible with Picovoice.
 
+    The raw file is memory-mapped and the selected channels are resampled in one
+    batched pass, so the conversion runs many times faster than real time.
+
     Args:
         input_file (Path): Path to the input ODAS raw file
         output_file (Path): Path to save the output WAV file
         sample_rate (int): Input sample rate (default: 44100)
         channels (int): Number of input channels (default: 4)
-        selected_channel (int): Channel to extract (default: 0)
-    """
-    # Create a temporary directory for ODASAudioProcessor
-    with tempfile.TemporaryDirectory() as temp_dir:
-        odas_input = ODASAudioProcessor(
-            odas_dir=Path(temp_dir),
-            sample_rate=sample_rate,
-            channels=channels,
-            selected_channel=selected_channel,
-        )
+        selected_channel (Union[int, Sequence[int]]): Channel to extract, or several
+            channels written to a multichannel WAV (default: 0)
+        target_sample_rate (int): Output sample rate (default: 16000)
 
-    # Open output WAV file
-    wav_file = wave.open(str(output_file), "wb")
-    wav_file.setnchannels(1)  # Mono
-    wav_file.setsampwidth(2)  # 16-bit
-    wav_file.setframerate(16000)  # Picovoice sample rate
+    Returns:
+        ConversionResult: Duration of the audio and time taken.
 
-    # Buffer to store converted audio
-    converted_audio = []
-    last_file_size = 0
-    no_change_count = 0
+    Raises:
+        ValueError: If a selected channel does not exist.
+        FileNotFoundError: If the input file does not exist.
+    """
+    selected = (
+        [selected_channel]
+        if isinstance(selected_channel, int)
+        else list(selected_channel)
+    )
+    if not selected or any(not 0 <= channel < channels for channel in selected):
+        raise ValueError(
+            f"Selected channels {selected} not in range of {channels} channels"
+        )
 
-    def audio_callback(audio_data: np.ndarray) -> None:
-        # Store the converted audio data
-        converted_audio.append(audio_data.tobytes())
+    start_time = time.perf_counter()
+    samples = read_odas_raw(input_file, channels)
+    source = samples[:, selected[0]] if len(selected) == 1 else samples[:, selected]
+    converted = resample(source, sample_rate, target_sample_rate)
+    pcm = np.clip(np.rint(converted), -32768, 32767).astype("<i2")
 
-    # Set up the callback
-    odas_input.set_audio_callback(audio_callback)
+    with wave.open(str(output_file), "wb") as wav_file:
+        wav_file.setnchannels(len(selected))
+        wav_file.setsampwidth(2)  # 16-bit
+        wav_file.setframerate(target_sample_rate)
+        wav_file.writeframes(pcm.tobytes())
 
-    # Start reading and converting
-    odas_input.start()
+    result = ConversionResult(
+        input_file=Path(input_file),
+        output_file=Path(output_file),
+        audio_seconds=len(samples) / sample_rate,
+        elapsed_seconds=time.perf_counter() - start_time,
+    )
+    logger.info(
+        f"Converted {input_file} to {output_file} "
+        f"({result.audio_seconds:.1f} s of audio, {result.realtime_factor:.0f}x real time)"
+    )
+    return result
 
-    # Wait for conversion to complete with timeout
-    start_time = time.time()
-    timeout = 30  # 30 seconds timeout
 
-    while odas_input.running:
-        current_file_size = input_file.stat().st_size
+def _convert_job(arguments: tuple) -> ConversionResult:
+    """Convert one file in a worker process."""
+    return convert_odas_to_wav(*arguments)
 
-        # Check if file size hasn't changed
-        if current_file_size == last_file_size:
-            no_change_count += 1
-            if no_change_count >= 5:  # If no change for 5 iterations
-                print("No new data detected, stopping conversion...")
-                break
-        else:
-            no_change_count = 0
-            last_file_size = current_file_size
 
-        # Check timeout
-        if time.time() - start_time > timeout:
-            print("Timeout reached, stopping conversion...")
-            break
+def convert_odas_files(
+    input_files: Sequence[Path],
+    output_dir: Path,
+    sample_rate: int = 44100,
+    channels: int = 4,
+    selected_channel: Union[int, Sequence[int]] = 0,
+    target_sample_rate: int = PICOVOICE_SAMPLE_RATE,
+    max_workers: Optional[int] = None,
+) -> BatchConversionResult:
+    """
+    Convert several ODAS raw files to WAV files in parallel.
 
-        time.sleep(0.1)  # Small delay to prevent CPU hogging
+    Each file is converted in its own worker process and written to ``output_dir``
+    under its name with a ``.wav`` suffix.
 
-    # Stop the ODASAudioProcessor
-    odas_input.stop()
+    Args:
+        input_files (Sequence[Path]): ODAS raw files.
+        output_dir (Path): Directory for the WAV files, created if needed.
+        sample_rate (int): Input sample rate.
+        channels (int): Number of input channels.
+        selected_channel (Union[int, Sequence[int]]): Channel(s) to extract.
+        target_sample_rate (int): Output sample rate.
+        max_workers (Optional[int]): Worker processes, defaults to the CPU count.
+            With one worker or one file the conversion runs in this process.
 
-    # Write all converted audio to the WAV file
-    for audio_chunk in converted_audio:
-        wav_file.writeframes(audio_chunk)
+    Returns:
+        BatchConversionResult: Per-file results and the overall throughput.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    jobs = [
+        (
+            Path(input_file),
+            output_dir / f"{Path(input_file).stem}.wav",
+            sample_rate,
+            channels,
+            selected_channel,
+            target_sample_rate,
+        )
+        for input_file in input_files
+    ]
+    workers = min(max_workers or os.cpu_count() or 1, max(len(jobs), 1))
 
-    # Close the WAV file
-    wav_file.close()
+    start_time = time.perf_counter()
+    if workers == 1:
+        results = [_convert_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_convert_job, jobs))
 
-    print(f"Successfully converted {input_file} to {output_file}")
-    print(f"Output format: 16000 Hz, mono, 16-bit PCM")
-    print(f"Converted {len(converted_audio)} chunks of audio")
+    return BatchConversionResult(
+        results=results,
+        elapsed_seconds=time.perf_counter() - start_time,
+        workers=workers,
+    )
 
 
 def main() -> None:  # pragma: no cover
@@ -120,9 +242,15 @@ def main() -> None:  # pragma: no cover
     parser = argparse.ArgumentParser(
         description="Convert ODAS raw audio to WAV format compatible with Picovoice"
     )
-    parser.add_argument("input_file", type=str, help="Path to the input ODAS raw file")
     parser.add_argument(
-        "output_file", type=str, help="Path to save the output WAV file"
+        "input_file",
+        type=str,
+        help="Path to the input ODAS raw file, or a directory of raw files",
+    )
+    parser.add_argument(
+        "output_file",
+        type=str,
+        help="Path to save the output WAV file, or the output directory",
     )
     parser.add_argument(
         "--sample-rate",
@@ -136,16 +264,42 @@ def main() -> None:  # pragma: no cover
     parser.add_argument(
         "--channel", type=int, default=0, help="Channel to extract (default: 0)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for a directory (default: CPU count)",
+    )
 
     args = parser.parse_args()
 
-    convert_odas_to_wav(
+    if os.path.isdir(args.input_file):
+        input_files = sorted(Path(args.input_file).glob("*.raw"))
+        batch = convert_odas_files(
+            input_files,
+            Path(args.output_file),
+            args.sample_rate,
+            args.channels,
+            args.channel,
+            max_workers=args.workers,
+        )
+        print(
+            f"Converted {len(batch.results)} files ({batch.audio_seconds:.1f} s of audio) "
+            f"in {batch.elapsed_seconds:.2f} s with {batch.workers} workers: "
+            f"{batch.realtime_factor:.0f}x real time"
+        )
+        return
+
+    result = convert_odas_to_wav(
         Path(args.input_file),
         Path(args.output_file),
         args.sample_rate,
         args.channels,
         args.channel,
     )
+    print(f"Successfully converted {result.input_file} to {result.output_file}")
+    print(f"Output format: {PICOVOICE_SAMPLE_RATE} Hz, mono, 16-bit PCM")
+    print(f"Converted at {result.realtime_factor:.0f}x real time")
 
 
 if __name__ == "__main__":
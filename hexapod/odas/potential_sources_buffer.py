@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+
+"""
+Bounded, time-windowed store for ODAS potential sound sources.
+
+Potential sources arrive on every ODAS frame for as long as sound source localization
+runs. They are kept in a fixed-capacity ring buffer of columnar NumPy arrays so memory
+stays constant regardless of session length, and queries over recent sources are vectorized.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import threading
+import time
+import math
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Iterable, Tuple, Any
+
+
+class PotentialSourcesBuffer:
+    """
+    Fixed-capacity ring buffer of potential sources with a retention window.
+
+    Each entry stores the x, y, z coordinates, the energy E and a monotonic timestamp
+    in separate columns. Once the buffer is full the oldest entries are overwritten, and
+    entries older than the retention window are ignored by all queries.
+    """
+
+    COLUMNS = ("x", "y", "z", "E", "timestamp")
+
+    def __init__(self, capacity: int = 4096, retention_ms: float = 5000.0) -> None:
+        """
+        Initialize the potential sources buffer.
+
+        Args:
+            capacity (int): Maximum number of potential sources kept in memory.
+            retention_ms (float): Age in milliseconds after which sources are ignored.
+
+        Raises:
+            ValueError: If capacity or retention_ms is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if retention_ms <= 0:
+            raise ValueError("retention_ms must be positive")
+
+        self.capacity: int = capacity
+        self.retention_ms: float = retention_ms
+        self._data: np.ndarray = np.zeros(
+            (len(self.COLUMNS), capacity), dtype=np.float64
+        )
+        self._write_index: int = 0
+        self._size: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones not yet overwritten."""
+        return self._size
+
+    def append(
+        self,
+        x: float,
+        y: float,
+        z: float,
+        energy: float,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """
+        Append a single potential source.
+
+        Args:
+            x (float): X coordinate of the source.
+            y (float): Y coordinate of the source.
+            z (float): Z coordinate of the source.
+            energy (float): Energy (E) of the source.
+            timestamp (Optional[float]): Monotonic timestamp in seconds, defaults to now.
+        """
+        self.extend([(x, y, z, energy)], timestamp)
+
+    def extend(
+        self,
+        rows: Iterable[Tuple[float, float, float, float]],
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """
+        Append all potential sources of one ODAS frame in a single vectorized write.
+
+        Args:
+            rows (Iterable[Tuple[float, float, float, float]]): (x, y, z, E) per source.
+            timestamp (Optional[float]): Monotonic timestamp in seconds, defaults to now.
+        """
+        values = np.asarray(list(rows), dtype=np.float64).reshape(-1, 4)
+        count = values.shape[0]
+        if count == 0:
+            return
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        # Only the newest `capacity` rows can survive the write
+        if count > self.capacity:
+            values = values[-self.capacity :]
+            count = self.capacity
+
+        with self._lock:
+            indices = (self._write_index + np.arange(count)) % self.capacity
+            self._data[:4, indices] = values.T
+            self._data[4, indices] = timestamp
+            self._write_index = (self._write_index + count) % self.capacity
+            self._size = min(self._size + count, self.capacity)
+
+    def extend_from_sources(
+        self, sources: Iterable[Dict[str, Any]], timestamp: Optional[float] = None
+    ) -> None:
+        """
+        Append parsed ODAS potential source dictionaries.
+
+        The energy is read from ``E`` and falls back to ``activity`` for older ODAS builds.
+
+        Args:
+            sources (Iterable[Dict[str, Any]]): Potential sources as decoded from JSON.
+            timestamp (Optional[float]): Monotonic timestamp in seconds, defaults to now.
+        """
+        self.extend(
+            (
+                (
+                    source.get("x", 0.0),
+                    source.get("y", 0.0),
+                    source.get("z", 0.0),
+                    source.get("E", source.get("activity", 0.0)),
+                )
+                for source in sources
+            ),
+            timestamp,
+        )
+
+    def clear(self) -> None:
+        """Remove all stored entries."""
+        with self._lock:
+            self._write_index = 0
+            self._size = 0
+
+    def recent(
+        self, window_ms: Optional[float] = None, now: Optional[float] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Return the potential sources seen within the last ``window_ms`` milliseconds.
+
+        Args:
+            window_ms (Optional[float]): Window length, capped at the retention window.
+            now (Optional[float]): Reference monotonic time in seconds, defaults to now.
+
+        Returns:
+            Dict[str, np.ndarray]: Column name to array, ordered from oldest to newest.
+        """
+        if now is None:
+            now = time.monotonic()
+        window_ms = (
+            self.retention_ms
+            if window_ms is None
+            else min(window_ms, self.retention_ms)
+        )
+
+        with self._lock:
+            start = (self._write_index - self._size) % self.capacity
+            order = (start + np.arange(self._size)) % self.capacity
+            data = self._data[:, order]
+
+        mask = data[4] >= now - window_ms / 1000.0
+        return {name: data[i, mask] for i, name in enumerate(self.COLUMNS)}
+
+    def energy_weighted_direction(
+        self, window_ms: Optional[float] = None, now: Optional[float] = None
+    ) -> Optional[Tuple[float, float, float]]:
+        """
+        Return the energy-weighted mean direction of recent potential sources.
+
+        Args:
+            window_ms (Optional[float]): Window length, capped at the retention window.
+            now (Optional[float]): Reference monotonic time in seconds, defaults to now.
+
+        Returns:
+            Optional[Tuple[float, float, float]]: Unit vector (x, y, z), or None if there
+            are no recent sources or their total energy is zero.
+        """
+        recent = self.recent(window_ms, now)
+        weights = recent["E"]
+        if weights.size == 0 or weights.sum() <= 0:
+            return None
+
+        direction = np.array(
+            [
+                np.dot(weights, recent["x"]),
+                np.dot(weights, recent["y"]),
+                np.dot(weights, recent["z"]),
+            ]
+        )
+        norm = np.linalg.norm(direction)
+        if norm == 0:
+            return None
+        direction /= norm
+        return (float(direction[0]), float(direction[1]), float(direction[2]))
+
+    def energy_weighted_azimuth(
+        self, window_ms: Optional[float] = None, now: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        Return the azimuth in degrees (0-360) of the energy-weighted mean direction.
+
+        Args:
+            window_ms (Optional[float]): Window length, capped at the retention window.
+            now (Optional[float]): Reference monotonic time in seconds, defaults to now.
+
+        Returns:
+            Optional[float]: Azimuth in degrees, or None if no direction is available.
+        """
+        direction = self.energy_weighted_direction(window_ms, now)
+        if direction is None:
+            return None
+        return (math.degrees(math.atan2(direction[1], direction[0])) + 360) % 360
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+
+"""
+Tail-following reader for the raw audio files written by ODAS.
+
+ODAS appends interleaved 16-bit samples to its raw output files for as long as it runs.
+The reader keeps the file open, reads new data directly into a fixed-size ring buffer
+and hands out complete frames as zero-copy ``memoryview`` slices of that buffer. New
+data is awaited with inotify on Linux and by polling elsewhere, so an idle reader costs
+nothing and a reader with a backlog drains it at disk speed without per-frame copies.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from pathlib import Path
+import ctypes
+import ctypes.util
+import select
+import struct
+import time
+import sys
+import os
+
+from hexapod.interface import get_custom_logger
+
+if TYPE_CHECKING:
+    from typing import Optional, Union, Iterator, BinaryIO
+
+logger = get_custom_logger("odas_logger")
+
+
+class _FileChangeWatcher:
+    """
+    Waits for changes of a single file using inotify, falling back to polling.
+
+    The parent directory is watched so that the file may be created, replaced or
+    truncated while it is being followed.
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_Q_OVERFLOW = 0x00004000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, path: Path, use_inotify: bool = True) -> None:
+        """
+        Start watching the file.
+
+        Args:
+            path (Path): File to watch.
+            use_inotify (bool): Use inotify where available, otherwise always poll.
+        """
+        self.path: Path = path
+        self._fd: int = -1
+        if use_inotify and sys.platform.startswith("linux"):
+            try:
+                self._fd = self._add_inotify_watch()
+            except (OSError, AttributeError) as e:
+                logger.debug(f"inotify unavailable, polling {path.name}: {e}")
+
+    @property
+    def uses_inotify(self) -> bool:
+        """Return whether changes are detected with inotify."""
+        return self._fd >= 0
+
+    def _add_inotify_watch(self) -> int:
+        """Create an inotify instance watching the parent directory of the file."""
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+        if libc.inotify_add_watch(fd, str(self.path.parent).encode(), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, f"inotify_add_watch failed for {self.path.parent}")
+        return fd
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Wait until the file changes or the timeout expires.
+
+        Args:
+            timeout (float): Maximum time to wait in seconds.
+
+        Returns:
+            bool: True if the file may have changed, False on timeout. Polling always
+            returns True after sleeping for the timeout.
+        """
+        if self._fd < 0:
+            time.sleep(timeout)
+            return True
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            ready, _, _ = select.select([self._fd], [], [], remaining)
+            if not ready:
+                return False
+            if self._drain_events():
+                return True
+
+    def _drain_events(self) -> bool:
+        """Read all pending inotify events and report whether one concerns the file."""
+        target = os.fsencode(self.path.name)
+        changed = False
+        while True:
+            try:
+                data = os.read(self._fd, 4096)
+            except BlockingIOError:
+                return changed
+            if not data:
+                return changed
+
+            offset = 0
+            while offset + self.EVENT_HEADER.size <= len(data):
+                _, mask, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+                offset += self.EVENT_HEADER.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                if mask & self.IN_Q_OVERFLOW or name == target:
+                    changed = True
+
+    def close(self) -> None:
+        """Stop watching the file."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class RawAudioTailReader:
+    """
+    Follows a growing raw audio file and yields complete frames without copying.
+
+    The ring buffer holds a whole number of frames and data is only ever read up to its
+    end, so a frame never wraps around and every frame can be handed out as a contiguous
+    ``memoryview``. Yielded views point into the ring buffer and are only valid until the
+    next frame is requested; consumers that keep the data must copy it.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        frame_bytes: int,
+        ring_frames: int = 64,
+        use_inotify: bool = True,
+    ) -> None:
+        """
+        Initialize the reader.
+
+        Args:
+            path (Union[str, Path]): Raw audio file to follow.
+            frame_bytes (int): Size of one frame in bytes.
+            ring_frames (int): Capacity of the ring buffer in frames.
+            use_inotify (bool): Use inotify where available, otherwise poll.
+
+        Raises:
+            ValueError: If frame_bytes or ring_frames is not positive.
+        """
+        if frame_bytes <= 0 or ring_frames <= 0:
+            raise ValueError("frame_bytes and ring_frames must be positive")
+
+        self.path: Path = Path(path)
+        self.frame_bytes: int = frame_bytes
+        self.position: int = 0  # Bytes of the file read so far
+        self._ring: bytearray = bytearray(frame_bytes * ring_frames)
+        self._view: memoryview = memoryview(self._ring)
+        self._read_pos: int = 0
+        self._write_pos: int = 0
+        self._file: Optional[BinaryIO] = None
+        self._watcher: _FileChangeWatcher = _FileChangeWatcher(self.path, use_inotify)
+
+    def __enter__(self) -> RawAudioTailReader:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether the audio file is currently open."""
+        return self._file is not None
+
+    @property
+    def uses_inotify(self) -> bool:
+        """Return whether new data is awaited with inotify."""
+        return self._watcher.uses_inotify
+
+    def open(self) -> bool:
+        """
+        Open the audio file from its beginning if it is not open yet.
+
+        Returns:
+            bool: True if the file is open, False if it cannot be opened (yet).
+        """
+        if self._file is not None:
+            return True
+        try:
+            self._file = open(self.path, "rb", buffering=0)
+        except OSError:
+            return False
+        self.position = 0
+        self._read_pos = self._write_pos = 0
+        return True
+
+    def frames(self) -> Iterator[memoryview]:
+        """
+        Yield all complete frames available in the file.
+
+        Returns once the end of the file is reached; a trailing partial frame is kept
+        and completed by later calls.
+
+        Yields:
+            memoryview: One frame, valid until the next frame is requested.
+        """
+        if not self.open():
+            return
+
+        frame_bytes = self.frame_bytes
+        while True:
+            while self._write_pos - self._read_pos >= frame_bytes:
+                start = self._read_pos
+                self._read_pos += frame_bytes
+                yield self._view[start : start + frame_bytes]
+
+            if self._read_pos == self._write_pos:
+                self._read_pos = self._write_pos = 0
+
+            count = self._file.readinto(self._view[self._write_pos :])
+            if not count:
+                self._check_replaced()
+                return
+            self._write_pos += count
+            self.position += count
+
+    def _check_replaced(self) -> None:
+        """Restart from the beginning if the file was truncated or replaced."""
+        try:
+            current = os.stat(self.path)
+        except OSError:
+            return
+        opened = os.fstat(self._file.fileno())
+
+        if current.st_ino != opened.st_ino or current.st_dev != opened.st_dev:
+            logger.info(f"{self.path.name} was replaced, reopening")
+            self._file.close()
+            self._file = None
+            self.open()
+        elif opened.st_size < self.position:
+            logger.info(f"{self.path.name} was truncated, reading from the start")
+            self._file.seek(0)
+            self.position = 0
+            self._read_pos = self._write_pos = 0
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Wait for new data in the file.
+
+        Args:
+            timeout (float): Maximum time to wait in seconds.
+
+        Returns:
+            bool: True if the file may have changed, False on timeout.
+        """
+        return self._watcher.wait(timeout)
+
+    def close(self) -> None:
+        """Close the file and stop watching it."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._watcher.close()
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+
+"""
+Transports delivering the raw audio stream written by ODAS.
+
+A transport hands out the bytes ODAS appended to one of its raw audio outputs since the
+last read. ``SFTPTransport`` keeps a single SFTP handle on the remote file open for the
+whole session, ``LocalFileTransport`` follows a local file and ``TCPTransport`` accepts
+the connection of an ODAS socket sink, so consumers such as the streaming player work
+the same on the robot, on a workstation and against a replayed session.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from pathlib import Path
+import select
+import socket
+import time
+import abc
+
+from hexapod.interface import get_custom_logger
+from hexapod.odas.raw_audio_tail_reader import _FileChangeWatcher
+
+if TYPE_CHECKING:
+    from typing import Optional, Union, BinaryIO, Any
+
+logger = get_custom_logger("odas_logger")
+
+DEFAULT_READ_SIZE = 65536
+
+
+class RawStreamTransport(abc.ABC):
+    """
+    Abstract source of a continuously growing raw audio stream.
+
+    ``read`` never blocks: it returns the new bytes available right now, or an empty
+    ``bytes`` when there are none, and ``wait`` blocks until more may be available.
+    A transport whose stream disappeared raises ``FileNotFoundError`` (file sources)
+    or ``ConnectionError`` (socket sources) from ``read`` and can be opened again.
+    """
+
+    def __enter__(self) -> RawStreamTransport:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    @abc.abstractmethod
+    def is_open(self) -> bool:
+        """Return whether the stream is currently open."""
+
+    @abc.abstractmethod
+    def open(self) -> bool:
+        """
+        Open the stream if it is not open yet.
+
+        Returns:
+            bool: True if the stream is open, False if it is not available (yet).
+        """
+
+    @abc.abstractmethod
+    def read(self, max_bytes: int = DEFAULT_READ_SIZE) -> bytes:
+        """
+        Read new stream data without blocking.
+
+        Args:
+            max_bytes (int): Maximum number of bytes to return.
+
+        Returns:
+            bytes: New data, empty if none is available.
+        """
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Wait for new stream data.
+
+        Args:
+            timeout (float): Maximum time to wait in seconds.
+
+        Returns:
+            bool: True if new data may be available, False on timeout.
+        """
+        time.sleep(timeout)
+        return True
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Close the stream."""
+
+
+class SFTPTransport(RawStreamTransport):
+    """
+    Follows a file on a remote machine through one persistent SFTP handle.
+
+    The file is opened once and read sequentially from the current position; the
+    remote size is only checked when a read comes back empty, to detect a restarted
+    ODAS instance that truncated or removed the file.
+    """
+
+    def __init__(
+        self, ssh: Any, remote_file: Union[str, Path], start_at_end: bool = True
+    ) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            ssh (Any): Connected ``paramiko.SSHClient``.
+            remote_file (Union[str, Path]): Raw audio file on the remote machine.
+            start_at_end (bool): Skip the data already in the file when opening it,
+                so playback starts with live audio.
+        """
+        self.ssh = ssh
+        self.remote_file: str = str(remote_file)
+        self.start_at_end = start_at_end
+        self.position: int = 0
+        self._sftp: Any = None
+        self._file: Any = None
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether the remote file is currently open."""
+        return self._file is not None
+
+    def open(self) -> bool:
+        """
+        Open an SFTP session and the remote file if they are not open yet.
+
+        Returns:
+            bool: True if the file is open, False if it does not exist (yet).
+        """
+        if self._file is not None:
+            return True
+        if self._sftp is None:
+            self._sftp = self.ssh.open_sftp()
+        try:
+            self._file = self._sftp.open(self.remote_file, "rb")
+        except FileNotFoundError:
+            return False
+        self.position = self._file.stat().st_size if self.start_at_end else 0
+        self._file.seek(self.position)
+        logger.debug(f"Following {self.remote_file} from byte {self.position}")
+        return True
+
+    def read(self, max_bytes: int = DEFAULT_READ_SIZE) -> bytes:
+        """
+        Read the data appended to the remote file since the last read.
+
+        Args:
+            max_bytes (int): Maximum number of bytes to return.
+
+        Returns:
+            bytes: New data, empty if none is available.
+
+        Raises:
+            FileNotFoundError: If the remote file was removed.
+        """
+        if not self.open():
+            raise FileNotFoundError(self.remote_file)
+
+        data = self._file.read(max_bytes)
+        if data:
+            self.position += len(data)
+            return data
+
+        size = self._sftp.stat(self.remote_file).st_size
+        if size < self.position:
+            logger.info(f"{self.remote_file} was truncated, reading from the start")
+            self._file.seek(0)
+            self.position = 0
+        return b""
+
+    def close(self) -> None:
+        """Close the remote file and the SFTP session."""
+        for resource in (self._file, self._sftp):
+            if resource is not None:
+                try:
+                    resource.close()
+                except Exception as e:
+                    logger.debug(f"Error closing SFTP resource: {e}")
+        self._file = None
+        self._sftp = None
+
+
+class LocalFileTransport(RawStreamTransport):
+    """
+    Follows a local raw audio file, e.g. on the robot itself or a replayed session.
+
+    New data is awaited with inotify on Linux and by polling elsewhere.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        start_at_end: bool = False,
+        use_inotify: bool = True,
+    ) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            path (Union[str, Path]): Raw audio file to follow.
+            start_at_end (bool): Skip the data already in the file when opening it.
+            use_inotify (bool): Use inotify where available, otherwise poll.
+        """
+        self.path: Path = Path(path)
+        self.start_at_end = start_at_end
+        self.position: int = 0
+        self._file: Optional[BinaryIO] = None
+        self._watcher = _FileChangeWatcher(self.path, use_inotify)
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether the file is currently open."""
+        return self._file is not None
+
+    def open(self) -> bool:
+        """
+        Open the file if it is not open yet.
+
+        Returns:
+            bool: True if the file is open, False if it does not exist (yet).
+        """
+        if self._file is not None:
+            return True
+        try:
+            self._file = open(self.path, "rb", buffering=0)
+        except OSError:
+            return False
+        self.position = self._file.seek(0, 2) if self.start_at_end else 0
+        return True
+
+    def read(self, max_bytes: int = DEFAULT_READ_SIZE) -> bytes:
+        """
+        Read the data appended to the file since the last read.
+
+        Args:
+            max_bytes (int): Maximum number of bytes to return.
+
+        Returns:
+            bytes: New data, empty if none is available.
+
+        Raises:
+            FileNotFoundError: If the file was removed.
+        """
+        if not self.open():
+            raise FileNotFoundError(str(self.path))
+
+        data = self._file.read(max_bytes)
+        if data:
+            self.position += len(data)
+            return data
+
+        current = self.path.stat()
+        if current.st_size < self.position:
+            logger.info(f"{self.path.name} was truncated, reading from the start")
+            self._file.seek(0)
+            self.position = 0
+        return b""
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Wait for the file to change.
+
+        Args:
+            timeout (float): Maximum time to wait in seconds.
+
+        Returns:
+            bool: True if the file may have changed, False on timeout.
+        """
+        return self._watcher.wait(timeout)
+
+    def close(self) -> None:
+        """Close the file and stop watching it."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._watcher.close()
+
+
+class TCPTransport(RawStreamTransport):
+    """
+    Receives a raw audio stream from an ODAS socket sink.
+
+    ODAS connects to its sinks as a client, so the transport listens on a port and
+    accepts one connection at a time. Configure the ``postfiltered`` or ``separated``
+    sink of ODAS with ``interface: { type = "socket"; ip = ...; port = ...; }``.
+    """
+
+    def __init__(self, host: str = "0.0.0.0", port: int = 10000) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            host (str): Address to listen on.
+            port (int): Port to listen on, 0 picks a free one.
+        """
+        self.host = host
+        self.port = port
+        self._server: Optional[socket.socket] = None
+        self._client: Optional[socket.socket] = None
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether an ODAS sink is connected."""
+        return self._client is not None
+
+    @property
+    def address(self) -> Optional[tuple]:
+        """Return the address the transport listens on once it is listening."""
+        return self._server.getsockname() if self._server is not None else None
+
+    def listen(self) -> None:
+        """Start listening for the ODAS sink if not listening yet."""
+        if self._server is None:
+            server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            server.bind((self.host, self.port))
+            server.listen(1)
+            server.setblocking(False)
+            self._server = server
+
+    def open(self) -> bool:
+        """
+        Accept a pending ODAS connection if none is connected yet.
+
+        Returns:
+            bool: True if a sink is connected, False if none has connected (yet).
+        """
+        if self._client is not None:
+            return True
+        self.listen()
+        try:
+            client, address = self._server.accept()
+        except BlockingIOError:
+            return False
+        client.setblocking(False)
+        self._client = client
+        logger.info(f"ODAS audio sink connected from {address[0]}:{address[1]}")
+        return True
+
+    def read(self, max_bytes: int = DEFAULT_READ_SIZE) -> bytes:
+        """
+        Receive the data sent since the last read.
+
+        Args:
+            max_bytes (int): Maximum number of bytes to return.
+
+        Returns:
+            bytes: New data, empty if none is available.
+
+        Raises:
+            ConnectionError: If ODAS closed the connection.
+        """
+        if not self.open():
+            return b""
+        try:
+            data = self._client.recv(max_bytes)
+        except BlockingIOError:
+            return b""
+        if not data:
+            self._client.close()
+            self._client = None
+            raise ConnectionError("ODAS audio sink disconnected")
+        return data
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Wait for data or for the ODAS sink to connect.
+
+        Args:
+            timeout (float): Maximum time to wait in seconds.
+
+        Returns:
+            bool: True if the socket is readable, False on timeout.
+        """
+        self.listen()
+        sock = self._client if self._client is not None else self._server
+        readable, _, _ = select.select([sock], [], [], timeout)
+        return bool(readable)
+
+    def close(self) -> None:
+        """Close the connection and stop listening."""
+        for sock in (self._client, self._server):
+            if sock is not None:
+                sock.close()
+        self._client = None
+        self._server = None
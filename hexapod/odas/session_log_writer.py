@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+
+"""
+Background writer for ODAS session logs in compact JSONL format.
+
+Sound source frames arrive on the ODAS receive path at the full ODAS frame rate. Instead
+of formatting and flushing every source synchronously, frames are handed to a bounded
+queue and a background thread serializes them as one compact JSON line per frame, writes
+them in batches and rotates the log file once it reaches a size limit.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from pathlib import Path
+import threading
+import queue
+import time
+import json
+
+from hexapod.interface import get_custom_logger
+
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Union, BinaryIO, Any
+
+logger = get_custom_logger("odas_logger")
+
+
+class SessionLogWriter:
+    """
+    File-like log writer that never blocks the caller.
+
+    Records are queued with ``write_record`` (dictionaries, one JSONL line each) or
+    ``write`` (preformatted text). If the writer thread falls behind and the queue is
+    full, new records are dropped and counted instead of blocking the producer.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 3,
+        flush_bytes: int = 64 * 1024,
+        flush_interval: float = 1.0,
+        max_queued_records: int = 10000,
+    ) -> None:
+        """
+        Open the log file and start the background writer thread.
+
+        Args:
+            path (Union[str, Path]): Path of the log file, truncated on open.
+            max_bytes (int): File size at which the log is rotated, 0 disables rotation.
+            backup_count (int): Number of rotated files kept as ``<name>.1`` ... ``<name>.N``.
+            flush_bytes (int): Pending batch size in bytes that triggers a write.
+            flush_interval (float): Maximum time in seconds a record waits before it is written.
+            max_queued_records (int): Capacity of the queue between producer and writer.
+
+        Raises:
+            OSError: If the log file cannot be opened.
+        """
+        self.path: Path = Path(path)
+        self.max_bytes: int = max_bytes
+        self.backup_count: int = backup_count
+        self.flush_bytes: int = flush_bytes
+        self.flush_interval: float = flush_interval
+        self.written_records: int = 0
+        self.dropped_records: int = 0
+        self.rotations: int = 0
+
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queued_records)
+        self._flush_requested: threading.Event = threading.Event()
+        self._file: BinaryIO = open(self.path, "wb")
+        self._file_size: int = 0
+        self._closed: bool = False
+
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run, name=f"SessionLogWriter-{self.path.stem}", daemon=True
+        )
+        self._thread.start()
+
+    def write_record(self, record: Dict[str, Any]) -> None:
+        """
+        Queue a record to be written as one compact JSON line.
+
+        The record is serialized by the writer thread, so it must not be mutated after
+        it has been queued.
+
+        Args:
+            record (Dict[str, Any]): JSON-serializable record.
+        """
+        self._enqueue(record)
+
+    def write(self, text: str) -> None:
+        """
+        Queue preformatted text, written as-is.
+
+        Args:
+            text (str): Text to append to the log.
+        """
+        self._enqueue(text)
+
+    def flush(self) -> None:
+        """Ask the writer thread to write pending records without waiting for it."""
+        self._flush_requested.set()
+        # Wake the writer if it is idle
+        self._enqueue(None)
+
+    def _enqueue(self, item: Any) -> None:
+        if self._closed:
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            if item is not None:
+                self.dropped_records += 1
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Write all queued records, stop the writer thread and close the file.
+
+        Args:
+            timeout (float): Maximum time in seconds to wait for the writer thread.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        # The sentinel must get through even if the queue is full
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+        if self.dropped_records:
+            logger.warning(
+                f"ODAS session log {self.path.name} dropped {self.dropped_records} records"
+            )
+
+    def _run(self) -> None:
+        """Writer thread: batch queued records and write them to the file."""
+        batch = bytearray()
+        last_write = time.monotonic()
+
+        try:
+            while True:
+                if batch:
+                    timeout = max(
+                        0.0, last_write + self.flush_interval - time.monotonic()
+                    )
+                    try:
+                        item = self._queue.get(timeout=timeout)
+                    except queue.Empty:
+                        item = None
+                else:
+                    item = self._queue.get()
+
+                if item is self._STOP:
+                    break
+                self._append(batch, item)
+
+                # Drain whatever else is already queued into the same batch
+                stop = False
+                while len(batch) < self.flush_bytes:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is self._STOP:
+                        stop = True
+                        break
+                    self._append(batch, item)
+                if stop:
+                    break
+
+                now = time.monotonic()
+                if batch and (
+                    len(batch) >= self.flush_bytes
+                    or now - last_write >= self.flush_interval
+                    or self._flush_requested.is_set()
+                ):
+                    self._flush_requested.clear()
+                    self._write_batch(batch)
+                    batch.clear()
+                    last_write = now
+                elif not batch:
+                    self._flush_requested.clear()
+                    last_write = now
+
+            if batch:
+                self._write_batch(batch)
+        except Exception as e:
+            logger.error(f"ODAS session log writer error: {str(e)}")
+        finally:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+
+    def _append(self, batch: bytearray, item: Any) -> None:
+        """Serialize a queued item into the pending batch."""
+        if item is None:
+            return
+        if isinstance(item, str):
+            batch += item.encode("utf-8")
+            return
+        try:
+            batch += json.dumps(item, separators=(",", ":")).encode("utf-8")
+            batch += b"\n"
+            self.written_records += 1
+        except (TypeError, ValueError) as e:
+            logger.error(f"Cannot serialize ODAS log record: {str(e)}")
+
+    def _write_batch(self, batch: bytearray) -> None:
+        """Write a batch to the file, rotating it first if it would exceed max_bytes."""
+        if self.max_bytes > 0 and self._file_size > 0:
+            if self._file_size + len(batch) > self.max_bytes:
+                self._rotate()
+        self._file.write(batch)
+        self._file.flush()
+        self._file_size += len(batch)
+
+    def _rotate(self) -> None:
+        """Shift ``<name>.N-1`` ... ``<name>`` to ``<name>.N`` ... ``<name>.1`` and reopen."""
+        self._file.close()
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = self.path.with_name(f"{self.path.name}.{index}")
+                if source.exists():
+                    source.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        self._file = open(self.path, "wb")
+        self._file_size = 0
+        self.rotations += 1
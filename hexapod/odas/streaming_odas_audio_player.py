@@ -10,16 +10,16 @@ ODAS creates two continuous raw audio streams:
 1. postfiltered.raw: Contains post-filtered audio streams (default, optimized for listening)
 2. separated.raw: Contains separated audio streams (one for each sound source)
 
-The script continuously monitors these streams, transfers new audio data, and plays it in real-time.
+The script follows the selected stream through one persistent transport (SFTP by default), decodes the new
+16-bit samples in memory, mixes the channels down to mono and writes the samples to an adaptive jitter buffer
+that holds playback near a target latency, without temporary files or external converters.
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING
 import sys
 import time
-import tempfile
 import platform
-import subprocess
 import threading
 import logging
 import logging.config
@@ -28,11 +28,16 @@ from pathlib import Path
 
 import paramiko
 import sounddevice as sd
-import wave
 import numpy as np
-import queue
 
 from hexapod.interface import setup_logging, clean_logs
+from hexapod.odas.raw_stream_transport import (
+    RawStreamTransport,
+    SFTPTransport,
+    LocalFileTransport,
+    TCPTransport,
+)
+from hexapod.odas.jitter_buffer import JitterBuffer
 
 if TYPE_CHECKING:
     from typing import Optional, Any
@@ -45,17 +50,62 @@ DEFAULT_REMOTE_DIR = "/home/hexapod/hexapod/data/audio/odas"
 DEFAULT_SAMPLE_RATE = 44100
 DEFAULT_CHANNELS = 4
 DEFAULT_BUFFER_SIZE = 1024
-DEFAULT_CHECK_INTERVAL = 0.5
+DEFAULT_CHECK_INTERVAL = 0.05
+DEFAULT_TARGET_LATENCY = 0.1
+DEFAULT_MAX_LATENCY = 1.0
+STATS_LOG_INTERVAL = 30.0
 
 # Type aliases
 AudioFileType = str  # 'postfiltered' or 'separated'
-ProcessList = List[subprocess.Popen]
 
 from hexapod.interface import get_custom_logger
 
 logger = get_custom_logger("odas_logger")
 
 
+class RawAudioDownmixer:
+    """
+    Decodes interleaved 16-bit ODAS audio into mono float32 blocks.
+
+    The channels are averaged with a single matrix-vector product that also scales the
+    samples to [-1, 1), and bytes of an incomplete sample frame are carried over to the
+    next call, so data can be fed in arbitrarily sized pieces as it arrives.
+    """
+
+    def __init__(self, channels: int) -> None:
+        """
+        Initialize the downmixer.
+
+        Args:
+            channels (int): Number of interleaved channels.
+        """
+        self.channels = channels
+        self.frame_bytes = channels * 2
+        self._weights = np.full(channels, 1.0 / (channels * 32768.0), dtype=np.float32)
+        self._remainder = b""
+
+    def reset(self) -> None:
+        """Drop a carried partial sample frame."""
+        self._remainder = b""
+
+    def process(self, data: bytes) -> np.ndarray:
+        """
+        Mix new raw audio down to mono.
+
+        Args:
+            data (bytes): Interleaved int16 samples, possibly ending mid-frame.
+
+        Returns:
+            np.ndarray: Mono float32 samples of all complete sample frames.
+        """
+        if self._remainder:
+            data = self._remainder + data
+        usable = len(data) - len(data) % self.frame_bytes
+        self._remainder = bytes(data[usable:])
+        samples = np.frombuffer(data, dtype=np.int16, count=usable // 2)
+        return samples.reshape(-1, self.channels) @ self._weights
+
+
 class StreamingODASAudioPlayer:
     """
     A class to handle remote ODAS audio streaming and playback.
@@ -69,12 +119,14 @@ class StreamingODASAudioPlayer:
         remote_host: str = DEFAULT_HOSTNAME,
         remote_user: str = DEFAULT_USER,
         remote_dir: str = DEFAULT_REMOTE_DIR,
-        local_dir: str = "data/audio/odas/streaming",
         sample_rate: int = DEFAULT_SAMPLE_RATE,
         channels: int = DEFAULT_CHANNELS,
         ssh_key_path: str = str(DEFAULT_SSH_KEY),
         buffer_size: int = DEFAULT_BUFFER_SIZE,
         check_interval: float = DEFAULT_CHECK_INTERVAL,
+        transport: Optional[RawStreamTransport] = None,
+        target_latency: float = DEFAULT_TARGET_LATENCY,
+        max_latency: float = DEFAULT_MAX_LATENCY,
     ) -> None:
         """
         Initialize the remote ODAS audio player.
@@ -83,40 +135,40 @@ class StreamingODASAudioPlayer:
             remote_host (str): Hostname or IP of the remote machine
             remote_user (str): Username for SSH connection
             remote_dir (str): Directory on remote machine where ODAS creates raw files
-            local_dir (str): Directory where WAV files will be saved locally
             sample_rate (int): Sample rate of the audio files
             channels (int): Number of channels in the audio files
             ssh_key_path (str): Path to SSH private key
-            buffer_size (int): Size of audio buffer in bytes
+            buffer_size (int): Number of samples per output block
             check_interval (float): Interval in seconds to check for new audio data
+            transport (Optional[RawStreamTransport]): Source of the raw stream, replacing
+                the SFTP connection to the remote file (e.g. a local file or socket)
+            target_latency (float): Playback latency the jitter buffer holds, in seconds
+            max_latency (float): Hard capacity of the jitter buffer, in seconds
         """
         self.remote_host = remote_host
         self.remote_user = remote_user
         self.remote_dir = Path(remote_dir)
-        self.local_dir = Path(local_dir)
         self.sample_rate = sample_rate
         self.channels = channels
         self.buffer_size = buffer_size
         self.check_interval = check_interval
         self.running = True
-        self.processes: ProcessList = []
         self.ssh_key_path = ssh_key_path
-
-        # Create local directory if it doesn't exist
-        self.local_dir.mkdir(parents=True, exist_ok=True)
+        self.transport = transport
 
         # Set up SSH client
         self.ssh = paramiko.SSHClient()
         self.ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
-        # Log directory information
         logger.user_info(f"Monitoring ODAS audio streams on {self.remote_host}")
-        logger.user_info(f"Saving WAV files locally to: {self.local_dir}")
 
-        self.audio_queue: queue.Queue[bytes] = queue.Queue()
+        self.jitter_buffer = JitterBuffer(
+            sample_rate, target_latency=target_latency, max_latency=max_latency
+        )
         self.stream = None
         self.stream_thread = None
         self.is_playing = False
+        self._downmixer = RawAudioDownmixer(channels)
 
     def connect_ssh(self) -> None:
         """Establish SSH connection to remote host."""
@@ -134,74 +186,28 @@ class StreamingODASAudioPlayer:
             logger.critical(f"Failed to connect to {self.remote_host}: {str(e)}")
             raise
 
-    def transfer_file(self, remote_file: str, local_file: Path) -> None:
-        """
-        Transfer a file from remote to local machine using SFTP.
-
-        Args:
-            remote_file: Path to file on remote machine
-            local_file: Path to save file locally
-        """
-        try:
-            sftp = self.ssh.open_sftp()
-            sftp.get(remote_file, str(local_file))
-            sftp.close()
-            logger.debug(f"Transferred {remote_file} to {local_file}")
-        except Exception as e:
-            logger.warning(f"Error transferring {remote_file}: {str(e)}")
-            raise
-
-    def convert_to_wav(self, input_file: Path, output_file: Path) -> None:
+    def audio_callback(self, outdata: Any, frames: int, time: Any, status: Any) -> None:
         """
-        Convert a raw audio file to WAV format using sox.
+        Callback for sounddevice streaming.
 
-        Args:
-            input_file: Path to the input raw file
-            output_file: Path to the output WAV file
+        Takes one block from the jitter buffer, which pads missing audio with silence,
+        so a lagging transport never stops the stream.
         """
-        try:
-            cmd = [
-                "sox",
-                "-r",
-                str(self.sample_rate),
-                "-b",
-                "16",
-                "-c",
-                str(self.channels),
-                "-e",
-                "signed-integer",
-                str(input_file),
-                str(output_file),
-            ]
-            logger.debug(f"Converting {input_file} to {output_file}")
-            subprocess.run(cmd, check=True)
-            logger.debug(f"Successfully converted {input_file} to {output_file}")
-        except subprocess.CalledProcessError as e:
-            logger.warning(f"Error converting {input_file}: {str(e)}")
-        except Exception as e:
-            logger.warning(f"Unexpected error converting {input_file}: {str(e)}")
-
-    def audio_callback(self, outdata: Any, frames: int, time: Any, status: Any) -> None:
-        """Callback for sounddevice streaming."""
         if status:
             logger.warning(f"Audio callback status: {status}")
-        try:
-            data = self.audio_queue.get_nowait()
-            # Convert bytes to numpy array and reshape
-            audio_array = np.frombuffer(data, dtype=np.float32)
-            outdata[:] = audio_array.reshape(-1, 1)
-        except queue.Empty:
+        if not self.is_playing:
             outdata.fill(0)
-            if not self.is_playing:
-                raise sd.CallbackStop()
+            raise sd.CallbackStop()
+        self.jitter_buffer.read(frames, out=outdata[:, 0])
 
     def start_audio_stream(self) -> None:
         """Start the audio streaming thread."""
+        self.jitter_buffer.clear()
         self.stream = sd.OutputStream(
             samplerate=self.sample_rate,
             channels=1,  # Mono output
             callback=self.audio_callback,
-            blocksize=1024,
+            blocksize=self.buffer_size,
         )
         if self.stream is not None:
             self.stream.start()
@@ -215,120 +221,98 @@ class StreamingODASAudioPlayer:
             self.stream.close()
             self.stream = None
 
-    def play_audio(self, wav_file: Path) -> None:
+    def enqueue_audio(self, data: bytes) -> int:
         """
-        Process WAV file and add it to the audio queue for streaming playback.
-        Splits audio into chunks that match the output buffer size.
+        Decode raw ODAS audio and write it to the jitter buffer for playback.
+
+        Args:
+            data (bytes): Interleaved int16 samples as written by ODAS.
+
+        Returns:
+            int: Number of mono samples written.
         """
-        try:
-            # Read WAV file
-            with wave.open(str(wav_file), "rb") as wav:
-                # Get WAV parameters
-                n_channels = wav.getnchannels()
-                sample_width = wav.getsampwidth()
-                frame_rate = wav.getframerate()
-                n_frames = wav.getnframes()
-
-                # Read all frames
-                audio_data = wav.readframes(n_frames)
-
-                # Convert to numpy array
-                dtype = np.int16 if sample_width == 2 else np.int32
-                audio_array = np.frombuffer(audio_data, dtype=dtype)
-
-                # Reshape to channels
-                audio_array = audio_array.reshape(-1, n_channels)
-
-                # Mix down all channels (average them)
-                audio_mono = np.mean(audio_array.astype(np.float64), axis=1)
-
-                # Normalize audio for playback
-                max_value = float(2 ** (sample_width * 8 - 1) - 1)
-                audio_float = audio_mono.astype(np.float32) / max_value
-
-                # Split audio into chunks that match the output buffer size
-                chunk_size = 1024  # Must match blocksize in start_audio_stream
-                for i in range(0, len(audio_float), chunk_size):
-                    chunk = audio_float[i : i + chunk_size]
-                    # Pad the last chunk if necessary
-                    if len(chunk) < chunk_size:
-                        chunk = np.pad(chunk, (0, chunk_size - len(chunk)))
-                    self.audio_queue.put(chunk)
+        mono = self._downmixer.process(data)
+        self.jitter_buffer.write(mono)
+        return len(mono)
+
+    def log_playback_stats(self) -> None:
+        """Log the latency and the underrun and overrun counters of the playback."""
+        stats = self.jitter_buffer.stats()
+        logger.info(
+            f"Playback latency {stats.latency * 1000:.0f} ms "
+            f"(target {stats.target_latency * 1000:.0f} ms), "
+            f"{stats.underruns} underruns, {stats.overruns} overruns, "
+            f"{stats.dropped_samples} samples dropped"
+        )
 
-        except Exception as e:
-            logger.warning(f"Error processing {wav_file}: {str(e)}")
+    def create_transport(self, file_type: AudioFileType) -> RawStreamTransport:
+        """
+        Return the transport for an ODAS audio stream.
+
+        Args:
+            file_type: Type of audio file to stream ('postfiltered' or 'separated')
+
+        Returns:
+            RawStreamTransport: The configured transport, or a persistent SFTP
+            transport following the remote file.
+        """
+        if self.transport is not None:
+            return self.transport
+        return SFTPTransport(self.ssh, self.remote_dir / f"{file_type}.raw")
 
     def stream_audio(self, file_type: AudioFileType) -> None:
         """
         Stream audio from remote machine and play it in real-time.
+
+        New data is read through one transport kept open for the whole session and
+        decoded in memory; the loop only waits when no new data is available.
+
+        Args:
+            file_type: Type of audio file to stream ('postfiltered' or 'separated')
         """
-        remote_file = str(self.remote_dir / f"{file_type}.raw")
-        temp_file = Path(tempfile.mktemp(suffix=".raw"))
-        wav_file = self.local_dir / f"{file_type}.wav"
+        transport = self.create_transport(file_type)
+        waiting_logged = False
+        next_stats_log = time.monotonic() + STATS_LOG_INTERVAL
 
         # Start audio stream
         self.start_audio_stream()
 
-        while self.running:
-            try:
-                # Open SFTP connection
-                sftp = self.ssh.open_sftp()
-
-                # Get initial file size
-                file_size: Optional[int] = None
+        try:
+            while self.running:
                 try:
-                    file_size = sftp.stat(remote_file).st_size
-                except FileNotFoundError:
-                    logger.warning(
-                        f"Audio stream {remote_file} not found on remote machine. Waiting for ODAS to start..."
-                    )
+                    if not transport.is_open:
+                        if not transport.open():
+                            if not waiting_logged:
+                                logger.warning(
+                                    f"Audio stream {file_type} not available. Waiting for ODAS to start..."
+                                )
+                                waiting_logged = True
+                            time.sleep(1)
+                            continue
+                        logger.user_info(f"Starting to stream {file_type} audio")
+                        waiting_logged = False
+                        self._downmixer.reset()
+
+                    data = transport.read()
+                    if data:
+                        self.enqueue_audio(data)
+                    else:
+                        transport.wait(self.check_interval)
+
+                    if time.monotonic() >= next_stats_log:
+                        self.log_playback_stats()
+                        next_stats_log += STATS_LOG_INTERVAL
+
+                except (FileNotFoundError, ConnectionError):
+                    logger.warning("ODAS stopped. Waiting for reconnection...")
+                    transport.close()
+                except Exception as e:
+                    logger.error(f"Error streaming {file_type} audio: {str(e)}")
+                    transport.close()
                     time.sleep(1)
-                    continue
-
-                logger.user_info(f"Starting to stream {file_type} audio")
-
-                while self.running:
-                    try:
-                        # Get current file size
-                        current_size = sftp.stat(remote_file).st_size
-
-                        if file_size is not None and current_size > file_size:  # type: ignore[operator]
-                            # New audio data available
-                            current_file_size = file_size  # Type narrowing for mypy
-                            with sftp.open(remote_file, "rb") as remote:
-                                remote.seek(current_file_size)
-                                new_data = remote.read(current_size - current_file_size)  # type: ignore[operator]
-
-                                # Write new data to temporary file
-                                with open(temp_file, "wb") as local:
-                                    local.write(new_data)
-
-                                # Convert to WAV and play
-                                self.convert_to_wav(temp_file, wav_file)
-                                self.play_audio(wav_file)
-
-                                # Update file size
-                                file_size = current_size
-
-                        # Sleep for the configured interval
-                        time.sleep(self.check_interval)
-
-                    except FileNotFoundError:
-                        logger.warning(f"ODAS stopped. Waiting for reconnection...")
-                        break
-                    except Exception as e:
-                        logger.error(f"Error streaming {file_type} audio: {str(e)}")
-                        time.sleep(1)
-
-            except Exception as e:
-                logger.error(f"Error in {file_type} stream: {str(e)}")
-                time.sleep(1)
-            finally:
-                try:
-                    sftp.close()
-                    temp_file.unlink(missing_ok=True)
-                except:
-                    pass
+        finally:
+            transport.close()
+            self.log_playback_stats()
 
     def monitor_files(self, file_type: AudioFileType = "separated") -> None:
         """
@@ -354,7 +338,7 @@ class StreamingODASAudioPlayer:
         stream_thread.join()
 
     def cleanup(self) -> None:
-        """Clean up resources and terminate running processes."""
+        """Clean up resources."""
         logger.debug("Cleaning up...")
 
         # Stop audio stream
@@ -366,48 +350,6 @@ class StreamingODASAudioPlayer:
         except:
             pass
 
-        self.processes.clear()
-
-    def get_audio_data(self) -> Optional[bytes]:
-        """
-        Get the latest audio data from ODAS.
-
-        Returns:
-            The latest audio data if available, None otherwise.
-        """
-        try:
-            sftp = self.ssh.open_sftp()
-            remote_file = str(self.remote_dir / "postfiltered.raw")
-
-            try:
-                current_size = sftp.stat(remote_file).st_size
-            except FileNotFoundError:
-                logger.warning("Audio stream not found on remote machine")
-                return None
-
-            if not hasattr(self, "_last_file_size"):
-                self._last_file_size = current_size
-                return None
-
-            if self._last_file_size is not None and current_size > self._last_file_size:  # type: ignore[operator]
-                last_size = self._last_file_size  # Type narrowing for mypy
-                with sftp.open(remote_file, "rb") as remote:
-                    remote.seek(last_size)
-                    new_data = remote.read(current_size - last_size)  # type: ignore[operator]
-                    self._last_file_size = current_size
-                    return new_data
-
-            return None
-
-        except Exception as e:
-            logger.error(f"Error getting audio data: {e}")
-            return None
-        finally:
-            try:
-                sftp.close()
-            except:
-                pass
-
 
 def main() -> None:  # pragma: no cover
     """Main entry point for the remote ODAS audio player."""
@@ -441,12 +383,6 @@ def main() -> None:  # pragma: no cover
         default=DEFAULT_REMOTE_DIR,
         help=f"Remote directory containing ODAS audio files (default: {DEFAULT_REMOTE_DIR})",
     )
-    parser.add_argument(
-        "--local-dir",
-        type=str,
-        default="data/audio/odas/streaming",
-        help="Local directory to store audio files (default: data/audio/odas/streaming)",
-    )
     parser.add_argument(
         "--sample-rate",
         type=int,
@@ -477,6 +413,18 @@ def main() -> None:  # pragma: no cover
         default=DEFAULT_CHECK_INTERVAL,
         help=f"Interval in seconds to check for new audio data (default: {DEFAULT_CHECK_INTERVAL})",
     )
+    parser.add_argument(
+        "--target-latency",
+        type=float,
+        default=DEFAULT_TARGET_LATENCY,
+        help=f"Playback latency to hold in seconds (default: {DEFAULT_TARGET_LATENCY})",
+    )
+    parser.add_argument(
+        "--max-latency",
+        type=float,
+        default=DEFAULT_MAX_LATENCY,
+        help=f"Maximum audio buffered in seconds (default: {DEFAULT_MAX_LATENCY})",
+    )
     parser.add_argument(
         "--file-type",
         type=str,
@@ -484,6 +432,16 @@ def main() -> None:  # pragma: no cover
         default="separated",
         help="Type of audio file to play: separated (default) or postfiltered",
     )
+    parser.add_argument(
+        "--local-file",
+        type=Path,
+        help="Follow a local raw audio file instead of the remote one",
+    )
+    parser.add_argument(
+        "--listen-port",
+        type=int,
+        help="Receive the audio from an ODAS socket sink on this port instead",
+    )
     parser.add_argument(
         "--log-dir", type=Path, default=Path("logs"), help="Directory to store logs"
     )
@@ -515,20 +473,31 @@ def main() -> None:  # pragma: no cover
 
     logger.user_info("Starting ODAS Remote Audio Player")
 
+    transport: Optional[RawStreamTransport] = None
+    if args.local_file is not None:
+        transport = LocalFileTransport(args.local_file)
+    elif args.listen_port is not None:
+        transport = TCPTransport(port=args.listen_port)
+
     player = StreamingODASAudioPlayer(
         remote_host=args.host,
         remote_user=args.user,
         remote_dir=args.remote_dir,
-        local_dir=args.local_dir,
         sample_rate=args.sample_rate,
         channels=args.channels,
         ssh_key_path=args.ssh_key,
         buffer_size=args.buffer_size,
         check_interval=args.check_interval,
+        transport=transport,
+        target_latency=args.target_latency,
+        max_latency=args.max_latency,
     )
 
     try:
-        player.monitor_files(file_type=args.file_type)
+        if transport is not None:
+            player.stream_audio(args.file_type)
+        else:
+            player.monitor_files(file_type=args.file_type)
     except KeyboardInterrupt:
         logger.critical("KeyboardInterrupt detected, initiating shutdown")
         sys.stdout.write("\b" * 2)
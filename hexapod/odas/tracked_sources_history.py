@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+
+"""
+Per-source history of ODAS tracked sources with temporal smoothing.
+
+Every tracked source ID gets a bounded ring of timestamped azimuth and activity samples.
+Azimuths are smoothed with an activity-weighted circular mean so that a single noisy
+frame does not flip the estimated direction, and the dominant source is chosen by
+activity and persistence rather than by dictionary order.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import threading
+import time
+import math
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Tuple, Any
+
+
+def angular_distance(a: float, b: float) -> float:
+    """
+    Return the absolute difference between two azimuths in degrees, in the range 0-180.
+
+    Args:
+        a (float): First azimuth in degrees.
+        b (float): Second azimuth in degrees.
+
+    Returns:
+        float: Shortest angular distance between the two azimuths.
+    """
+    diff = abs(a - b) % 360
+    return 360 - diff if diff > 180 else diff
+
+
+class TrackedSourcesHistory:
+    """
+    Bounded timestamped azimuth/activity history for each tracked source ID.
+
+    Sources that have not been reported for longer than ``stale_ms`` are dropped, so the
+    number of tracks is bounded by the number of concurrently tracked sources.
+    """
+
+    class _SourceTrack:
+        """Fixed-size ring of (timestamp, azimuth, activity) samples for one source."""
+
+        def __init__(self, length: int, timestamp: float) -> None:
+            self.timestamps: np.ndarray = np.zeros(length, dtype=np.float64)
+            self.azimuths: np.ndarray = np.zeros(length, dtype=np.float64)
+            self.activities: np.ndarray = np.zeros(length, dtype=np.float64)
+            self.write_index: int = 0
+            self.size: int = 0
+            self.first_seen: float = timestamp
+            self.last_seen: float = timestamp
+
+        def append(self, timestamp: float, azimuth: float, activity: float) -> None:
+            length = self.timestamps.size
+            self.timestamps[self.write_index] = timestamp
+            self.azimuths[self.write_index] = azimuth
+            self.activities[self.write_index] = activity
+            self.write_index = (self.write_index + 1) % length
+            self.size = min(self.size + 1, length)
+            self.last_seen = timestamp
+
+        def window(self, since: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            """Return timestamps, azimuths and activities of samples newer than `since`."""
+            mask = self.timestamps[: self.size] >= since
+            return (
+                self.timestamps[: self.size][mask],
+                self.azimuths[: self.size][mask],
+                self.activities[: self.size][mask],
+            )
+
+    def __init__(
+        self,
+        history_length: int = 64,
+        smoothing_window_ms: float = 750.0,
+        persistence_ms: float = 1500.0,
+        stale_ms: float = 500.0,
+    ) -> None:
+        """
+        Initialize the tracked sources history.
+
+        Args:
+            history_length (int): Number of samples kept per source.
+            smoothing_window_ms (float): Window of samples used for the smoothed azimuth.
+            persistence_ms (float): Track age at which a source reaches full persistence.
+            stale_ms (float): Time after which a source that is no longer reported is dropped.
+
+        Raises:
+            ValueError: If any of the parameters is not positive.
+        """
+        if history_length <= 0:
+            raise ValueError("history_length must be positive")
+        if smoothing_window_ms <= 0 or persistence_ms <= 0 or stale_ms <= 0:
+            raise ValueError("time windows must be positive")
+
+        self.history_length: int = history_length
+        self.smoothing_window_ms: float = smoothing_window_ms
+        self.persistence_ms: float = persistence_ms
+        self.stale_ms: float = stale_ms
+        self._tracks: Dict[int, TrackedSourcesHistory._SourceTrack] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of sources currently tracked."""
+        return len(self._tracks)
+
+    def update(
+        self, sources: Dict[int, Dict[str, Any]], timestamp: Optional[float] = None
+    ) -> None:
+        """
+        Record one ODAS tracked frame.
+
+        Args:
+            sources (Dict[int, Dict[str, Any]]): Tracked sources keyed by source ID.
+            timestamp (Optional[float]): Monotonic timestamp in seconds, defaults to now.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        with self._lock:
+            for source_id, source in sources.items():
+                azimuth = (
+                    math.degrees(math.atan2(source.get("y", 0), source.get("x", 0)))
+                    + 360
+                ) % 360
+                track = self._tracks.get(source_id)
+                if track is None:
+                    track = self._SourceTrack(self.history_length, timestamp)
+                    self._tracks[source_id] = track
+                track.append(timestamp, azimuth, source.get("activity", 0.0))
+
+            stale_before = timestamp - self.stale_ms / 1000.0
+            for source_id in [
+                sid
+                for sid, track in self._tracks.items()
+                if track.last_seen < stale_before
+            ]:
+                del self._tracks[source_id]
+
+    def clear(self) -> None:
+        """Forget all tracked sources."""
+        with self._lock:
+            self._tracks.clear()
+
+    def _smoothed(self, track: _SourceTrack, now: float) -> Tuple[float, float]:
+        """Return the smoothed azimuth and mean activity of a track. Caller holds the lock."""
+        _, azimuths, activities = track.window(now - self.smoothing_window_ms / 1000.0)
+        if azimuths.size == 0:
+            # Fall back to the latest sample if the window is empty
+            latest = (track.write_index - 1) % self.history_length
+            return float(track.azimuths[latest]), float(track.activities[latest])
+
+        # Activity-weighted circular mean; uniform weights if all activities are zero
+        weights = activities if activities.sum() > 0 else np.ones_like(activities)
+        radians = np.radians(azimuths)
+        mean_sin = np.dot(weights, np.sin(radians))
+        mean_cos = np.dot(weights, np.cos(radians))
+        azimuth = (math.degrees(math.atan2(mean_sin, mean_cos)) + 360) % 360
+        return azimuth, float(activities.mean())
+
+    def smoothed_azimuth(
+        self, source_id: int, now: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        Return the smoothed azimuth of a source in degrees (0-360).
+
+        Args:
+            source_id (int): ODAS tracked source ID.
+            now (Optional[float]): Reference monotonic time in seconds, defaults to now.
+
+        Returns:
+            Optional[float]: Smoothed azimuth, or None if the source is not tracked.
+        """
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            track = self._tracks.get(source_id)
+            if track is None:
+                return None
+            return self._smoothed(track, now)[0]
+
+    def smoothed_azimuths(self, now: Optional[float] = None) -> Dict[int, float]:
+        """
+        Return the smoothed azimuths of all tracked sources.
+
+        Args:
+            now (Optional[float]): Reference monotonic time in seconds, defaults to now.
+
+        Returns:
+            Dict[int, float]: Source ID to smoothed azimuth in degrees.
+        """
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            return {
+                source_id: self._smoothed(track, now)[0]
+                for source_id, track in self._tracks.items()
+            }
+
+    def dominant_source(
+        self, now: Optional[float] = None
+    ) -> Optional[Tuple[int, float]]:
+        """
+        Return the dominant source weighted by activity and persistence.
+
+        The score of a source is its mean activity over the smoothing window multiplied
+        by its persistence, i.e. how long it has been tracked relative to ``persistence_ms``.
+
+        Args:
+            now (Optional[float]): Reference monotonic time in seconds, defaults to now.
+
+        Returns:
+            Optional[Tuple[int, float]]: (source ID, smoothed azimuth), or None if no
+            source is tracked.
+        """
+        if now is None:
+            now = time.monotonic()
+
+        best: Optional[Tuple[int, float]] = None
+        best_score = -1.0
+        with self._lock:
+            for source_id, track in self._tracks.items():
+                azimuth, activity = self._smoothed(track, now)
+                persistence = min(
+                    1.0,
+                    max(track.last_seen - track.first_seen, 0.0)
+                    * 1000.0
+                    / self.persistence_ms,
+                )
+                # Small floor so a brand-new source still ranks by activity
+                score = activity * max(persistence, 0.05)
+                if score > best_score:
+                    best_score = score
+                    best = (source_id, azimuth)
+        return best
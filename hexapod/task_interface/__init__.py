@@ -1,4 +1,5 @@
+from .audio_device_broker import AudioDeviceBroker, AudioDeviceLease
 from .task_interface import TaskInterface
 from .status_reporter import StatusReporter
 
-__all__ = ["TaskInterface", "StatusReporter"]
+__all__ = ["AudioDeviceBroker", "AudioDeviceLease", "TaskInterface", "StatusReporter"]
@@ -0,0 +1,209 @@
+"""
+Ownership broker for the ReSpeaker capture device.
+
+Only one process can open the microphone array at a time: Voice Control opens it
+through PyAudio and the ODAS tasks start ``odaslive``, which opens it through ALSA.
+``AudioDeviceBroker`` makes the handoff between them explicit. Consumers acquire a
+lease before opening the device and release it once the device is closed. A consumer
+that needs a busy device asks the holder to give it up through the callback the
+holder registered, and is woken as soon as the holder releases its lease, so the
+switchover takes as long as closing the device rather than a fixed delay. The time
+from each request to the grant is measured.
+
+The recorder does not need a lease of its own: it reads Voice Control's capture ring
+with its own cursor, so both share one capture.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from collections import deque
+import threading
+import time
+
+from hexapod.interface import get_custom_logger
+
+if TYPE_CHECKING:
+    from typing import Optional, Callable, Dict, Any, Deque
+
+logger = get_custom_logger("task_interface_logger")
+
+
+class AudioDeviceLease:
+    """Ownership of the capture device by one consumer until released."""
+
+    def __init__(
+        self,
+        broker: AudioDeviceBroker,
+        consumer: str,
+        requested_at: float,
+        granted_at: float,
+    ) -> None:
+        """
+        Initialize the lease. Leases are created by ``AudioDeviceBroker.acquire``.
+
+        Args:
+            broker (AudioDeviceBroker): Broker that granted the lease.
+            consumer (str): Name of the consumer holding the device.
+            requested_at (float): time.monotonic() of the request.
+            granted_at (float): time.monotonic() of the grant.
+        """
+        self.broker = broker
+        self.consumer = consumer
+        self.requested_at = requested_at
+        self.granted_at = granted_at
+        self.released: bool = False
+
+    @property
+    def wait_seconds(self) -> float:
+        """Return the time from the request to the grant in seconds."""
+        return self.granted_at - self.requested_at
+
+    def release(self) -> None:
+        """Give the device back to the broker. Releasing twice has no effect."""
+        self.broker.release(self)
+
+    def __enter__(self) -> AudioDeviceLease:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+
+class AudioDeviceBroker:
+    """
+    Grants exclusive leases on the capture device and measures the handoffs.
+
+    Thread-safe: consumers acquire and release from their own threads.
+    """
+
+    def __init__(self, history: int = 100) -> None:
+        """
+        Initialize the broker.
+
+        Args:
+            history (int): Number of handoff durations kept for the statistics.
+        """
+        self._condition = threading.Condition()
+        self._lease: Optional[AudioDeviceLease] = None
+        self._release_handlers: Dict[str, Callable[[], None]] = {}
+        self._handoffs: Deque[float] = deque(maxlen=history)
+
+    @property
+    def owner(self) -> Optional[str]:
+        """Return the consumer holding the device, or None if it is free."""
+        lease = self._lease
+        return lease.consumer if lease is not None else None
+
+    def register(self, consumer: str, on_release_request: Callable[[], None]) -> None:
+        """
+        Register the callback asking a consumer to release the device.
+
+        The callback runs on the thread of the consumer requesting the device and
+        must not block; the consumer closes the device and releases its lease on its
+        own thread.
+
+        Args:
+            consumer (str): Consumer name.
+            on_release_request (Callable[[], None]): Callback asking for the release.
+        """
+        with self._condition:
+            self._release_handlers[consumer] = on_release_request
+
+    def unregister(self, consumer: str) -> None:
+        """Remove the release callback of a consumer."""
+        with self._condition:
+            self._release_handlers.pop(consumer, None)
+
+    def acquire(
+        self, consumer: str, timeout: Optional[float] = None, preempt: bool = True
+    ) -> AudioDeviceLease:
+        """
+        Wait for the device and lease it to a consumer.
+
+        Args:
+            consumer (str): Consumer name.
+            timeout (Optional[float]): Maximum seconds to wait, or None to wait
+                until the device is released.
+            preempt (bool): Ask the current holder to release the device.
+
+        Returns:
+            AudioDeviceLease: The lease; the consumer's existing lease if it already
+            holds the device.
+
+        Raises:
+            TimeoutError: If the device was not released in time.
+        """
+        requested_at = time.monotonic()
+        with self._condition:
+            if self._lease is not None and self._lease.consumer == consumer:
+                return self._lease
+            holder = self.owner
+            on_release_request = self._release_handlers.get(holder) if holder else None
+
+        if holder is not None:
+            logger.debug(f"{consumer} waiting for the audio device held by {holder}")
+            if preempt and on_release_request is not None:
+                try:
+                    on_release_request()
+                except Exception as e:
+                    logger.error(
+                        f"Audio device release request to {holder} failed: {e}"
+                    )
+
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._lease is None, timeout):
+                raise TimeoutError(
+                    f"{consumer} could not acquire the audio device from "
+                    f"{self.owner} within {timeout} s"
+                )
+            lease = AudioDeviceLease(self, consumer, requested_at, time.monotonic())
+            self._lease = lease
+            if holder is not None:
+                self._handoffs.append(lease.wait_seconds)
+                logger.info(
+                    f"Audio device handed over from {holder} to {consumer} in "
+                    f"{lease.wait_seconds * 1000:.0f} ms"
+                )
+            else:
+                logger.debug(f"Audio device leased to {consumer}")
+            return lease
+
+    def release(self, lease: AudioDeviceLease) -> None:
+        """
+        End a lease and wake the consumers waiting for the device.
+
+        Args:
+            lease (AudioDeviceLease): Lease to end; stale leases are ignored.
+        """
+        with self._condition:
+            if lease.released:
+                return
+            lease.released = True
+            if self._lease is lease:
+                self._lease = None
+                self._condition.notify_all()
+                logger.debug(
+                    f"Audio device released by {lease.consumer} after "
+                    f"{time.monotonic() - lease.granted_at:.1f} s"
+                )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the owner and the handoff statistics.
+
+        Returns:
+            Dict[str, Any]: Current owner, number of handoffs and the last, mean and
+            maximum handoff duration in milliseconds.
+        """
+        with self._condition:
+            handoffs = list(self._handoffs)
+            owner = self.owner
+        return {
+            "owner": owner,
+            "handoffs": len(handoffs),
+            "last_handoff_ms": handoffs[-1] * 1000 if handoffs else None,
+            "mean_handoff_ms": (
+                sum(handoffs) / len(handoffs) * 1000 if handoffs else None
+            ),
+            "max_handoff_ms": max(handoffs) * 1000 if handoffs else None,
+        }
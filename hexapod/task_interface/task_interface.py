@@ -10,6 +10,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 import logging
 import os
+import math
 import time
 import threading
 from functools import wraps
@@ -22,9 +23,10 @@ from hexapod.task_interface import tasks
 from hexapod.interface import NonBlockingConsoleInputHandler, get_custom_logger
 from hexapod.utils import rename_thread
 from .status_reporter import StatusReporter
+from .audio_device_broker import AudioDeviceBroker
 
 if TYPE_CHECKING:
-    from typing import Any, Optional, Callable
+    from typing import Any, Optional, Callable, Tuple
     from hexapod.task_interface.tasks import Task
 
 logger = get_custom_logger("task_interface_logger")
@@ -54,6 +56,12 @@ class TaskInterface:
         self._last_kwargs: Optional[dict] = None
         # Event to pause voice control
         self.voice_control_paused_event = threading.Event()
+        # Leases the microphone array to voice control or the ODAS tasks
+        self.audio_device_broker = AudioDeviceBroker()
+        # Capture hub sharing the microphone array with ODAS, if one is running
+        self.capture_hub: Optional[Any] = None
+        # Reader and wake word spotter of the ODAS separated channels during ODAS tasks
+        self.odas_keyword_spotter: Optional[Tuple[Any, Any]] = None
 
         # Event to pause external control (button interactions) during particular operations
         # like calibration, shutdown, or other maintenance tasks
@@ -70,7 +78,6 @@ class TaskInterface:
         The voice control thread will monitor this request and pause accordingly.
         """
         self.voice_control_paused_event.set()
-        time.sleep(0.1)
         logger.info("Voice control pause requested")
 
     def request_unpause_voice_control(self) -> None:
@@ -79,7 +86,6 @@ class TaskInterface:
         The voice control thread will monitor this request and unpause accordingly.
         """
         self.voice_control_paused_event.clear()
-        time.sleep(0.1)
         logger.info("Voice control unpause requested")
 
     def request_block_voice_control_pausing(self) -> None:
@@ -102,6 +108,121 @@ class TaskInterface:
         time.sleep(0.1)
         logger.info("Voice control pausing unblocking requested")
 
+    def _steer_voice_control(self, odas_processor: Any) -> None:
+        """
+        Let voice control steer its microphone beam at the sources found by ODAS.
+
+        Args:
+            odas_processor (ODASDoASSLProcessor): Processor of the starting ODAS task.
+        """
+        if self.voice_control is not None:
+            odas_processor.add_dominant_source_listener(self.voice_control.update_doa)
+
+    def _start_odas_keyword_spotter(self, odas_processor: Any) -> None:
+        """
+        Listen for the wake word on every ODAS separated channel during an ODAS task.
+
+        Uses the wake word of voice control, so nothing is spotted without it. Channels
+        are only processed while the processor tracks a source in their slot.
+
+        Args:
+            odas_processor (ODASDoASSLProcessor): Processor of the starting ODAS task.
+        """
+        if self.voice_control is None:
+            return
+        from hexapod.odas import ODASAudioProcessor, MultiChannelKeywordSpotter
+        from hexapod.odas.multi_channel_keyword_spotter import (
+            porcupine_engine_factory,
+        )
+
+        self._stop_odas_keyword_spotter()
+        spotter = MultiChannelKeywordSpotter(
+            porcupine_engine_factory(
+                self.voice_control.access_key,
+                [self.voice_control.keyword_path],
+                [self.voice_control.porcupine_sensitivity],
+            ),
+            self._on_odas_wake_word,
+        )
+        reader = ODASAudioProcessor(
+            odas_processor.data_manager.odas_data_dir, source_file="separated.raw"
+        )
+        reader.set_frame_callback(spotter.process_frame)
+        odas_processor.add_tracked_frame_listener(spotter.update_sources)
+        reader.start()
+        self.odas_keyword_spotter = (reader, spotter)
+
+    def _stop_odas_keyword_spotter(self) -> None:
+        """Stop spotting wake words on the ODAS separated channels, if running."""
+        spotting, self.odas_keyword_spotter = self.odas_keyword_spotter, None
+        if spotting is None:
+            return
+        reader, spotter = spotting
+        try:
+            reader.stop()
+        finally:
+            spotter.close()
+
+    def _on_odas_wake_word(self, detection: Any) -> None:
+        """
+        Handle a wake word heard on an ODAS separated channel.
+
+        The voice control beam is steered at the speaker, so the command that follows
+        is heard from their direction. While ODAS reads the sound card voice control is
+        paused and cannot hear the command at all, so the ODAS task is stopped to hand
+        the microphone array back.
+
+        Args:
+            detection (KeywordDetection): Detection reported by the keyword spotter.
+        """
+        if self.voice_control is not None and detection.source is not None:
+            source = detection.source
+            azimuth = (
+                math.degrees(math.atan2(source.get("y", 0), source.get("x", 0))) + 360
+            ) % 360
+            self.voice_control.update_doa((source.get("id", 0), azimuth))
+
+        if self.voice_control_paused_event.is_set() and self.task is not None:
+            logger.user_info(
+                f"Wake word heard on ODAS channel {detection.channel}, "
+                f"stopping {self.task.__class__.__name__}"
+            )
+            # Stopping the task stops the spotter calling this, so not on its thread
+            stopper = threading.Thread(target=self.stop_task, daemon=True)
+            rename_thread(stopper, "ODASWakeWordStop")
+            stopper.start()
+
+    def _create_odas_processor(self, lights_handler: LightsInteractionHandler) -> Any:
+        """
+        Prepare an ODAS task and create its processor.
+
+        ODAS reads the microphone array itself unless the capture hub feeds it, in
+        which case voice control keeps listening during the task. External control
+        toggling is blocked either way. The wake word is also spotted on the ODAS
+        separated channels for as long as the task runs.
+
+        Args:
+            lights_handler (LightsInteractionHandler): Handles lights activity.
+
+        Returns:
+            ODASDoASSLProcessor: Processor for the ODAS task.
+        """
+        from hexapod.odas import ODASDoASSLProcessor
+
+        hub = self.capture_hub
+        config_path = hub.odas_config_path if hub is not None else None
+        if config_path is None:
+            # ODAS opens the sound card, so voice control has to release it
+            self.request_pause_voice_control()
+        self.request_block_voice_control_pausing()
+
+        odas_processor = ODASDoASSLProcessor(
+            lights_handler=lights_handler, config_path=config_path
+        )
+        self._steer_voice_control(odas_processor)
+        self._start_odas_keyword_spotter(odas_processor)
+        return odas_processor
+
     @staticmethod
     def inject_hexapod(func: Callable[..., Any]) -> Callable[..., Any]:
         """
@@ -159,6 +280,7 @@ class TaskInterface:
 
                 # Unpause controls for tasks that were stopped manually
                 if needs_unpausing:
+                    self._stop_odas_keyword_spotter()
                     self.request_unpause_voice_control()
                     self.request_unblock_voice_control_pausing()
 
@@ -253,6 +375,7 @@ class TaskInterface:
             "StreamODASAudioTask",
             "CompositeCalibrationTask",
         ]:
+            self._stop_odas_keyword_spotter()
             self.request_unpause_voice_control()
             self.request_unblock_voice_control_pausing()
 
@@ -749,13 +872,7 @@ class TaskInterface:
             lights_handler (LightsInteractionHandler): Handles lights activity.
         """
         try:
-            # Pause both voice control and external control before starting ODAS task
-            self.request_pause_voice_control()
-            self.request_block_voice_control_pausing()
-
-            from hexapod.odas import ODASDoASSLProcessor
-
-            odas_processor = ODASDoASSLProcessor(lights_handler=lights_handler)
+            odas_processor = self._create_odas_processor(lights_handler)
 
             self.task = tasks.FollowTask(
                 hexapod,
@@ -767,6 +884,7 @@ class TaskInterface:
                     if self.task is not None
                     else None
                 ),
+                audio_device_broker=self.audio_device_broker,
             )
         except Exception as e:
             logger.exception(f"Follow task failed: {e}")
@@ -786,13 +904,7 @@ class TaskInterface:
             lights_handler (LightsInteractionHandler): Handles lights activity.
         """
         try:
-            # Pause both voice control and external control before starting ODAS task
-            self.request_pause_voice_control()
-            self.request_block_voice_control_pausing()
-
-            from hexapod.odas import ODASDoASSLProcessor
-
-            odas_processor = ODASDoASSLProcessor(lights_handler=lights_handler)
+            odas_processor = self._create_odas_processor(lights_handler)
 
             self.task = tasks.SoundSourceLocalizationTask(
                 hexapod=hexapod,
@@ -804,6 +916,7 @@ class TaskInterface:
                     if self.task is not None
                     else None
                 ),
+                audio_device_broker=self.audio_device_broker,
             )
             logger.user_info("Sound source localization started.")
         except Exception as e:
@@ -828,13 +941,7 @@ class TaskInterface:
             stream_type (str): Type of audio stream to play (default: "separated").
         """
         try:
-            # Pause both voice control and external control before starting ODAS task
-            self.request_pause_voice_control()
-            self.request_block_voice_control_pausing()
-
-            from hexapod.odas import ODASDoASSLProcessor
-
-            odas_processor = ODASDoASSLProcessor(lights_handler=lights_handler)
+            odas_processor = self._create_odas_processor(lights_handler)
 
             self.task = tasks.StreamODASAudioTask(
                 hexapod=hexapod,
@@ -847,6 +954,7 @@ class TaskInterface:
                     if self.task is not None
                     else None
                 ),
+                audio_device_broker=self.audio_device_broker,
             )
         except Exception as e:
             logger.exception(f"ODAS audio streaming task failed: {e}")
@@ -994,9 +1102,9 @@ class TaskInterface:
         if self.button_handler:
             self.button_handler.cleanup()
             logger.info("Button handler cleaned up.")
-        # Turn off lights
+        # Stop the lights render loop and turn off lights
         if self.lights_handler:
-            self.lights_handler.off()
+            self.lights_handler.cleanup()
             logger.info("Lights turned off.")
         if self.hexapod:
             self.hexapod.deactivate_all_servos()
@@ -1026,6 +1134,17 @@ class TaskInterface:
         self._setup_recording_methods()
         logger.debug("Voice control dependency injected")
 
+    def set_capture_hub(self, capture_hub: Any) -> None:
+        """
+        Set the capture hub that feeds ODAS, so ODAS tasks run without pausing
+        voice control.
+
+        Args:
+            capture_hub: Started CaptureHub instance
+        """
+        self.capture_hub = capture_hub
+        logger.debug("Capture hub dependency injected")
+
     @voice_command
     @inject_lights_handler
     def start_recording(
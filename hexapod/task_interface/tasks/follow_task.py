@@ -10,10 +10,11 @@ from hexapod.robot import PredefinedPosition
 from hexapod.interface import get_custom_logger
 
 if TYPE_CHECKING:
-    from typing import Optional, Callable
+    from typing import Optional, Callable, Tuple
     from hexapod.robot import Hexapod
     from hexapod.lights import LightsInteractionHandler
     from hexapod.odas import ODASDoASSLProcessor
+    from hexapod.task_interface import AudioDeviceBroker, AudioDeviceLease
 
 logger = get_custom_logger("task_interface_logger")
 
@@ -24,8 +25,14 @@ class FollowTask(Task):
 
     Processes incoming target data to determine follow directions and updates lights based on analysis.
     Uses ODAS output to determine movement direction and controls hexapod movement via gait generator.
+    The follow loop is woken up by dominant source change notifications from the ODAS processor
+    and only re-queues the gait when the movement direction actually changes.
     """
 
+    SOURCE_CHANGE_TIMEOUT: float = 0.5  # Max seconds between stop checks while waiting
+    AUDIO_RELEASE_TIMEOUT: float = 4.0  # Max seconds to wait for Voice Control to pause
+    AUDIO_CONSUMER: str = "odas"  # Name of the audio device lease
+
     def __init__(
         self,
         hexapod: Hexapod,
@@ -33,6 +40,7 @@ class FollowTask(Task):
         odas_processor: ODASDoASSLProcessor,
         external_control_paused_event: threading.Event,
         callback: Optional[Callable] = None,
+        audio_device_broker: Optional[AudioDeviceBroker] = None,
     ) -> None:
         """
         Initialize the FollowTask.
@@ -43,6 +51,8 @@ class FollowTask(Task):
             odas_processor: The ODAS processor for sound source localization.
             external_control_paused_event: Event to manage external control state.
             callback: Function to call upon task completion.
+            audio_device_broker: Broker leasing the microphone array to ODAS once
+                Voice Control has released it; without it a fixed delay is used.
         """
         logger.debug("Initializing FollowTask")
         super().__init__(callback)
@@ -50,7 +60,21 @@ class FollowTask(Task):
         self.lights_handler = lights_handler
         self.odas_processor = odas_processor
         self.external_control_paused_event = external_control_paused_event
+        self.audio_device_broker = audio_device_broker
+        self._audio_lease: Optional[AudioDeviceLease] = None
         self.odas_processor.stop_event = self.stop_event
+        self._source_changed: threading.Event = threading.Event()
+
+    def _on_dominant_source_changed(
+        self, dominant_source: Optional[Tuple[int, float]]
+    ) -> None:
+        """
+        Wake up the follow loop when the ODAS processor reports a new dominant source.
+
+        Args:
+            dominant_source: (source ID, smoothed azimuth) or None if no source is tracked.
+        """
+        self._source_changed.set()
 
     def _get_movement_direction_from_odas(self) -> str:
         """
@@ -59,12 +83,11 @@ class FollowTask(Task):
         Returns:
             str: Direction name from BaseGait.DIRECTION_MAP
         """
-        # Get the most recent azimuths from ODAS
-        azimuths = self.odas_processor.get_tracked_sources_azimuths()
-        if not azimuths:
+        # Use the dominant source (by activity and persistence) with its smoothed azimuth
+        dominant_source = self.odas_processor.get_dominant_source()
+        if dominant_source is None:
             return "neutral"  # No movement if no sources
-        # Use the first azimuth as the target to follow
-        azimuth = list(azimuths.values())[0]
+        _, azimuth = dominant_source
         # Normalize to 0-360 range
         azimuth_degrees = azimuth % 360
 
@@ -117,10 +140,20 @@ class FollowTask(Task):
         logger.info("FollowTask started")
         self._odas_thread = None
         try:
-            time.sleep(4)  # Wait for Voice Control to pause and release resources
+            # Take the microphone array over from Voice Control
+            if self.audio_device_broker is not None:
+                self._audio_lease = self.audio_device_broker.acquire(
+                    self.AUDIO_CONSUMER, timeout=self.AUDIO_RELEASE_TIMEOUT
+                )
+            else:
+                time.sleep(self.AUDIO_RELEASE_TIMEOUT)
 
             # self.lights_handler.off()
 
+            self.odas_processor.add_dominant_source_listener(
+                self._on_dominant_source_changed
+            )
+
             # Start ODAS processor in a background thread
             def _odas_bg() -> None:
                 self.odas_processor.start()
@@ -133,24 +166,28 @@ class FollowTask(Task):
             self.hexapod.move_to_position(PredefinedPosition.ZERO)
             self.hexapod.wait_until_motion_complete(stop_event=self.stop_event)
 
-            # Follow loop - continuously move towards tracked sources
+            # Follow loop - move towards the dominant source whenever it changes
+            last_direction: Optional[str] = None
             while not self.stop_event.is_set():
                 try:
+                    self._source_changed.clear()
+
                     # Get movement direction from ODAS
                     direction_name = self._get_movement_direction_from_odas()
 
-                    # Check if we have a valid direction (not neutral)
-                    if direction_name != "neutral":
-                        logger.debug(f"Moving in direction: {direction_name}")
-                        self._move_hexapod_in_direction(direction_name)
-                    else:
-                        # Stop movement if no clear direction
-                        if self.hexapod.gait_generator.is_running:
+                    # Only re-queue the gait when the direction actually changes
+                    if direction_name != last_direction:
+                        if direction_name != "neutral":
+                            logger.debug(f"Moving in direction: {direction_name}")
+                            self._move_hexapod_in_direction(direction_name)
+                        elif self.hexapod.gait_generator.is_running:
+                            # Stop movement if no clear direction
                             logger.debug("No clear direction, stopping movement")
                             self.hexapod.gait_generator.stop()
+                        last_direction = direction_name
 
-                    # Wait before next update
-                    self.stop_event.wait(0.5)  # Update direction every 500ms
+                    # Wait for the next dominant source change notification
+                    self._source_changed.wait(self.SOURCE_CHANGE_TIMEOUT)
 
                 except Exception as e:
                     logger.error(f"Error in follow loop: {e}")
@@ -165,9 +202,15 @@ class FollowTask(Task):
 
             # Ensure ODAS processor is closed
             if hasattr(self, "odas_processor"):
+                self.odas_processor.remove_dominant_source_listener(
+                    self._on_dominant_source_changed
+                )
                 self.odas_processor.close()
             # Wait for ODAS thread to finish
             if self._odas_thread is not None:
                 self._odas_thread.join(timeout=5)
+            # Hand the microphone array back once ODAS is closed
+            if self._audio_lease is not None:
+                self._audio_lease.release()
 
             logger.info("FollowTask completed")
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
     from hexapod.robot import Hexapod
     from hexapod.lights import LightsInteractionHandler
     from hexapod.odas import ODASDoASSLProcessor
+    from hexapod.task_interface import AudioDeviceBroker, AudioDeviceLease
 
 logger = get_custom_logger("task_interface_logger")
 
@@ -23,6 +24,9 @@ class SoundSourceLocalizationTask(Task):
     Processes incoming sound data to determine source directions and updates lights based on analysis.
     """
 
+    AUDIO_RELEASE_TIMEOUT: float = 4.0  # Max seconds to wait for Voice Control to pause
+    AUDIO_CONSUMER: str = "odas"  # Name of the audio device lease
+
     def __init__(
         self,
         hexapod: Hexapod,
@@ -30,6 +34,7 @@ class SoundSourceLocalizationTask(Task):
         odas_processor: ODASDoASSLProcessor,
         external_control_paused_event: threading.Event,
         callback: Optional[Callable] = None,
+        audio_device_broker: Optional[AudioDeviceBroker] = None,
     ) -> None:
         """
         Initialize the SoundSourceLocalizationTask.
@@ -40,6 +45,8 @@ class SoundSourceLocalizationTask(Task):
             odas_processor: The ODAS processor for sound source localization.
             external_control_paused_event: Event to manage external control state.
             callback: Function to call upon task completion.
+            audio_device_broker: Broker leasing the microphone array to ODAS once
+                Voice Control has released it; without it a fixed delay is used.
         """
         logger.debug("Initializing SoundSourceLocalizationTask")
         super().__init__(callback)
@@ -47,6 +54,8 @@ class SoundSourceLocalizationTask(Task):
         self.lights_handler = lights_handler
         self.odas_processor = odas_processor
         self.external_control_paused_event = external_control_paused_event
+        self.audio_device_broker = audio_device_broker
+        self._audio_lease: Optional[AudioDeviceLease] = None
         self.odas_processor.stop_event = self.stop_event
 
     @override
@@ -60,7 +69,13 @@ class SoundSourceLocalizationTask(Task):
         try:
             self.lights_handler.think()
 
-            time.sleep(4)  # Wait for Voice Control to pause and release resources
+            # Take the microphone array over from Voice Control
+            if self.audio_device_broker is not None:
+                self._audio_lease = self.audio_device_broker.acquire(
+                    self.AUDIO_CONSUMER, timeout=self.AUDIO_RELEASE_TIMEOUT
+                )
+            else:
+                time.sleep(self.AUDIO_RELEASE_TIMEOUT)
 
             self.lights_handler.off()
 
@@ -77,4 +92,7 @@ class SoundSourceLocalizationTask(Task):
             # Ensure ODAS processor is closed
             if hasattr(self, "odas_processor"):
                 self.odas_processor.close()
+            # Hand the microphone array back once ODAS is closed
+            if self._audio_lease is not None:
+                self._audio_lease.release()
             logger.info("SoundSourceLocalizationTask completed")
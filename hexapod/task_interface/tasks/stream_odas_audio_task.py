@@ -21,6 +21,7 @@ if TYPE_CHECKING:
     from hexapod.robot import Hexapod
     from hexapod.lights import LightsInteractionHandler
     from hexapod.odas import ODASDoASSLProcessor
+    from hexapod.task_interface import AudioDeviceBroker, AudioDeviceLease
 
 logger = get_custom_logger("task_interface_logger")
 
@@ -31,6 +32,10 @@ class StreamODASAudioTask(Task):
     Extends sound source localization functionality to include audio streaming.
     """
 
+    AUDIO_RELEASE_TIMEOUT: float = 4.0  # Max seconds to wait for Voice Control to pause
+    AUDIO_CONSUMER: str = "odas"  # Name of the audio device lease
+    ODAS_READY_TIMEOUT: float = 15.0  # Max seconds to wait for ODAS before streaming
+
     def __init__(
         self,
         hexapod: Hexapod,
@@ -39,6 +44,7 @@ class StreamODASAudioTask(Task):
         external_control_paused_event: threading.Event,
         stream_type: str = "separated",
         callback: Optional[Callable] = None,
+        audio_device_broker: Optional[AudioDeviceBroker] = None,
     ) -> None:
         """
         Initialize the StreamODASAudioTask.
@@ -50,6 +56,8 @@ class StreamODASAudioTask(Task):
             external_control_paused_event: Event to manage external control state.
             stream_type: Type of audio stream to play (default: "separated").
             callback: Function to call upon task completion.
+            audio_device_broker: Broker leasing the microphone array to ODAS once
+                Voice Control has released it; without it a fixed delay is used.
         """
         logger.debug("Initializing StreamODASAudioTask")
         super().__init__(callback)
@@ -57,6 +65,8 @@ class StreamODASAudioTask(Task):
         self.lights_handler = lights_handler
         self.odas_processor = odas_processor
         self.external_control_paused_event = external_control_paused_event
+        self.audio_device_broker = audio_device_broker
+        self._audio_lease: Optional[AudioDeviceLease] = None
         self.stream_type = stream_type
         self.odas_processor.stop_event = self.stop_event
 
@@ -76,7 +86,18 @@ class StreamODASAudioTask(Task):
         Handles the setup phase including starting the processor.
         """
         self.lights_handler.think()
-        time.sleep(4)  # Wait for Voice Control to pause and release resources
+        # Take the microphone array over from Voice Control
+        if self.audio_device_broker is not None:
+            try:
+                self._audio_lease = self.audio_device_broker.acquire(
+                    self.AUDIO_CONSUMER, timeout=self.AUDIO_RELEASE_TIMEOUT
+                )
+            except TimeoutError as e:
+                logger.error(f"ODAS not started: {e}")
+                self.lights_handler.off()
+                return
+        else:
+            time.sleep(self.AUDIO_RELEASE_TIMEOUT)
         self.lights_handler.off()
         # Start ODAS processor
         self.odas_processor.start()
@@ -84,10 +105,12 @@ class StreamODASAudioTask(Task):
     def _cleanup_odas_processor(self) -> None:
         """
         Clean up ODAS processor resources.
-        Ensures proper shutdown of the processor.
+        Ensures proper shutdown of the processor and hands the microphone array back.
         """
         if hasattr(self, "odas_processor"):
             self.odas_processor.close()
+        if self._audio_lease is not None:
+            self._audio_lease.release()
 
     def _verify_ssh_connection(self) -> bool:
         """
@@ -249,6 +272,10 @@ class StreamODASAudioTask(Task):
             odas_thread = threading.Thread(target=self._initialize_odas_processor)
             odas_thread.start()
 
+            # ODAS creates the audio streams once it is running, so wait for it
+            if not self.odas_processor.wait_until_ready(self.ODAS_READY_TIMEOUT):
+                logger.warning("ODAS not ready, starting remote streaming anyway")
+
             # Start remote streaming
             self._start_remote_streaming()
 
@@ -1,6 +1,7 @@
 from .utils import map_range
 from .utils import parse_percentage
 from .utils import rename_thread
+from .utils import LatestValue
 from .utils import euler_rotation_matrix
 from .utils import homogeneous_transformation_matrix
 from .utils import Vector2D, Vector3D
@@ -9,6 +10,7 @@ __all__ = [
     "map_range",
     "parse_percentage",
     "rename_thread",
+    "LatestValue",
     "euler_rotation_matrix",
     "homogeneous_transformation_matrix",
     "Vector2D",
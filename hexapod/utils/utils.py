@@ -14,7 +14,7 @@ from dataclasses import dataclass
 import numpy as np
 
 if TYPE_CHECKING:
-    from typing import Tuple, Union
+    from typing import Tuple, Union, Any
 
 
 def map_range(value: int, in_min: int, in_max: int, out_min: int, out_max: int) -> int:
@@ -82,6 +82,61 @@ def rename_thread(thread: threading.Thread, custom_name: str) -> None:
         thread.name = f"{custom_name}"
 
 
+class LatestValue:
+    """
+    Lock-free single-value slot handing the newest value from one thread to another.
+
+    The writer replaces the slot contents with one reference assignment, which is
+    atomic, so it never blocks and never waits for the reader. The reader takes the
+    most recent value whenever it runs and skips the ones it missed. Each publish
+    increments the version, which lets the reader tell a new value from one it
+    already handled.
+
+    Only one thread may publish; any number of threads may read.
+
+    Attributes:
+        version (int): Number of values published so far.
+        value (Any): The most recent value.
+    """
+
+    __slots__ = ("_slot",)
+
+    def __init__(self, value: Any = None) -> None:
+        """
+        Initialize the slot.
+
+        Args:
+            value (Any): Value held before the first publish, at version 0.
+        """
+        self._slot: Tuple[int, Any] = (0, value)
+
+    def publish(self, value: Any) -> None:
+        """
+        Replace the held value.
+
+        Args:
+            value (Any): The new value; it must not be modified after publishing.
+        """
+        self._slot = (self._slot[0] + 1, value)
+
+    def read(self) -> Tuple[int, Any]:
+        """
+        Return the version and the value, taken together.
+
+        Returns:
+            Tuple[int, Any]: The version and the most recent value.
+        """
+        return self._slot
+
+    @property
+    def version(self) -> int:
+        return self._slot[0]
+
+    @property
+    def value(self) -> Any:
+        return self._slot[1]
+
+
 def euler_rotation_matrix(roll: float, pitch: float, yaw: float) -> np.ndarray:
     """
     Create a combined rotation matrix from roll, pitch, and yaw angles.
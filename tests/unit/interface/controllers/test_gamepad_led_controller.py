@@ -12,6 +12,10 @@ from hexapod.interface.controllers.gamepad_led_controllers.gamepad_led_controlle
     BaseGamepadLEDController,
     GamepadLEDColor,
 )
+from hexapod.interface.controllers.gamepad_led_controllers.gamepad_led_writer import (
+    ColorCurve,
+    GamepadLEDWriter,
+)
 
 
 class TestGamepadLEDColor:
@@ -61,14 +65,17 @@ class TestBaseGamepadLEDController:
     @pytest.fixture
     def controller(self):
         """Create a concrete LED controller for testing."""
-        return ConcreteLEDController()
+        controller = ConcreteLEDController()
+        yield controller
+        controller.led_writer.stop()
 
     def test_init(self, controller):
         """Test controller initialization."""
         assert controller.is_connected is False
         assert controller.current_color == GamepadLEDColor.BLUE
         assert controller.brightness == 1.0
-        assert controller.animation_thread is None
+        assert isinstance(controller.led_writer, GamepadLEDWriter)
+        assert controller.led_writer.ident is None  # Started on first use
         assert controller.animation_running is False
 
     def test_set_color_success(self, controller):
@@ -172,14 +179,14 @@ class TestBaseGamepadLEDController:
     def test_pulse_success(self, controller):
         """Test starting pulse animation successfully."""
         controller.is_connected = True
-        controller.stop_animation = Mock()
 
         result = controller.pulse(GamepadLEDColor.RED, duration=1.0, cycles=2)
 
         assert result is True
         assert controller.animation_running is True
-        assert controller.animation_thread is not None
-        assert controller.animation_thread.is_alive()
+        assert controller.led_writer.is_alive()
+        assert controller.current_color == GamepadLEDColor.RED
+        controller.led_writer.stop()
 
     def test_pulse_not_connected(self, controller):
         """Test pulse animation when not connected."""
@@ -189,43 +196,48 @@ class TestBaseGamepadLEDController:
 
         assert result is False
 
-    def test_pulse_stop_existing_animation(self, controller):
-        """Test pulse stops existing animation."""
+    def test_pulse_replaces_running_animation(self, controller):
+        """Test that a new animation replaces the running one."""
         controller.is_connected = True
-        controller.animation_running = True
-        controller.stop_animation = Mock()
+        controller.led_writer.play = Mock()
 
         controller.pulse(GamepadLEDColor.RED)
+        controller.breathing_animation(GamepadLEDColor.GREEN)
 
-        controller.stop_animation.assert_called_once()
+        assert controller.led_writer.play.call_count == 2
+        curve = controller.led_writer.play.call_args[0][0]
+        assert len(curve.colors) == 80
 
-    def test_pulse_animation_thread(self, controller):
-        """Test pulse animation thread execution."""
+    def test_pulse_curve(self, controller):
+        """Test that the pulse plays a precomputed sine curve from off to the color."""
         controller.is_connected = True
-        controller.set_color = Mock()
-
-        # Start pulse animation
-        controller.pulse(GamepadLEDColor.RED, duration=0.1, cycles=1)
-
-        # Wait for animation to complete
-        if controller.animation_thread:
-            controller.animation_thread.join(timeout=1.0)
-
-        # Should have called set_color multiple times
-        assert controller.set_color.call_count > 0
+        controller.led_writer.play = Mock()
+
+        controller.pulse(GamepadLEDColor.RED, duration=1.5, cycles=3)
+
+        curve = controller.led_writer.play.call_args[0][0]
+        assert isinstance(curve, ColorCurve)
+        assert curve.duration == 1.5
+        assert curve.cycles == 3
+        assert len(curve.colors) == 60
+        # Full color at the top of the wave, off at the bottom
+        assert curve.colors[15] == (255, 0, 0)
+        assert curve.colors[45] == (0, 0, 0)
+        # The pulse does not change the stored brightness
+        assert controller.brightness == 1.0
 
     def test_pulse_two_colors_success(self, controller):
         """Test starting two-color pulse animation."""
         controller.is_connected = True
-        controller.stop_animation = Mock()
+        controller.led_writer.play = Mock()
 
         result = controller.pulse_two_colors(
             GamepadLEDColor.RED, GamepadLEDColor.BLUE, duration=1.0, cycles=2
         )
 
         assert result is True
-        assert controller.animation_running is True
-        assert controller.animation_thread is not None
+        curve = controller.led_writer.play.call_args[0][0]
+        assert (curve.duration, curve.cycles) == (1.0, 2)
 
     def test_pulse_two_colors_not_connected(self, controller):
         """Test two-color pulse when not connected."""
@@ -238,15 +250,16 @@ class TestBaseGamepadLEDController:
     def test_breathing_animation_success(self, controller):
         """Test starting breathing animation."""
         controller.is_connected = True
-        controller.stop_animation = Mock()
+        controller.led_writer.play = Mock()
 
         result = controller.breathing_animation(
             GamepadLEDColor.RED, duration=1.0, cycles=2
         )
 
         assert result is True
-        assert controller.animation_running is True
-        assert controller.animation_thread is not None
+        curve = controller.led_writer.play.call_args[0][0]
+        assert len(curve.colors) == 80
+        assert curve.colors[20] == (255, 0, 0)
 
     def test_breathing_animation_not_connected(self, controller):
         """Test breathing animation when not connected."""
@@ -258,25 +271,21 @@ class TestBaseGamepadLEDController:
 
     def test_stop_animation(self, controller):
         """Test stopping animation."""
-        controller.animation_running = True
-        controller.animation_thread = Mock()
-        controller.animation_thread.is_alive.return_value = True
-        controller.animation_thread.join = Mock()
+        controller.is_connected = True
+        controller.led_writer.play(ColorCurve(((1, 2, 3),), 1.0), now=0.0)
+        controller.led_writer.stop()
 
         controller.stop_animation()
 
         assert controller.animation_running is False
-        controller.animation_thread.join.assert_called_once_with(timeout=1.0)
-
-    def test_stop_animation_no_thread(self, controller):
-        """Test stopping animation when no thread exists."""
-        controller.animation_running = True
-        controller.animation_thread = None
 
+    def test_stop_animation_not_started(self, controller):
+        """Test stopping animation when none was started."""
         # Should not raise exception
         controller.stop_animation()
 
         assert controller.animation_running is False
+        assert controller.led_writer.ident is None
 
     def test_get_available_colors(self, controller):
         """Test getting available colors."""
@@ -384,27 +393,9 @@ class TestBaseGamepadLEDController:
             # Should be clamped to 255
             mock_internal.assert_called_once_with(255, 255, 255)
 
-    def test_animation_thread_naming(self, controller):
-        """Test that animation threads are properly named."""
-        controller.is_connected = True
-
-        # Test pulse animation thread naming
-        controller.pulse(GamepadLEDColor.RED, duration=0.01, cycles=1)
-        if controller.animation_thread:
-            controller.animation_thread.join(timeout=1.0)
-            assert controller.animation_thread.name.startswith(
-                "GamepadLEDPulseAnimation"
-            )
-
-        # Test two-color pulse animation thread naming
-        controller.pulse_two_colors(
-            GamepadLEDColor.RED, GamepadLEDColor.BLUE, duration=0.01, cycles=1
-        )
-        if controller.animation_thread:
-            controller.animation_thread.join(timeout=1.0)
-            assert controller.animation_thread.name.startswith(
-                "GamepadLEDTwoColorPulseAnimation"
-            )
+    def test_writer_thread_naming(self, controller):
+        """Test that the LED writer thread is properly named."""
+        assert controller.led_writer.name.startswith("GamepadLEDWriter")
 
     def test_animation_stop_condition(self, controller):
         """Test that animations stop when animation_running is False."""
@@ -426,49 +417,34 @@ class TestBaseGamepadLEDController:
     def test_animation_cycles_limit(self, controller):
         """Test that animations respect cycle limits."""
         controller.is_connected = True
-        controller.set_color = Mock()
+        controller.led_writer.play = Mock()
+        controller.pulse(GamepadLEDColor.RED, duration=0.6, cycles=2)
+        curve = controller.led_writer.play.call_args[0][0]
+        del controller.led_writer.play
 
-        # Start animation with limited cycles
-        controller.pulse(GamepadLEDColor.RED, duration=0.01, cycles=2)
-
-        # Wait for completion
-        if controller.animation_thread:
-            controller.animation_thread.join(timeout=2.0)  # Give more time
-
-        # Wait a bit more to ensure animation_running is updated
-        import time
-
-        time.sleep(0.2)  # Give more time for the animation to complete
+        with patch.object(controller, "_set_color_internal", return_value=True):
+            controller.led_writer.play(curve, now=0.0)
+            controller.led_writer.render(now=1.0)
+            assert controller.animation_running is True
+            controller.led_writer.render(now=1.5)
 
         # Should have stopped after 2 cycles
-        # If still running, force stop it
-        if controller.animation_running:
-            controller.stop_animation()
-
         assert not controller.animation_running
 
     def test_pulse_two_colors_interpolation(self, controller):
         """Test that two-color pulse properly interpolates between colors."""
         controller.is_connected = True
-        controller.set_color_rgb = Mock()
+        controller.brightness = 0.5
+        controller.led_writer.play = Mock()
 
-        # Start two-color animation
         controller.pulse_two_colors(
             GamepadLEDColor.RED, GamepadLEDColor.BLUE, duration=0.01, cycles=1
         )
 
-        # Wait for completion
-        if controller.animation_thread:
-            controller.animation_thread.join(timeout=1.0)
-
-        # Should have called set_color_rgb multiple times with interpolated values
-        assert controller.set_color_rgb.call_count > 0
-
-        # Check that interpolation happened (values between RED and BLUE)
-        calls = controller.set_color_rgb.call_args_list
-        for call_args in calls:
-            rgb = call_args[0][0]  # First argument (RGB tuple)
-            # Should be interpolated between (255, 0, 0) and (0, 0, 255)
-            assert 0 <= rgb[0] <= 255  # Red component
+        colors = controller.led_writer.play.call_args[0][0].colors
+        # Should be interpolated between (255, 0, 0) and (0, 0, 255) at half brightness
+        for rgb in colors:
+            assert 0 <= rgb[0] <= 127  # Red component
             assert rgb[1] == 0  # Green component (both colors have 0 green)
-            assert 0 <= rgb[2] <= 255  # Blue component
+            assert 0 <= rgb[2] <= 127  # Blue component
+        assert colors[0] == (63, 0, 63)
@@ -0,0 +1,237 @@
+"""
+Unit tests for gamepad_led_writer.py module.
+"""
+
+import pytest
+from unittest.mock import Mock, call, patch
+
+from hexapod.interface.controllers.gamepad_led_controllers.gamepad_led_writer import (
+    ColorCurve,
+    GamepadLEDWriter,
+    sine_blend_colors,
+)
+
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+
+
+@pytest.fixture
+def write():
+    """Mock HID write succeeding for every color."""
+    return Mock(return_value=True)
+
+
+@pytest.fixture
+def writer(write):
+    """Writer limited to 10 reports per second whose thread is not started."""
+    writer = GamepadLEDWriter(write, max_rate=10.0, quantum=4)
+    writer._wake_thread = Mock()
+    return writer
+
+
+class TestColorCurve:
+    """Test cases for ColorCurve class."""
+
+    def test_color_at(self):
+        """Test that each color is shown for an equal slice of the cycle."""
+        curve = ColorCurve(((1, 1, 1), (2, 2, 2)), duration=1.0)
+
+        assert curve.frame_interval == 0.5
+        assert curve.color_at(0.2) == ((1, 1, 1), False)
+        assert curve.color_at(0.7) == ((2, 2, 2), False)
+        assert curve.color_at(1.2) == ((1, 1, 1), False)
+
+    def test_finite_curve_ends_on_last_color(self):
+        """Test that a finite curve stays on its last color once played."""
+        curve = ColorCurve(((1, 1, 1), (2, 2, 2)), duration=1.0, cycles=2)
+
+        assert curve.color_at(1.9) == ((2, 2, 2), False)
+        assert curve.color_at(2.0) == ((2, 2, 2), True)
+        assert curve.color_at(10.0) == ((2, 2, 2), True)
+
+
+class TestSineBlendColors:
+    """Test cases for sine_blend_colors function."""
+
+    def test_sine_wave(self):
+        """Test the middle, top and bottom of the wave."""
+        colors = sine_blend_colors((0, 0, 0), RED, 4)
+
+        assert colors == ((127, 0, 0), RED, (127, 0, 0), (0, 0, 0))
+
+    def test_brightness(self):
+        """Test that the brightness scales the blended colors."""
+        colors = sine_blend_colors(RED, BLUE, 4, 0.5)
+
+        assert colors[1] == (0, 0, 127)
+        assert colors[3] == (127, 0, 0)
+
+    def test_cached(self):
+        """Test that equal parameters reuse the computed curve."""
+        assert sine_blend_colors(RED, BLUE, 60) is sine_blend_colors(RED, BLUE, 60)
+
+
+class TestGamepadLEDWriter:
+    """Test cases for GamepadLEDWriter class."""
+
+    def test_init(self, write):
+        """Test writer initialization."""
+        writer = GamepadLEDWriter(write)
+
+        assert writer.min_interval == pytest.approx(1.0 / 30.0)
+        assert writer.quantum == 4
+        assert writer.daemon is True
+        assert writer.name.startswith("GamepadLEDWriter")
+        assert writer.ident is None
+        assert writer.is_playing is False
+
+    @pytest.mark.parametrize("kwargs", [{"max_rate": 0}, {"quantum": 0}])
+    def test_invalid_parameters(self, write, kwargs):
+        """Test that the report rate and quantum must be positive."""
+        with pytest.raises(ValueError):
+            GamepadLEDWriter(write, **kwargs)
+
+    def test_write_sends_at_once(self, writer, write):
+        """Test that a static color is sent exactly as given."""
+        assert writer.write((101, 2, 3), now=0.0) is True
+
+        write.assert_called_once_with(101, 2, 3)
+        assert writer.reports_sent == 1
+
+    def test_write_skips_shown_color(self, writer, write):
+        """Test that a color already shown is not sent again."""
+        writer.write(RED, now=0.0)
+        writer.write(RED, now=1.0)
+
+        write.assert_called_once_with(*RED)
+        assert writer.reports_skipped == 1
+
+    def test_write_coalesces_within_rate(self, writer, write):
+        """Test that colors set faster than the rate are merged into the latest."""
+        writer.write(RED, now=0.0)
+        writer.write((1, 1, 1), now=0.02)
+        writer.write(BLUE, now=0.04)
+
+        write.assert_called_once_with(*RED)
+        assert writer.render(now=0.05) == pytest.approx(0.05)
+        assert writer.render(now=0.1) is None
+
+        assert write.call_args_list == [call(*RED), call(*BLUE)]
+        writer._wake_thread.assert_called()
+
+    def test_failed_write_is_retried(self, writer, write):
+        """Test that a color that could not be sent is not treated as shown."""
+        write.return_value = False
+
+        assert writer.write(RED, now=0.0) is False
+        write.return_value = True
+        assert writer.write(RED, now=1.0) is True
+
+        assert write.call_count == 2
+
+    def test_invalidate(self, writer, write):
+        """Test that an invalidated color is sent again."""
+        writer.write(RED, now=0.0)
+
+        writer.invalidate()
+        writer.write(RED, now=1.0)
+
+        assert write.call_count == 2
+
+    def test_curve_limited_to_report_rate(self, writer, write):
+        """Test that a curve finer than the rate sends at most one report per tick."""
+        colors = tuple((i * 8, 0, 0) for i in range(20))
+        writer.play(ColorCurve(colors, duration=1.0), now=0.0)
+
+        # Frames every 50 ms, reports every 100 ms
+        delays = [writer.render(now=tick * 0.1) for tick in range(10)]
+
+        assert delays == [pytest.approx(0.1)] * 10
+        assert [c.args for c in write.call_args_list] == [
+            (i * 16, 0, 0) for i in range(10)
+        ]
+        assert writer.is_playing
+
+    def test_curve_colors_quantized_and_deduplicated(self, writer, write):
+        """Test that curve steps too small to see do not cost reports."""
+        colors = ((100, 0, 0), (101, 0, 0), (99, 0, 0), (110, 0, 0))
+        writer.play(ColorCurve(colors, duration=2.0), now=0.0)
+
+        for tick in range(4):
+            writer.render(now=tick * 0.5)
+
+        assert [c.args for c in write.call_args_list] == [(100, 0, 0), (112, 0, 0)]
+        assert writer.reports_skipped == 2
+
+    def test_static_colors_not_quantized(self, writer, write):
+        """Test that only curve colors are quantized."""
+        writer.write((101, 0, 0), now=0.0)
+
+        write.assert_called_once_with(101, 0, 0)
+
+    def test_finished_curve_keeps_last_color(self, writer, write):
+        """Test that a finite curve ends on its last color and stops playing."""
+        writer.play(ColorCurve((RED, BLUE), duration=0.2, cycles=1), now=0.0)
+
+        writer.render(now=0.0)
+        assert writer.render(now=0.5) is None
+
+        assert write.call_args_list == [call(*RED), call(*BLUE)]
+        assert not writer.is_playing
+
+    def test_write_stops_curve(self, writer, write):
+        """Test that a static color replaces the running curve."""
+        writer.play(ColorCurve((RED, BLUE), duration=1.0), now=0.0)
+
+        writer.write((0, 255, 0), now=0.0)
+
+        assert not writer.is_playing
+        assert writer.render(now=1.0) is None
+        write.assert_called_once_with(0, 255, 0)
+
+    def test_stop_curve_keeps_color(self, writer, write):
+        """Test that stopping a curve sends nothing more."""
+        writer.play(ColorCurve((RED, BLUE), duration=1.0), now=0.0)
+        writer.render(now=0.0)
+
+        writer.stop_curve()
+
+        assert writer.render(now=1.0) is None
+        write.assert_called_once_with(*RED)
+
+    def test_run_plays_curve_and_stops(self, write):
+        """Test that the writer thread plays a curve until stopped."""
+        writer = GamepadLEDWriter(write, max_rate=200.0)
+        done = []
+
+        def record(r, g, b):
+            done.append((r, g, b))
+            if len(done) == 3:
+                writer.stop_event.set()
+            return True
+
+        write.side_effect = record
+        writer.play(ColorCurve((RED, BLUE), duration=0.02))
+        writer.join(timeout=2.0)
+        writer.stop()
+
+        assert not writer.is_alive()
+        assert len(done) >= 3
+
+    def test_run_survives_write_error(self, write):
+        """Test that a failing report does not end the writer thread."""
+        writer = GamepadLEDWriter(write, max_rate=200.0)
+        write.side_effect = [OSError("HID write failed")] + [True] * 10
+
+        with patch(
+            "hexapod.interface.controllers.gamepad_led_controllers."
+            "gamepad_led_writer.logger"
+        ) as mock_logger:
+            writer.play(ColorCurve((RED, BLUE), duration=0.02, cycles=1))
+            writer.join(timeout=0.5)
+            writer.stop()
+
+        mock_logger.exception.assert_called_once()
+        # The color that failed is sent again, then the rest of the curve
+        assert write.call_args_list[:2] == [call(*RED), call(*RED)]
+        assert write.call_args_list[-1] == call(*BLUE)
@@ -0,0 +1,213 @@
+"""
+Unit tests for the capture hub and its shared capture ring.
+"""
+
+import multiprocessing
+import os
+import threading
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from hexapod.kws.capture_hub import (
+    CaptureHub,
+    SharedCaptureRing,
+    _feed_odas,
+    write_odas_config,
+)
+
+CHANNELS = 8
+FRAMES = 512
+
+
+def _buffer(value, frames=FRAMES):
+    """Create one interleaved input buffer with every sample set to a value."""
+    return np.full(frames * CHANNELS, value, dtype=np.int16).tobytes()
+
+
+class TestSharedCaptureRing:
+    """Test cases for SharedCaptureRing class."""
+
+    @pytest.fixture
+    def ring(self):
+        """Shared ring of four buffers, released after the test."""
+        ring = SharedCaptureRing(CHANNELS, FRAMES, 4)
+        yield ring
+        ring.release()
+
+    def test_attached_ring_shares_samples_and_counters(self, ring):
+        """Test that frames written through an attached ring reach the owner's cursors."""
+        writer = SharedCaptureRing(CHANNELS, FRAMES, 4, name=ring.name)
+        cursor = ring.cursor("picovoice")
+
+        writer.write(_buffer(7), status=1)
+        frames = cursor.read(FRAMES, timeout=0)
+
+        assert frames.shape == (FRAMES, CHANNELS)
+        assert np.all(frames == 7)
+        assert ring.written == FRAMES
+        assert ring.input_overflows == 1
+        assert not writer.owner
+        del frames
+        writer.release()
+
+    def test_notify_wakes_waiting_cursor(self, ring):
+        """Test that a cursor waiting in this process wakes up on notify."""
+        writer = SharedCaptureRing(CHANNELS, FRAMES, 4, name=ring.name)
+        cursor = ring.cursor("picovoice")
+        result = []
+        reader = threading.Thread(
+            target=lambda: result.append(cursor.read(FRAMES, timeout=2.0))
+        )
+        reader.start()
+
+        writer.write(_buffer(3))
+        ring.notify()
+        reader.join()
+
+        assert result[0] is not None
+        assert np.all(result[0] == 3)
+        result.clear()
+        writer.release()
+
+    def test_release_unlinks_owned_block(self):
+        """Test that the owner removes the shared memory block."""
+        ring = SharedCaptureRing(CHANNELS, FRAMES, 4)
+        name = ring.name
+
+        ring.release()
+
+        with pytest.raises(FileNotFoundError):
+            SharedCaptureRing(CHANNELS, FRAMES, 4, name=name)
+
+    def test_invalid_size(self):
+        """Test that the ring needs positive sizes."""
+        with pytest.raises(ValueError):
+            SharedCaptureRing(0, FRAMES, 4)
+
+
+class TestWriteOdasConfig:
+    """Test cases for the ODAS configuration reading the hub's pipe."""
+
+    def test_raw_input_replaced(self, tmp_path):
+        """Test that only the raw input interface is changed."""
+        fifo_path = tmp_path / "hub.raw"
+
+        config = write_odas_config(fifo_path, tmp_path / "hub.cfg").read_text()
+
+        raw = config[config.index("raw:") : config.index("mapping:")]
+        assert 'type = "file";' in raw
+        assert f'path = "{fifo_path}";' in raw
+        assert "nBits = 32;" in raw
+        assert 'type = "soundcard"' not in config
+        assert "map: (1, 2, 3, 4, 5, 6);" in config
+
+    def test_template_without_raw_input(self, tmp_path):
+        """Test that a template without a raw input is rejected."""
+        template = tmp_path / "empty.cfg"
+        template.write_text('version = "2.1";\n')
+
+        with pytest.raises(ValueError):
+            write_odas_config(tmp_path / "hub.raw", tmp_path / "hub.cfg", template)
+
+
+class TestFeedOdas:
+    """Test cases for the writer feeding ODAS through the named pipe."""
+
+    def test_frames_written_as_32_bit_samples(self, tmp_path):
+        """Test that ODAS reads the captured frames in the sound card format."""
+        fifo_path = tmp_path / "hub.raw"
+        os.mkfifo(fifo_path)
+        ring = SharedCaptureRing(CHANNELS, FRAMES, 4)
+        stop_event = threading.Event()
+        feeder = threading.Thread(
+            target=_feed_odas, args=(ring, fifo_path, stop_event), daemon=True
+        )
+        feeder.start()
+
+        # Capture until ODAS has read one buffer; audio before it connects is skipped
+        capturing = threading.Event()
+
+        def capture():
+            while not capturing.wait(0.02):
+                ring.write(_buffer(-2))
+
+        capture_thread = threading.Thread(target=capture, daemon=True)
+        capture_thread.start()
+        fd = os.open(fifo_path, os.O_RDONLY)
+        expected = FRAMES * CHANNELS * 4
+        data = b""
+        while len(data) < expected:
+            data += os.read(fd, expected - len(data))
+        capturing.set()
+        capture_thread.join()
+        stop_event.set()
+        os.close(fd)
+        feeder.join(timeout=2.0)
+
+        samples = np.frombuffer(data, dtype="<i4")
+        assert np.all(samples == -2 << 16)
+        assert not feeder.is_alive()
+        ring.release()
+
+
+class TestCaptureHub:
+    """Test cases for CaptureHub class."""
+
+    @pytest.fixture
+    def hub(self, tmp_path):
+        """Hub whose capture process is replaced by a mock."""
+        hub = CaptureHub(device_index=3, odas_fifo_path=tmp_path / "hub.raw")
+        hub._context = Mock()
+        self.wakeup, self.sender = multiprocessing.Pipe(duplex=False)
+        hub._context.Pipe.return_value = (self.wakeup, Mock())
+        hub._context.Process.return_value.is_alive.return_value = False
+        return hub
+
+    def test_start_and_stop(self, hub, tmp_path):
+        """Test that the hub shares its ring and writes the ODAS configuration."""
+        hub.start()
+        cursor = hub.ring.cursor("picovoice")
+        writer = SharedCaptureRing(CHANNELS, FRAMES, 64, name=hub.ring.name)
+        writer.write(_buffer(5))
+        self.sender.send_bytes(b"")
+
+        frames = cursor.read(FRAMES, timeout=2.0)
+
+        assert np.all(frames == 5)
+        args = hub._context.Process.call_args.kwargs["args"]
+        assert args[0] == hub.ring.name
+        assert args[5] == 3
+        assert (tmp_path / "hub.raw").exists()
+        assert 'type = "file"' in hub.odas_config_path.read_text()
+
+        del frames
+        writer.release()
+        self.sender.close()
+        hub.stop()
+
+        assert hub.ring is None
+        hub._context.Event.return_value.set.assert_called()
+
+    def test_capture_process_exit_closes_ring(self, hub):
+        """Test that consumers stop waiting once the capture process is gone."""
+        hub.start()
+        ring = hub.ring
+
+        self.sender.close()
+        hub._notifier.join(timeout=2.0)
+
+        assert ring.closed
+        hub.stop()
+
+    def test_start_timeout(self, hub):
+        """Test that a capture that does not start is stopped."""
+        hub._context.Event.return_value.wait.return_value = False
+        self.sender.close()
+
+        with pytest.raises(RuntimeError):
+            hub.start()
+
+        assert hub.ring is None
+        assert hub.process is None
@@ -0,0 +1,143 @@
+"""
+Unit tests for the multichannel capture ring.
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from hexapod.kws.capture_ring import CaptureRing
+
+CHANNELS = 4
+BUFFER = 8
+
+
+class TestCaptureRing:
+    """Test cases for CaptureRing and RingCursor classes."""
+
+    @pytest.fixture
+    def ring(self):
+        """Ring of four 8-frame buffers of 4-channel audio."""
+        return CaptureRing(CHANNELS, frames_per_buffer=BUFFER, capacity_buffers=4)
+
+    @staticmethod
+    def _frames(start, count=BUFFER):
+        """Create consecutive frames whose channels are offset by 1000."""
+        values = np.arange(start, start + count, dtype=np.int16)[:, None]
+        return values + 1000 * np.arange(CHANNELS, dtype=np.int16)
+
+    def test_read_returns_view(self, ring):
+        """Test that aligned reads are views into the preallocated buffer."""
+        cursor = ring.cursor("picovoice")
+        ring.write(self._frames(0).tobytes())
+
+        frames = cursor.read(BUFFER, timeout=0)
+
+        np.testing.assert_array_equal(frames, self._frames(0))
+        assert np.shares_memory(frames, ring.buffer)
+        channel = frames[:, 1]
+        assert np.shares_memory(channel, ring.buffer)
+        np.testing.assert_array_equal(channel, np.arange(BUFFER) + 1000)
+
+    def test_independent_cursors(self, ring):
+        """Test that each consumer reads the whole stream at its own pace."""
+        fast = ring.cursor("picovoice")
+        slow = ring.cursor("recorder")
+        for block in range(3):
+            ring.write(self._frames(block * BUFFER).tobytes())
+            np.testing.assert_array_equal(
+                fast.read(BUFFER, timeout=0), self._frames(block * BUFFER)
+            )
+
+        assert slow.available == 3 * BUFFER
+        np.testing.assert_array_equal(
+            slow.read(3 * BUFFER, timeout=0), self._frames(0, 3 * BUFFER)
+        )
+        assert fast.overruns == slow.overruns == 0
+
+    def test_read_across_wrap(self, ring):
+        """Test that unaligned reads across the end of the ring are contiguous."""
+        cursor = ring.cursor("vad")
+        for block in range(4):
+            ring.write(self._frames(block * BUFFER).tobytes())
+        cursor.read(5, timeout=0)
+        cursor.read(20, timeout=0)
+        ring.write(self._frames(4 * BUFFER).tobytes())
+
+        frames = cursor.read(BUFFER, timeout=0)
+
+        np.testing.assert_array_equal(frames, self._frames(25))
+        assert cursor.overruns == 0
+
+    def test_overrun_skips_to_oldest_frame(self, ring):
+        """Test that a consumer lapped by the writer counts the lost frames."""
+        cursor = ring.cursor("slow")
+        for block in range(6):
+            ring.write(self._frames(block * BUFFER).tobytes())
+
+        frames = cursor.read(BUFFER, timeout=0)
+
+        np.testing.assert_array_equal(frames, self._frames(2 * BUFFER))
+        assert cursor.overruns == 1
+        assert cursor.dropped_frames == 2 * BUFFER
+        assert ring.stats()["cursors"]["slow"]["overruns"] == 1
+
+    def test_read_timeout(self, ring):
+        """Test that a read without enough captured frames times out."""
+        cursor = ring.cursor("picovoice")
+        ring.write(self._frames(0, 4).tobytes())
+
+        assert cursor.read(BUFFER, timeout=0.01) is None
+        assert cursor.position == 0
+
+    def test_read_waits_for_writer(self, ring):
+        """Test that a waiting consumer wakes up when the callback writes."""
+        cursor = ring.cursor("picovoice")
+        writer = threading.Timer(0.01, ring.write, (self._frames(0).tobytes(),))
+        writer.start()
+
+        frames = cursor.read(BUFFER, timeout=5.0)
+        writer.join()
+
+        np.testing.assert_array_equal(frames, self._frames(0))
+
+    def test_close_wakes_consumers(self, ring):
+        """Test that closing the ring ends a blocking read."""
+        cursor = ring.cursor("picovoice")
+        threading.Timer(0.01, ring.close).start()
+
+        assert cursor.read(BUFFER) is None
+
+        ring.open()
+        ring.write(self._frames(0).tobytes())
+        assert cursor.read(BUFFER, timeout=0) is not None
+
+    def test_cursor_start_position(self, ring):
+        """Test that a cursor can start at audio captured before it existed."""
+        for block in range(6):
+            ring.write(self._frames(block * BUFFER).tobytes())
+
+        cursor = ring.cursor("recorder", position=0)
+
+        assert cursor.position == 2 * BUFFER
+        assert ring.cursor("late").available == 0
+
+    def test_input_overflow_and_stats(self, ring):
+        """Test that input overflows and cursors are reported in the statistics."""
+        cursor = ring.cursor("picovoice")
+        ring.write(self._frames(0).tobytes(), status=2)
+        ring.write(self._frames(BUFFER).tobytes())
+
+        stats = ring.stats()
+
+        assert stats["written"] == 2 * BUFFER
+        assert stats["input_overflows"] == 1
+        assert stats["cursors"]["picovoice"]["lag"] == 2 * BUFFER
+        cursor.close()
+        assert ring.stats()["cursors"] == {}
+
+    def test_invalid_size(self):
+        """Test that an empty ring is rejected."""
+        with pytest.raises(ValueError):
+            CaptureRing(CHANNELS, capacity_buffers=0)
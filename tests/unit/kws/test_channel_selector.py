@@ -0,0 +1,172 @@
+"""
+Unit tests for the microphone channel selector.
+"""
+
+import math
+import time
+
+import numpy as np
+import pytest
+
+from hexapod.kws.channel_selector import (
+    ChannelSelector,
+    RESPEAKER6_MIC_POSITIONS,
+    SPEED_OF_SOUND,
+)
+
+RATE = 16000
+FRAME = 512
+
+
+def _noise(frames, scale=100.0, seed=0):
+    """Create 8-channel frames of independent noise on every channel."""
+    rng = np.random.default_rng(seed)
+    return rng.normal(0, scale, (frames, FRAME, 8)).astype(np.int16)
+
+
+def _plane_wave(frames, azimuth, amplitude=3000.0, seed=1):
+    """Create 8-channel frames of a far-field source at an azimuth."""
+    rng = np.random.default_rng(seed)
+    total = frames * FRAME
+    source = np.convolve(rng.normal(0, 1, total + 32), np.ones(4) / 4, "same")
+    direction = np.array(
+        [math.cos(math.radians(azimuth)), math.sin(math.radians(azimuth))]
+    )
+    samples = np.arange(total)
+    audio = np.zeros((total, 8))
+    for channel, position in enumerate(RESPEAKER6_MIC_POSITIONS):
+        advance = np.dot(position, direction) / SPEED_OF_SOUND * RATE
+        audio[:, channel] = np.interp(
+            samples + advance + 16, np.arange(len(source)), source
+        )
+    return (audio * amplitude).reshape(frames, FRAME, 8), source[16 : 16 + total]
+
+
+def _snr_db(output, reference):
+    """Return the SNR of an output against the best-scaled, best-aligned reference."""
+    best = -np.inf
+    for lag in range(-6, 7):
+        shifted = np.roll(reference, lag)
+        gain = np.dot(output, shifted) / np.dot(shifted, shifted)
+        residual = output - gain * shifted
+        ratio = gain**2 * np.dot(shifted, shifted) / np.dot(residual, residual)
+        best = max(best, 10 * np.log10(ratio))
+    return best
+
+
+class TestChannelSelector:
+    """Test cases for ChannelSelector class."""
+
+    @pytest.fixture
+    def selector(self):
+        """Selector switching after 4 frames."""
+        return ChannelSelector(sample_rate=RATE, frame_length=FRAME, min_hold_frames=4)
+
+    def test_default_is_first_channel_view(self, selector):
+        """Test that the first microphone is used as a view before any switch."""
+        frames = _noise(1)[0]
+
+        pcm = selector.process(frames)
+
+        assert np.shares_memory(pcm, frames)
+        np.testing.assert_array_equal(pcm, frames[:, 0])
+
+    def test_switches_to_louder_channel(self, selector):
+        """Test that the microphone with the best SNR is selected."""
+        for frames in _noise(20):
+            selector.process(frames)
+
+        loud = _noise(10, seed=2)
+        loud[:, :, 3] *= 20
+        for frames in loud:
+            pcm = selector.process(frames)
+
+        assert selector.selected_channel == 3
+        assert selector.switches == 1
+        np.testing.assert_array_equal(pcm, loud[-1, :, 3])
+
+    def test_hysteresis(self, selector):
+        """Test that a slightly better channel does not take over."""
+        for frames in _noise(20):
+            selector.process(frames)
+
+        slightly = _noise(30, scale=400.0, seed=2)
+        slightly[:, :, 0] = (slightly[:, :, 0] * 0.9).astype(np.int16)
+        for frames in slightly:
+            selector.process(frames)
+
+        assert selector.selected_channel == 0
+        assert selector.switches == 0
+
+    def test_ignores_loopback_channels(self, selector):
+        """Test that the playback loopback channels are never selected."""
+        for frames in _noise(20):
+            selector.process(frames)
+
+        loopback = _noise(10, seed=2)
+        loopback[:, :, 6:] = 30000
+        for frames in loopback:
+            selector.process(frames)
+
+        assert selector.selected_channel == 0
+
+    def test_beam_improves_snr(self, selector):
+        """Test that the beam steered at the source beats a single microphone."""
+        speech, source = _plane_wave(40, azimuth=200)
+        noisy = (speech + _noise(40, scale=1000.0, seed=3)).astype(np.int16)
+        single = np.concatenate([frames[:, 0] for frames in noisy]).astype(float)
+
+        selector.steer(200.0)
+        beam = np.concatenate([selector.process(f).copy() for f in noisy])
+
+        assert selector.frames_beamformed == 40
+        assert _snr_db(beam.astype(float), source) > _snr_db(single, source) + 5
+
+    def test_stale_doa_not_used(self, selector):
+        """Test that an old direction of arrival falls back to channel selection."""
+        selector.steer(90.0, timestamp=time.monotonic() - 60)
+
+        assert not selector.beam_active
+        frames = _noise(1)[0]
+        assert np.shares_memory(selector.process(frames), frames)
+
+        selector.steer(90.0)
+        assert selector.beam_active
+        selector.steer(None)
+        assert not selector.beam_active
+
+    def test_beamforming_disabled(self):
+        """Test that steering is ignored when beamforming is off."""
+        selector = ChannelSelector(beamforming=False)
+        selector.steer(45.0)
+
+        assert not selector.beam_active
+
+    def test_digital_silence(self, selector):
+        """Test that all-zero frames have the silence level."""
+        levels = selector.channel_levels(np.zeros((FRAME, 8), dtype=np.int16))
+
+        assert levels.shape == (6,)
+        assert np.all(levels == -120.0)
+
+    def test_reset_and_stats(self, selector):
+        """Test the counters and resetting the selector."""
+        for frames in _noise(3):
+            selector.process(frames)
+
+        stats = selector.stats()
+        selector.reset()
+
+        assert stats == {
+            "frames_total": 3,
+            "frames_beamformed": 0,
+            "switches": 0,
+            "selected_channel": 0,
+        }
+        assert selector.frames_total == 0
+        assert selector.noise_floor_db is None
+
+    def test_no_microphones(self):
+        """Test that a selector needs microphones."""
+        with pytest.raises(ValueError):
+            ChannelSelector(mic_positions=())
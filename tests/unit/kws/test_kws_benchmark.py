@@ -0,0 +1,266 @@
+"""
+Unit tests for the offline keyword spotting benchmark.
+"""
+
+import json
+import wave
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from hexapod.kws.kws_benchmark import (
+    StubPicovoice,
+    EngineConfig,
+    RecordingLabel,
+    FileResult,
+    BenchmarkReport,
+    benchmark_file,
+    create_engine,
+    read_recording,
+    run_benchmark,
+)
+
+RATE = 16000
+
+
+def _tone(frequency, seconds, amplitude=8000.0):
+    """Create a sine tone."""
+    t = np.arange(int(seconds * RATE)) / RATE
+    return amplitude * np.sin(2 * np.pi * frequency * t)
+
+
+def _noise(seconds, seed=0):
+    """Create quiet background noise."""
+    return np.random.default_rng(seed).normal(0, 30, int(seconds * RATE))
+
+
+def _command(intent_frequency):
+    """Create a recording with a wake word at 1 s followed by a command tone."""
+    return np.concatenate(
+        [
+            _noise(1.0),
+            _tone(300, 0.5),
+            _noise(0.5, seed=1),
+            _tone(intent_frequency, 0.6),
+            _noise(1.0, seed=2),
+        ]
+    )
+
+
+def _write_wav(path, samples, channels=1, rate=RATE):
+    """Write samples to every channel of a 16-bit WAV file."""
+    data = np.repeat(samples[:, None], channels, axis=1).astype(np.int16)
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(data.tobytes())
+
+
+class TestStubPicovoice:
+    """Test cases for the deterministic stub engine."""
+
+    def _run(self, samples):
+        """Run samples through a stub and return its callbacks."""
+        wake_word, inference = Mock(), Mock()
+        stub = StubPicovoice(wake_word, inference)
+        frames = len(samples) // stub.frame_length
+        for frame in samples[: frames * stub.frame_length].reshape(frames, -1):
+            stub.process(frame.astype(np.int16))
+        return wake_word, inference
+
+    def test_wake_word_and_intent(self):
+        """Test that the command tone frequency selects the intent."""
+        wake_word, inference = self._run(_command(1250))
+
+        wake_word.assert_called_once()
+        result = inference.call_args[0][0]
+        assert result.is_understood
+        assert result.intent == "stop"
+
+    def test_unknown_tone_not_understood(self):
+        """Test that a tone outside the intent range is not understood."""
+        _, inference = self._run(_command(4000))
+
+        assert inference.call_args[0][0].is_understood is False
+
+    def test_no_command_times_out(self):
+        """Test that a wake word without a command ends as not understood."""
+        samples = np.concatenate([_tone(300, 0.5), _noise(4.0)])
+
+        wake_word, inference = self._run(samples)
+
+        wake_word.assert_called_once()
+        assert inference.call_args[0][0].is_understood is False
+
+    def test_noise_only(self):
+        """Test that background noise triggers nothing."""
+        wake_word, inference = self._run(_noise(3.0))
+
+        wake_word.assert_not_called()
+        inference.assert_not_called()
+
+
+class TestBenchmarkFile:
+    """Test cases for running one recording through the pipeline."""
+
+    @pytest.mark.parametrize("channels", [1, 8])
+    def test_detections_and_latency(self, tmp_path, channels):
+        """Test that mono and ReSpeaker recordings are processed like live audio."""
+        path = tmp_path / "help.wav"
+        _write_wav(path, _command(250), channels)
+        label = RecordingLabel(wake_word_onset=1.0, intent="help", check_intent=True)
+
+        result = benchmark_file(path, "help.wav", label)
+
+        assert result.channels == channels
+        assert result.frames == len(result.frame_times_ms) == 112
+        assert result.audio_seconds == pytest.approx(3.584)
+        assert 0 < result.frames_processed < result.frames
+        assert result.wake_word_times == [pytest.approx(1.248)]
+        assert result.wake_word_latency == pytest.approx(0.248)
+        assert result.false_alarms == 0
+        assert result.intents == ["help"]
+        assert result.intent_correct is True
+
+    def test_without_gate(self, tmp_path):
+        """Test that every frame reaches the engine without the gate."""
+        path = tmp_path / "noise.wav"
+        _write_wav(path, _noise(1.0))
+
+        result = benchmark_file(path, "noise.wav", use_vad_gate=False)
+
+        assert result.frames_processed == result.frames == 31
+        assert result.label is None
+        assert result.intent_correct is None
+
+    def test_wrong_sample_rate(self, tmp_path):
+        """Test that recordings not sampled at 16 kHz are rejected."""
+        path = tmp_path / "cd.wav"
+        _write_wav(path, _noise(0.1), rate=44100)
+
+        with pytest.raises(ValueError):
+            read_recording(path)
+
+
+class TestEngines:
+    """Test cases for the engine selection."""
+
+    def test_stub_without_access_key(self):
+        """Test that the stub is used without an access key."""
+        engine = create_engine(EngineConfig(), Mock(), Mock())
+
+        assert isinstance(engine, StubPicovoice)
+        assert EngineConfig().name == "stub"
+
+    def test_picovoice_with_access_key(self):
+        """Test that Picovoice is created with the VoiceControl sensitivities."""
+        config = EngineConfig(access_key="key")
+        with patch("picovoice.Picovoice") as mock_picovoice:
+            engine = create_engine(config, Mock(), Mock())
+
+        assert engine is mock_picovoice.return_value
+        kwargs = mock_picovoice.call_args[1]
+        assert kwargs["access_key"] == "key"
+        assert kwargs["porcupine_sensitivity"] == 0.75
+        assert kwargs["rhino_sensitivity"] == 0.25
+        assert config.name == "picovoice"
+
+
+class TestBenchmarkReport:
+    """Test cases for the aggregated report."""
+
+    def test_metrics(self):
+        """Test latency, false alarm and accuracy aggregation."""
+        detected = FileResult(
+            "a.wav", 1, 2.0, 0.01, 2, 2, [1.0, 3.0], [1.3], ["help"],
+            RecordingLabel(1.0, "help", True),
+        )  # fmt: skip
+        missed = FileResult(
+            "b.wav", 1, 2.0, 0.01, 1, 1, [2.0], [0.5], [],
+            RecordingLabel(1.0, "stop", True),
+        )  # fmt: skip
+        report = BenchmarkReport([detected, missed], elapsed_seconds=0.5, workers=2)
+
+        result = report.as_dict()
+
+        assert result["realtime_factor"] == pytest.approx(8.0)
+        assert result["single_core_realtime_factor"] == pytest.approx(200.0)
+        assert result["frame_time_ms"]["max"] == 3.0
+        assert result["frame_time_ms"]["p50"] == 2.0
+        assert result["wake_word"] == {
+            "labeled": 2,
+            "detected": 1,
+            "missed": 1,
+            "false_alarms": 1,
+            "latency_ms": pytest.approx(
+                {"mean": 300.0, "p50": 300.0, "p90": 300.0, "p99": 300.0, "max": 300.0}
+            ),
+        }
+        assert result["intent"] == {"labeled": 2, "correct": 1, "accuracy": 0.5}
+        assert [r["file"] for r in result["results"]] == ["a.wav", "b.wav"]
+
+    def test_empty(self):
+        """Test the report without recordings."""
+        result = BenchmarkReport().as_dict()
+
+        assert result["frame_time_ms"] is None
+        assert result["intent"]["accuracy"] is None
+
+
+class TestRunBenchmark:
+    """Test cases for benchmarking a corpus."""
+
+    @pytest.fixture
+    def corpus(self, tmp_path):
+        """Corpus with two commands, a noise recording and labels."""
+        _write_wav(tmp_path / "help.wav", _command(250))
+        (tmp_path / "ws").mkdir()
+        _write_wav(tmp_path / "ws" / "stop.wav", _command(1250), channels=8)
+        _write_wav(tmp_path / "noise.wav", _noise(2.0))
+        labels = {
+            "help.wav": {"wake_word_onset": 1.0, "intent": "help"},
+            "ws/stop.wav": {"wake_word_onset": 1.0, "intent": "stop"},
+            "noise.wav": {"wake_word_onset": None},
+        }
+        (tmp_path / "labels.json").write_text(json.dumps(labels))
+        return tmp_path
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_corpus(self, corpus, max_workers):
+        """Test that all recordings are benchmarked against their labels."""
+        report = run_benchmark(corpus, max_workers=max_workers)
+
+        result = json.loads(json.dumps(report.as_dict()))
+        assert result["engine"] == "stub"
+        assert result["workers"] == max_workers
+        assert result["files"] == 3
+        assert [r["file"] for r in result["results"]] == [
+            "help.wav",
+            "noise.wav",
+            "ws/stop.wav",
+        ]
+        assert result["wake_word"]["detected"] == 2
+        assert result["wake_word"]["false_alarms"] == 0
+        assert result["intent"]["accuracy"] == 1.0
+        assert result["realtime_factor"] > 1
+
+    def test_workers_limited_to_files(self, corpus):
+        """Test that no more workers than files are started."""
+        with patch("hexapod.kws.kws_benchmark.ProcessPoolExecutor") as mock_pool:
+            mock_pool.return_value.__enter__.return_value.map.return_value = []
+            report = run_benchmark(corpus, max_workers=8)
+
+        mock_pool.assert_called_once_with(max_workers=3)
+        assert report.workers == 3
+
+    def test_unlabeled_corpus(self, corpus):
+        """Test that a corpus without labels only reports throughput."""
+        (corpus / "labels.json").unlink()
+
+        result = run_benchmark(corpus, max_workers=1).as_dict()
+
+        assert result["wake_word"]["labeled"] == 0
+        assert result["intent"]["labeled"] == 0
+        assert result["frames"] > 0
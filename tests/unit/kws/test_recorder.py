@@ -6,8 +6,12 @@ import pytest
 import time
 import threading
 import wave
+from concurrent.futures import Future
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock, mock_open
+from unittest.mock import Mock, patch, MagicMock
+
+import numpy as np
+
 from hexapod.kws.recorder import Recorder
 
 
@@ -27,36 +31,48 @@ class TestRecorder:
     @pytest.fixture
     def recorder_custom(self, temp_recordings_dir):
         """Create a Recorder instance with custom parameters."""
-        return Recorder(recordings_dir=temp_recordings_dir)
+        recorder = Recorder(recordings_dir=temp_recordings_dir)
+        yield recorder
+        recorder.cleanup()
 
     @pytest.fixture
     def sample_audio_data(self):
-        """Create sample audio data."""
-        return b"sample_audio_data_16bit"
+        """Create one buffer of 8-channel 16-bit audio."""
+        return np.arange(512 * 8, dtype=np.int16).tobytes()
+
+    @staticmethod
+    def _read_wav(path):
+        """Return the channel count, frame count and data of a WAV file."""
+        with wave.open(str(path), "rb") as wf:
+            return wf.getnchannels(), wf.getnframes(), wf.readframes(wf.getnframes())
 
     def test_init_default_parameters(self, recorder_default):
         """Test Recorder initialization with default parameters."""
         assert recorder_default.recordings_dir == Path("data/audio/recordings")
+        assert recorder_default.file_format == "wav"
         assert recorder_default.is_recording is False
         assert recorder_default.is_continuous_recording is False
-        assert recorder_default.recording_frames == []
+        assert recorder_default.recording_frame_count == 0
         assert recorder_default.recording_start_time is None
         assert recorder_default.recording_audio_record_start_time is None
         assert recorder_default.recording_audio_record_number == 1
         assert recorder_default.recording_base_filename is None
         assert recorder_default.recording_timer is None
+        assert recorder_default.writer is None
 
     def test_init_custom_parameters(self, temp_recordings_dir, recorder_custom):
         """Test Recorder initialization with custom parameters."""
         assert recorder_custom.recordings_dir == temp_recordings_dir
+        assert temp_recordings_dir.is_dir()
         assert recorder_custom.is_recording is False
-        assert recorder_custom.is_continuous_recording is False
-        assert recorder_custom.recording_frames == []
-        assert recorder_custom.recording_start_time is None
-        assert recorder_custom.recording_audio_record_start_time is None
-        assert recorder_custom.recording_audio_record_number == 1
-        assert recorder_custom.recording_base_filename is None
-        assert recorder_custom.recording_timer is None
+        assert recorder_custom.recording_path is None
+
+    def test_init_flac_without_soundfile(self, temp_recordings_dir):
+        """Test that FLAC falls back to WAV when soundfile is missing."""
+        with patch("hexapod.kws.recorder.flac_available", return_value=False):
+            recorder = Recorder(temp_recordings_dir, file_format="flac")
+
+        assert recorder.file_format == "wav"
 
     def test_constants(self):
         """Test class constants."""
@@ -85,8 +101,12 @@ class TestRecorder:
         assert recorder_custom.recording_start_time == 1000.0
         assert recorder_custom.recording_audio_record_start_time == 1000.0
         assert recorder_custom.recording_audio_record_number == 1
-        assert recorder_custom.recording_frames == []
+        assert recorder_custom.recording_frame_count == 0
+        assert recorder_custom.recording_path == (
+            recorder_custom.recordings_dir / "test_recording_001.wav"
+        )
         assert recorder_custom.recording_timer is None
+        assert recorder_custom.writer.is_alive()
 
     @patch("time.time")
     @patch("time.strftime")
@@ -103,11 +123,6 @@ class TestRecorder:
         assert recorder_custom.recording_base_filename == "20231201_120000"
         assert recorder_custom.is_recording is True
         assert recorder_custom.is_continuous_recording is True
-        assert recorder_custom.recording_start_time == 1000.0
-        assert recorder_custom.recording_audio_record_start_time == 1000.0
-        assert recorder_custom.recording_audio_record_number == 1
-        assert recorder_custom.recording_frames == []
-        assert recorder_custom.recording_timer is None
 
     @patch("time.time")
     @patch("time.strftime")
@@ -125,13 +140,11 @@ class TestRecorder:
             assert recorder_custom.is_recording is True
             assert recorder_custom.is_continuous_recording is False
             assert recorder_custom.recording_timer is not None
+            assert recorder_custom.recording_path.name == "20231201_120000.wav"
             mock_timer.assert_called_once_with(60.0, recorder_custom.stop_recording)
 
-    @patch("time.time")
-    def test_start_recording_already_recording(self, mock_time, recorder_custom):
+    def test_start_recording_already_recording(self, recorder_custom):
         """Test starting recording when already recording."""
-        mock_time.return_value = 1000.0
-
         # Start first recording
         recorder_custom.start_recording("first_recording")
 
@@ -147,79 +160,84 @@ class TestRecorder:
     def test_add_audio_frame_not_recording(self, recorder_custom, sample_audio_data):
         """Test adding audio frame when not recording."""
         recorder_custom.add_audio_frame(sample_audio_data)
-        assert recorder_custom.recording_frames == []
+
+        assert recorder_custom.recording_frame_count == 0
+        assert recorder_custom.writer is None
 
     def test_add_audio_frame_recording(self, recorder_custom, sample_audio_data):
-        """Test adding audio frame when recording."""
-        recorder_custom.is_recording = True
-        recorder_custom.recording_frames = []
+        """Test that added frames are streamed to the recording file."""
+        recorder_custom.start_recording("test_recording", duration=60.0)
 
+        recorder_custom.add_audio_frame(sample_audio_data)
         recorder_custom.add_audio_frame(sample_audio_data)
 
-        assert recorder_custom.recording_frames == [sample_audio_data]
-
-    def test_save_recording_audio_record_no_frames(self, recorder_custom):
-        """Test saving audio record with no frames."""
-        recorder_custom.recording_frames = []
-
-        result = recorder_custom._save_recording_audio_record()
-
-        assert result == ""
-
-    @patch("time.time")
-    @patch("wave.open")
-    @patch("pathlib.Path.stat")
-    def test_save_recording_audio_record_success(
-        self, mock_stat, mock_wave_open, mock_time, recorder_custom, sample_audio_data
-    ):
-        """Test successful saving of audio record."""
-        mock_time.return_value = 2000.0
-        mock_stat.return_value.st_size = 1024 * 1024  # 1MB
-
-        recorder_custom.recording_frames = [sample_audio_data]
-        recorder_custom.recording_base_filename = "test_recording"
-        recorder_custom.recording_audio_record_number = 1
-        recorder_custom.recording_audio_record_start_time = 1000.0
-
-        mock_wf = MagicMock()
-        mock_wave_open.return_value.__enter__.return_value = mock_wf
+        assert recorder_custom.recording_frame_count == 1024
+        path = recorder_custom.stop_recording()
+        assert path == str(recorder_custom.recordings_dir / "test_recording.wav")
+        channels, frames, data = self._read_wav(path)
+        assert channels == 8
+        assert frames == 1024
+        assert data == sample_audio_data * 2
 
-        result = recorder_custom._save_recording_audio_record()
+    def test_add_audio_frame_array_view(self, recorder_custom):
+        """Test that frames passed as array views are copied before queuing."""
+        ring = np.arange(1024 * 8, dtype=np.int16).reshape(1024, 8)
+        recorder_custom.start_recording("test_recording")
 
-        assert result == str(recorder_custom.recordings_dir / "test_recording_001.wav")
-        assert recorder_custom.recording_frames == []
-        assert recorder_custom.recording_audio_record_start_time == 2000.0
-        assert recorder_custom.recording_audio_record_number == 2
+        recorder_custom.add_audio_frame(ring[:512])
+        ring[:512] = 0
 
-        # Verify wave file setup
-        mock_wf.setnchannels.assert_called_once_with(8)
-        mock_wf.setsampwidth.assert_called_once_with(2)
-        mock_wf.setframerate.assert_called_once_with(16000)
-        mock_wf.writeframes.assert_called_once_with(sample_audio_data)
+        _, frames, data = self._read_wav(recorder_custom.stop_recording())
+        assert frames == 512
+        assert data == np.arange(512 * 8, dtype=np.int16).tobytes()
 
-    @patch("time.time")
-    @patch("wave.open")
-    def test_save_recording_audio_record_exception(
-        self, mock_wave_open, mock_time, recorder_custom, sample_audio_data
+    def test_continuous_recording_rotates_audio_records(
+        self, recorder_custom, sample_audio_data
     ):
-        """Test saving audio record with exception."""
-        mock_time.return_value = 2000.0
-        mock_wave_open.side_effect = Exception("File write error")
+        """Test that continuous recordings are split without buffering in memory."""
+        recorder_custom._audio_record_frames = 1024
+        recorder_custom.start_recording("test_recording")
+
+        for _ in range(5):
+            recorder_custom.add_audio_frame(sample_audio_data)
+
+        assert recorder_custom.recording_audio_record_number == 3
+        assert recorder_custom.recording_frame_count == 512
+        last = recorder_custom.stop_recording()
+
+        assert last == str(recorder_custom.recordings_dir / "test_recording_003.wav")
+        frame_counts = [
+            self._read_wav(
+                recorder_custom.recordings_dir / f"test_recording_00{n}.wav"
+            )[1]
+            for n in (1, 2, 3)
+        ]
+        assert frame_counts == [1024, 1024, 512]
 
-        recorder_custom.recording_frames = [sample_audio_data]
-        recorder_custom.recording_base_filename = "test_recording"
-        recorder_custom.recording_audio_record_number = 1
-        recorder_custom.recording_audio_record_start_time = 1000.0
+    def test_save_recording_audio_record_no_frames(self, recorder_custom):
+        """Test saving audio record with no frames."""
+        recorder_custom.start_recording("test_recording")
 
         result = recorder_custom._save_recording_audio_record()
 
         assert result == ""
+        assert recorder_custom.recording_audio_record_number == 1
 
     def test_stop_recording_not_recording(self, recorder_custom):
         """Test stopping recording when not recording."""
         result = recorder_custom.stop_recording()
         assert result == ""
 
+    def test_stop_recording_without_frames(self, recorder_custom):
+        """Test that a recording without audio leaves no file behind."""
+        recorder_custom.start_recording("test_recording")
+
+        result = recorder_custom.stop_recording()
+
+        assert result == ""
+        assert recorder_custom.is_recording is False
+        assert list(recorder_custom.recordings_dir.iterdir()) == []
+
     @patch("time.time")
     def test_stop_recording_with_timer(self, mock_time, recorder_custom):
         """Test stopping recording with active timer."""
@@ -237,75 +255,51 @@ class TestRecorder:
         mock_timer.cancel.assert_called_once()
         assert recorder_custom.recording_timer is None
 
-    @patch("time.time")
-    @patch("wave.open")
-    @patch("pathlib.Path.stat")
-    def test_stop_recording_continuous_with_frames(
-        self, mock_stat, mock_wave_open, mock_time, recorder_custom, sample_audio_data
-    ):
-        """Test stopping continuous recording with frames."""
-        mock_time.return_value = 2000.0
-        mock_stat.return_value.st_size = 1024 * 1024  # 1MB
-
-        recorder_custom.is_recording = True
-        recorder_custom.is_continuous_recording = True
-        recorder_custom.recording_start_time = 1000.0
-        recorder_custom.recording_frames = [sample_audio_data]
-        recorder_custom.recording_base_filename = "test_recording"
-        recorder_custom.recording_audio_record_number = 1
-        recorder_custom.recording_audio_record_start_time = 1000.0
-
-        mock_wf = MagicMock()
-        mock_wave_open.return_value.__enter__.return_value = mock_wf
-
-        result = recorder_custom.stop_recording()
+    def test_stop_recording_write_error(self, recorder_custom, sample_audio_data):
+        """Test that a file that cannot be written is reported as not saved."""
+        recorder_custom.start_recording("test_recording")
+        recorder_custom.add_audio_frame(sample_audio_data)
+        with patch(
+            "hexapod.kws.recording_writer.RecordingWriter._close",
+            side_effect=OSError("disk full"),
+        ):
+            result = recorder_custom.stop_recording()
 
-        assert result == str(recorder_custom.recordings_dir / "test_recording_001.wav")
+        assert result == ""
         assert recorder_custom.is_recording is False
 
-    @patch("time.time")
-    @patch("wave.open")
-    @patch("pathlib.Path.stat")
-    def test_stop_recording_duration_based_with_frames(
-        self, mock_stat, mock_wave_open, mock_time, recorder_custom, sample_audio_data
+    def test_stop_recording_releases_lock_while_closing(
+        self, recorder_custom, sample_audio_data
     ):
-        """Test stopping duration-based recording with frames."""
-        mock_time.return_value = 2000.0
-        mock_stat.return_value.st_size = 1024 * 1024  # 1MB
-
-        recorder_custom.is_recording = True
-        recorder_custom.is_continuous_recording = False
-        recorder_custom.recording_start_time = 1000.0
-        recorder_custom.recording_frames = [sample_audio_data]
-        recorder_custom.recording_base_filename = "test_recording"
-
-        mock_wf = MagicMock()
-        mock_wave_open.return_value.__enter__.return_value = mock_wf
-
-        result = recorder_custom.stop_recording()
-
-        assert result == str(recorder_custom.recordings_dir / "test_recording.wav")
+        """Test that audio frames are not held up while the last file is closed."""
+        recorder_custom.start_recording("test_recording")
+        recorder_custom.add_audio_frame(sample_audio_data)
+        closed = Future()
+        recorder_custom.writer.request_close = Mock(return_value=closed)
+
+        stopper = threading.Thread(target=recorder_custom.stop_recording)
+        stopper.start()
+        try:
+            # The lock is free while stop_recording waits for the writer
+            assert recorder_custom._lock.acquire(timeout=1.0)
+            recorder_custom._lock.release()
+            assert stopper.is_alive()
+        finally:
+            closed.set_result(None)
+            stopper.join(timeout=1.0)
+
+        assert not stopper.is_alive()
         assert recorder_custom.is_recording is False
 
-    @patch("time.time")
-    @patch("wave.open")
-    def test_stop_recording_duration_based_exception(
-        self, mock_wave_open, mock_time, recorder_custom, sample_audio_data
-    ):
-        """Test stopping duration-based recording with exception."""
-        mock_time.return_value = 2000.0
-        mock_wave_open.side_effect = Exception("File write error")
+    def test_memory_is_bounded(self, recorder_custom, sample_audio_data):
+        """Test that a writer falling behind drops audio instead of growing."""
+        recorder_custom.start_recording("test_recording")
+        recorder_custom.writer.write = Mock(return_value=False)
 
-        recorder_custom.is_recording = True
-        recorder_custom.is_continuous_recording = False
-        recorder_custom.recording_start_time = 1000.0
-        recorder_custom.recording_frames = [sample_audio_data]
-        recorder_custom.recording_base_filename = "test_recording"
-
-        result = recorder_custom.stop_recording()
+        recorder_custom.add_audio_frame(sample_audio_data)
 
-        assert result == ""
-        assert recorder_custom.is_recording is False
+        assert not hasattr(recorder_custom, "recording_frames")
+        assert recorder_custom.recording_frame_count == 512
 
     @patch("time.time")
     def test_get_recording_status_not_recording(self, mock_time, recorder_custom):
@@ -322,13 +316,13 @@ class TestRecorder:
             "current_audio_record_duration": None,
             "current_audio_record_number": 1,
             "frame_count": 0,
+            "file_format": "wav",
+            "dropped_buffers": 0,
         }
         assert status == expected
 
     @patch("time.time")
-    def test_get_recording_status_recording(
-        self, mock_time, recorder_custom, sample_audio_data
-    ):
+    def test_get_recording_status_recording(self, mock_time, recorder_custom):
         """Test getting recording status when recording."""
         mock_time.return_value = 2000.0
 
@@ -338,7 +332,8 @@ class TestRecorder:
         recorder_custom.recording_audio_record_start_time = 1500.0
         recorder_custom.recording_base_filename = "test_recording"
         recorder_custom.recording_audio_record_number = 2
-        recorder_custom.recording_frames = [sample_audio_data, sample_audio_data]
+        recorder_custom.recording_frame_count = 1024
+        recorder_custom.writer = Mock(dropped_buffers=3)
 
         status = recorder_custom.get_recording_status()
 
@@ -349,9 +344,12 @@ class TestRecorder:
             "total_duration": 1000.0,
             "current_audio_record_duration": 500.0,
             "current_audio_record_number": 2,
-            "frame_count": 2,
+            "frame_count": 1024,
+            "file_format": "wav",
+            "dropped_buffers": 3,
         }
         assert status == expected
+        recorder_custom.is_recording = False
 
     def test_cleanup_not_recording(self, recorder_custom):
         """Test cleanup when not recording."""
@@ -373,6 +371,22 @@ class TestRecorder:
             mock_stop.assert_called_once()
             mock_timer.cancel.assert_called_once()
             assert recorder_custom.recording_timer is None
+        recorder_custom.is_recording = False
+
+    def test_cleanup_stops_writer(self, recorder_custom, sample_audio_data):
+        """Test that cleanup saves the recording and stops the writer thread."""
+        recorder_custom.start_recording("test_recording")
+        recorder_custom.add_audio_frame(sample_audio_data)
+        writer = recorder_custom.writer
+
+        recorder_custom.cleanup()
+
+        assert not writer.is_alive()
+        assert recorder_custom.writer is None
+        _, frames, _ = self._read_wav(
+            recorder_custom.recordings_dir / "test_recording_001.wav"
+        )
+        assert frames == 512
 
     def test_cleanup_with_timer_only(self, recorder_custom):
         """Test cleanup with timer but not recording."""
@@ -384,68 +398,6 @@ class TestRecorder:
         mock_timer.cancel.assert_called_once()
         assert recorder_custom.recording_timer is None
 
-    @patch("time.time")
-    @patch("wave.open")
-    @patch("pathlib.Path.stat")
-    def test_file_size_formatting_mb(
-        self, mock_stat, mock_wave_open, mock_time, recorder_custom, sample_audio_data
-    ):
-        """Test file size formatting in MB."""
-        mock_time.return_value = 2000.0
-        mock_stat.return_value.st_size = 2 * 1024 * 1024  # 2MB
-
-        recorder_custom.recording_frames = [sample_audio_data]
-        recorder_custom.recording_base_filename = "test_recording"
-        recorder_custom.recording_audio_record_number = 1
-        recorder_custom.recording_audio_record_start_time = 1000.0
-
-        mock_wf = MagicMock()
-        mock_wave_open.return_value.__enter__.return_value = mock_wf
-
-        result = recorder_custom._save_recording_audio_record()
-
-        assert result == str(recorder_custom.recordings_dir / "test_recording_001.wav")
-
-    @patch("time.time")
-    @patch("wave.open")
-    @patch("pathlib.Path.stat")
-    def test_file_size_formatting_gb(
-        self, mock_stat, mock_wave_open, mock_time, recorder_custom, sample_audio_data
-    ):
-        """Test file size formatting in GB."""
-        mock_time.return_value = 2000.0
-        mock_stat.return_value.st_size = 2 * 1024 * 1024 * 1024  # 2GB
-
-        recorder_custom.recording_frames = [sample_audio_data]
-        recorder_custom.recording_base_filename = "test_recording"
-        recorder_custom.recording_audio_record_number = 1
-        recorder_custom.recording_audio_record_start_time = 1000.0
-
-        mock_wf = MagicMock()
-        mock_wave_open.return_value.__enter__.return_value = mock_wf
-
-        result = recorder_custom._save_recording_audio_record()
-
-        assert result == str(recorder_custom.recordings_dir / "test_recording_001.wav")
-
-    def test_audio_record_duration_calculation_none_start_time(
-        self, recorder_custom, sample_audio_data
-    ):
-        """Test audio record duration calculation when start time is None."""
-        recorder_custom.recording_frames = [sample_audio_data]
-        recorder_custom.recording_base_filename = "test_recording"
-        recorder_custom.recording_audio_record_number = 1
-        recorder_custom.recording_audio_record_start_time = None
-
-        with patch("wave.open"), patch("pathlib.Path.stat") as mock_stat:
-            # Mock the stat to return a proper file size
-            mock_stat.return_value.st_size = 1024
-            result = recorder_custom._save_recording_audio_record()
-
-            assert result == str(
-                recorder_custom.recordings_dir / "test_recording_001.wav"
-            )
-
     def test_total_duration_calculation_none_start_time(self, recorder_custom):
         """Test total duration calculation when start time is None."""
         recorder_custom.is_recording = True
@@ -0,0 +1,172 @@
+"""
+Unit tests for the background recording writer.
+"""
+
+import wave
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from hexapod.kws.recording_writer import (
+    RecordingWriter,
+    RecordedFile,
+    _WavSink,
+    format_file_size,
+)
+
+RATE = 16000
+CHANNELS = 2
+
+
+def _audio(frames, start=0):
+    """Create interleaved 16-bit frames with consecutive values."""
+    return np.arange(start, start + frames * CHANNELS, dtype=np.int16).tobytes()
+
+
+class TestRecordingWriter:
+    """Test cases for RecordingWriter class."""
+
+    @pytest.fixture
+    def writer(self):
+        """Running writer for 2-channel audio."""
+        writer = RecordingWriter(RATE, CHANNELS)
+        writer.start()
+        yield writer
+        writer.stop()
+
+    def test_streams_wav_file(self, writer, tmp_path):
+        """Test that queued audio ends up in a WAV file with a final header."""
+        path = tmp_path / "recording.wav"
+        writer.open_file(path)
+        for block in range(3):
+            assert writer.write(_audio(512, block * 1024))
+
+        recorded = writer.close_file()
+
+        assert recorded == RecordedFile(path, 1536, RATE)
+        assert recorded.duration == pytest.approx(0.096)
+        with wave.open(str(path), "rb") as wf:
+            assert wf.getnchannels() == CHANNELS
+            assert wf.getsampwidth() == 2
+            assert wf.getframerate() == RATE
+            assert wf.getnframes() == 1536
+            assert wf.readframes(1536) == _audio(1536)
+
+    def test_open_closes_previous_file(self, writer, tmp_path):
+        """Test that opening the next file finishes the current one in order."""
+        first, second = tmp_path / "001.wav", tmp_path / "002.wav"
+        writer.open_file(first)
+        writer.write(_audio(100))
+        writer.open_file(second)
+        writer.write(_audio(200))
+
+        assert writer.close_file().path == second
+        with wave.open(str(first), "rb") as wf:
+            assert wf.getnframes() == 100
+        with wave.open(str(second), "rb") as wf:
+            assert wf.getnframes() == 200
+
+    def test_close_without_file(self, writer):
+        """Test that closing without an open file reports nothing."""
+        assert writer.close_file() is None
+
+    def test_full_queue_drops_audio(self, tmp_path):
+        """Test that a stalled writer drops buffers instead of growing."""
+        writer = RecordingWriter(RATE, CHANNELS, max_pending_buffers=2)
+        path = tmp_path / "recording.wav"
+        writer.open_file(path)
+        assert writer.write(_audio(10)) is True
+        assert writer.write(_audio(10)) is True
+        assert writer.write(_audio(10)) is False
+        assert writer.dropped_buffers == 1
+
+        writer.start()
+        try:
+            assert writer.close_file().frames == 20
+        finally:
+            writer.stop()
+
+    def test_rotation_does_not_block_on_full_queue(self, tmp_path):
+        """Test that opening and closing files never waits for queued audio."""
+        writer = RecordingWriter(RATE, CHANNELS, max_pending_buffers=1)
+        first, second = tmp_path / "001.wav", tmp_path / "002.wav"
+        writer.open_file(first)
+        writer.write(_audio(10))
+        assert writer.write(_audio(10)) is False
+
+        # The writer thread is not running, so blocking calls would hang here
+        writer.open_file(second)
+        closed = writer.request_close()
+        assert not closed.done()
+
+        writer.start()
+        try:
+            assert closed.result(timeout=1.0) == RecordedFile(second, 0, RATE)
+        finally:
+            writer.stop()
+        with wave.open(str(first), "rb") as wf:
+            assert wf.getnframes() == 10
+
+    def test_flac_output(self, tmp_path):
+        """Test that FLAC recordings are encoded with soundfile."""
+        soundfile = MagicMock()
+        with patch("hexapod.kws.recording_writer._soundfile", return_value=soundfile):
+            writer = RecordingWriter(RATE, CHANNELS, file_format="flac")
+            path = tmp_path / "recording.flac"
+            path.touch()
+            writer.start()
+            try:
+                writer.open_file(path)
+                writer.write(_audio(64))
+                recorded = writer.close_file()
+            finally:
+                writer.stop()
+
+        assert writer.extension == ".flac"
+        assert recorded.frames == 64
+        _, kwargs = soundfile.SoundFile.call_args
+        assert kwargs["format"] == "FLAC"
+        assert kwargs["channels"] == CHANNELS
+        sound_file = soundfile.SoundFile.return_value
+        sound_file.buffer_write.assert_called_once_with(_audio(64), dtype="int16")
+        sound_file.close.assert_called_once()
+
+    def test_flac_requires_soundfile(self):
+        """Test that FLAC output is rejected without soundfile."""
+        with patch("hexapod.kws.recording_writer._soundfile", return_value=None):
+            with pytest.raises(RuntimeError):
+                RecordingWriter(RATE, CHANNELS, file_format="flac")
+
+    def test_unknown_format(self):
+        """Test that unknown file formats are rejected."""
+        with pytest.raises(ValueError):
+            RecordingWriter(RATE, CHANNELS, file_format="mp3")
+
+
+class TestWavSink:
+    """Test cases for the WAV file sink."""
+
+    def test_header_update_while_writing(self, tmp_path):
+        """Test that the header covers the audio written before the update."""
+        path = tmp_path / "recording.wav"
+        sink = _WavSink(path, RATE, CHANNELS)
+        sink.write(_audio(300))
+        sink.update_header()
+        sink.write(_audio(50))
+
+        with wave.open(str(path), "rb") as wf:
+            assert wf.getnframes() == 300
+
+        sink.close()
+        with wave.open(str(path), "rb") as wf:
+            assert wf.getnframes() == 350
+
+
+@pytest.mark.parametrize(
+    "size,expected",
+    [(1024 * 1024, "1.0 MB"), (3 * 1024 * 1024 * 1024 // 2, "1.5 GB")],
+)
+def test_format_file_size(size, expected):
+    """Test file size formatting for log messages."""
+    assert format_file_size(size) == expected
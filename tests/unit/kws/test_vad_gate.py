@@ -0,0 +1,211 @@
+"""
+Unit tests for the voice-activity gate.
+"""
+
+import wave
+
+import numpy as np
+import pytest
+
+from hexapod.kws.vad_gate import (
+    VoiceActivityGate,
+    GateEvaluation,
+    evaluate_gate,
+    read_wav_frames,
+)
+
+RATE = 16000
+FRAME = 512
+MARKER = 12345
+
+
+def _noise(frames, scale=30.0, seed=0):
+    """Create frames of quiet white noise."""
+    rng = np.random.default_rng(seed)
+    return rng.normal(0, scale, (frames, FRAME)).astype(np.int16)
+
+
+def _voice(frames, amplitude=3000.0):
+    """Create frames of a loud harmonic, low zero-crossing signal."""
+    t = np.arange(frames * FRAME) / RATE
+    signal = np.sin(2 * np.pi * 150 * t) + 0.5 * np.sin(2 * np.pi * 300 * t)
+    return (amplitude * signal).astype(np.int16).reshape(frames, FRAME)
+
+
+def _run(gate, frames):
+    """Pass frames through the gate and return how many were forwarded each time."""
+    return [len(gate.process(frame)) for frame in frames]
+
+
+def _write_wav(path, frames, channels=1):
+    """Write frames as a 16 kHz 16-bit WAV file."""
+    samples = np.repeat(frames.reshape(-1), channels)
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(2)
+        wf.setframerate(RATE)
+        wf.writeframes(samples.astype(np.int16).tobytes())
+
+
+class TestVoiceActivityGate:
+    """Test cases for VoiceActivityGate class."""
+
+    @pytest.fixture
+    def gate(self):
+        """Gate with a 3-frame hangover and a 4-frame pre-roll."""
+        return VoiceActivityGate(
+            RATE, FRAME, hangover=3 * FRAME / RATE, pre_roll=4 * FRAME / RATE
+        )
+
+    def test_background_noise_is_skipped(self, gate):
+        """Test that steady background noise never reaches the keyword spotter."""
+        assert sum(_run(gate, _noise(200))) == 0
+        assert gate.skipped_fraction == 1.0
+        assert gate.noise_floor_db == pytest.approx(-61, abs=1)
+
+    def test_voice_opens_gate_with_pre_roll(self, gate):
+        """Test that the frames before the onset are forwarded first, in order."""
+        noise = _noise(20)
+        _run(gate, noise)
+        onset = _voice(1)[0]
+
+        forwarded = gate.process(onset)
+
+        assert len(forwarded) == 5
+        for expected, frame in zip(noise[-4:], forwarded[:4]):
+            np.testing.assert_array_equal(frame, expected)
+        assert forwarded[-1] is onset
+        assert gate.is_open
+        assert gate.activations == 1
+
+    def test_hangover_keeps_gate_open(self, gate):
+        """Test that the gate stays open for the hangover after voice ends."""
+        _run(gate, _noise(20))
+        _run(gate, _voice(5))
+
+        counts = _run(gate, _noise(5, seed=1))
+
+        assert counts == [1, 1, 1, 0, 0]
+        assert not gate.is_open
+
+    def test_loud_broadband_noise_is_skipped(self, gate):
+        """Test that loud hiss is rejected by its zero-crossing rate."""
+        _run(gate, _noise(20))
+
+        assert sum(_run(gate, _noise(10, scale=3000.0, seed=2))) == 0
+
+    def test_lasting_noise_closes_gate(self, gate):
+        """Test that the noise floor adapts to a lasting change of the background."""
+        _run(gate, _noise(20))
+
+        counts = _run(gate, _voice(2000, amplitude=300.0))
+
+        assert counts[0] > 0
+        assert counts[-1] == 0
+
+    def test_hold_open(self, gate):
+        """Test that a held gate forwards silence until released."""
+        _run(gate, _noise(20))
+        gate.hold_open()
+
+        assert _run(gate, _noise(5, seed=1)) == [5, 1, 1, 1, 1]
+
+        gate.release()
+        assert _run(gate, _noise(5, seed=2)) == [1, 1, 1, 0, 0]
+
+    def test_digital_silence(self, gate):
+        """Test that all-zero frames are handled."""
+        level, zero_crossing_rate = gate.frame_features(np.zeros(FRAME, np.int16))
+
+        assert level == -120.0
+        assert zero_crossing_rate == 0.0
+
+    def test_strided_frames(self, gate):
+        """Test that a channel view of multichannel audio can be gated."""
+        frames = np.zeros((FRAME, 8), dtype=np.int16)
+        frames[:, 0] = _voice(1)[0]
+
+        level, _ = gate.frame_features(frames[:, 0])
+
+        assert level == pytest.approx(
+            gate.frame_features(np.ascontiguousarray(frames[:, 0]))[0]
+        )
+
+    def test_reset_and_stats(self, gate):
+        """Test the counters and resetting the gate."""
+        _run(gate, _noise(20))
+        _run(gate, _voice(2))
+
+        stats = gate.stats()
+        gate.reset()
+
+        assert stats["frames_total"] == 22
+        assert stats["frames_forwarded"] == 6
+        assert stats["activations"] == 1
+        assert not gate.is_open
+        assert gate.noise_floor_db is None
+
+
+class TestEvaluateGate:
+    """Test cases for the gate evaluation on recordings."""
+
+    class MarkerDetector:
+        """Detector reporting a keyword on frames starting with the marker."""
+
+        def process(self, pcm):
+            return 0 if pcm[0] == MARKER else -1
+
+        def delete(self):
+            pass
+
+    @pytest.fixture
+    def recording(self, tmp_path):
+        """Recording with one spoken keyword in background noise."""
+        voice = _voice(20)
+        voice[0, 0] = MARKER
+        path = tmp_path / "hexapod.wav"
+        _write_wav(path, np.concatenate([_noise(300), voice, _noise(180, seed=1)]))
+        return path
+
+    def test_skipped_fraction_and_recall(self, recording):
+        """Test that the gate keeps the detection while skipping most frames."""
+        evaluation = evaluate_gate([recording], self.MarkerDetector)
+
+        assert evaluation.files == [str(recording)]
+        assert evaluation.frames_total == 500
+        assert evaluation.frames_forwarded == 16 + 20 + 19
+        assert evaluation.skipped_fraction > 0.8
+        assert evaluation.detections_ungated == 1
+        assert evaluation.recall == 1.0
+        assert evaluation.as_dict()["recall"] == 1.0
+
+    def test_without_detector(self, recording):
+        """Test that only the skipped frames are measured without a detector."""
+        evaluation = evaluate_gate([recording])
+
+        assert evaluation.skipped_fraction > 0.8
+        assert evaluation.recall is None
+
+    def test_empty_evaluation(self):
+        """Test the metrics without recordings."""
+        assert GateEvaluation().skipped_fraction == 0.0
+
+    def test_read_multichannel_wav(self, tmp_path):
+        """Test that the first channel of a multichannel recording is used."""
+        path = tmp_path / "eight.wav"
+        frames = _voice(2)
+        _write_wav(path, frames, channels=8)
+
+        np.testing.assert_array_equal(read_wav_frames(path, FRAME), frames)
+
+    def test_read_wav_wrong_width(self, tmp_path):
+        """Test that recordings other than 16-bit are rejected."""
+        path = tmp_path / "eight_bit.wav"
+        with wave.open(str(path), "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(1)
+            wf.setframerate(RATE)
+            wf.writeframes(b"\x80" * FRAME)
+
+        with pytest.raises(ValueError):
+            read_wav_frames(path, FRAME)
@@ -9,7 +9,9 @@ from unittest.mock import Mock, patch, MagicMock, call
 from pathlib import Path
 import numpy as np
 
+from hexapod.kws import CaptureRing
 from hexapod.kws.voice_control import VoiceControl
+from hexapod.task_interface import AudioDeviceBroker
 
 
 class TestVoiceControl:
@@ -21,6 +23,7 @@ class TestVoiceControl:
         task_interface = Mock()
         task_interface.lights_handler = Mock()
         task_interface.voice_control_paused_event = threading.Event()
+        task_interface.audio_device_broker = AudioDeviceBroker()
         task_interface.voice_control_context_info = None
         task_interface.task = None
         task_interface.stop = Mock()
@@ -50,6 +53,8 @@ class TestVoiceControl:
             "rhino_sensitivity": 0.25,
             "print_context": False,
             "recordings_dir": Path("test_recordings"),
+            "use_vad_gate": True,
+            "use_channel_selector": True,
         }
 
     @pytest.fixture
@@ -107,6 +112,8 @@ class TestVoiceControl:
             )
             assert vc.rhino_sensitivity == VoiceControl.DEFAULT_RHINO_SENSITIVITY
             assert vc.print_context is False
+            assert vc.vad_gate is None
+            assert vc.channel_selector is None
             assert vc.stop_event.is_set() is False
             assert vc.pause_event.is_set() is False
             assert vc.task_interface_interrupted is False
@@ -216,6 +223,14 @@ class TestVoiceControl:
         voice_control.task_interface.stop.assert_called_once()
         assert voice_control.task_interface_interrupted is True
 
+    def test_voice_activity_gate_held_for_intent(self, voice_control):
+        """Test that the gate passes every frame between wake word and inference."""
+        voice_control._wake_word_callback()
+        assert voice_control.vad_gate._held is True
+
+        voice_control._inference_callback(Mock(is_understood=True))
+        assert voice_control.vad_gate._held is False
+
     def test_wake_word_callback_no_task(self, voice_control):
         """Test wake word callback when no task is running."""
         voice_control.task_interface.task = None
@@ -322,6 +337,44 @@ class TestVoiceControl:
             voice_control._initialize_audio.assert_called_once()
             voice_control.task_interface.lights_handler.listen_wakeword.assert_called_once()
 
+    def test_pause_releases_audio_device(self, voice_control):
+        """Test that pausing hands the audio device back once the stream is closed."""
+        broker = voice_control.audio_device_broker
+        voice_control.audio_lease = broker.acquire("voice_control")
+        voice_control.audio_thread = None
+        voice_control.audio_stream = Mock()
+        voice_control.picovoice = None
+
+        voice_control.pause()
+
+        assert broker.owner is None
+        assert voice_control.audio_lease is None
+
+    def test_audio_device_handed_back_to_voice_control(self, voice_control):
+        """Test that unpausing waits for ODAS to release the audio device."""
+        broker = voice_control.audio_device_broker
+        odas_lease = broker.acquire("odas")
+        threading.Timer(0.05, odas_lease.release).start()
+
+        with (
+            patch("hexapod.kws.voice_control.pyaudio.PyAudio"),
+            patch.object(voice_control, "_suppress_alsa_warnings"),
+        ):
+            voice_control._initialize_audio()
+
+        assert broker.owner == "voice_control"
+        assert broker.stats()["handoffs"] == 1
+
+    def test_audio_release_request_wakes_control_loop(self, voice_control):
+        """Test that a task requesting the audio device wakes the control loop."""
+        broker = voice_control.audio_device_broker
+        broker.acquire("voice_control")
+
+        with pytest.raises(TimeoutError):
+            broker.acquire("odas", timeout=0.01)
+
+        assert voice_control._state_changed.is_set()
+
     def test_start_recording(self, voice_control):
         """Test starting audio recording."""
         voice_control.audio_recorder.start_recording.return_value = "test_recording"
@@ -391,34 +444,113 @@ class TestVoiceControl:
         # Should sleep when paused
         assert call_count > 0
 
-    def test_audio_processor_processing(self, voice_control):
-        """Test audio processor when processing audio."""
+    @staticmethod
+    def _run_audio_processor_once(voice_control, frames=None):
+        """Run one audio processor iteration, capturing frames when it starts."""
         voice_control.pause_event.clear()
         voice_control.audio_stop_event = Mock()
-        voice_control.audio_stop_event.is_set.return_value = False
-        voice_control.audio_stream = Mock()
-        voice_control.audio_stream.read.return_value = b"\x00" * 1024
-        voice_control.picovoice = Mock()
-        voice_control.audio_recorder = Mock()
-        voice_control.audio_recorder.is_recording = False
-
-        # Mock the while loop to run once
-        original_is_set = voice_control.audio_stop_event.is_set
         call_count = 0
 
         def mock_is_set():
             nonlocal call_count
             call_count += 1
             if call_count == 1:
+                if frames is not None:
+                    voice_control._audio_callback(frames.tobytes(), len(frames), {}, 0)
                 return False
             return True
 
         voice_control.audio_stop_event.is_set = mock_is_set
-
         voice_control._audio_processor()
 
-        voice_control.audio_stream.read.assert_called_once()
+    @staticmethod
+    def _captured_frames():
+        """Create one buffer of 8-channel audio with distinct channel values."""
+        frames = np.zeros((512, 8), dtype=np.int16)
+        frames[:, 0] = np.arange(512)
+        frames[:, 1:] = -1
+        return frames
+
+    def test_audio_processor_processing(self, voice_control):
+        """Test that Picovoice gets a view of the first channel of the ring."""
+        voice_control.vad_gate = None
+        voice_control.audio_stream = Mock()
+        voice_control.picovoice = Mock()
+        voice_control.audio_recorder = Mock()
+        voice_control.audio_recorder.is_recording = False
+
+        self._run_audio_processor_once(voice_control, self._captured_frames())
+
         voice_control.picovoice.process.assert_called_once()
+        pcm = voice_control.picovoice.process.call_args[0][0]
+        np.testing.assert_array_equal(pcm, np.arange(512))
+        assert np.shares_memory(pcm, voice_control.capture_ring.buffer)
+        voice_control.audio_recorder.add_audio_frame.assert_not_called()
+
+    def test_audio_processor_gated(self, voice_control):
+        """Test that only the frames let through by the gate reach Picovoice."""
+        voice_control.audio_stream = Mock()
+        voice_control.picovoice = Mock()
+        voice_control.audio_recorder = Mock()
+        voice_control.audio_recorder.is_recording = False
+        pre_roll = np.ones(512, dtype=np.int16)
+        voice_control.vad_gate = Mock()
+        voice_control.vad_gate.process.side_effect = lambda pcm: [pre_roll, pcm]
+
+        self._run_audio_processor_once(voice_control, self._captured_frames())
+
+        gated = voice_control.vad_gate.process.call_args[0][0]
+        np.testing.assert_array_equal(gated, np.arange(512))
+        processed = [c[0][0] for c in voice_control.picovoice.process.call_args_list]
+        assert processed[0] is pre_roll
+        assert processed[1] is gated
+
+    def test_audio_processor_gate_closed(self, voice_control):
+        """Test that silence is not passed to Picovoice."""
+        voice_control.audio_stream = Mock()
+        voice_control.picovoice = Mock()
+        voice_control.audio_recorder = Mock()
+        voice_control.audio_recorder.is_recording = False
+
+        self._run_audio_processor_once(voice_control, np.zeros((512, 8), np.int16))
+
+        voice_control.picovoice.process.assert_not_called()
+        assert voice_control.vad_gate.frames_total == 1
+
+    def test_audio_processor_channel_selector(self, voice_control):
+        """Test that Picovoice gets the channel chosen by the selector."""
+        voice_control.vad_gate = None
+        voice_control.audio_stream = Mock()
+        voice_control.picovoice = Mock()
+        voice_control.audio_recorder = Mock()
+        voice_control.audio_recorder.is_recording = False
+        beam = np.ones(512, dtype=np.int16)
+        voice_control.channel_selector = Mock()
+        voice_control.channel_selector.process.return_value = beam
+
+        self._run_audio_processor_once(voice_control, self._captured_frames())
+
+        frames = voice_control.channel_selector.process.call_args[0][0]
+        assert frames.shape == (512, 8)
+        voice_control.picovoice.process.assert_called_once_with(beam)
+
+    def test_update_doa(self, voice_control):
+        """Test that the dominant ODAS source steers the beam and is kept when lost."""
+        voice_control.update_doa((3, 120.0))
+        voice_control.update_doa(None)
+
+        assert voice_control.channel_selector.beam_active
+        assert voice_control.channel_selector._doa[0] == 120.0
+
+    def test_audio_callback(self, voice_control):
+        """Test that the PyAudio callback fills the capture ring."""
+        frames = self._captured_frames()
+
+        result = voice_control._audio_callback(frames.tobytes(), 512, {}, 0)
+
+        assert result[0] is None
+        assert voice_control.capture_ring.written == 512
+        np.testing.assert_array_equal(voice_control.capture_ring.view(0, 512), frames)
 
     def test_cleanup_audio(self, voice_control):
         """Test audio cleanup."""
@@ -470,6 +602,30 @@ class TestVoiceControl:
             assert voice_control.pyaudio_instance == mock_pyaudio
             assert voice_control.audio_stream == mock_stream
             mock_pyaudio.open.assert_called_once()
+            assert (
+                mock_pyaudio.open.call_args.kwargs["stream_callback"]
+                == voice_control._audio_callback
+            )
+
+    def test_capture_hub_shares_ring(self, voice_control_params, mock_picovoice):
+        """Test that voice control reads the hub's ring instead of opening the device."""
+        capture_hub = Mock()
+        capture_hub.ring = CaptureRing(8, 512, 4)
+        with (
+            patch("hexapod.kws.voice_control.Picovoice", return_value=mock_picovoice),
+            patch("hexapod.kws.voice_control.Recorder"),
+            patch("hexapod.kws.voice_control.IntentDispatcher"),
+            patch("hexapod.kws.voice_control.pyaudio.PyAudio") as mock_pyaudio,
+        ):
+            vc = VoiceControl(**voice_control_params, capture_hub=capture_hub)
+            vc.capture_ring.close()
+
+            vc._initialize_audio()
+
+        assert vc.capture_ring is capture_hub.ring
+        assert not vc.capture_ring.closed
+        mock_pyaudio.assert_not_called()
+        assert vc.audio_device_broker.owner is None
 
     def test_initialize_audio_error(self, voice_control):
         """Test audio initialization error handling."""
@@ -484,92 +640,50 @@ class TestVoiceControl:
             with pytest.raises(Exception, match="Audio init error"):
                 voice_control._initialize_audio()
 
+        assert voice_control.audio_device_broker.owner is None
+
     def test_audio_processor_recording(self, voice_control):
-        """Test audio processor when recording is active."""
-        voice_control.pause_event.clear()
-        voice_control.audio_stop_event = Mock()
-        voice_control.audio_stop_event.is_set.return_value = False
+        """Test that the recorder reads all channels with its own cursor."""
+        voice_control.vad_gate = None
         voice_control.audio_stream = Mock()
-        voice_control.audio_stream.read.return_value = b"\x00" * 1024
         voice_control.picovoice = Mock()
         voice_control.audio_recorder = Mock()
         voice_control.audio_recorder.is_recording = True
-        voice_control.audio_recorder.add_audio_frame = Mock()
+        frames = self._captured_frames()
 
-        # Mock the while loop to run once
-        call_count = 0
-
-        def mock_is_set():
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return False
-            return True
+        self._run_audio_processor_once(voice_control, frames)
 
-        voice_control.audio_stop_event.is_set = mock_is_set
-
-        voice_control._audio_processor()
-
-        voice_control.audio_stream.read.assert_called_once()
         voice_control.picovoice.process.assert_called_once()
         voice_control.audio_recorder.add_audio_frame.assert_called_once()
+        recorded = voice_control.audio_recorder.add_audio_frame.call_args[0][0]
+        np.testing.assert_array_equal(recorded, frames)
+        assert voice_control.capture_ring.stats()["cursors"] == {}
 
-    def test_audio_processor_short_data(self, voice_control):
-        """Test audio processor with short audio data."""
-        voice_control.pause_event.clear()
-        voice_control.audio_stop_event = Mock()
-        voice_control.audio_stop_event.is_set.return_value = False
+    def test_audio_processor_no_data(self, voice_control):
+        """Test that the processor waits when no audio was captured."""
         voice_control.audio_stream = Mock()
-        voice_control.audio_stream.read.return_value = b"\x00" * 4  # Very short data
         voice_control.picovoice = Mock()
-        voice_control.picovoice.frame_length = 512
         voice_control.audio_recorder = Mock()
         voice_control.audio_recorder.is_recording = False
 
-        # Mock the while loop to run once
-        call_count = 0
-
-        def mock_is_set():
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return False
-            return True
-
-        voice_control.audio_stop_event.is_set = mock_is_set
-
-        voice_control._audio_processor()
+        self._run_audio_processor_once(voice_control)
 
-        voice_control.audio_stream.read.assert_called_once()
-        voice_control.picovoice.process.assert_called_once()
+        voice_control.picovoice.process.assert_not_called()
 
     def test_audio_processor_error(self, voice_control):
         """Test audio processor error handling."""
-        voice_control.pause_event.clear()
-        voice_control.audio_stop_event = Mock()
-        voice_control.audio_stop_event.is_set.return_value = False
+        voice_control.vad_gate = None
         voice_control.audio_stream = Mock()
-        voice_control.audio_stream.read.side_effect = Exception("Audio read error")
         voice_control.picovoice = Mock()
+        voice_control.picovoice.process.side_effect = Exception("Process error")
         voice_control.audio_recorder = Mock()
         voice_control.audio_recorder.is_recording = False
 
-        # Mock the while loop to run once
-        call_count = 0
-
-        def mock_is_set():
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return False
-            return True
-
-        voice_control.audio_stop_event.is_set = mock_is_set
-
         # Should not raise exception, just log error
-        voice_control._audio_processor()
+        self._run_audio_processor_once(voice_control, self._captured_frames())
 
-        voice_control.audio_stream.read.assert_called_once()
+        voice_control.picovoice.process.assert_called_once()
+        voice_control.audio_stop_event.wait.assert_called_once_with(0.01)
 
     def test_audio_processor_thread_error(self, voice_control):
         """Test audio processor thread error handling."""
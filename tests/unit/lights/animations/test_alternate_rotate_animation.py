@@ -85,7 +85,7 @@ class TestAlternateRotateAnimation:
         # Mock stop_event to allow all 12 LEDs to be set, then stop
         animation_default.stop_event.wait = Mock(side_effect=[False] * 12 + [True])
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify all LEDs were set with alternating colors
         assert mock_lights.set_color.call_count == 12
@@ -115,7 +115,7 @@ class TestAlternateRotateAnimation:
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
         animation_default.positions = 6  # Set smaller number for testing
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify rotation was called
         assert mock_lights.rotate.call_count == 6
@@ -130,7 +130,7 @@ class TestAlternateRotateAnimation:
         # Mock stop_event to return True immediately
         animation_default.stop_event.wait = Mock(return_value=True)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify no LEDs were set
         mock_lights.set_color.assert_not_called()
@@ -155,7 +155,7 @@ class TestAlternateRotateAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify initial setup was completed
         assert mock_lights.set_color.call_count == 12
@@ -167,7 +167,7 @@ class TestAlternateRotateAnimation:
         # Mock stop_event to return True after first iteration
         animation_custom.stop_event.wait = Mock(side_effect=[False, True])
 
-        animation_custom.execute_animation()
+        animation_custom.run()
 
         # Verify custom colors were used
         calls = mock_lights.set_color.call_args_list
@@ -187,7 +187,7 @@ class TestAlternateRotateAnimation:
 
         animation_custom.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_custom.execute_animation()
+        animation_custom.run()
 
         # Verify custom delay was used
         assert all(delay == 0.1 for delay in delays)
@@ -209,7 +209,7 @@ class TestAlternateRotateAnimation:
 
         animation_custom.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_custom.execute_animation()
+        animation_custom.run()
 
         # Verify custom positions were used (3 rotations out of 6)
         assert mock_lights.rotate.call_count == 3
@@ -233,7 +233,7 @@ class TestAlternateRotateAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify two full rotation cycles occurred
         assert mock_lights.rotate.call_count == 24
@@ -248,7 +248,7 @@ class TestAlternateRotateAnimation:
             side_effect=[False, False, False, False, False, False, False, True]
         )
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify all 7 LEDs were set
         assert mock_lights.set_color.call_count == 7
@@ -268,7 +268,7 @@ class TestAlternateRotateAnimation:
         # Mock stop_event to return True after initial setup
         animation.stop_event.wait = Mock(side_effect=[False, True])
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify single LED was set
         assert mock_lights.set_color.call_count == 1
@@ -284,7 +284,7 @@ class TestAlternateRotateAnimation:
         # Mock stop_event to return True immediately
         animation.stop_event.wait = Mock(return_value=True)
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify no LEDs were set
         mock_lights.set_color.assert_not_called()
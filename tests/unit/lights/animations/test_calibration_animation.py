@@ -115,7 +115,7 @@ class TestCalibrationAnimation:
         # Mock stop_event to return True after first iteration
         animation_default.stop_event.wait = Mock(return_value=True)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify all legs were processed
         assert mock_lights.set_color.call_count == 6
@@ -150,7 +150,7 @@ class TestCalibrationAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify 3 iterations occurred (6 legs * 3 iterations)
         assert (
@@ -162,7 +162,7 @@ class TestCalibrationAnimation:
         # Mock stop_event to return True immediately
         animation_default.stop_event.wait = Mock(return_value=True)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify LEDs were set (the while loop executes at least once)
         assert mock_lights.set_color.call_count == 6
@@ -185,7 +185,7 @@ class TestCalibrationAnimation:
         # Mock stop_event to return True after first iteration
         animation.stop_event.wait = Mock(return_value=True)
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify only legs with status were processed
         assert mock_lights.set_color.call_count == 2
@@ -221,7 +221,7 @@ class TestCalibrationAnimation:
         with pytest.raises(
             ValueError, match="Invalid calibration status: invalid_status"
         ):
-            animation.execute_animation()
+            animation.run()
 
     def test_execute_animation_custom_refresh_delay(self, animation_custom):
         """Test that custom refresh delay is used."""
@@ -233,7 +233,7 @@ class TestCalibrationAnimation:
 
         animation_custom.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_custom.execute_animation()
+        animation_custom.run()
 
         # Verify custom delay was used
         assert all(delay == 0.5 for delay in delays)
@@ -249,7 +249,7 @@ class TestCalibrationAnimation:
         # Mock stop_event to return True after first iteration
         animation.stop_event.wait = Mock(return_value=True)
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify no LEDs were set
         mock_lights.set_color.assert_not_called()
@@ -267,7 +267,7 @@ class TestCalibrationAnimation:
         # Mock stop_event to return True after first iteration
         animation.stop_event.wait = Mock(return_value=True)
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify no LEDs were set
         mock_lights.set_color.assert_not_called()
@@ -285,7 +285,7 @@ class TestCalibrationAnimation:
         # Mock stop_event to return True after first iteration
         animation.stop_event.wait = Mock(return_value=True)
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify all three status types were processed
         assert mock_lights.set_color.call_count == 3
@@ -308,7 +308,7 @@ class TestCalibrationAnimation:
         # Mock stop_event to return True after first iteration
         animation.stop_event.wait = Mock(return_value=True)
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify only legs with non-None status were processed
         assert mock_lights.set_color.call_count == 2
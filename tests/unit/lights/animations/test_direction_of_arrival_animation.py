@@ -7,8 +7,10 @@ import math
 from unittest.mock import Mock, patch
 from hexapod.lights.animations.direction_of_arrival_animation import (
     DirectionOfArrivalAnimation,
+    azimuth_led_table,
 )
 from hexapod.lights.lights import ColorRGB
+from hexapod.utils import LatestValue
 
 
 @pytest.fixture
@@ -86,6 +88,27 @@ class TestDirectionOfArrivalAnimation:
         animation_default.update_sources(azimuths)
 
         assert animation_default.azimuths == azimuths
+        assert animation_default.sources.read() == (1, azimuths)
+
+    def test_shared_sources_slot(self, mock_lights):
+        """Test that the animation reads azimuths published into a given slot."""
+        sources = LatestValue({})
+        animation = DirectionOfArrivalAnimation(lights=mock_lights, sources=sources)
+
+        sources.publish({0: 90.0})
+
+        assert animation.sources is sources
+        assert animation.azimuths == {0: 90.0}
+
+    def test_azimuth_led_table(self):
+        """Test that the table holds one LED set per degree and is built once."""
+        table = azimuth_led_table(12)
+
+        assert len(table) == 360
+        assert table[0] == {2, 3, 4}
+        assert table[90] == {11, 0, 1}
+        assert all(len(leds) == 3 for leds in table)
+        assert azimuth_led_table(12) is table
 
     def test_get_led_indices_from_azimuth_0_degrees(self, animation_default):
         """Test LED index calculation for 0 degrees azimuth."""
@@ -145,7 +168,7 @@ class TestDirectionOfArrivalAnimation:
         # Mock stop_event to return True after first iteration
         animation_default.stop_event.wait = Mock(return_value=True)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify clear was called but no LEDs were set
         mock_lights.clear.assert_called_once()
@@ -160,7 +183,7 @@ class TestDirectionOfArrivalAnimation:
         # Mock stop_event to return True after first iteration
         animation_default.stop_event.wait = Mock(return_value=True)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify clear was called
         mock_lights.clear.assert_called_once()
@@ -189,7 +212,7 @@ class TestDirectionOfArrivalAnimation:
         # Mock stop_event to return True after first iteration
         animation_default.stop_event.wait = Mock(return_value=True)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify clear was called
         mock_lights.clear.assert_called_once()
@@ -221,10 +244,10 @@ class TestDirectionOfArrivalAnimation:
         # Mock stop_event to return True after first iteration
         animation_default.stop_event.wait = Mock(return_value=True)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
-        # Verify LEDs were set for all sources
-        assert mock_lights.set_color.call_count == 18  # 6 sources * 3 LEDs each
+        # Sources 60 degrees apart overlap; every LED is set once
+        assert mock_lights.set_color.call_count == 12
 
         # Verify colors cycle correctly
         calls = mock_lights.set_color.call_args_list
@@ -246,7 +269,7 @@ class TestDirectionOfArrivalAnimation:
         # Mock stop_event to return True after first iteration
         animation_custom.stop_event.wait = Mock(return_value=True)
 
-        animation_custom.execute_animation()
+        animation_custom.run()
 
         # Verify custom colors were used
         calls = mock_lights.set_color.call_args_list
@@ -265,7 +288,7 @@ class TestDirectionOfArrivalAnimation:
 
         animation_custom.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_custom.execute_animation()
+        animation_custom.run()
 
         # Verify custom delay was used
         assert all(delay == 0.2 for delay in delays)
@@ -275,7 +298,7 @@ class TestDirectionOfArrivalAnimation:
         # Mock stop_event to return True immediately
         animation_default.stop_event.wait = Mock(return_value=True)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify clear was called but no LEDs were set
         mock_lights.clear.assert_called_once()
@@ -298,11 +321,45 @@ class TestDirectionOfArrivalAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
-        # Verify 3 iterations occurred
-        assert mock_lights.clear.call_count == 4  # 3 iterations + initial clear
-        assert mock_lights.set_color.call_count == 12  # 4 iterations * 3 LEDs
+        # The source did not move, so only the first iteration painted
+        assert call_count == 4
+        mock_lights.clear.assert_called_once()
+        assert mock_lights.set_color.call_count == 3
+
+    def test_execute_animation_repaints_only_on_change(
+        self, animation_default, mock_lights
+    ):
+        """Test that the layer is repainted only when the lit LEDs change."""
+        animation_default.update_sources({0: 15.0})
+        animation_default.start()
+        animation_default.step()
+        # Jitter within the same LEDs and repeated frames keep the painted layer
+        animation_default.update_sources({0: 20.3})
+        animation_default.step()
+        animation_default.step()
+        assert mock_lights.clear.call_count == 1
+        assert mock_lights.set_color.call_count == 3
+
+        # Moving to other LEDs repaints
+        animation_default.update_sources({0: 90.0})
+        animation_default.step()
+        assert mock_lights.clear.call_count == 2
+        assert mock_lights.set_color.call_count == 6
+        assert animation_default.active_leds == {11, 0, 1}
+
+    def test_execute_animation_sources_lost(self, animation_default, mock_lights):
+        """Test that the LEDs are cleared when all sources disappear."""
+        animation_default.update_sources({0: 0.0})
+        animation_default.start()
+        animation_default.step()
+
+        animation_default.update_sources({})
+        animation_default.step()
+
+        assert mock_lights.clear.call_count == 2
+        assert animation_default.active_leds == set()
 
     def test_execute_animation_led_overlap(self, animation_default, mock_lights):
         """Test execute_animation when sources have overlapping LED indices."""
@@ -315,7 +372,7 @@ class TestDirectionOfArrivalAnimation:
         # Mock stop_event to return True after first iteration
         animation_default.stop_event.wait = Mock(return_value=True)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify clear was called
         mock_lights.clear.assert_called_once()
@@ -331,7 +388,7 @@ class TestDirectionOfArrivalAnimation:
         # Mock stop_event to return True after first iteration
         animation_default.stop_event.wait = Mock(return_value=True)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify clear was called but no LEDs were set
         mock_lights.clear.assert_called_once()
@@ -0,0 +1,170 @@
+"""
+Unit tests for precomputed animation frame tables.
+"""
+
+import pytest
+from unittest.mock import Mock
+from hexapod.lights.animations import (
+    AlternateRotateAnimation,
+    CalibrationAnimation,
+    OppositeRotateAnimation,
+    PulseAnimation,
+    PulseSmoothlyAnimation,
+    WheelAnimation,
+    WheelFillAnimation,
+)
+from hexapod.lights.animations.frame_table import (
+    FrameTable,
+    compile_frame_table,
+    record_frame_table,
+)
+from hexapod.lights.compositor import LightsLayer
+from hexapod.lights.lights import ColorRGB
+
+ANIMATIONS = [
+    (PulseAnimation, {}),
+    (PulseSmoothlyAnimation, {"pulse_color": ColorRGB.YELLOW}),
+    (WheelAnimation, {}),
+    (WheelAnimation, {"use_rainbow": False, "color": ColorRGB.PINK}),
+    (WheelFillAnimation, {}),
+    (AlternateRotateAnimation, {"positions": 5}),
+    (OppositeRotateAnimation, {}),
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty frame table cache."""
+    compile_frame_table.cache_clear()
+    yield
+    compile_frame_table.cache_clear()
+
+
+def live_steps(animation_class, kwargs, num_led, count):
+    """Draw an animation live and return the delay and pixels of each step."""
+    layer = LightsLayer(num_led)
+    steps = animation_class(layer, **kwargs).execute_animation()
+    result = []
+    for delay in steps:
+        result.append((delay, list(layer.pixels)))
+        if len(result) == count:
+            break
+    else:
+        result.append((None, list(layer.pixels)))
+    return result
+
+
+def table_steps(animation_class, kwargs, num_led, count):
+    """Play an animation from its frame table and return its steps."""
+    layer = LightsLayer(num_led)
+    animation = animation_class(layer, **kwargs)
+    animation.start()
+    result = []
+    while len(result) < count:
+        delay = animation.step()
+        result.append((delay, list(layer.pixels)))
+        if delay is None:
+            break
+    return result
+
+
+class TestFrameTable:
+    """Test cases for frame table recording and playback."""
+
+    @pytest.mark.parametrize("num_led", [12, 5, 1])
+    @pytest.mark.parametrize(
+        "animation_class, kwargs",
+        ANIMATIONS,
+        ids=[f"{cls.__name__}-{i}" for i, (cls, _) in enumerate(ANIMATIONS)],
+    )
+    def test_playback_matches_live_drawing(self, animation_class, kwargs, num_led):
+        """Test that three cycles played from the table equal the live animation."""
+        table = animation_class(LightsLayer(num_led), **kwargs).frame_table()
+        count = 3 * len(table)
+
+        assert table_steps(animation_class, kwargs, num_led, count) == live_steps(
+            animation_class, kwargs, num_led, count
+        )
+
+    def test_cycle_recorded_once(self):
+        """Test the recorded steps of the pulse."""
+        table = PulseAnimation(LightsLayer(2), pulse_speed=0.2).frame_table()
+
+        blue, red = ColorRGB.BLUE.rgb, ColorRGB.RED.rgb
+        assert table.rows == ((None, None), (blue, blue), (red, red))
+        assert table.delays == (0.2, 0.2, 0.2)
+        assert table.loop_start == 1
+
+    def test_ending_animation_keeps_final_frame(self):
+        """Test that a fill ends on its last frame."""
+        table = WheelFillAnimation(
+            LightsLayer(2), use_rainbow=False, color=ColorRGB.RED
+        ).frame_table()
+
+        red = ColorRGB.RED.rgb
+        assert table.rows[-1] == (red, red)
+        assert table.delays[-1] is None
+        assert table.loop_start is None
+
+    def test_tables_cached_per_parameter_set(self):
+        """Test that equal parameters share a table and others compile a new one."""
+        first = PulseAnimation(LightsLayer(12), pulse_speed=0.1).frame_table()
+        second = PulseAnimation(LightsLayer(12), pulse_speed=0.1).frame_table()
+        faster = PulseAnimation(LightsLayer(12), pulse_speed=0.05).frame_table()
+        smaller = PulseAnimation(LightsLayer(6), pulse_speed=0.1).frame_table()
+
+        assert first is second
+        assert faster is not first
+        assert smaller is not first
+        info = compile_frame_table.cache_info()
+        assert (info.hits, info.misses) == (1, 3)
+
+    def test_restart_plays_from_start(self):
+        """Test that a stopped animation restarts at the first step of its table."""
+        layer = LightsLayer(4)
+        animation = WheelAnimation(layer, interval=0.1)
+        animation.start()
+        for _ in range(3):
+            animation.step()
+        animation.stop_animation()
+
+        animation.start()
+        animation.step()
+        animation.step()
+
+        assert layer.pixels[0] is not None
+        assert layer.pixels[1:] == [None, None, None]
+
+    def test_live_animation_has_no_table(self):
+        """Test that animations depending on live data are drawn live."""
+        animation = CalibrationAnimation(LightsLayer(12), {}, {})
+
+        assert animation.frame_table() is None
+        animation.start()
+        assert animation.step() == 1.0
+
+    def test_record_without_cycle(self):
+        """Test that only animations declaring a cycle are recorded."""
+        with pytest.raises(ValueError):
+            record_frame_table(CalibrationAnimation(LightsLayer(12), {}, {}))
+
+    def test_record_animation_that_never_ends(self):
+        """Test that an animation declared as ending must end."""
+        animation = PulseAnimation(LightsLayer(1))
+        animation.cycle = Mock(return_value=(1, None))
+
+        with pytest.raises(ValueError):
+            record_frame_table(animation)
+
+    def test_play_loads_rows(self):
+        """Test that playback loads each row before yielding its delay."""
+        table = FrameTable(
+            rows=((None,), ((1, 2, 3),), ((4, 5, 6),)),
+            delays=(0.1, 0.2, 0.3),
+            loop_start=1,
+        )
+        layer = LightsLayer(1)
+        steps = table.play(layer)
+
+        assert [next(steps) for _ in range(4)] == [0.1, 0.2, 0.3, 0.2]
+        assert layer.pixels == [(1, 2, 3)]
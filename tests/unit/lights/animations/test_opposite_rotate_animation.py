@@ -87,7 +87,7 @@ class TestOppositeRotateAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify clear and set_color were called for initial LED
         assert mock_lights.clear.call_count == 1
@@ -111,7 +111,7 @@ class TestOppositeRotateAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify clear was called multiple times
         assert mock_lights.clear.call_count >= 2
@@ -146,7 +146,7 @@ class TestOppositeRotateAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify multiple clear and set_color calls
         assert mock_lights.clear.call_count > 1
@@ -157,7 +157,7 @@ class TestOppositeRotateAnimation:
         # Mock stop_event to return True immediately
         animation_default.stop_event.wait = Mock(return_value=True)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify no LEDs were set
         mock_lights.clear.assert_not_called()
@@ -168,7 +168,7 @@ class TestOppositeRotateAnimation:
         # Mock stop_event to allow one LED to be set
         animation_custom.stop_event.wait = Mock(side_effect=[False, True])
 
-        animation_custom.execute_animation()
+        animation_custom.run()
 
         # Verify custom color was used
         call = mock_lights.set_color.call_args_list[0]
@@ -185,7 +185,7 @@ class TestOppositeRotateAnimation:
 
         animation_custom.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_custom.execute_animation()
+        animation_custom.run()
 
         # Verify custom interval was used
         assert all(delay == 0.2 for delay in delays)
@@ -205,7 +205,7 @@ class TestOppositeRotateAnimation:
 
         animation.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify animation ran
         assert mock_lights.clear.call_count > 0
@@ -219,7 +219,7 @@ class TestOppositeRotateAnimation:
         # Mock stop_event to allow one iteration
         animation.stop_event.wait = Mock(side_effect=[False, True])
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify single LED was set (clear is called twice due to the while loop structure)
         assert mock_lights.clear.call_count == 2
@@ -237,7 +237,7 @@ class TestOppositeRotateAnimation:
         # Mock stop_event to return True immediately
         animation.stop_event.wait = Mock(return_value=True)
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify no LEDs were set
         mock_lights.clear.assert_not_called()
@@ -261,7 +261,7 @@ class TestOppositeRotateAnimation:
 
         animation.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify animation ran
         assert mock_lights.clear.call_count > 0
@@ -275,7 +275,7 @@ class TestOppositeRotateAnimation:
         call_count = 0
         animation.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify animation ran
         assert mock_lights.clear.call_count > 0
@@ -355,7 +355,7 @@ class TestOppositeRotateAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify animation completed multiple phases
         assert mock_lights.clear.call_count > 1
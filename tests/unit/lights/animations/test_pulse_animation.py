@@ -85,7 +85,7 @@ class TestPulseAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify both colors were set
         assert mock_lights.set_color.call_count == 2
@@ -110,7 +110,7 @@ class TestPulseAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify 3 complete cycles occurred
         assert mock_lights.set_color.call_count == 6
@@ -130,7 +130,7 @@ class TestPulseAnimation:
         # Mock stop_event to return True during base color phase
         animation_default.stop_event.wait = Mock(side_effect=[False, True])
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify only base color was set
         assert mock_lights.set_color.call_count == 1
@@ -144,7 +144,7 @@ class TestPulseAnimation:
         # Mock stop_event to allow base color, then stop during pulse color
         animation_default.stop_event.wait = Mock(side_effect=[False, False, True])
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify both colors were set
         assert mock_lights.set_color.call_count == 2
@@ -157,7 +157,7 @@ class TestPulseAnimation:
         # Mock stop_event to return True immediately
         animation_default.stop_event.wait = Mock(return_value=True)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify no LEDs were set
         mock_lights.set_color.assert_not_called()
@@ -167,7 +167,7 @@ class TestPulseAnimation:
         # Mock stop_event to allow one complete cycle
         animation_custom.stop_event.wait = Mock(side_effect=[False, False, True])
 
-        animation_custom.execute_animation()
+        animation_custom.run()
 
         # Verify custom colors were used
         assert mock_lights.set_color.call_count == 2
@@ -185,7 +185,7 @@ class TestPulseAnimation:
 
         animation_custom.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_custom.execute_animation()
+        animation_custom.run()
 
         # Verify custom pulse speed was used
         assert all(delay == 0.1 for delay in delays)
@@ -203,7 +203,7 @@ class TestPulseAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify 10 complete cycles occurred
         assert mock_lights.set_color.call_count == 20
@@ -228,7 +228,7 @@ class TestPulseAnimation:
         # Mock stop_event to allow one complete cycle
         animation.stop_event.wait = Mock(side_effect=[False, False, True])
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify both calls used the same color
         assert mock_lights.set_color.call_count == 2
@@ -248,7 +248,7 @@ class TestPulseAnimation:
             return True  # Stop immediately
 
         animation_fast.stop_event.wait = Mock(side_effect=mock_wait)
-        animation_fast.execute_animation()
+        animation_fast.run()
 
         # Verify fast speed was used
         assert all(delay == 0.01 for delay in delays)
@@ -259,7 +259,7 @@ class TestPulseAnimation:
 
         delays = []
         animation_slow.stop_event.wait = Mock(side_effect=mock_wait)
-        animation_slow.execute_animation()
+        animation_slow.run()
 
         # Verify slow speed was used
         assert all(delay == 1.0 for delay in delays)
@@ -275,7 +275,7 @@ class TestPulseAnimation:
             return True  # Stop immediately
 
         animation.stop_event.wait = Mock(side_effect=mock_wait)
-        animation.execute_animation()
+        animation.run()
 
         # Verify zero speed was used
         assert all(delay == 0.0 for delay in delays)
@@ -291,7 +291,7 @@ class TestPulseAnimation:
             return True  # Stop immediately
 
         animation.stop_event.wait = Mock(side_effect=mock_wait)
-        animation.execute_animation()
+        animation.run()
 
         # Verify negative speed was used
         assert all(delay == -0.1 for delay in delays)
@@ -322,7 +322,7 @@ class TestPulseAnimation:
         # Mock stop_event to allow exactly one cycle
         animation_default.stop_event.wait = Mock(side_effect=[False, False, True])
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify exactly 2 calls (base + pulse)
         assert mock_lights.set_color.call_count == 2
@@ -347,7 +347,7 @@ class TestPulseAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify both delays were the pulse_speed (3 delays due to while loop structure)
         assert len(delays) == 3
@@ -87,7 +87,7 @@ class TestPulseSmoothlyAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify set_color_rgb was called
         assert mock_lights.set_color_rgb.call_count > 0
@@ -122,7 +122,7 @@ class TestPulseSmoothlyAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify set_color_rgb was called
         assert mock_lights.set_color_rgb.call_count > 0
@@ -147,7 +147,7 @@ class TestPulseSmoothlyAnimation:
         # Mock stop_event to return True immediately
         animation_default.stop_event.wait = Mock(return_value=True)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify no LEDs were set
         mock_lights.set_color_rgb.assert_not_called()
@@ -166,7 +166,7 @@ class TestPulseSmoothlyAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify some interpolation occurred
         assert mock_lights.set_color_rgb.call_count > 0
@@ -187,7 +187,7 @@ class TestPulseSmoothlyAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify both forward and backward interpolation occurred
         assert mock_lights.set_color_rgb.call_count > 20
@@ -205,7 +205,7 @@ class TestPulseSmoothlyAnimation:
 
         animation_custom.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_custom.execute_animation()
+        animation_custom.run()
 
         # Verify set_color_rgb was called
         assert mock_lights.set_color_rgb.call_count > 0
@@ -233,7 +233,7 @@ class TestPulseSmoothlyAnimation:
 
         animation_custom.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_custom.execute_animation()
+        animation_custom.run()
 
         # Verify custom pulse speed was used
         assert all(delay == 0.1 for delay in delays)
@@ -253,7 +253,7 @@ class TestPulseSmoothlyAnimation:
         # Mock stop_event to allow one forward step
         animation.stop_event.wait = Mock(side_effect=[False, True])
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify interpolation calculation
         calls = mock_lights.set_color_rgb.call_args_list
@@ -277,7 +277,7 @@ class TestPulseSmoothlyAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify step size is 5 (as defined in the code)
         calls = mock_lights.set_color_rgb.call_args_list
@@ -299,7 +299,7 @@ class TestPulseSmoothlyAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify many interpolation calls occurred
         assert mock_lights.set_color_rgb.call_count > 40  # At least 2 complete cycles
@@ -323,7 +323,7 @@ class TestPulseSmoothlyAnimation:
 
         animation.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify interpolation occurred
         assert mock_lights.set_color_rgb.call_count > 0
@@ -346,7 +346,7 @@ class TestPulseSmoothlyAnimation:
             return True  # Stop immediately
 
         animation_fast.stop_event.wait = Mock(side_effect=mock_wait)
-        animation_fast.execute_animation()
+        animation_fast.run()
 
         # Verify fast speed was used
         assert all(delay == 0.01 for delay in delays)
@@ -357,7 +357,7 @@ class TestPulseSmoothlyAnimation:
 
         delays = []
         animation_slow.stop_event.wait = Mock(side_effect=mock_wait)
-        animation_slow.execute_animation()
+        animation_slow.run()
 
         # Verify slow speed was used
         assert all(delay == 1.0 for delay in delays)
@@ -367,7 +367,7 @@ class TestPulseSmoothlyAnimation:
         # Mock stop_event to allow one interpolation step
         animation_default.stop_event.wait = Mock(side_effect=[False, True])
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify set_color_rgb was called with RGB tuple
         assert mock_lights.set_color_rgb.call_count == 1
@@ -410,7 +410,7 @@ class TestPulseSmoothlyAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify full forward cycle occurred
         assert mock_lights.set_color_rgb.call_count == 20
@@ -451,7 +451,7 @@ class TestPulseSmoothlyAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify both cycles occurred
         assert mock_lights.set_color_rgb.call_count == 40
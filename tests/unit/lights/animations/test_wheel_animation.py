@@ -98,7 +98,7 @@ class TestWheelAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify all LEDs were processed
         assert mock_lights.clear.call_count == 12
@@ -124,7 +124,7 @@ class TestWheelAnimation:
 
         animation_custom.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_custom.execute_animation()
+        animation_custom.run()
 
         # Verify all LEDs were processed
         assert mock_lights.clear.call_count == 12
@@ -144,7 +144,7 @@ class TestWheelAnimation:
         # Mock stop_event to return True immediately
         animation_default.stop_event.wait = Mock(return_value=True)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify no LEDs were processed
         mock_lights.clear.assert_not_called()
@@ -163,7 +163,7 @@ class TestWheelAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify only 3 LEDs were processed
         assert mock_lights.clear.call_count == 3
@@ -183,7 +183,7 @@ class TestWheelAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify 2 complete cycles occurred
         assert mock_lights.clear.call_count == 24
@@ -200,7 +200,7 @@ class TestWheelAnimation:
 
         animation_custom.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_custom.execute_animation()
+        animation_custom.run()
 
         # Verify custom interval was used
         assert all(delay == 0.1 for delay in delays)
@@ -212,7 +212,7 @@ class TestWheelAnimation:
         # Mock stop_event to allow one complete cycle
         animation_default.stop_event.wait = Mock(side_effect=[False] * 12 + [True])
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify get_wheel_color was called with correct wheel positions
         calls = mock_lights.get_wheel_color.call_args_list
@@ -228,7 +228,7 @@ class TestWheelAnimation:
         # Mock stop_event to allow one LED
         animation.stop_event.wait = Mock(side_effect=[False, True])
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify single LED was processed
         assert mock_lights.clear.call_count == 1
@@ -251,7 +251,7 @@ class TestWheelAnimation:
         animation.stop_event.is_set = Mock(side_effect=mock_is_set)
         animation.stop_event.wait = Mock(return_value=False)
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify no LEDs were processed (for loop doesn't execute with 0 LEDs)
         mock_lights.clear.assert_not_called()
@@ -266,7 +266,7 @@ class TestWheelAnimation:
         # Mock stop_event to allow one complete cycle
         animation.stop_event.wait = Mock(side_effect=[False] * 6 + [True])
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify 6 LEDs were processed
         assert mock_lights.clear.call_count == 6
@@ -292,7 +292,7 @@ class TestWheelAnimation:
         # Mock stop_event to allow one LED
         animation.stop_event.wait = Mock(side_effect=[False, True])
 
-        animation.execute_animation()
+        animation.run()
 
         # Should use (0, 0, 0) as fallback
         assert mock_lights.set_color_rgb.call_count == 1
@@ -312,7 +312,7 @@ class TestWheelAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify many LEDs were processed
         assert mock_lights.clear.call_count > 40
@@ -326,7 +326,7 @@ class TestWheelAnimation:
         # Mock stop_event to allow one complete cycle
         animation_default.stop_event.wait = Mock(side_effect=[False] * 12 + [True])
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify LED indices progress from 0 to 11
         calls = mock_lights.set_color_rgb.call_args_list
@@ -342,7 +342,7 @@ class TestWheelAnimation:
             side_effect=[False, False, False, True]
         )
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify clear was called before each LED
         assert mock_lights.clear.call_count == 3
@@ -98,7 +98,7 @@ class TestWheelFillAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify all LEDs were processed
         assert mock_lights.set_color_rgb.call_count == 12
@@ -123,7 +123,7 @@ class TestWheelFillAnimation:
 
         animation_custom.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_custom.execute_animation()
+        animation_custom.run()
 
         # Verify all LEDs were processed
         assert mock_lights.set_color_rgb.call_count == 12
@@ -142,7 +142,7 @@ class TestWheelFillAnimation:
         # Mock stop_event to return True immediately
         animation_default.stop_event.wait = Mock(return_value=True)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify no LEDs were processed
         mock_lights.set_color_rgb.assert_not_called()
@@ -160,7 +160,7 @@ class TestWheelFillAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify only 3 LEDs were processed
         assert mock_lights.set_color_rgb.call_count == 3
@@ -176,7 +176,7 @@ class TestWheelFillAnimation:
 
         animation_custom.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_custom.execute_animation()
+        animation_custom.run()
 
         # Verify custom interval was used
         assert all(delay == 0.5 for delay in delays)
@@ -188,7 +188,7 @@ class TestWheelFillAnimation:
         # Mock stop_event to allow one complete fill
         animation_default.stop_event.wait = Mock(side_effect=[False] * 12 + [True])
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify get_wheel_color was called with correct wheel positions
         calls = mock_lights.get_wheel_color.call_args_list
@@ -204,7 +204,7 @@ class TestWheelFillAnimation:
         # Mock stop_event to allow one LED
         animation.stop_event.wait = Mock(side_effect=[False, True])
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify single LED was processed
         assert mock_lights.set_color_rgb.call_count == 1
@@ -226,7 +226,7 @@ class TestWheelFillAnimation:
         animation.stop_event.is_set = Mock(side_effect=mock_is_set)
         animation.stop_event.wait = Mock(return_value=False)
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify no LEDs were processed (for loop doesn't execute with 0 LEDs)
         mock_lights.set_color_rgb.assert_not_called()
@@ -240,7 +240,7 @@ class TestWheelFillAnimation:
         # Mock stop_event to allow one complete fill
         animation.stop_event.wait = Mock(side_effect=[False] * 6 + [True])
 
-        animation.execute_animation()
+        animation.run()
 
         # Verify 6 LEDs were processed
         assert mock_lights.set_color_rgb.call_count == 6
@@ -265,7 +265,7 @@ class TestWheelFillAnimation:
         # Mock stop_event to allow one LED
         animation.stop_event.wait = Mock(side_effect=[False, True])
 
-        animation.execute_animation()
+        animation.run()
 
         # Should use (0, 0, 0) as fallback
         assert mock_lights.set_color_rgb.call_count == 1
@@ -279,7 +279,7 @@ class TestWheelFillAnimation:
         # Mock stop_event to allow one complete fill
         animation_default.stop_event.wait = Mock(side_effect=[False] * 12 + [True])
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify LED indices progress from 0 to 11
         calls = mock_lights.set_color_rgb.call_args_list
@@ -291,7 +291,7 @@ class TestWheelFillAnimation:
         # Mock stop_event to allow one complete fill
         animation_default.stop_event.wait = Mock(side_effect=[False] * 12 + [True])
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify all LEDs were set
         assert mock_lights.set_color_rgb.call_count == 12
@@ -306,7 +306,7 @@ class TestWheelFillAnimation:
         # Test rainbow mode
         animation_rainbow = WheelFillAnimation(lights=mock_lights)
         animation_rainbow.stop_event.wait = Mock(side_effect=[False] * 3 + [True])
-        animation_rainbow.execute_animation()
+        animation_rainbow.run()
 
         rainbow_calls = mock_lights.set_color_rgb.call_args_list
         rainbow_wheel_calls = mock_lights.get_wheel_color.call_args_list
@@ -319,7 +319,7 @@ class TestWheelFillAnimation:
             lights=mock_lights, use_rainbow=False, color=ColorRGB.BLUE
         )
         animation_single.stop_event.wait = Mock(side_effect=[False] * 3 + [True])
-        animation_single.execute_animation()
+        animation_single.run()
 
         single_calls = mock_lights.set_color_rgb.call_args_list
         single_wheel_calls = mock_lights.get_wheel_color.call_args_list
@@ -345,7 +345,7 @@ class TestWheelFillAnimation:
 
         animation_default.stop_event.wait = Mock(side_effect=mock_wait)
 
-        animation_default.execute_animation()
+        animation_default.run()
 
         # Verify interval was used for each LED (4 delays due to while loop structure)
         assert len(delays) == 4
@@ -363,7 +363,7 @@ class TestWheelFillAnimation:
             return True  # Stop immediately
 
         animation_fast.stop_event.wait = Mock(side_effect=mock_wait)
-        animation_fast.execute_animation()
+        animation_fast.run()
 
         # Verify fast interval was used
         assert all(delay == 0.01 for delay in delays)
@@ -374,7 +374,7 @@ class TestWheelFillAnimation:
 
         delays = []
         animation_slow.stop_event.wait = Mock(side_effect=mock_wait)
-        animation_slow.execute_animation()
+        animation_slow.run()
 
         # Verify slow interval was used
         assert all(delay == 2.0 for delay in delays)
@@ -435,7 +435,7 @@ class TestWheelFillAnimation:
         # WheelFillAnimation should not call clear between LEDs
         animation = WheelFillAnimation(lights=mock_lights)
         animation.stop_event.wait = Mock(side_effect=[False] * 3 + [True])
-        animation.execute_animation()
+        animation.run()
 
         # Should not call clear (unlike WheelAnimation)
         mock_lights.clear.assert_not_called()
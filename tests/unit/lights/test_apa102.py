@@ -315,14 +315,30 @@ class TestAPA102:
         apa102_default.set_pixel(0, 255, 128, 64)
         apa102_default.set_pixel(1, 128, 255, 64)
 
+        assert apa102_default.show() is True
+
+        # Start frame, LED frames and end frame go out in one transfer
+        apa102_default.spi.writebytes2.assert_called_once()
+        apa102_default.spi.xfer2.assert_not_called()
+        data = apa102_default.spi.writebytes2.call_args[0][0]
+        assert data[:4] == bytes(4)
+        assert data[4:44] == apa102_default.leds
+        assert data[44:] == b"\xff" * 4
+        assert data[4:8] == bytes([apa102_default.leds[0], 64, 128, 255])
+
+    def test_show_unchanged_frame_skipped(self, apa102_default):
+        """Test that an unchanged frame is not transferred again."""
+        apa102_default.set_pixel(0, 255, 0, 0)
         apa102_default.show()
 
-        # Check that start frame was called
-        assert apa102_default.spi.xfer2.call_count >= 1
+        assert apa102_default.show() is False
+        apa102_default.set_pixel(0, 255, 0, 0)
+        assert apa102_default.show() is False
+        assert apa102_default.show(force=True) is True
+        apa102_default.set_pixel(0, 0, 255, 0)
+        assert apa102_default.show() is True
 
-        # Check that data was sent in chunks
-        calls = apa102_default.spi.xfer2.call_args_list
-        assert len(calls) >= 2  # Start frame + data chunks + end frame
+        assert apa102_default.spi.writebytes2.call_count == 3
 
     def test_show_large_strip(self, mock_spi):
         """Test showing LEDs with a large strip (more than 1024 LEDs)."""
@@ -332,9 +348,39 @@ class TestAPA102:
 
             apa102.show()
 
-            # Should send data in multiple chunks
-            calls = mock_spi.xfer2.call_args_list
-            assert len(calls) >= 2  # Multiple data chunks
+            # writebytes2 splits the frame itself; the end frame clocks 750 extra bits
+            data = mock_spi.writebytes2.call_args[0][0]
+            mock_spi.writebytes2.assert_called_once()
+            assert len(data) == 4 + 1500 * 4 + 94
+
+    def test_set_pixels(self, apa102_custom):
+        """Test that many pixels are set at once like set_pixel does."""
+        apa102_custom.set_pixels(
+            [0, 3, 25, -1], [[255, 128, 64], [1, 2, 3], [9, 9, 9], [9, 9, 9]]
+        )
+
+        expected = APA102.LED_START | 15
+        assert apa102_custom.leds[0:4] == bytes([expected, 64, 255, 128])  # GRB
+        assert apa102_custom.leds[12:16] == bytes([expected, 3, 1, 2])
+        assert apa102_custom.leds[4:8] == bytes([APA102.LED_START, 0, 0, 0])
+
+    def test_set_pixels_single_color(self, apa102_default):
+        """Test that one color is used for every index."""
+        apa102_default.set_pixels(range(3), (10, 20, 30), bright_percent=50)
+
+        expected = bytearray(apa102_default.leds)
+        for i in range(3):
+            apa102_default.set_pixel(i, 10, 20, 30, bright_percent=50)
+        assert apa102_default.leds == expected
+
+    @pytest.mark.parametrize(
+        "rgb_array",
+        [[[256, 0, 0]], [[0, -1, 0]], [[0.5, 0, 0]], [[1, 2, 3], [4, 5, 6]]],
+    )
+    def test_set_pixels_invalid(self, apa102_default, rgb_array):
+        """Test that invalid colors or shapes are rejected."""
+        with pytest.raises(ValueError):
+            apa102_default.set_pixels([0, 1, 2], rgb_array)
 
     def test_clear_strip(self, apa102_default):
         """Test clearing the strip."""
@@ -352,7 +398,7 @@ class TestAPA102:
             assert apa102_default.leds[start_index + 3] == 0  # Red
 
         # Check that show was called
-        assert apa102_default.spi.xfer2.call_count >= 1
+        apa102_default.spi.writebytes2.assert_called_once()
 
     def test_cleanup(self, apa102_default):
         """Test cleanup (closing SPI connection)."""
@@ -508,7 +554,7 @@ class TestAPA102:
             apa102 = APA102(num_led=10)
 
             # Simulate SPI error
-            mock_spi.xfer2.side_effect = Exception("SPI communication error")
+            mock_spi.writebytes2.side_effect = Exception("SPI communication error")
 
             # Should not raise exception during show()
             try:
@@ -0,0 +1,317 @@
+"""
+Unit tests for the LED compositor and its layers.
+"""
+
+import pytest
+from unittest.mock import Mock, call, patch
+from hexapod.lights.compositor import LightsCompositor, LightsLayer
+from hexapod.lights.animations import (
+    DirectionOfArrivalAnimation,
+    PulseAnimation,
+    WheelFillAnimation,
+)
+from hexapod.lights.lights import ColorRGB
+
+NUM_LED = 4
+BLACK = (0, 0, 0)
+
+
+@pytest.fixture
+def mock_lights():
+    """Mock Lights object with a mock APA102 driver."""
+    mock_lights = Mock()
+    mock_lights.num_led = NUM_LED
+    return mock_lights
+
+
+@pytest.fixture
+def compositor(mock_lights):
+    """Compositor at 40 fps whose loop is not started."""
+    return LightsCompositor(mock_lights, fps=40)
+
+
+def shown_frames(mock_lights):
+    """Return the frames sent to the driver, one list of pixels per show()."""
+    frames, frame = [], []
+    for name, args, _ in mock_lights.driver.method_calls:
+        if name == "set_pixels":
+            frame = [(i, *rgb) for i, rgb in zip(args[0], args[1])]
+        elif name == "show":
+            frames.append(frame)
+            frame = []
+    return frames
+
+
+class TestLightsLayer:
+    """Test cases for LightsLayer class."""
+
+    def test_new_layer_is_transparent(self):
+        """Test that a new layer draws nothing."""
+        layer = LightsLayer(NUM_LED)
+
+        assert layer.pixels == [None] * NUM_LED
+        assert layer.opacity == 1.0
+
+    def test_set_color(self):
+        """Test setting all LEDs, the first LEDs and a single LED."""
+        layer = LightsLayer(NUM_LED)
+
+        layer.set_color(ColorRGB.BLUE, num_led=2)
+        layer.set_color_rgb((1, 2, 3), led_index=3)
+
+        assert layer.pixels == [(0, 0, 255), (0, 0, 255), None, (1, 2, 3)]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"color": "blue"},
+            {"color": ColorRGB.BLUE, "led_index": NUM_LED},
+        ],
+    )
+    def test_set_color_invalid(self, kwargs):
+        """Test that invalid colors and indices are rejected like Lights does."""
+        with pytest.raises(ValueError):
+            LightsLayer(NUM_LED).set_color(**kwargs)
+
+    def test_set_color_rgb_invalid(self):
+        """Test that RGB values outside 0-255 are rejected."""
+        with pytest.raises(ValueError):
+            LightsLayer(NUM_LED).set_color_rgb((256, 0, 0))
+
+    def test_rotate(self):
+        """Test that rotating moves pixels like the APA102 driver."""
+        layer = LightsLayer(NUM_LED)
+        layer.set_color_rgb((1, 1, 1), led_index=1)
+
+        layer.rotate(1)
+        assert layer.pixels == [(1, 1, 1), None, None, None]
+
+        layer.rotate(-2)
+        assert layer.pixels == [None, None, (1, 1, 1), None]
+
+    def test_clear(self):
+        """Test that cleared LEDs become transparent."""
+        layer = LightsLayer(NUM_LED)
+        layer.set_color(ColorRGB.RED)
+
+        layer.clear(led_indices=[3])
+        layer.clear(count=1)
+        assert layer.pixels == [None, (255, 0, 0), (255, 0, 0), None]
+
+        layer.clear()
+        assert layer.pixels == [None] * NUM_LED
+
+    def test_get_wheel_color(self):
+        """Test that the color wheel matches Lights."""
+        assert LightsLayer(NUM_LED).get_wheel_color(85) == (255, 0, 0)
+
+    def test_invalid_opacity(self):
+        """Test that the opacity must be between 0 and 1."""
+        with pytest.raises(ValueError):
+            LightsLayer(NUM_LED, opacity=1.5)
+
+
+class TestLightsCompositor:
+    """Test cases for LightsCompositor class."""
+
+    def test_init(self, compositor, mock_lights):
+        """Test compositor initialization."""
+        assert compositor.lights == mock_lights
+        assert compositor.frame_interval == pytest.approx(0.025)
+        assert compositor.daemon is True
+        assert compositor.name.startswith("LightsCompositor")
+        assert compositor.animations == []
+
+    def test_invalid_fps(self, mock_lights):
+        """Test that the frame rate must be positive."""
+        with pytest.raises(ValueError):
+            LightsCompositor(mock_lights, fps=0)
+
+    def test_first_render_shows_dark_frame(self, compositor, mock_lights):
+        """Test that an empty stack shows black once."""
+        assert compositor.render(now=0.0) is True
+        assert compositor.render(now=0.1) is False
+
+        assert shown_frames(mock_lights) == [[(i, *BLACK) for i in range(NUM_LED)]]
+        assert compositor.ticks == 2
+        assert compositor.frames_shown == 1
+
+    def test_one_show_per_changed_frame(self, compositor, mock_lights):
+        """Test that the pulse is sent once per color change, not once per tick."""
+        animation = PulseAnimation(
+            LightsLayer(NUM_LED),
+            base_color=ColorRGB.BLUE,
+            pulse_color=ColorRGB.RED,
+            pulse_speed=0.1,
+        )
+        compositor.play(animation)
+
+        # Ticks every 25 ms; the pulse changes color every 100 ms
+        shown = [compositor.render(now=tick * 0.025) for tick in range(13)]
+
+        assert shown.count(True) == 4
+        assert [frame[0][1:] for frame in shown_frames(mock_lights)] == [
+            BLACK,
+            ColorRGB.BLUE.rgb,
+            ColorRGB.RED.rgb,
+            ColorRGB.BLUE.rgb,
+        ]
+        assert mock_lights.driver.show.call_count == 4
+
+    def test_step_cadence_after_stall(self, compositor):
+        """Test that a late tick reschedules the animation instead of catching up."""
+        animation = Mock(lights=LightsLayer(NUM_LED))
+        animation.step.return_value = 0.1
+        compositor.play(animation)
+
+        compositor.render(now=0.0)
+        compositor.render(now=0.1)
+        compositor.render(now=1.0)
+        compositor.render(now=1.05)
+        compositor.render(now=1.1)
+
+        assert animation.step.call_count == 4
+
+    def test_finished_animation_keeps_last_frame(self, compositor, mock_lights):
+        """Test that a finished fill stays lit and is no longer stepped."""
+        animation = WheelFillAnimation(
+            LightsLayer(NUM_LED), use_rainbow=False, color=ColorRGB.TEAL, interval=0.1
+        )
+        compositor.play(animation)
+
+        for tick in range(30):
+            compositor.render(now=tick * 0.025)
+
+        assert shown_frames(mock_lights)[-1] == [
+            (i, *ColorRGB.TEAL.rgb) for i in range(NUM_LED)
+        ]
+        assert not animation.is_running
+        assert compositor.animations == [animation]
+
+    def test_failing_animation_is_dropped(self, compositor):
+        """Test that an animation raising an error stops being stepped."""
+        animation = Mock(lights=LightsLayer(NUM_LED))
+        animation.step.side_effect = ValueError("Invalid calibration status")
+        compositor.play(animation)
+
+        with patch("hexapod.lights.compositor.logger") as mock_logger:
+            compositor.render(now=0.0)
+            compositor.render(now=1.0)
+
+        animation.step.assert_called_once()
+        mock_logger.exception.assert_called_once()
+
+    def test_overlay_blending(self, compositor, mock_lights):
+        """Test that an overlay covers only the LEDs it draws, blended by opacity."""
+        base = LightsLayer(NUM_LED)
+        base.set_color_rgb((200, 0, 0))
+        overlay = LightsLayer(NUM_LED, opacity=0.5)
+        overlay.set_color_rgb((0, 0, 100), led_index=1)
+        top = LightsLayer(NUM_LED)
+        top.set_color_rgb((1, 2, 3), led_index=2)
+        compositor.add_layer(base)
+        compositor.add_layer(overlay)
+        compositor.add_layer(top)
+
+        compositor.render(now=0.0)
+
+        assert shown_frames(mock_lights)[-1] == [
+            (0, 200, 0, 0),
+            (1, 100, 0, 50),
+            (2, 1, 2, 3),
+            (3, 200, 0, 0),
+        ]
+
+    def test_direction_of_arrival_overlay(self, compositor, mock_lights):
+        """Test that DoA sources are drawn over the running animation."""
+        base = PulseAnimation(
+            LightsLayer(NUM_LED),
+            base_color=ColorRGB.BLUE,
+            pulse_color=ColorRGB.BLUE,
+            pulse_speed=0.1,
+        )
+        doa = DirectionOfArrivalAnimation(LightsLayer(NUM_LED), refresh_delay=0.1)
+        doa.update_sources({0: 90.0})
+        compositor.play(base)
+        compositor.play(doa)
+
+        for tick in range(5):
+            compositor.render(now=tick * 0.025)
+
+        # Azimuth 90 degrees lights LED 0 and its neighbours 1 and 3
+        teal, blue = ColorRGB.TEAL.rgb, ColorRGB.BLUE.rgb
+        assert shown_frames(mock_lights)[-1] == [
+            (0, *teal),
+            (1, *teal),
+            (2, *blue),
+            (3, *teal),
+        ]
+        assert compositor.animations == [base, doa]
+
+    def test_remove(self, compositor):
+        """Test that a removed animation is stopped and its layer dropped."""
+        first = Mock(lights=LightsLayer(NUM_LED))
+        second = Mock(lights=LightsLayer(NUM_LED))
+        compositor.play(first)
+        compositor.play(second)
+
+        compositor.remove(first)
+
+        first.stop_animation.assert_called_once()
+        assert compositor.animations == [second]
+
+    def test_clear(self, compositor, mock_lights):
+        """Test that clearing stops every animation and darkens the strip."""
+        animation = Mock(lights=LightsLayer(NUM_LED))
+        animation.step.return_value = 0.1
+        layer = LightsLayer(NUM_LED)
+        layer.set_color(ColorRGB.WHITE)
+        compositor.play(animation)
+        compositor.add_layer(layer)
+        compositor.render(now=0.0)
+
+        compositor.clear()
+        compositor.render(now=0.0)
+
+        animation.start.assert_called_once()
+        animation.stop_animation.assert_called_once()
+        assert compositor.animations == []
+        assert shown_frames(mock_lights)[-1] == [(i, *BLACK) for i in range(NUM_LED)]
+
+    def test_invalidate(self, compositor, mock_lights):
+        """Test that an invalidated frame is sent again."""
+        compositor.render(now=0.0)
+
+        compositor.invalidate()
+
+        assert compositor.render(now=0.1) is True
+        assert mock_lights.driver.show.call_count == 2
+
+    def test_run_and_stop(self, compositor, mock_lights):
+        """Test that the loop renders until stopped."""
+        with patch.object(compositor, "render") as mock_render:
+            mock_render.side_effect = lambda: compositor.stop_event.set()
+            compositor.start()
+            compositor.stop()
+
+        assert not compositor.is_alive()
+        assert mock_render.call_args_list == [call()]
+
+    def test_run_survives_render_error(self, compositor):
+        """Test that a failing frame does not end the loop."""
+        calls = []
+
+        def render():
+            calls.append(1)
+            if len(calls) == 1:
+                raise OSError("SPI transfer failed")
+            compositor.stop_event.set()
+
+        with (
+            patch.object(compositor, "render", side_effect=render),
+            patch("hexapod.lights.compositor.logger") as mock_logger,
+        ):
+            compositor.run()
+
+        assert len(calls) == 2
+        mock_logger.exception.assert_called_once()
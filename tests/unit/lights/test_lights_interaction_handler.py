@@ -3,15 +3,18 @@ Unit tests for lights interaction handler.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import ANY, Mock, patch, MagicMock
 from hexapod.lights.lights_interaction_handler import LightsInteractionHandler
 from hexapod.lights.lights import ColorRGB
+from hexapod.lights.compositor import LightsLayer
+from hexapod.utils import LatestValue
 
 
 @pytest.fixture
 def mock_lights():
     """Mock Lights object."""
     mock_lights = Mock()
+    mock_lights.num_led = 12
     mock_lights.clear = Mock()
     mock_lights.set_color = Mock()
     mock_lights.set_brightness = Mock()
@@ -40,6 +43,7 @@ def handler_default(mock_lights, sample_leg_to_led):
         patch(
             "hexapod.lights.lights_interaction_handler.Lights", return_value=mock_lights
         ),
+        patch("hexapod.lights.lights_interaction_handler.LightsCompositor"),
         patch("hexapod.lights.lights_interaction_handler.logger"),
     ):
         return LightsInteractionHandler(leg_to_led=sample_leg_to_led)
@@ -52,6 +56,7 @@ def handler_with_animation(mock_lights, mock_animation, sample_leg_to_led):
         patch(
             "hexapod.lights.lights_interaction_handler.Lights", return_value=mock_lights
         ),
+        patch("hexapod.lights.lights_interaction_handler.LightsCompositor"),
         patch("hexapod.lights.lights_interaction_handler.logger"),
     ):
         handler = LightsInteractionHandler(leg_to_led=sample_leg_to_led)
@@ -70,12 +75,18 @@ class TestLightsInteractionHandler:
                 "hexapod.lights.lights_interaction_handler.Lights",
                 return_value=mock_lights,
             ) as mock_lights_class,
+            patch(
+                "hexapod.lights.lights_interaction_handler.LightsCompositor"
+            ) as mock_compositor_class,
             patch("hexapod.lights.lights_interaction_handler.logger") as mock_logger,
         ):
 
             handler = LightsInteractionHandler(leg_to_led=sample_leg_to_led)
 
             assert handler.lights == mock_lights
+            assert handler.compositor == mock_compositor_class.return_value
+            mock_compositor_class.assert_called_once_with(mock_lights)
+            handler.compositor.start.assert_called_once()
             assert handler.animation is None
             assert handler.leg_to_led == sample_leg_to_led
 
@@ -94,6 +105,7 @@ class TestLightsInteractionHandler:
                 "hexapod.lights.lights_interaction_handler.Lights",
                 return_value=mock_lights,
             ),
+            patch("hexapod.lights.lights_interaction_handler.LightsCompositor"),
             patch("hexapod.lights.lights_interaction_handler.logger"),
         ):
 
@@ -113,8 +125,8 @@ class TestLightsInteractionHandler:
         with patch("hexapod.lights.lights_interaction_handler.logger") as mock_logger:
             handler_default.stop_animation()
 
-            # Verify animation was stopped
-            mock_animation.stop_animation.assert_called_once()
+            # Verify the compositor stopped the animation
+            handler_default.compositor.clear.assert_called_once()
             assert handler_default.animation is None
             mock_logger.info.assert_called_with(
                 f"Stopping currently running animation {mock_animation}"
@@ -146,20 +158,32 @@ class TestLightsInteractionHandler:
         with patch("hexapod.lights.lights_interaction_handler.logger") as mock_logger:
             handler_default.off()
 
-            # Verify animation was stopped and lights were cleared
-            mock_animation.stop_animation.assert_called_once()
-            handler_default.lights.clear.assert_called_once()
+            # Verify layers were cleared and the dark frame sent right away
+            handler_default.compositor.clear.assert_called_once()
+            handler_default.compositor.render.assert_called_once_with()
             assert handler_default.animation is None
             mock_logger.debug.assert_called_with("Lights turned off.")
 
+    def test_cleanup(self, handler_default):
+        """Test that cleanup stops the compositor before turning off the lights."""
+        handler_default.cleanup()
+
+        compositor = handler_default.compositor
+        compositor.stop.assert_called_once_with()
+        compositor.clear.assert_called_once_with()
+        compositor.render.assert_called_once_with()
+        called = [name for name, _, _ in compositor.mock_calls]
+        assert called.index("stop") < called.index("render")
+
     def test_set_single_color_all_leds(self, handler_default):
         """Test setting all LEDs to a single color."""
         with patch("hexapod.lights.lights_interaction_handler.logger") as mock_logger:
             handler_default.set_single_color(ColorRGB.RED)
 
-            # Verify lights were turned off and color was set
-            handler_default.lights.clear.assert_called_once()
-            handler_default.lights.set_color.assert_called_once_with(ColorRGB.RED)
+            # Verify lights were turned off and a red layer was added
+            handler_default.compositor.clear.assert_called_once()
+            layer = handler_default.compositor.add_layer.call_args[0][0]
+            assert layer.pixels == [ColorRGB.RED.rgb] * 12
             mock_logger.debug.assert_called_with("All LEDs set to RED.")
 
     def test_set_single_color_specific_led(self, handler_default):
@@ -167,11 +191,11 @@ class TestLightsInteractionHandler:
         with patch("hexapod.lights.lights_interaction_handler.logger") as mock_logger:
             handler_default.set_single_color(ColorRGB.BLUE, led_index=5)
 
-            # Verify lights were turned off and specific LED color was set
-            handler_default.lights.clear.assert_called_once()
-            handler_default.lights.set_color.assert_called_once_with(
-                ColorRGB.BLUE, led_index=5
-            )
+            # Verify lights were turned off and only the LED is set
+            handler_default.compositor.clear.assert_called_once()
+            layer = handler_default.compositor.add_layer.call_args[0][0]
+            assert layer.pixels[5] == ColorRGB.BLUE.rgb
+            assert layer.pixels.count(None) == 11
             mock_logger.debug.assert_called_with("LED 5 set to BLUE.")
 
     def test_set_brightness(self, handler_default):
@@ -181,6 +205,7 @@ class TestLightsInteractionHandler:
 
             # Verify brightness was set
             handler_default.lights.set_brightness.assert_called_once_with(75)
+            handler_default.compositor.invalidate.assert_called_once()
             mock_logger.info.assert_called_with("Brightness set to 75%.")
 
     def test_anim_decorator_success(self, handler_default, mock_animation):
@@ -198,7 +223,7 @@ class TestLightsInteractionHandler:
 
             # Verify animation was set and started
             assert handler_default.animation == mock_animation
-            mock_animation.start.assert_called_once()
+            handler_default.compositor.play.assert_called_once_with(mock_animation)
             # Check that both logging calls were made (off() calls stop_animation first)
             assert (
                 mock_logger.info.call_count == 2
@@ -257,7 +282,7 @@ class TestLightsInteractionHandler:
             from hexapod.lights.lights_interaction_handler import animations
 
             animations.WheelFillAnimation.assert_called_once_with(
-                lights=handler_default.lights,
+                lights=ANY,
                 use_rainbow=True,
                 color=ColorRGB.WHITE,
                 interval=0.2,
@@ -277,7 +302,7 @@ class TestLightsInteractionHandler:
             from hexapod.lights.lights_interaction_handler import animations
 
             animations.WheelFillAnimation.assert_called_once_with(
-                lights=handler_default.lights,
+                lights=ANY,
                 use_rainbow=False,
                 color=ColorRGB.BLUE,
                 interval=0.5,
@@ -297,7 +322,7 @@ class TestLightsInteractionHandler:
             from hexapod.lights.lights_interaction_handler import animations
 
             animations.PulseSmoothlyAnimation.assert_called_once_with(
-                lights=handler_default.lights,
+                lights=ANY,
                 base_color=ColorRGB.RED,
                 pulse_color=ColorRGB.YELLOW,
                 pulse_speed=0.1,
@@ -315,7 +340,7 @@ class TestLightsInteractionHandler:
             from hexapod.lights.lights_interaction_handler import animations
 
             animations.PulseSmoothlyAnimation.assert_called_once_with(
-                lights=handler_default.lights,
+                lights=ANY,
                 base_color=ColorRGB.BLUE,
                 pulse_color=ColorRGB.GREEN,
                 pulse_speed=0.05,
@@ -335,7 +360,7 @@ class TestLightsInteractionHandler:
             from hexapod.lights.lights_interaction_handler import animations
 
             animations.AlternateRotateAnimation.assert_called_once_with(
-                lights=handler_default.lights,
+                lights=ANY,
                 color_even=ColorRGB.GREEN,
                 color_odd=ColorRGB.RED,
                 delay=0.3,
@@ -353,7 +378,7 @@ class TestLightsInteractionHandler:
             from hexapod.lights.lights_interaction_handler import animations
 
             animations.OppositeRotateAnimation.assert_called_once_with(
-                lights=handler_default.lights, interval=0.2, color=ColorRGB.PURPLE
+                lights=ANY, interval=0.2, color=ColorRGB.PURPLE
             )
 
     def test_police_animation(self, handler_default, mock_animation):
@@ -368,7 +393,7 @@ class TestLightsInteractionHandler:
             from hexapod.lights.lights_interaction_handler import animations
 
             animations.PulseAnimation.assert_called_once_with(
-                lights=handler_default.lights,
+                lights=ANY,
                 base_color=ColorRGB.BLUE,
                 pulse_color=ColorRGB.RED,
                 pulse_speed=0.5,
@@ -386,7 +411,7 @@ class TestLightsInteractionHandler:
             from hexapod.lights.lights_interaction_handler import animations
 
             animations.WheelFillAnimation.assert_called_once_with(
-                lights=handler_default.lights,
+                lights=ANY,
                 use_rainbow=False,
                 color=ColorRGB.RED,
                 interval=2.0,
@@ -406,7 +431,7 @@ class TestLightsInteractionHandler:
             from hexapod.lights.lights_interaction_handler import animations
 
             animations.CalibrationAnimation.assert_called_once_with(
-                lights=handler_default.lights,
+                lights=ANY,
                 calibration_status=calibration_status,
                 leg_to_led=handler_default.leg_to_led,
             )
@@ -432,7 +457,7 @@ class TestLightsInteractionHandler:
             from hexapod.lights.lights_interaction_handler import animations
 
             animations.DirectionOfArrivalAnimation.assert_called_once_with(
-                lights=handler_default.lights,
+                lights=ANY,
                 refresh_delay=0.1,
                 source_colors=[
                     ColorRGB.TEAL,
@@ -440,6 +465,7 @@ class TestLightsInteractionHandler:
                     ColorRGB.YELLOW,
                     ColorRGB.LIME,
                 ],
+                sources=None,
             )
 
     def test_direction_of_arrival_animation_custom(
@@ -452,19 +478,48 @@ class TestLightsInteractionHandler:
             "hexapod.lights.lights_interaction_handler.animations.DirectionOfArrivalAnimation",
             return_value=mock_animation,
         ):
+            sources = LatestValue({})
             handler_default.direction_of_arrival(
-                refresh_delay=0.2, source_colors=custom_colors
+                refresh_delay=0.2, source_colors=custom_colors, sources=sources
             )
 
             # Verify animation was created with custom parameters
             from hexapod.lights.lights_interaction_handler import animations
 
             animations.DirectionOfArrivalAnimation.assert_called_once_with(
-                lights=handler_default.lights,
+                lights=ANY,
                 refresh_delay=0.2,
                 source_colors=custom_colors,
+                sources=sources,
             )
 
+    def test_direction_of_arrival_overlay(self, handler_default, mock_animation):
+        """Test that the overlay keeps the running animation and blends over it."""
+        with patch(
+            "hexapod.lights.lights_interaction_handler.animations.DirectionOfArrivalAnimation",
+            return_value=mock_animation,
+        ) as mock_doa:
+            handler_default.direction_of_arrival(overlay=True, opacity=0.6)
+
+        handler_default.compositor.clear.assert_not_called()
+        handler_default.compositor.play.assert_called_once_with(mock_animation)
+        assert handler_default.animation == mock_animation
+        layer = mock_doa.call_args.kwargs["lights"]
+        assert isinstance(layer, LightsLayer)
+        assert layer.opacity == 0.6
+
+    def test_each_animation_draws_into_new_layer(self, handler_default):
+        """Test that animations get their own transparent layer of all LEDs."""
+        handler_default.police()
+        first = handler_default.animation.lights
+        handler_default.think()
+        second = handler_default.animation.lights
+
+        assert isinstance(first, LightsLayer)
+        assert first is not second
+        assert second.num_led == 12
+        assert second.opacity == 1.0
+
     def test_odas_loading_animation(self, handler_default, mock_animation):
         """Test odas_loading animation."""
         with patch(
@@ -477,7 +532,7 @@ class TestLightsInteractionHandler:
             from hexapod.lights.lights_interaction_handler import animations
 
             animations.WheelFillAnimation.assert_called_once_with(
-                lights=handler_default.lights,
+                lights=ANY,
                 use_rainbow=False,
                 color=ColorRGB.TEAL,
                 interval=0.1,
@@ -495,7 +550,7 @@ class TestLightsInteractionHandler:
             from hexapod.lights.lights_interaction_handler import animations
 
             animations.WheelFillAnimation.assert_called_once_with(
-                lights=handler_default.lights,
+                lights=ANY,
                 use_rainbow=False,
                 color=ColorRGB.TEAL,
                 interval=1.5 / 12,
@@ -515,7 +570,7 @@ class TestLightsInteractionHandler:
             from hexapod.lights.lights_interaction_handler import animations
 
             animations.PulseSmoothlyAnimation.assert_called_once_with(
-                lights=handler_default.lights,
+                lights=ANY,
                 base_color=ColorRGB.GREEN,
                 pulse_color=ColorRGB.BLACK,
                 pulse_speed=0.1,
@@ -533,7 +588,7 @@ class TestLightsInteractionHandler:
             from hexapod.lights.lights_interaction_handler import animations
 
             animations.WheelAnimation.assert_called_once_with(
-                lights=handler_default.lights,
+                lights=ANY,
                 use_rainbow=True,
                 color=None,
                 interval=0.1,
@@ -553,7 +608,7 @@ class TestLightsInteractionHandler:
             from hexapod.lights.lights_interaction_handler import animations
 
             animations.WheelAnimation.assert_called_once_with(
-                lights=handler_default.lights,
+                lights=ANY,
                 use_rainbow=False,
                 color=ColorRGB.ORANGE,
                 interval=0.3,
@@ -585,7 +640,7 @@ class TestLightsInteractionHandler:
                 continue  # Skip speak as it raises NotImplementedError
 
             # Reset the mock
-            handler_default.lights.clear.reset_mock()
+            handler_default.compositor.clear.reset_mock()
 
             with patch(
                 f"hexapod.lights.lights_interaction_handler.animations.{animation_class}",
@@ -594,13 +649,14 @@ class TestLightsInteractionHandler:
                 method = getattr(handler_default, method_name)
                 method(*args)
 
-                # Verify off() was called (which calls lights.clear())
-                handler_default.lights.clear.assert_called_once()
+                # Verify off() was called (which clears the compositor)
+                handler_default.compositor.clear.assert_called_once()
 
     def test_leg_to_led_mapping_preserved(self, sample_leg_to_led):
         """Test that leg_to_led mapping is preserved correctly."""
         with (
             patch("hexapod.lights.lights_interaction_handler.Lights"),
+            patch("hexapod.lights.lights_interaction_handler.LightsCompositor"),
             patch("hexapod.lights.lights_interaction_handler.logger"),
         ):
 
@@ -0,0 +1,171 @@
+"""
+Unit tests for the adaptive jitter buffer.
+"""
+
+import numpy as np
+import pytest
+
+from hexapod.odas.jitter_buffer import JitterBuffer, JitterBufferStats
+
+RATE = 10000
+BLOCK = 100
+
+
+class TestJitterBuffer:
+    """Test cases for JitterBuffer class."""
+
+    @pytest.fixture
+    def buffer(self):
+        """Buffer holding 50 ms with a capacity of 200 ms at 10 kHz."""
+        return JitterBuffer(RATE, target_latency=0.05, max_latency=0.2)
+
+    @staticmethod
+    def _ramp(start, count):
+        """Create consecutive sample values to check ordering."""
+        return np.arange(start, start + count, dtype=np.float32)
+
+    def test_silence_until_target_reached(self, buffer):
+        """Test that playback waits until the target latency is buffered."""
+        buffer.write(self._ramp(1, 499))
+        np.testing.assert_array_equal(buffer.read(BLOCK), 0)
+        assert len(buffer) == 499
+
+        buffer.write(self._ramp(500, 1))
+        np.testing.assert_array_equal(buffer.read(BLOCK), self._ramp(1, BLOCK))
+        assert buffer.underruns == 0
+
+    def test_samples_in_order_across_wrap(self, buffer):
+        """Test that samples come out in order while the ring wraps around."""
+        written = 0
+        output = []
+        for _ in range(100):
+            buffer.write(self._ramp(written, BLOCK))
+            written += BLOCK
+            output.append(buffer.read(BLOCK).copy())
+
+        played = np.concatenate(output)
+        played = played[played > 0]
+        np.testing.assert_array_equal(played, self._ramp(1, len(played)))
+        assert buffer.underruns == buffer.overruns == buffer.dropped_samples == 0
+
+    def test_read_into_output_buffer(self, buffer):
+        """Test that a block can be written into the device buffer in place."""
+        buffer.write(self._ramp(1, 500))
+        outdata = np.zeros((BLOCK, 1), dtype=np.float32)
+
+        buffer.read(BLOCK, out=outdata[:, 0])
+
+        np.testing.assert_array_equal(outdata[:, 0], self._ramp(1, BLOCK))
+
+    def test_underrun_pads_silence_and_reprimes(self, buffer):
+        """Test that an underrun outputs the rest padded with silence."""
+        buffer.write(self._ramp(1, 550))
+        for _ in range(5):
+            buffer.read(BLOCK)
+
+        block = buffer.read(BLOCK)
+
+        np.testing.assert_array_equal(block[:50], self._ramp(501, 50))
+        np.testing.assert_array_equal(block[50:], 0)
+        assert buffer.underruns == 1
+        buffer.write(self._ramp(1, 100))
+        np.testing.assert_array_equal(buffer.read(BLOCK), 0)
+
+    def test_capacity_is_hard_limit(self):
+        """Test that writes beyond the capacity keep only the newest samples."""
+        buffer = JitterBuffer(
+            RATE, target_latency=0.05, max_latency=0.2, drop_latency=0.2
+        )
+        buffer.write(self._ramp(1, 1500))
+        buffer.write(self._ramp(1501, 1000))
+
+        assert len(buffer) == 2000
+        assert buffer.latency == pytest.approx(0.2)
+        assert buffer.overruns == 1
+        assert buffer.dropped_samples == 500
+
+        buffer.write(self._ramp(2501, 3000))
+        assert buffer.overruns == 2
+        assert buffer.dropped_samples == 3500
+        assert buffer.read(BLOCK)[0] == 3501
+
+    def test_burst_dropped_to_target(self, buffer):
+        """Test that a fill level above the drop latency is cut to the target."""
+        buffer.write(self._ramp(1, 1500))
+
+        block = buffer.read(BLOCK)
+
+        assert block[0] == 1001
+        assert buffer.dropped_samples == 1000
+        assert len(buffer) == 500 - BLOCK
+
+    @pytest.mark.parametrize("fill,direction", [(900, 1), (350, -1), (520, 0)])
+    def test_stretch_follows_fill_level(self, fill, direction):
+        """Test that a fill level off target plays faster or slower."""
+        buffer = JitterBuffer(RATE, target_latency=0.05, max_latency=0.2)
+        buffer.write(np.ones(max(fill, 500), dtype=np.float32))
+        buffer.read(BLOCK)
+        buffer._fill = buffer._smoothed_fill = fill
+
+        before = len(buffer)
+        block = buffer.read(BLOCK)
+
+        assert np.sign(buffer.stretch_ratio) == direction
+        assert abs(buffer.stretch_ratio) <= buffer.max_stretch
+        assert len(block) == BLOCK
+        assert before - len(buffer) == round(BLOCK * (1 + buffer.stretch_ratio))
+
+    def test_drifting_source_stays_near_target(self):
+        """Test that a bursty source running 1% fast keeps latency bounded."""
+        buffer = JitterBuffer(RATE, target_latency=0.05, max_latency=0.2)
+        rng = np.random.default_rng(0)
+        latencies = []
+        pending = 0.0
+        for step in range(3000):
+            # Data arrives in bursts every 5 blocks, 1% more than is played
+            pending += BLOCK * 1.01
+            if step % 5 == 0:
+                count = int(pending) + int(rng.integers(-50, 50))
+                buffer.write(np.ones(count, dtype=np.float32))
+                pending -= count
+            buffer.read(BLOCK)
+            latencies.append(buffer.latency)
+
+        assert max(latencies[500:]) < 0.1
+        assert buffer.overruns == buffer.underruns == buffer.dropped_samples == 0
+
+    def test_clear(self, buffer):
+        """Test that clearing drops the audio and waits for the target again."""
+        buffer.write(self._ramp(1, 600))
+        buffer.read(BLOCK)
+
+        buffer.clear()
+
+        assert len(buffer) == 0
+        buffer.write(self._ramp(1, 100))
+        np.testing.assert_array_equal(buffer.read(BLOCK), 0)
+
+    def test_stats(self, buffer):
+        """Test the statistics snapshot."""
+        buffer.write(self._ramp(1, 2500))
+
+        stats = buffer.stats()
+
+        assert isinstance(stats, JitterBufferStats)
+        assert stats.latency == pytest.approx(0.2)
+        assert stats.target_latency == 0.05
+        assert stats.overruns == 1
+        assert stats.as_dict()["dropped_samples"] == 500
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"target_latency": 0.0},
+            {"target_latency": 0.5, "max_latency": 0.2},
+            {"target_latency": 0.05, "drop_latency": 0.3, "max_latency": 0.2},
+        ],
+    )
+    def test_invalid_latencies(self, kwargs):
+        """Test that inconsistent latencies are rejected."""
+        with pytest.raises(ValueError):
+            JitterBuffer(RATE, **kwargs)
@@ -0,0 +1,230 @@
+"""
+Unit tests for the multi-channel keyword spotter.
+"""
+
+import threading
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from hexapod.odas.multi_channel_keyword_spotter import (
+    MultiChannelKeywordSpotter,
+    KeywordDetection,
+    porcupine_engine_factory,
+)
+
+# One Picovoice frame at 16 kHz is 1411 samples at 44.1 kHz
+SOURCE_FRAME = 1411
+
+
+class FakeEngine:
+    """Keyword engine that detects keyword 0 in loud frames."""
+
+    frame_length = 512
+
+    def __init__(self):
+        self.frames = []
+        self.threads = set()
+        self.deleted = False
+
+    def process(self, pcm):
+        self.frames.append(pcm.copy())
+        self.threads.add(threading.current_thread().name)
+        return 0 if np.max(np.abs(pcm)) > 10000 else -1
+
+    def delete(self):
+        self.deleted = True
+
+
+class TestMultiChannelKeywordSpotter:
+    """Test cases for MultiChannelKeywordSpotter class."""
+
+    @pytest.fixture
+    def engines(self):
+        """Engines created by the spotter, in creation order."""
+        return []
+
+    @pytest.fixture
+    def spotter(self, engines):
+        """Spotter with fake engines and a detection recorder."""
+
+        def factory():
+            engines.append(FakeEngine())
+            return engines[-1]
+
+        spotter = MultiChannelKeywordSpotter(factory, Mock())
+        yield spotter
+        spotter.close()
+
+    @staticmethod
+    def _frame(loud_channels=(), length=SOURCE_FRAME):
+        """Create a 4-channel int16 frame, loud on the given channels."""
+        samples = np.zeros((length, 4), dtype=np.int16)
+        for channel in loud_channels:
+            samples[:, channel] = 20000
+        return samples
+
+    @staticmethod
+    def _slots(*active_ids):
+        """Create 4 tracked slots with the given source IDs."""
+        return [
+            {"id": source_id, "x": 1.0, "y": 0.0, "activity": 0.9}
+            for source_id in active_ids
+        ]
+
+    def test_idle_channels_are_gated(self, spotter, engines):
+        """Test that nothing is processed without tracked sources."""
+        spotter.process_frame(self._frame(loud_channels=(0, 1, 2, 3)))
+
+        assert engines == []
+        assert spotter.active_channels() == []
+        spotter.on_detection.assert_not_called()
+
+    def test_only_active_channels_are_processed(self, spotter, engines):
+        """Test that engines run only on channels holding a tracked source."""
+        spotter.update_sources(self._slots(0, 7, 0, 9))
+        spotter.process_frame(self._frame())
+
+        assert spotter.active_channels() == [1, 3]
+        assert len(engines) == 2
+        assert spotter.frames_processed == [0, 1, 0, 1]
+
+    def test_detection_reports_channel_and_source(self, spotter):
+        """Test that a detection carries its channel and tracked source."""
+        slots = self._slots(0, 0, 5, 6)
+        spotter.update_sources(slots)
+        spotter.process_frame(self._frame(loud_channels=(2,)))
+
+        spotter.on_detection.assert_called_once()
+        detection = spotter.on_detection.call_args[0][0]
+        assert isinstance(detection, KeywordDetection)
+        assert detection.channel == 2
+        assert detection.keyword_index == 0
+        assert detection.source == slots[2]
+
+    def test_channels_demultiplexed_and_resampled(self, spotter, engines):
+        """Test that each engine gets its own channel at 16 kHz in 512-sample frames."""
+        spotter.update_sources(self._slots(1, 2, 0, 0))
+        samples = self._frame(length=SOURCE_FRAME * 3)
+        samples[:, 1] = 4000
+
+        for start in range(0, len(samples), 512):
+            spotter.process_frame(samples[start : start + 512])
+
+        quiet, steady = engines
+        assert len(quiet.frames) == len(steady.frames) == 3
+        assert all(len(frame) == 512 for frame in steady.frames)
+        assert np.all(np.concatenate(quiet.frames) == 0)
+        # Past the filter start-up the constant channel keeps its level
+        np.testing.assert_allclose(steady.frames[-1], 4000, atol=5)
+
+    def test_channels_run_on_worker_pool(self, spotter, engines):
+        """Test that several active channels are processed on the worker threads."""
+        spotter.update_sources(self._slots(1, 2, 3, 4))
+        spotter.process_frame(self._frame())
+
+        assert len(engines) == 4
+        for engine in engines:
+            assert len(engine.frames) == 1
+            assert all(name.startswith("KeywordSpotter") for name in engine.threads)
+
+    def test_hangover_keeps_channel_active(self, spotter):
+        """Test that a channel stays active for the hangover after its source left."""
+        with patch(
+            "hexapod.odas.multi_channel_keyword_spotter.time.monotonic",
+            return_value=100.0,
+        ):
+            spotter.update_sources(self._slots(3, 0, 0, 0))
+
+        assert spotter.active_channels(now=100.5) == [0]
+        assert spotter.active_channels(now=101.5) == []
+
+    def test_channel_gone_idle_is_reset(self, spotter, engines):
+        """Test that a channel gone idle drops its buffered audio but keeps its engine."""
+        spotter.update_sources(self._slots(3, 0, 0, 0))
+        spotter.process_frame(self._frame(length=700))
+        assert len(spotter._pending[0]) > 0
+
+        spotter.hangover = -1.0
+        spotter.process_frame(self._frame())
+
+        assert len(spotter._pending[0]) == 0
+        assert spotter._resamplers[0] is None
+        assert len(engines) == 1
+
+    def test_gating_disabled_processes_all_channels(self, engines):
+        """Test that all channels are processed when gating is disabled."""
+
+        def factory():
+            engines.append(FakeEngine())
+            return engines[-1]
+
+        spotter = MultiChannelKeywordSpotter(factory, Mock(), gate_idle_channels=False)
+        try:
+            spotter.process_frame(self._frame())
+        finally:
+            spotter.close()
+
+        assert spotter.frames_processed == [1, 1, 1, 1]
+
+    def test_engine_creation_failure(self):
+        """Test that a failing engine factory disables the channel once."""
+        factory = Mock(side_effect=RuntimeError("invalid access key"))
+        spotter = MultiChannelKeywordSpotter(factory, Mock())
+        try:
+            with patch(
+                "hexapod.odas.multi_channel_keyword_spotter.logger"
+            ) as mock_logger:
+                spotter.update_sources(self._slots(1, 0, 0, 0))
+                for _ in range(3):
+                    spotter.process_frame(self._frame(loud_channels=(0,)))
+        finally:
+            spotter.close()
+
+        factory.assert_called_once()
+        mock_logger.error.assert_called_once()
+        assert spotter.frames_processed == [0, 0, 0, 0]
+        spotter.on_detection.assert_not_called()
+
+    def test_detection_callback_error(self, spotter):
+        """Test that an error in the detection callback does not stop processing."""
+        spotter.on_detection.side_effect = RuntimeError("callback failed")
+        spotter.update_sources(self._slots(1, 0, 0, 0))
+
+        spotter.process_frame(self._frame(loud_channels=(0,)))
+        spotter.process_frame(self._frame(loud_channels=(0,)))
+
+        assert spotter.on_detection.call_count == 2
+
+    def test_close_deletes_engines(self, engines):
+        """Test that closing the spotter deletes all engines."""
+
+        def factory():
+            engines.append(FakeEngine())
+            return engines[-1]
+
+        spotter = MultiChannelKeywordSpotter(factory, Mock())
+        spotter.update_sources(self._slots(1, 2, 0, 0))
+        spotter.process_frame(self._frame())
+        spotter.close()
+
+        assert [engine.deleted for engine in engines] == [True, True]
+
+    def test_porcupine_engine_factory(self):
+        """Test that the factory creates Porcupine instances with the keywords."""
+        with patch(
+            "hexapod.odas.multi_channel_keyword_spotter.pvporcupine"
+        ) as mock_porcupine:
+            factory = porcupine_engine_factory(
+                "key", [Path("/models/hexapod.ppn")], [0.6]
+            )
+            engine = factory()
+
+        mock_porcupine.create.assert_called_once_with(
+            access_key="key",
+            keyword_paths=["/models/hexapod.ppn"],
+            sensitivities=[0.6],
+        )
+        assert engine is mock_porcupine.create.return_value
@@ -75,8 +75,10 @@ class TestODASAudioProcessor:
         assert processor.check_interval == 0.5
         assert processor.frame_length == 512
         assert processor.resample_ratio == 16000 / 44100
-        assert processor._last_file_size == 0
-        assert len(processor._buffer) == 0
+        assert processor.ring_frames == 64
+        assert processor.bytes_per_frame == 2 * 4 * 512
+        assert processor.frame_callback is None
+        assert processor._reader is None
 
     def test_init_custom_parameters(self, temp_odas_dir):
         """Test ODASAudioProcessor initialization with custom parameters."""
@@ -104,6 +106,13 @@ class TestODASAudioProcessor:
         assert processor.frame_length == 256
         assert processor.resample_ratio == 8000 / 48000
 
+    def test_init_source_file(self, temp_odas_dir):
+        """Test reading another ODAS output file, e.g. the separated channels."""
+        processor = ODASAudioProcessor(
+            odas_dir=temp_odas_dir, source_file="separated.raw"
+        )
+        assert processor.audio_file == temp_odas_dir / "separated.raw"
+
     def test_set_audio_callback(self, processor_default):
         """Test setting audio callback function."""
         callback = Mock()
@@ -201,24 +210,58 @@ class TestODASAudioProcessor:
         assert converted is not None
         assert len(converted) == processor_custom.frame_length
 
-    def test_convert_audio_padding(self, processor_default):
-        """Test audio padding when resampled audio is too short."""
-        # Create data that will result in shorter resampled audio
-        # Need enough samples to pass the initial checks (1411 samples)
-        samples = np.random.randint(-32768, 32767, (1411, 4), dtype=np.int16)
-        audio_data = samples.tobytes()
+    def test_convert_audio_continuous_across_frames(self, processor_default):
+        """Test that frames resampled one by one form one continuous signal."""
+        # 1 kHz tone on the selected channel, split into ODAS-sized frames
+        t = np.arange(44100) / 44100
+        tone = (8000 * np.sin(2 * np.pi * 1000 * t)).astype(np.int16)
+        samples = np.zeros((len(tone), 4), dtype=np.int16)
+        samples[:, 0] = tone
+
+        frames = []
+        for start in range(0, len(tone) - 512, 512):
+            converted = processor_default._convert_audio(
+                samples[start : start + 512].tobytes()
+            )
+            if converted is not None:
+                frames.append(converted)
+
+        output = np.concatenate(frames).astype(np.float64)
+        assert all(len(frame) == processor_default.frame_length for frame in frames)
+        # Exact 16 kHz sample count over time, no padding or truncation per frame
+        consumed = len(range(0, len(tone) - 512, 512)) * 512
+        assert len(output) + len(processor_default._sample_buffer) == int(
+            np.ceil(consumed * 16000 / 44100)
+        )
 
-        # Mock resampy to return shorter array
-        with patch("resampy.resample") as mock_resample:
-            mock_resample.return_value = np.array(
-                [1, 2, 3], dtype=np.int16
-            )  # Very short
-            converted = processor_default._convert_audio(audio_data)
+        # Compare with the ideal tone, skipping the filter start-up
+        t_out = np.arange(len(output)) / 16000 - processor_default._resampler.delay
+        expected = 8000 * np.sin(2 * np.pi * 1000 * t_out)
+        assert np.max(np.abs(output[200:] - expected[200:])) < 10
 
-            assert converted is not None
-            assert len(converted) == processor_default.frame_length
-            # Should be padded with zeros
-            assert np.all(converted[3:] == 0)
+    def test_process_frame_feeds_all_complete_frames(self, processor_default):
+        """Test that every complete converted frame reaches the audio callback."""
+        processor_default.audio_callback = Mock()
+        # Leave almost a full frame buffered so the next input completes two frames
+        processor_default._sample_buffer = np.zeros(1000, dtype=np.int16)
+
+        processor_default._process_frame(
+            memoryview(np.zeros((512, 4), dtype=np.int16).tobytes())
+        )
+
+        assert processor_default.audio_callback.call_count == 2
+        assert len(processor_default._sample_buffer) < processor_default.frame_length
+
+    def test_start_resets_resampler(self, processor_default, sample_audio_data):
+        """Test that a new reading session starts with a fresh resampler."""
+        processor_default._convert_audio(sample_audio_data[:4000])
+        assert len(processor_default._sample_buffer) > 0
+
+        processor_default.start()
+        processor_default.stop()
+
+        assert len(processor_default._sample_buffer) == 0
+        assert processor_default._resampler._consumed == 0
 
     def test_convert_audio_clipping(self, processor_default, sample_audio_data):
         """Test audio clipping to 16-bit range."""
@@ -229,14 +272,16 @@ class TestODASAudioProcessor:
         assert np.all(converted >= -32768)
         assert np.all(converted <= 32767)
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("pathlib.Path.exists")
-    @patch("pathlib.Path.stat")
-    def test_read_audio_file_not_exists(
-        self, mock_stat, mock_exists, mock_file, processor_default
-    ):
+    @staticmethod
+    def _wait_for(condition, timeout=2.0):
+        """Poll a condition until it holds or the timeout expires."""
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return condition()
+
+    def test_read_audio_file_not_exists(self, processor_default):
         """Test reading audio when file doesn't exist."""
-        mock_exists.return_value = False
         processor_default.audio_callback = Mock()
 
         # Start and immediately stop to avoid infinite loop
@@ -247,16 +292,9 @@ class TestODASAudioProcessor:
         # Should not call callback when file doesn't exist
         processor_default.audio_callback.assert_not_called()
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("pathlib.Path.exists")
-    @patch("pathlib.Path.stat")
-    def test_read_audio_no_new_data(
-        self, mock_stat, mock_exists, mock_file, processor_default
-    ):
+    def test_read_audio_no_new_data(self, processor_default):
         """Test reading audio when no new data is available."""
-        mock_exists.return_value = True
-        mock_stat.return_value.st_size = 1000
-        processor_default._last_file_size = 1000  # Same size, no new data
+        processor_default.audio_file.write_bytes(b"")
         processor_default.audio_callback = Mock()
 
         processor_default.start()
@@ -281,55 +319,102 @@ class TestODASAudioProcessor:
             processor_default.audio_callback(converted)
             processor_default.audio_callback.assert_called_once_with(converted)
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("pathlib.Path.exists")
-    @patch("pathlib.Path.stat")
-    def test_read_audio_incomplete_frame(
-        self, mock_stat, mock_exists, mock_file, processor_default
-    ):
+    def test_read_audio_incomplete_frame(self, processor_default):
         """Test reading audio with incomplete frame data."""
-        mock_exists.return_value = True
-        mock_stat.return_value.st_size = 2000
-        processor_default._last_file_size = 1000
+        # Not enough for a complete frame
+        processor_default.audio_file.write_bytes(b"\x00\x01" * 100)
+        processor_default.frame_callback = Mock()
         processor_default.audio_callback = Mock()
 
-        # Mock file read to return incomplete data
-        incomplete_data = b"\x00\x01" * 100  # Not enough for a complete frame
-        mock_file.return_value.read.return_value = incomplete_data
-
         processor_default.start()
         time.sleep(0.1)
         processor_default.stop()
 
-        # Should not call callback with incomplete frame
+        # Should not call callbacks with incomplete frame
+        processor_default.frame_callback.assert_not_called()
         processor_default.audio_callback.assert_not_called()
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("pathlib.Path.exists")
-    @patch("pathlib.Path.stat")
-    def test_read_audio_multiple_frames(
-        self, mock_stat, mock_exists, mock_file, processor_default, sample_audio_data
-    ):
+    def test_read_audio_multiple_frames(self, processor_default, sample_audio_data):
         """Test reading audio with multiple complete frames."""
-        mock_exists.return_value = True
-        mock_stat.return_value.st_size = 2000
-        processor_default._last_file_size = 1000
+        bytes_per_frame = processor_default.bytes_per_frame
+        multiple_frames = sample_audio_data * 3  # 8 complete frames and a partial one
+        processor_default.audio_file.write_bytes(multiple_frames)
+        processor_default.frame_callback = Mock()
         processor_default.audio_callback = Mock()
 
-        # Create data for multiple frames
-        bytes_per_frame = (
-            2 * processor_default.source_channels * processor_default.frame_length
-        )
-        multiple_frames = sample_audio_data * 3  # 3 complete frames
-        mock_file.return_value.read.return_value = multiple_frames
-
         processor_default.start()
-        time.sleep(0.1)
+        assert self._wait_for(
+            lambda: processor_default.frame_callback.call_count
+            == len(multiple_frames) // bytes_per_frame
+        )
         processor_default.stop()
 
         # Should call callback multiple times
         assert processor_default.audio_callback.call_count >= 1
 
+    def test_read_audio_follows_appended_data(self, processor_default):
+        """Test that data appended while reading is picked up in order."""
+        frames = np.arange(6 * 512 * 4, dtype=np.int16).reshape(6, 512, 4)
+        received = []
+        processor_default.set_frame_callback(
+            lambda frame: received.append(frame.copy())
+        )
+        processor_default.audio_file.write_bytes(frames[:2].tobytes())
+
+        processor_default.start()
+        try:
+            assert self._wait_for(lambda: len(received) == 2)
+            with open(processor_default.audio_file, "ab") as f:
+                # Split a frame across two writes
+                data = frames[2:].tobytes()
+                f.write(data[:1000])
+                f.flush()
+                time.sleep(0.05)
+                f.write(data[1000:])
+            assert self._wait_for(lambda: len(received) == 6, timeout=3.0)
+        finally:
+            processor_default.stop()
+
+        for index, frame in enumerate(received):
+            assert frame.shape == (512, 4)
+            np.testing.assert_array_equal(frame, frames[index])
+
+    def test_read_audio_file_created_later(self, processor_default):
+        """Test that the reader starts once ODAS creates the audio file."""
+        processor_default.frame_callback = Mock()
+
+        processor_default.start()
+        try:
+            time.sleep(0.05)
+            processor_default.audio_file.write_bytes(
+                bytes(processor_default.bytes_per_frame)
+            )
+            assert self._wait_for(
+                lambda: processor_default.frame_callback.call_count == 1, timeout=3.0
+            )
+        finally:
+            processor_default.stop()
+
+    def test_frame_callback_receives_ring_buffer_view(self, temp_odas_dir):
+        """Test that frames are passed as views into the ring buffer, not copies."""
+        processor = ODASAudioProcessor(odas_dir=temp_odas_dir, ring_frames=2)
+        shares_ring = []
+
+        def frame_callback(frame):
+            ring = np.frombuffer(processor._reader._ring, dtype=np.int16)
+            shares_ring.append(np.shares_memory(frame, ring))
+
+        processor.set_frame_callback(frame_callback)
+        processor.audio_file.write_bytes(bytes(processor.bytes_per_frame * 5))
+
+        processor.start()
+        try:
+            assert self._wait_for(lambda: len(shares_ring) == 5)
+        finally:
+            processor.stop()
+
+        assert all(shares_ring)
+
     @patch("builtins.open", side_effect=IOError("File read error"))
     @patch("pathlib.Path.exists")
     @patch("pathlib.Path.stat")
@@ -372,25 +457,6 @@ class TestODASAudioProcessor:
             callback(converted)
             callback.assert_called_once_with(converted)
 
-    def test_buffer_management(self, processor_default):
-        """Test internal buffer management."""
-        # Test initial buffer state
-        assert len(processor_default._buffer) == 0
-
-        # Test buffer extension
-        test_data = b"\x00\x01\x02\x03"
-        processor_default._buffer.extend(test_data)
-        assert len(processor_default._buffer) == 4
-        assert processor_default._buffer == bytearray(test_data)
-
-    def test_file_size_tracking(self, processor_default):
-        """Test file size tracking functionality."""
-        assert processor_default._last_file_size == 0
-
-        # Simulate file size update
-        processor_default._last_file_size = 1000
-        assert processor_default._last_file_size == 1000
-
     def test_resample_ratio_calculation(self, processor_default):
         """Test resample ratio calculation."""
         expected_ratio = 16000 / 44100
@@ -3,7 +3,9 @@ Unit tests for ODAS DOA SSL processor.
 """
 
 import pytest
+import asyncio
 import json
+import os
 import socket
 import threading
 import time
@@ -12,15 +14,50 @@ import subprocess
 import logging
 import struct
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock, call
+from unittest.mock import Mock, patch, MagicMock, AsyncMock, call
 from io import StringIO
 
 from hexapod.odas.odas_doa_ssl_processor import ODASDoASSLProcessor
+from hexapod.odas.odas_session_capture import read_session
+from hexapod.odas.session_log_writer import SessionLogWriter
 
 
 class TestODASDoASSLProcessor:
     """Test cases for ODASDoASSLProcessor class."""
 
+    @pytest.fixture(autouse=True)
+    def session_log_writers(self, tmp_path, monkeypatch):
+        """
+        Keep the session logs of processors built without directories in tmp_path,
+        and stop every session log writer thread after the test.
+        """
+        data_manager_class = ODASDoASSLProcessor.DataManager
+        original_init = data_manager_class.__init__
+
+        def init(manager, processor, odas_logs_dir=None, odas_data_dir=None, **kwargs):
+            original_init(
+                manager,
+                processor,
+                odas_logs_dir or tmp_path / "session" / "logs",
+                odas_data_dir or tmp_path / "session" / "data",
+                **kwargs,
+            )
+
+        writers = []
+
+        def open_writer(*args, **kwargs):
+            writer = SessionLogWriter(*args, **kwargs)
+            writers.append(writer)
+            return writer
+
+        monkeypatch.setattr(data_manager_class, "__init__", init)
+        monkeypatch.setattr(
+            "hexapod.odas.odas_doa_ssl_processor.SessionLogWriter", open_writer
+        )
+        yield writers
+        for writer in writers:
+            writer.close()
+
     @pytest.fixture
     def mock_lights_handler(self):
         """Mock lights handler for testing."""
@@ -29,7 +66,6 @@ class TestODASDoASSLProcessor:
         mock_handler.direction_of_arrival = MagicMock()
         mock_handler.off = MagicMock()
         mock_handler.animation = MagicMock()
-        mock_handler.animation.update_sources = MagicMock()
         return mock_handler
 
     @pytest.fixture
@@ -58,21 +94,21 @@ class TestODASDoASSLProcessor:
             assert processor.tracked_sources_server is None
             assert processor.potential_sources_server is None
             assert processor.running is True
-            assert processor.threads == []
+            assert processor.loop is None
             assert processor.odas_process is None
             assert processor.stop_event is None
             assert processor.lights_handler == mock_lights_handler
             assert processor.tracked_sources == {}
-            assert processor.potential_sources == {}
+            assert len(processor.potential_sources) == 0
             assert processor.debug_mode is True
             assert processor.last_num_lines == 0
             assert processor.initial_connection_made is False
 
-    def test_init_custom_parameters(self, mock_lights_handler):
+    def test_init_custom_parameters(self, mock_lights_handler, tmp_path):
         """Test ODASDoASSLProcessor initialization with custom parameters."""
         stop_event = threading.Event()
         gui_config = {"gui_host": "192.168.1.100", "forward_to_gui": True}
-        data_config = {"odas_logs_dir": Path("/test/logs")}
+        data_config = {"odas_logs_dir": tmp_path / "logs"}
 
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
             processor = ODASDoASSLProcessor(
@@ -138,39 +174,51 @@ class TestODASDoASSLProcessor:
             # Should fall back to current directory (hexapod/odas)
             assert "odas" in str(processor.data_manager.odas_logs_dir)
 
-    def test_data_manager_log(self, mock_lights_handler, caplog):
-        """Test DataManager logging functionality."""
+    def test_data_manager_close(self, mock_lights_handler):
+        """Test DataManager close functionality."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
             processor = ODASDoASSLProcessor(mock_lights_handler)
-            mock_file = StringIO()
+            mock_file1 = StringIO()
+            mock_file2 = StringIO()
+            processor.data_manager.log_files = [mock_file1, mock_file2]
 
-            processor.data_manager.log("Test message", mock_file, print_to_console=True)
+            processor.data_manager.close()
 
-            assert "Test message" in mock_file.getvalue()
+            assert len(processor.data_manager.log_files) == 0
 
-    def test_data_manager_log_when_not_running(self, mock_lights_handler):
-        """Test DataManager logging when processor is not running."""
+    def test_data_manager_log_frame(self, mock_lights_handler, tmp_path):
+        """Test DataManager writing frames as compact JSONL through the session log."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
-            processor = ODASDoASSLProcessor(mock_lights_handler)
-            processor.running = False
-            mock_file = StringIO()
+            processor = ODASDoASSLProcessor(
+                mock_lights_handler,
+                data_config={
+                    "odas_logs_dir": tmp_path / "logs",
+                    "odas_data_dir": tmp_path / "data",
+                },
+            )
+            sources = [{"id": 1, "x": 1.0, "y": 0.0, "z": 0.0, "activity": 0.5}]
 
-            processor.data_manager.log("Test message", mock_file)
+            processor.data_manager.log_frame(
+                sources, processor.data_manager.tracked_log
+            )
+            processor.data_manager.log_frame([], processor.data_manager.tracked_log)
+            processor.data_manager.close()
 
-            # Should not log when not running
-            assert mock_file.getvalue() == ""
+            lines = (tmp_path / "logs" / "tracked.jsonl").read_text().splitlines()
+            assert len(lines) == 1
+            assert json.loads(lines[0])["sources"] == sources
+            assert ", " not in lines[0]
 
-    def test_data_manager_close(self, mock_lights_handler):
-        """Test DataManager close functionality."""
+    def test_data_manager_log_frame_when_not_running(self, mock_lights_handler):
+        """Test that frames are not logged once the processor stopped."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
             processor = ODASDoASSLProcessor(mock_lights_handler)
-            mock_file1 = StringIO()
-            mock_file2 = StringIO()
-            processor.data_manager.log_files = [mock_file1, mock_file2]
+            processor.running = False
+            mock_log = MagicMock()
 
-            processor.data_manager.close()
+            processor.data_manager.log_frame([{"id": 1}], mock_log)
 
-            assert len(processor.data_manager.log_files) == 0
+            mock_log.write_record.assert_not_called()
 
     def test_gui_manager_init(self, mock_lights_handler):
         """Test GUIManager initialization."""
@@ -217,7 +265,7 @@ class TestODASDoASSLProcessor:
             assert processor.gui_manager.gui_potential_sources_socket is None
 
     def test_gui_manager_forward_data_tracked(self, mock_lights_handler):
-        """Test GUIManager forwarding tracked data."""
+        """Test GUIManager queuing tracked data."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
             processor = ODASDoASSLProcessor(mock_lights_handler)
             mock_socket = MagicMock()
@@ -226,10 +274,13 @@ class TestODASDoASSLProcessor:
             test_data = b"test data"
             processor.gui_manager.forward_data(test_data, "tracked")
 
-            mock_socket.send.assert_called_once_with(test_data)
+            assert list(processor.gui_manager._outbound["tracked"]) == [test_data]
+            assert list(processor.gui_manager._outbound["potential"]) == []
+            # Queuing never touches the socket directly
+            mock_socket.send.assert_not_called()
 
     def test_gui_manager_forward_data_potential(self, mock_lights_handler):
-        """Test GUIManager forwarding potential data."""
+        """Test GUIManager queuing potential data."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
             processor = ODASDoASSLProcessor(mock_lights_handler)
             mock_socket = MagicMock()
@@ -238,23 +289,121 @@ class TestODASDoASSLProcessor:
             test_data = b"test data"
             processor.gui_manager.forward_data(test_data, "potential")
 
-            mock_socket.send.assert_called_once_with(test_data)
+            assert list(processor.gui_manager._outbound["potential"]) == [test_data]
+
+    def test_gui_manager_forward_data_without_socket(self, mock_lights_handler):
+        """Test that nothing is queued for a client that is not connected."""
+        with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
+            processor = ODASDoASSLProcessor(mock_lights_handler)
+
+            processor.gui_manager.forward_data(b"test data", "tracked")
+            processor.gui_manager.forward_data(b"test data", "unknown")
+
+            assert len(processor.gui_manager._outbound["tracked"]) == 0
+
+    def test_gui_manager_forward_data_drops_oldest(self, mock_lights_handler):
+        """Test that a full queue drops the oldest frame and counts it."""
+        with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
+            processor = ODASDoASSLProcessor(
+                mock_lights_handler, gui_config={"max_queued_frames": 2}
+            )
+            processor.gui_manager.gui_tracked_sources_socket = MagicMock()
+
+            for frame in (b"1", b"2", b"3", b"4"):
+                processor.gui_manager.forward_data(frame, "tracked")
+
+            assert list(processor.gui_manager._outbound["tracked"]) == [b"3", b"4"]
+            assert processor.gui_manager.dropped_frames == {
+                "tracked": 2,
+                "potential": 0,
+            }
+
+    def test_gui_manager_forward_data_over_socket(self, mock_lights_handler):
+        """Test GUIManager sending queued data through a real non-blocking socket."""
+        with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
+            processor = ODASDoASSLProcessor(mock_lights_handler)
+            gui_manager = processor.gui_manager
+            gui_side, processor_side = socket.socketpair()
+            processor_side.setblocking(False)
+            gui_manager.gui_tracked_sources_socket = processor_side
+
+            async def _run():
+                gui_manager.start_senders()
+                gui_manager.forward_data(b"frame1", "tracked")
+                gui_manager.forward_data(b"frame2", "tracked")
+                for _ in range(100):
+                    if gui_manager.sent_frames["tracked"] == 2:
+                        break
+                    await asyncio.sleep(0.01)
+                await gui_manager.stop_senders()
+
+            try:
+                asyncio.run(_run())
+                assert gui_side.recv(64) == b"frame1frame2"
+                assert gui_manager.sent_frames["tracked"] == 2
+            finally:
+                gui_side.close()
+                processor_side.close()
+
+    def test_gui_manager_stalled_gui_does_not_block(self, mock_lights_handler):
+        """Test that a GUI that stops reading only causes dropped frames."""
+        with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
+            processor = ODASDoASSLProcessor(
+                mock_lights_handler, gui_config={"max_queued_frames": 4}
+            )
+            gui_manager = processor.gui_manager
+            gui_side, processor_side = socket.socketpair()
+            processor_side.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+            processor_side.setblocking(False)
+            gui_manager.gui_tracked_sources_socket = processor_side
+            frame = b"x" * 8192
+
+            async def _run():
+                gui_manager.start_senders()
+                started = time.monotonic()
+                for _ in range(200):
+                    gui_manager.forward_data(frame, "tracked")
+                    await asyncio.sleep(0)
+                elapsed = time.monotonic() - started
+                await gui_manager.stop_senders()
+                return elapsed
+
+            try:
+                elapsed = asyncio.run(_run())
+                assert elapsed < 1.0
+                assert gui_manager.dropped_frames["tracked"] > 0
+                assert len(gui_manager._outbound["tracked"]) <= 4
+            finally:
+                gui_side.close()
+                processor_side.close()
 
     def test_gui_manager_forward_data_connection_error(self, mock_lights_handler):
         """Test GUIManager forwarding data with connection error."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
             processor = ODASDoASSLProcessor(mock_lights_handler)
-            mock_socket = MagicMock()
-            mock_socket.send.side_effect = BrokenPipeError()
-            processor.gui_manager.gui_tracked_sources_socket = mock_socket
+            gui_manager = processor.gui_manager
+            gui_manager.gui_tracked_sources_socket = MagicMock()
 
             # Mock the handle_disconnection method
-            processor.gui_manager.handle_disconnection = MagicMock()
+            gui_manager.handle_disconnection = MagicMock()
 
-            test_data = b"test data"
-            processor.gui_manager.forward_data(test_data, "tracked")
+            async def _run():
+                loop = asyncio.get_running_loop()
+                with patch.object(
+                    loop, "sock_sendall", AsyncMock(side_effect=BrokenPipeError())
+                ):
+                    gui_manager.start_senders()
+                    gui_manager.forward_data(b"test data", "tracked")
+                    for _ in range(100):
+                        if gui_manager.handle_disconnection.called:
+                            break
+                        await asyncio.sleep(0.01)
+                    await gui_manager.stop_senders()
+
+            asyncio.run(_run())
 
-            processor.gui_manager.handle_disconnection.assert_called_once()
+            gui_manager.handle_disconnection.assert_called_once()
+            assert gui_manager.sent_frames["tracked"] == 0
 
     def test_get_direction(self, mock_lights_handler):
         """Test direction calculation from coordinates."""
@@ -357,8 +506,45 @@ class TestODASDoASSLProcessor:
             json_data = json.dumps(sample_potential_data).encode("utf-8")
             processor._process_json_data(json_data, "potential", mock_file)
 
-            assert 0 in processor.potential_sources
-            assert processor.potential_sources[0] == sample_potential_data
+            recent = processor.potential_sources.recent()
+            assert len(processor.potential_sources) == 1
+            assert recent["x"][0] == sample_potential_data["x"]
+            assert recent["y"][0] == sample_potential_data["y"]
+            assert recent["E"][0] == sample_potential_data["activity"]
+
+    def test_process_json_data_logs_one_record_per_frame(self, mock_lights_handler):
+        """Test that a frame is logged as a single record with all its sources."""
+        with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
+            processor = ODASDoASSLProcessor(mock_lights_handler)
+            mock_log = MagicMock()
+
+            data1 = {"id": 1, "x": 1.0, "y": 0.0, "z": 0.0, "activity": 0.8}
+            data2 = {"id": 0, "x": 0.0, "y": 1.0, "z": 0.0, "activity": 0.0}
+            json_data = (json.dumps(data1) + json.dumps(data2)).encode("utf-8")
+            processor._process_json_data(json_data, "tracked", mock_log)
+
+            mock_log.write_record.assert_called_once()
+            record = mock_log.write_record.call_args[0][0]
+            # Inactive tracked sources (id 0) are not logged
+            assert record["sources"] == [data1]
+            assert "timestamp" in record
+            mock_log.write.assert_not_called()
+
+    def test_process_json_data_potential_is_bounded(self, mock_lights_handler):
+        """Test that potential sources never grow beyond the configured capacity."""
+        with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
+            processor = ODASDoASSLProcessor(
+                mock_lights_handler, potential_sources_config={"capacity": 8}
+            )
+            mock_file = StringIO()
+
+            frame = "".join(
+                json.dumps({"x": 1.0, "y": 0.0, "z": 0.0, "E": 0.5}) for _ in range(4)
+            ).encode("utf-8")
+            for _ in range(10):
+                processor._process_json_data(frame, "potential", mock_file)
+
+            assert len(processor.potential_sources) == 8
 
     def test_process_json_data_multiple_objects(self, mock_lights_handler):
         """Test processing JSON data with multiple objects."""
@@ -376,6 +562,55 @@ class TestODASDoASSLProcessor:
             assert 1 in processor.tracked_sources
             assert 2 in processor.tracked_sources
 
+    def test_process_json_data_odas_frame_wrapper(self, mock_lights_handler):
+        """Test that all sources of a wrapped ODAS frame are parsed, including the first."""
+        with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
+            processor = ODASDoASSLProcessor(mock_lights_handler)
+            frame = {
+                "timeStamp": 42,
+                "src": [
+                    {"id": 3, "x": 1.0, "y": 0.0, "z": 0.0, "activity": 0.9},
+                    {"id": 0, "x": 0.0, "y": 0.0, "z": 0.0, "activity": 0.0},
+                    {"id": 5, "x": 0.0, "y": 1.0, "z": 0.0, "activity": 0.4},
+                    {"id": 0, "x": 0.0, "y": 0.0, "z": 0.0, "activity": 0.0},
+                ],
+            }
+
+            processor._process_json_data(
+                json.dumps(frame, indent=4).encode("utf-8"), "tracked", StringIO()
+            )
+
+            assert set(processor.tracked_sources) == {3, 5}
+
+    def test_tracked_frame_listener_receives_slots(self, mock_lights_handler):
+        """Test that tracked frame listeners get all slots in ODAS order."""
+        with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
+            processor = ODASDoASSLProcessor(mock_lights_handler)
+            listener = Mock()
+            failing_listener = Mock(side_effect=RuntimeError("listener failed"))
+            processor.add_tracked_frame_listener(failing_listener)
+            processor.add_tracked_frame_listener(listener)
+            sources = [
+                {"id": 0, "x": 0.0, "y": 0.0, "z": 0.0, "activity": 0.0},
+                {"id": 8, "x": 0.0, "y": 1.0, "z": 0.0, "activity": 0.7},
+            ]
+            frame = {"timeStamp": 1, "src": sources}
+
+            processor._process_json_data(
+                json.dumps(frame).encode("utf-8"), "tracked", StringIO()
+            )
+            processor._process_json_data(
+                json.dumps(sources[0]).encode("utf-8"), "potential", StringIO()
+            )
+
+            listener.assert_called_once_with(sources)
+
+            processor.remove_tracked_frame_listener(listener)
+            processor._process_json_data(
+                json.dumps(frame).encode("utf-8"), "tracked", StringIO()
+            )
+            listener.assert_called_once()
+
     def test_process_json_data_limit_to_top_4(self, mock_lights_handler):
         """Test processing JSON data limits to top 4 sources by activity."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
@@ -423,22 +658,43 @@ class TestODASDoASSLProcessor:
             # Should not crash and should not add any sources
             assert len(processor.tracked_sources) == 0
 
-    def test_process_json_data_exception(self, mock_lights_handler, caplog):
-        """Test processing JSON data with exception."""
+    def test_process_json_data_publishes_doa_sources(self, mock_lights_handler):
+        """Test that tracked frames publish azimuths without calling the animation."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
             processor = ODASDoASSLProcessor(mock_lights_handler)
             mock_file = StringIO()
 
-            # Mock the lights handler to raise an exception
-            processor.lights_handler.animation.update_sources.side_effect = Exception(
-                "Test error"
+            tracked = json.dumps(
+                {"id": 1, "x": 0.0, "y": 1.0, "z": 0.0, "activity": 0.8}
+            ).encode("utf-8")
+            potential = json.dumps({"x": 1.0, "y": 0.0, "z": 0.0, "E": 0.5}).encode(
+                "utf-8"
             )
+            processor._process_json_data(tracked, "tracked", mock_file)
+            processor._process_json_data(potential, "potential", mock_file)
+
+            version, azimuths = processor.doa_sources.read()
+            assert version == 1
+            assert azimuths == {1: pytest.approx(90.0)}
+            mock_lights_handler.animation.update_sources.assert_not_called()
+
+    def test_process_json_data_exception(self, mock_lights_handler, caplog):
+        """Test processing JSON data with exception."""
+        with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
+            processor = ODASDoASSLProcessor(mock_lights_handler)
+            mock_file = StringIO()
 
             json_data = json.dumps(
                 {"id": 1, "x": 1.0, "y": 0.0, "z": 0.0, "activity": 0.8}
             ).encode("utf-8")
 
-            with caplog.at_level(logging.ERROR):
+            # Make publishing the azimuths raise an exception
+            with (
+                patch.object(
+                    processor, "_sources_azimuths", side_effect=Exception("Test error")
+                ),
+                caplog.at_level(logging.ERROR),
+            ):
                 processor._process_json_data(json_data, "tracked", mock_file)
                 # Should log the error
                 assert "Error processing JSON data: Test error" in caplog.text
@@ -474,6 +730,22 @@ class TestODASDoASSLProcessor:
             assert processor.odas_process == mock_process
             mock_popen.assert_called_once()
 
+    @patch("hexapod.odas.odas_doa_ssl_processor.subprocess.Popen")
+    def test_start_odas_process_custom_config(
+        self, mock_popen, mock_lights_handler, tmp_path
+    ):
+        """Test starting ODAS with another configuration, e.g. the capture hub's."""
+        config_path = tmp_path / "hub.cfg"
+        config_path.write_text("")
+        with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
+            processor = ODASDoASSLProcessor(
+                mock_lights_handler, config_path=config_path
+            )
+
+            processor.start_odas_process()
+
+            assert mock_popen.call_args[0][0] == ["odas", "-c", str(config_path)]
+
     @patch("hexapod.odas.odas_doa_ssl_processor.subprocess.Popen")
     def test_start_odas_process_config_not_found(self, mock_popen, mock_lights_handler):
         """Test starting ODAS process when config file not found."""
@@ -492,23 +764,18 @@ class TestODASDoASSLProcessor:
         """Test monitoring ODAS output."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
             processor = ODASDoASSLProcessor(mock_lights_handler)
+            stdout_read, stdout_write = os.pipe()
+            os.write(stdout_write, b"ODAS output line\n")
+            os.close(stdout_write)
+
             mock_process = MagicMock()
-            mock_process.poll.return_value = None
-            mock_process.stdout.readline.return_value = "ODAS output line"
-            mock_process.stderr.readline.return_value = None
+            mock_process.stdout = os.fdopen(stdout_read, "rb")
+            mock_process.stderr = None
             processor.odas_process = mock_process
-
-            # Set running to True to enter the loop, but set stop_event to exit after one iteration
             processor.running = True
-            mock_stop_event = MagicMock()
-            mock_stop_event.is_set.side_effect = [
-                False,
-                True,
-            ]  # First call False, second call True
-            processor.stop_event = mock_stop_event
 
             with caplog.at_level(logging.INFO):
-                processor._monitor_odas_output()
+                asyncio.run(processor._monitor_odas_output())
                 # Should log the output line
                 assert "ODAS output line" in caplog.text
 
@@ -516,25 +783,8 @@ class TestODASDoASSLProcessor:
         """Test monitoring ODAS output with connection error."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
             processor = ODASDoASSLProcessor(mock_lights_handler)
-            mock_process = MagicMock()
-            mock_process.poll.return_value = None
-            mock_process.stdout.readline.return_value = "Cannot connect to server"
-            mock_process.stderr.readline.return_value = None
-            processor.odas_process = mock_process
-
-            # Set running to False to exit the loop quickly after one iteration
-            original_running = processor.running
-            processor.running = True
-
-            # Mock the stop_event to return False initially, then True to exit
-            mock_stop_event = MagicMock()
-            mock_stop_event.is_set.side_effect = [
-                False,
-                True,
-            ]  # First call False, second call True
-            processor.stop_event = mock_stop_event
 
-            processor._monitor_odas_output()
+            processor._handle_odas_stdout("Cannot connect to server")
 
             # The connection error should disable GUI forwarding
             assert processor.gui_manager.forward_to_gui is False
@@ -576,16 +826,13 @@ class TestODASDoASSLProcessor:
             # Should not raise exception
             processor._close_odas_process()
 
-    @patch("hexapod.odas.odas_doa_ssl_processor.threading.Thread")
     @patch("hexapod.odas.odas_doa_ssl_processor.subprocess.Popen")
-    def test_start_method(self, mock_popen, mock_thread_class, mock_lights_handler):
+    def test_start_method(self, mock_popen, mock_lights_handler):
         """Test the start method."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
             processor = ODASDoASSLProcessor(mock_lights_handler)
             mock_process = MagicMock()
             mock_popen.return_value = mock_process
-            mock_thread = MagicMock()
-            mock_thread_class.return_value = mock_thread
 
             # Mock the server creation
             with patch.object(processor, "start_server") as mock_start_server:
@@ -596,15 +843,18 @@ class TestODASDoASSLProcessor:
                 with patch(
                     "hexapod.odas.odas_doa_ssl_processor.Path.exists", return_value=True
                 ):
-                    # Mock the accept_and_handle_data to prevent hanging
+                    # Mock the event loop to prevent hanging
                     with patch.object(
-                        processor, "accept_and_handle_data"
-                    ) as mock_accept:
+                        processor, "_run_event_loop", new_callable=AsyncMock
+                    ) as mock_run_loop:
                         processor.start()
 
             # Verify lights handler methods were called
             mock_lights_handler.odas_loading.assert_called_once()
-            mock_lights_handler.direction_of_arrival.assert_called_once()
+            # The DoA animation is switched on by the event loop once ODAS is ready
+            mock_lights_handler.direction_of_arrival.assert_not_called()
+            mock_run_loop.assert_awaited_once()
+            assert "process_started" in processor.startup_latencies
 
     def test_close_method(self, mock_lights_handler):
         """Test the close method."""
@@ -625,71 +875,97 @@ class TestODASDoASSLProcessor:
             processor.gui_manager.close.assert_called_once()
             processor._close_odas_process.assert_called_once()
 
-    def test_handle_odas_data_timeout(self, mock_lights_handler):
-        """Test handling ODAS data with timeout."""
+    @staticmethod
+    def _run_handle_odas_data(processor, client_type, payload=b"", exception=None):
+        """Run handle_odas_data against an in-memory stream reader."""
+
+        async def _run():
+            reader = asyncio.StreamReader()
+            if payload:
+                reader.feed_data(payload)
+            if exception is not None:
+                reader.set_exception(exception)
+            else:
+                reader.feed_eof()
+            writer = MagicMock()
+            await processor.handle_odas_data(reader, writer, client_type)
+            return writer
+
+        return asyncio.run(_run())
+
+    def test_handle_odas_data_stops_when_not_running(self, mock_lights_handler):
+        """Test handling ODAS data when the processor is no longer running."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
             processor = ODASDoASSLProcessor(mock_lights_handler)
-            mock_socket = MagicMock()
-            mock_socket.recv.side_effect = socket.timeout()
             processor.running = False  # Stop immediately
 
-            # Should not raise exception
-            processor.handle_odas_data(mock_socket, "tracked")
+            test_data = json.dumps({"id": 1, "x": 1.0, "y": 0.0}).encode("utf-8")
+            writer = self._run_handle_odas_data(
+                processor, "tracked", struct.pack("I", len(test_data)) + test_data
+            )
+
+            assert processor.tracked_sources == {}
+            writer.close.assert_called_once()
 
     def test_handle_odas_data_connection_reset(self, mock_lights_handler):
         """Test handling ODAS data with connection reset."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
             processor = ODASDoASSLProcessor(mock_lights_handler)
-            mock_socket = MagicMock()
-            mock_socket.recv.side_effect = ConnectionResetError()
-            processor.running = False  # Stop immediately
 
             # Should not raise exception
-            processor.handle_odas_data(mock_socket, "tracked")
+            writer = self._run_handle_odas_data(
+                processor, "tracked", exception=ConnectionResetError()
+            )
+
+            writer.close.assert_called_once()
 
     def test_handle_odas_data_broken_pipe(self, mock_lights_handler):
         """Test handling ODAS data with broken pipe."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
             processor = ODASDoASSLProcessor(mock_lights_handler)
-            mock_socket = MagicMock()
-            mock_socket.recv.side_effect = BrokenPipeError()
-            processor.running = False  # Stop immediately
 
             # Should not raise exception
-            processor.handle_odas_data(mock_socket, "tracked")
+            writer = self._run_handle_odas_data(
+                processor, "tracked", exception=BrokenPipeError()
+            )
+
+            writer.close.assert_called_once()
 
     def test_handle_odas_data_empty_data(self, mock_lights_handler):
         """Test handling ODAS data with empty data."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
             processor = ODASDoASSLProcessor(mock_lights_handler)
-            mock_socket = MagicMock()
-            mock_socket.recv.return_value = b""  # Empty data
-            processor.running = False  # Stop immediately
 
             # Should not raise exception
-            processor.handle_odas_data(mock_socket, "tracked")
+            writer = self._run_handle_odas_data(processor, "tracked")
 
-    def test_accept_and_handle_data_timeout(self, mock_lights_handler):
-        """Test accept and handle data with timeout."""
+            writer.close.assert_called_once()
+
+    def test_handle_odas_data_partial_frame(self, mock_lights_handler):
+        """Test handling ODAS data when the connection closes mid-frame."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
             processor = ODASDoASSLProcessor(mock_lights_handler)
-            mock_server = MagicMock()
-            mock_server.accept.side_effect = socket.timeout()
-            processor.running = False  # Stop immediately
 
-            # Should not raise exception
-            processor.accept_and_handle_data(mock_server, "tracked")
+            self._run_handle_odas_data(
+                processor, "tracked", struct.pack("I", 100) + b'{"id": 1'
+            )
+
+            assert processor.tracked_sources == {}
 
-    def test_accept_and_handle_data_exception(self, mock_lights_handler):
-        """Test accept and handle data with exception."""
+    def test_run_event_loop_stops_on_stop_event(self, mock_lights_handler):
+        """Test that the event loop exits once the external stop event is set."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
             processor = ODASDoASSLProcessor(mock_lights_handler)
-            mock_server = MagicMock()
-            mock_server.accept.side_effect = Exception("Test error")
-            processor.running = False  # Stop immediately
+            processor.tracked_sources_server = processor.start_server(0, "tracked")
+            processor.potential_sources_server = processor.start_server(0, "potential")
+            processor.stop_event = threading.Event()
+            processor.stop_event.set()
 
-            # Should not raise exception
-            processor.accept_and_handle_data(mock_server, "tracked")
+            asyncio.run(processor._run_event_loop())
+
+            assert processor.loop is None
+            assert processor.tracked_sources_server.fileno() == -1
+            assert processor.potential_sources_server.fileno() == -1
 
     def test_constants_and_defaults(self, mock_lights_handler):
         """Test that constants and defaults are properly set."""
@@ -732,7 +1008,7 @@ class TestODASDoASSLProcessor:
 
             # Mock the open function to raise an exception
             with patch(
-                "hexapod.odas.odas_doa_ssl_processor.open",
+                "hexapod.odas.session_log_writer.open",
                 side_effect=IOError("Permission denied"),
             ):
                 processor.data_manager.tracked_log = None
@@ -748,6 +1024,7 @@ class TestODASDoASSLProcessor:
 
                 # Test that DummyFile methods work without error
                 processor.data_manager.tracked_log.write("test message")
+                processor.data_manager.tracked_log.write_record({"sources": []})
                 processor.data_manager.tracked_log.flush()
                 processor.data_manager.tracked_log.close()
 
@@ -820,41 +1097,42 @@ class TestODASDoASSLProcessor:
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
             processor = ODASDoASSLProcessor(mock_lights_handler)
 
-            # Create mock socket
-            mock_socket = MagicMock(spec=socket.socket)
-
             # Create test data
             test_data = json.dumps(
                 {"id": 1, "x": 1.0, "y": 0.0, "z": 0.0, "activity": 0.8}
             ).encode("utf-8")
             size_bytes = struct.pack("I", len(test_data))
-
-            # Configure socket to return data then close
-            mock_socket.recv.side_effect = [
-                size_bytes,  # Size
-                test_data,  # Data
-                b"",  # Empty data to break loop
-            ]
-
-            # Mock the stop_event to allow one iteration
-            mock_stop_event = MagicMock()
-            mock_stop_event.is_set.side_effect = [
-                False,
-                False,
-                True,
-            ]  # Allow 2 iterations then stop
-            processor.stop_event = mock_stop_event
             processor.running = True
 
             # Mock GUI manager forwarding
             with patch.object(processor.gui_manager, "forward_data") as mock_forward:
-                processor.handle_odas_data(mock_socket, "tracked")
+                self._run_handle_odas_data(processor, "tracked", size_bytes + test_data)
 
                 # Verify data was processed and forwarded
-                mock_forward.assert_called_once()
+                mock_forward.assert_called_once_with(size_bytes + test_data, "tracked")
                 assert len(processor.tracked_sources) == 1
                 assert processor.tracked_sources[1]["x"] == 1.0
 
+    def test_handle_odas_data_captures_session(self, mock_lights_handler, tmp_path):
+        """Test that received frames are written to the session capture."""
+        with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
+            capture_path = tmp_path / "session.odascap"
+            processor = ODASDoASSLProcessor(
+                mock_lights_handler, session_capture_path=capture_path
+            )
+            processor.gui_manager.forward_to_gui = False
+
+            test_data = json.dumps({"id": 1, "x": 1.0, "y": 0.0}).encode("utf-8")
+            self._run_handle_odas_data(
+                processor, "tracked", struct.pack("I", len(test_data)) + test_data
+            )
+            processor.close()
+
+            frames = list(read_session(capture_path))
+            assert [(f.client_type, f.payload) for f in frames] == [
+                ("tracked", test_data)
+            ]
+
     def test_handle_odas_data_with_gui_disabled(self, mock_lights_handler):
         """Test ODAS data handling when GUI forwarding is disabled."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
@@ -863,76 +1141,182 @@ class TestODASDoASSLProcessor:
             # Disable GUI forwarding
             processor.gui_manager.forward_to_gui = False
 
-            # Create mock socket
-            mock_socket = MagicMock(spec=socket.socket)
             test_data = json.dumps(
                 {"id": 1, "x": 1.0, "y": 0.0, "z": 0.0, "activity": 0.8}
             ).encode("utf-8")
             size_bytes = struct.pack("I", len(test_data))
-
-            mock_socket.recv.side_effect = [size_bytes, test_data, b""]
-
-            mock_stop_event = MagicMock()
-            mock_stop_event.is_set.side_effect = [False, False, True]
-            processor.stop_event = mock_stop_event
             processor.running = True
 
             with patch.object(processor.gui_manager, "forward_data") as mock_forward:
-                processor.handle_odas_data(mock_socket, "tracked")
+                self._run_handle_odas_data(processor, "tracked", size_bytes + test_data)
 
                 # GUI forwarding should not be called
                 mock_forward.assert_not_called()
                 # But data should still be processed
                 assert len(processor.tracked_sources) == 1
 
-    def test_accept_and_handle_data_success(self, mock_lights_handler):
-        """Test successful data acceptance and handling."""
+    def test_run_event_loop_receives_from_both_servers(self, mock_lights_handler):
+        """Test that tracked and potential streams are served by the same loop."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
             processor = ODASDoASSLProcessor(mock_lights_handler)
+            processor.gui_manager.forward_to_gui = False
+            processor.debug_mode = False
+            processor.tracked_sources_server = processor.start_server(0, "tracked")
+            processor.potential_sources_server = processor.start_server(0, "potential")
+            tracked_port = processor.tracked_sources_server.getsockname()[1]
+            potential_port = processor.potential_sources_server.getsockname()[1]
 
-            # Create mock server socket
-            mock_server = MagicMock(spec=socket.socket)
-            mock_client = MagicMock(spec=socket.socket)
-            mock_server.accept.return_value = (mock_client, ("127.0.0.1", 12345))
+            loop_thread = threading.Thread(
+                target=lambda: asyncio.run(processor._run_event_loop())
+            )
+            loop_thread.start()
+
+            tracked = json.dumps({"id": 2, "x": 0.0, "y": 1.0}).encode("utf-8")
+            potential = json.dumps({"x": 1.0, "y": 0.0, "E": 0.5}).encode("utf-8")
+            clients = []
+            try:
+                for port, payload in (
+                    (tracked_port, tracked),
+                    (potential_port, potential),
+                ):
+                    client = socket.create_connection(("127.0.0.1", port))
+                    client.sendall(struct.pack("I", len(payload)) + payload)
+                    clients.append(client)
 
-            # Mock the handle_odas_data method to prevent hanging
-            with patch.object(processor, "handle_odas_data") as mock_handle:
-                # Set up stop conditions
-                processor.running = False
-                processor.stop_event = MagicMock(spec=threading.Event)
-                processor.stop_event.is_set.return_value = True
+                deadline = time.time() + 5
+                while time.time() < deadline and (
+                    not processor.tracked_sources or not processor.potential_sources
+                ):
+                    time.sleep(0.01)
+
+                assert processor.get_tracked_sources_azimuths() == {2: 90.0}
+                assert processor.potential_sources.recent()["E"].tolist() == [0.5]
+            finally:
+                processor.close()
+                loop_thread.join(timeout=5)
+                for client in clients:
+                    client.close()
+
+            assert not loop_thread.is_alive()
+            assert processor.loop is None
+
+    @staticmethod
+    def _start_loop_thread(processor):
+        """Serve the processor's event loop on ephemeral ports in a thread."""
+        processor.gui_manager.forward_to_gui = False
+        processor.debug_mode = False
+        processor.tracked_sources_server = processor.start_server(0, "tracked")
+        processor.potential_sources_server = processor.start_server(0, "potential")
+        loop_thread = threading.Thread(
+            target=lambda: asyncio.run(processor._run_event_loop())
+        )
+        loop_thread.start()
+        return loop_thread
+
+    def test_run_event_loop_signals_readiness(self, mock_lights_handler):
+        """Test readiness once both streams connected and the first frame arrived."""
+        with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
+            processor = ODASDoASSLProcessor(mock_lights_handler)
+            processor._startup_time = time.monotonic()
+            loop_thread = self._start_loop_thread(processor)
+
+            clients = []
+            try:
+                for server in (
+                    processor.tracked_sources_server,
+                    processor.potential_sources_server,
+                ):
+                    clients.append(
+                        socket.create_connection(("127.0.0.1", server.getsockname()[1]))
+                    )
+                assert not processor.wait_until_ready(timeout=0.2)
 
-                processor.accept_and_handle_data(mock_server, "tracked")
+                payload = json.dumps({"id": 1, "x": 1.0, "y": 0.0}).encode("utf-8")
+                clients[0].sendall(struct.pack("I", len(payload)) + payload)
 
-                # Should not call handle_odas_data since running is False
-                mock_handle.assert_not_called()
+                assert processor.wait_until_ready(timeout=5)
+                mock_lights_handler.direction_of_arrival.assert_called_once_with(
+                    sources=processor.doa_sources
+                )
+                assert set(processor.startup_latencies) >= {
+                    "tracked_connected",
+                    "potential_connected",
+                    "first_frame",
+                }
+                assert (
+                    processor.startup_latencies["first_frame"]
+                    >= processor.startup_latencies["tracked_connected"]
+                )
+            finally:
+                processor.close()
+                loop_thread.join(timeout=5)
+                for client in clients:
+                    client.close()
+
+    def test_run_event_loop_ready_from_odas_stdout(self, mock_lights_handler):
+        """Test readiness reported by ODAS on stdout before any connection."""
+        with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
+            processor = ODASDoASSLProcessor(mock_lights_handler)
+            processor._startup_time = time.monotonic()
+            loop_thread = self._start_loop_thread(processor)
+
+            try:
+                deadline = time.time() + 5
+                while processor.loop is None and time.time() < deadline:
+                    time.sleep(0.01)
+                processor.loop.call_soon_threadsafe(
+                    processor._handle_odas_stdout,
+                    "| + Launch threads................... [Done]",
+                )
 
-    def test_accept_and_handle_data_with_connection(self, mock_lights_handler):
-        """Test data acceptance with actual connection."""
-        with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
-            processor = ODASDoASSLProcessor(mock_lights_handler)
+                assert processor.wait_until_ready(timeout=5)
+                assert "odas_ready" in processor.startup_latencies
+                mock_lights_handler.direction_of_arrival.assert_called_once_with(
+                    sources=processor.doa_sources
+                )
+            finally:
+                processor.close()
+                loop_thread.join(timeout=5)
+
+    def test_run_event_loop_readiness_timeout(self, mock_lights_handler, caplog):
+        """Test that a phase timeout is reported and readiness still follows later."""
+        with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
+            processor = ODASDoASSLProcessor(mock_lights_handler, connect_timeout=0.05)
+            processor._startup_time = time.monotonic()
+            loop_thread = self._start_loop_thread(processor)
+
+            clients = []
+            try:
+                assert not processor.wait_until_ready(timeout=0.2)
+                assert "no connections within 0.1 s" in caplog.text
+                mock_lights_handler.direction_of_arrival.assert_not_called()
+
+                for server in (
+                    processor.tracked_sources_server,
+                    processor.potential_sources_server,
+                ):
+                    clients.append(
+                        socket.create_connection(("127.0.0.1", server.getsockname()[1]))
+                    )
+                payload = json.dumps({"x": 1.0, "y": 0.0, "E": 0.5}).encode("utf-8")
+                clients[1].sendall(struct.pack("I", len(payload)) + payload)
 
-            # Create mock server socket
-            mock_server = MagicMock(spec=socket.socket)
-            mock_client = MagicMock(spec=socket.socket)
-            mock_server.accept.return_value = (mock_client, ("127.0.0.1", 12345))
+                assert processor.wait_until_ready(timeout=5)
+            finally:
+                processor.close()
+                loop_thread.join(timeout=5)
+                for client in clients:
+                    client.close()
 
-            # Mock the handle_odas_data method
-            with patch.object(processor, "handle_odas_data") as mock_handle:
-                # Set up to allow one connection then stop
-                processor.running = True
-                mock_stop_event = MagicMock(spec=threading.Event)
-                mock_stop_event.is_set.side_effect = [
-                    False,
-                    True,
-                ]  # First call False, second True
-                processor.stop_event = mock_stop_event
+    def test_mark_startup_phase_without_start(self, mock_lights_handler):
+        """Test that startup phases are ignored when start() was not called."""
+        with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
+            processor = ODASDoASSLProcessor(mock_lights_handler)
 
-                processor.accept_and_handle_data(mock_server, "tracked")
+            processor._mark_startup_phase("first_frame")
 
-                # Should accept connection and call handle_odas_data
-                mock_server.accept.assert_called_once()
-                mock_handle.assert_called_once_with(mock_client, "tracked")
+            assert processor.startup_latencies == {}
+            assert not processor.ready_event.is_set()
 
     def test_start_odas_process_with_config_read_error(
         self, mock_lights_handler, caplog
@@ -961,37 +1345,29 @@ class TestODASDoASSLProcessor:
         """Test monitoring ODAS output with stderr content."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
             processor = ODASDoASSLProcessor(mock_lights_handler)
+            stderr_read, stderr_write = os.pipe()
+            os.write(stderr_write, b"ODAS error message\n")
+            os.close(stderr_write)
+
             mock_process = MagicMock()
-            mock_process.poll.return_value = None
-            mock_process.stdout.readline.return_value = None
-            mock_process.stderr.readline.return_value = "ODAS error message"
+            mock_process.stdout = None
+            mock_process.stderr = os.fdopen(stderr_read, "rb")
             processor.odas_process = mock_process
-
-            # Set up to allow one iteration then stop
             processor.running = True
-            mock_stop_event = MagicMock()
-            mock_stop_event.is_set.side_effect = [False, True]
-            processor.stop_event = mock_stop_event
 
             with caplog.at_level(logging.ERROR):
-                processor._monitor_odas_output()
+                asyncio.run(processor._monitor_odas_output())
                 # Should log the stderr content
                 assert "ODAS error message" in caplog.text
 
-    def test_monitor_odas_output_with_process_termination(
-        self, mock_lights_handler, caplog
-    ):
-        """Test monitoring ODAS output when process terminates."""
+    def test_monitor_odas_output_without_process(self, mock_lights_handler):
+        """Test monitoring ODAS output when no process is running."""
         with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
             processor = ODASDoASSLProcessor(mock_lights_handler)
-            mock_process = MagicMock()
-            mock_process.poll.return_value = 0  # Process terminated
-            processor.odas_process = mock_process
-
-            processor._monitor_odas_output()
+            processor.odas_process = None
 
-            # The process cleanup might not happen in the mock
-            # Just verify the method executed without error
+            # Should return immediately without error
+            asyncio.run(processor._monitor_odas_output())
 
     def test_close_socket_error_handling(self, mock_lights_handler):
         """Test socket close error handling."""
@@ -1077,7 +1453,7 @@ class TestODASDoASSLProcessor:
                 patch(
                     "hexapod.odas.odas_doa_ssl_processor.Path.exists", return_value=True
                 ),
-                patch.object(processor, "accept_and_handle_data"),
+                patch.object(processor, "_run_event_loop", new_callable=AsyncMock),
             ):
 
                 mock_start_server.return_value = MagicMock()
@@ -1210,3 +1586,78 @@ class TestODASDoASSLProcessor:
             assert processor.data_manager.tracked_log is not None
             assert processor.data_manager.potential_log is not None
             assert len(processor.data_manager.log_files) == 2
+
+    def test_process_json_data_updates_tracked_history(self, mock_lights_handler):
+        """Test that tracked frames feed the per-source history."""
+        with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
+            processor = ODASDoASSLProcessor(mock_lights_handler, debug_mode=False)
+            mock_file = StringIO()
+
+            json_data = json.dumps(
+                {"id": 3, "x": 0.0, "y": 1.0, "z": 0.0, "activity": 0.9}
+            ).encode("utf-8")
+            processor._process_json_data(json_data, "tracked", mock_file)
+
+            assert len(processor.tracked_history) == 1
+            source_id, azimuth = processor.get_dominant_source()
+            assert source_id == 3
+            assert abs(azimuth - 90.0) < 1e-6
+
+    def test_dominant_source_listener_notified_on_change(self, mock_lights_handler):
+        """Test that listeners are only notified on noticeable dominant source changes."""
+        with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
+            processor = ODASDoASSLProcessor(mock_lights_handler, debug_mode=False)
+            listener = MagicMock()
+            processor.add_dominant_source_listener(listener)
+
+            with patch.object(
+                processor.tracked_history, "dominant_source"
+            ) as mock_dominant:
+                for dominant in [(1, 90.0), (1, 92.0), (1, 100.0), (2, 100.0), None]:
+                    mock_dominant.return_value = dominant
+                    processor._update_dominant_source()
+
+            assert [c.args[0] for c in listener.call_args_list] == [
+                (1, 90.0),
+                (1, 100.0),
+                (2, 100.0),
+                None,
+            ]
+
+    def test_dominant_source_listener_errors_are_logged(
+        self, mock_lights_handler, caplog
+    ):
+        """Test that a failing listener does not break processing."""
+        with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
+            processor = ODASDoASSLProcessor(mock_lights_handler, debug_mode=False)
+            failing = MagicMock(side_effect=Exception("listener failed"))
+            other = MagicMock()
+            processor.add_dominant_source_listener(failing)
+            processor.add_dominant_source_listener(other)
+
+            with patch.object(
+                processor.tracked_history, "dominant_source", return_value=(1, 0.0)
+            ):
+                with caplog.at_level(logging.ERROR):
+                    processor._update_dominant_source()
+
+            other.assert_called_once_with((1, 0.0))
+            assert "Dominant source listener error: listener failed" in caplog.text
+
+    def test_remove_dominant_source_listener(self, mock_lights_handler):
+        """Test removing a dominant source listener."""
+        with patch("hexapod.odas.odas_doa_ssl_processor.get_custom_logger"):
+            processor = ODASDoASSLProcessor(mock_lights_handler)
+            listener = MagicMock()
+            processor.add_dominant_source_listener(listener)
+
+            processor.remove_dominant_source_listener(listener)
+            # Removing an unknown listener is a no-op
+            processor.remove_dominant_source_listener(listener)
+
+            with patch.object(
+                processor.tracked_history, "dominant_source", return_value=(1, 0.0)
+            ):
+                processor._update_dominant_source()
+
+            listener.assert_not_called()
@@ -0,0 +1,74 @@
+"""
+Unit tests for the ODAS session capture format.
+"""
+
+import pytest
+
+from hexapod.odas.odas_session_capture import (
+    CAPTURE_MAGIC,
+    CapturedFrame,
+    ODASSessionRecorder,
+    read_session,
+)
+
+
+class TestODASSessionCapture:
+    """Test cases for ODASSessionRecorder and read_session."""
+
+    def test_record_and_read_roundtrip(self, tmp_path):
+        """Test that recorded frames are read back in order with relative times."""
+        path = tmp_path / "session.odascap"
+        recorder = ODASSessionRecorder(path)
+
+        recorder.record("tracked", b'{"id": 1}', timestamp=100.0)
+        recorder.record("potential", b'{"E": 0.5}', timestamp=100.25)
+        recorder.record("tracked", b"", timestamp=100.5)
+        recorder.close()
+
+        assert recorder.frames == 3
+        assert list(read_session(path)) == [
+            CapturedFrame(0.0, "tracked", b'{"id": 1}'),
+            CapturedFrame(0.25, "potential", b'{"E": 0.5}'),
+            CapturedFrame(0.5, "tracked", b""),
+        ]
+
+    def test_recorder_creates_parent_directory(self, tmp_path):
+        """Test that the capture directory is created."""
+        path = tmp_path / "captures" / "session.odascap"
+
+        recorder = ODASSessionRecorder(path)
+        recorder.close()
+
+        assert path.read_bytes() == CAPTURE_MAGIC
+
+    def test_record_after_close_ignored(self, tmp_path):
+        """Test that frames recorded after close are ignored."""
+        path = tmp_path / "session.odascap"
+        recorder = ODASSessionRecorder(path)
+        recorder.close()
+
+        recorder.record("tracked", b"{}")
+        recorder.close()
+
+        assert list(read_session(path)) == []
+
+    def test_read_session_invalid_file(self, tmp_path):
+        """Test that files without the capture header are rejected."""
+        path = tmp_path / "tracked.jsonl"
+        path.write_bytes(b'{"timestamp": 1}\n')
+
+        with pytest.raises(ValueError):
+            list(read_session(path))
+
+    def test_read_session_truncated_frame(self, tmp_path):
+        """Test that a truncated last frame ends the iteration."""
+        path = tmp_path / "session.odascap"
+        recorder = ODASSessionRecorder(path)
+        recorder.record("tracked", b'{"id": 1}', timestamp=0.0)
+        recorder.record("tracked", b'{"id": 2}', timestamp=0.1)
+        recorder.close()
+        path.write_bytes(path.read_bytes()[:-3])
+
+        frames = list(read_session(path))
+
+        assert [frame.payload for frame in frames] == [b'{"id": 1}']
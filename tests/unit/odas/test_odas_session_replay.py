@@ -0,0 +1,134 @@
+"""
+Unit tests for the ODAS session replay engine.
+"""
+
+import json
+import socket
+import struct
+import threading
+
+import pytest
+
+from hexapod.odas.odas_session_capture import CapturedFrame, ODASSessionRecorder
+from hexapod.odas.odas_session_replay import (
+    ODASSessionReplayer,
+    ReplayStats,
+    run_replay_benchmark,
+)
+
+
+def _make_frames(count, interval=0.01):
+    """Build alternating tracked/potential frames with a source moving around."""
+    frames = []
+    for i in range(count):
+        if i % 2 == 0:
+            payload = {"id": 1, "x": 1.0, "y": i * 0.1, "z": 0.0, "activity": 0.9}
+            client_type = "tracked"
+        else:
+            payload = {"x": 0.0, "y": 1.0, "z": 0.0, "E": 0.4}
+            client_type = "potential"
+        frames.append(
+            CapturedFrame(i * interval, client_type, json.dumps(payload).encode())
+        )
+    return frames
+
+
+class TestODASSessionReplayer:
+    """Test cases for ODASSessionReplayer."""
+
+    def test_invalid_speed(self):
+        """Test that a non-positive speed is rejected."""
+        with pytest.raises(ValueError):
+            ODASSessionReplayer([], speed=0)
+
+    def test_replay_sends_framed_streams(self):
+        """Test that frames are sent with the ODAS size header on their stream."""
+        servers = {}
+        for client_type in ("tracked", "potential"):
+            server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            server.bind(("127.0.0.1", 0))
+            server.listen(1)
+            servers[client_type] = server
+
+        frames = _make_frames(4)
+        replayer = ODASSessionReplayer(
+            frames,
+            tracked_sources_port=servers["tracked"].getsockname()[1],
+            potential_sources_port=servers["potential"].getsockname()[1],
+            speed=None,
+        )
+        sent_streams = []
+        try:
+            replayer.connect()
+            connections = {name: server.accept()[0] for name, server in servers.items()}
+            assert replayer.replay(on_send=sent_streams.append) == 4
+            replayer.close()
+
+            for client_type, connection in connections.items():
+                received = b""
+                while chunk := connection.recv(4096):
+                    received += chunk
+                connection.close()
+                expected = b"".join(
+                    struct.pack("I", len(frame.payload)) + frame.payload
+                    for frame in frames
+                    if frame.client_type == client_type
+                )
+                assert received == expected
+        finally:
+            replayer.close()
+            for server in servers.values():
+                server.close()
+
+        assert sent_streams == ["tracked", "potential", "tracked", "potential"]
+
+    def test_replay_stop_event(self):
+        """Test that the replay stops when the stop event is set."""
+        replayer = ODASSessionReplayer(_make_frames(4), speed=None)
+        replayer._sockets = {"tracked": None, "potential": None}
+        stop_event = threading.Event()
+        stop_event.set()
+
+        assert replayer.replay(stop_event=stop_event) == 0
+
+
+class TestReplayBenchmark:
+    """Test cases for run_replay_benchmark."""
+
+    def test_benchmark_max_speed(self):
+        """Test that every replayed frame is processed and measured."""
+        frames = _make_frames(40)
+
+        stats = run_replay_benchmark(frames, speed=None, loops=2)
+
+        assert isinstance(stats, ReplayStats)
+        assert stats.frames_sent == 80
+        assert stats.frames_processed == 80
+        assert stats.fps > 0
+        assert 0 < stats.latency_p50_ms <= stats.latency_p95_ms
+        assert stats.latency_p95_ms <= stats.latency_max_ms
+        # Every tracked frame publishes the current sources to the LED animation
+        assert stats.led_updates == 40
+        assert stats.doa_updates >= 1
+
+    def test_benchmark_paced_replay(self):
+        """Test that a paced replay takes the recorded time divided by the speed."""
+        frames = _make_frames(11, interval=0.04)
+
+        stats = run_replay_benchmark(frames, speed=2.0)
+
+        assert stats.frames_processed == 11
+        assert stats.duration >= 0.2
+
+    def test_benchmark_from_capture_file(self, tmp_path):
+        """Test replaying a capture file recorded by ODASSessionRecorder."""
+        path = tmp_path / "session.odascap"
+        recorder = ODASSessionRecorder(path)
+        for frame in _make_frames(6):
+            recorder.record(frame.client_type, frame.payload, frame.timestamp)
+        recorder.close()
+
+        stats = run_replay_benchmark(path, speed=None)
+
+        assert stats.frames_processed == 6
+        assert set(stats.as_dict()) >= {"fps", "latency_p95_ms", "led_update_rate"}
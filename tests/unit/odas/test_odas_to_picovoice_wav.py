@@ -3,507 +3,200 @@ Unit tests for ODAS to Picovoice WAV converter.
 """
 
 import pytest
-import tempfile
 import wave
 import numpy as np
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock, call
-import sys
-import time
+from unittest.mock import Mock, patch
 
-from hexapod.odas.odas_to_picovoice_wav import convert_odas_to_wav, main
+from hexapod.odas.odas_to_picovoice_wav import (
+    convert_odas_to_wav,
+    convert_odas_files,
+    read_odas_raw,
+    ConversionResult,
+    BatchConversionResult,
+    main,
+)
+from hexapod.odas.streaming_resampler import resample
 
+RESULT = ConversionResult(Path("input.raw"), Path("output.wav"), 1.0, 0.01)
 
-class TestConvertODASToWAV:
-    """Test cases for convert_odas_to_wav function."""
-
-    @pytest.fixture
-    def temp_input_file(self):
-        """Create a temporary input file for testing."""
-        with tempfile.NamedTemporaryFile(suffix=".raw", delete=False) as f:
-            # Write some sample audio data
-            sample_data = np.random.randint(-32768, 32767, (1000, 4), dtype=np.int16)
-            f.write(sample_data.tobytes())
-            return Path(f.name)
-
-    @pytest.fixture
-    def temp_output_file(self):
-        """Create a temporary output file path for testing."""
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            return Path(f.name)
-
-    @pytest.fixture
-    def mock_odas_processor(self):
-        """Mock ODASAudioProcessor for testing."""
-        mock_processor = Mock()
-        mock_processor.running = True
-        mock_processor.set_audio_callback = Mock()
-        mock_processor.start = Mock()
-        mock_processor.stop = Mock()
-        return mock_processor
-
-    def test_convert_odas_to_wav_success(
-        self, temp_input_file, temp_output_file, mock_odas_processor
-    ):
-        """Test successful conversion of ODAS to WAV."""
-        with (
-            patch(
-                "hexapod.odas.odas_to_picovoice_wav.ODASAudioProcessor",
-                return_value=mock_odas_processor,
-            ),
-            patch("hexapod.odas.odas_to_picovoice_wav.wave.open") as mock_wave_open,
-            patch("hexapod.odas.odas_to_picovoice_wav.time.sleep"),
-        ):
-
-            # Mock the WAV file - wave.open returns the file object directly, not a context manager
-            mock_wav_file = Mock()
-            mock_wave_open.return_value = mock_wav_file
-
-            # Mock file size changes to simulate new data
-            with patch("pathlib.Path.stat") as mock_stat:
-                mock_stat.return_value.st_size = 1000
-
-                # Create a time counter that increments slowly
-                time_counter = [0]
-
-                def mock_time():
-                    time_counter[0] += 0.1
-                    return time_counter[0]
-
-                # Simulate the processor running for a few iterations then stopping
-                call_count = 0
-
-                def stop_processor(*args, **kwargs):
-                    nonlocal call_count
-                    call_count += 1
-                    if call_count >= 3:  # Allow a few iterations
-                        mock_odas_processor.running = False
-
-                with (
-                    patch(
-                        "hexapod.odas.odas_to_picovoice_wav.time.time",
-                        side_effect=mock_time,
-                    ),
-                    patch(
-                        "hexapod.odas.odas_to_picovoice_wav.time.sleep",
-                        side_effect=stop_processor,
-                    ),
-                ):
-                    convert_odas_to_wav(temp_input_file, temp_output_file)
-
-            # Verify ODASAudioProcessor was created with correct parameters
-            from hexapod.odas.odas_to_picovoice_wav import ODASAudioProcessor
-
-            ODASAudioProcessor.assert_called_once()
-            call_args = ODASAudioProcessor.call_args
-            assert call_args[1]["sample_rate"] == 44100
-            assert call_args[1]["channels"] == 4
-            assert call_args[1]["selected_channel"] == 0
-
-            # Verify WAV file was opened and configured
-            mock_wave_open.assert_called_once_with(str(temp_output_file), "wb")
-            # WAV file configuration happens after ODASAudioProcessor creation
-            mock_wav_file.setnchannels.assert_called_once_with(1)
-            mock_wav_file.setsampwidth.assert_called_once_with(2)
-            mock_wav_file.setframerate.assert_called_once_with(16000)
-            mock_wav_file.close.assert_called_once()
-
-            # Verify processor methods were called
-            mock_odas_processor.set_audio_callback.assert_called_once()
-            mock_odas_processor.start.assert_called_once()
-            mock_odas_processor.stop.assert_called_once()
-
-    def test_convert_odas_to_wav_custom_parameters(
-        self, temp_input_file, temp_output_file, mock_odas_processor
-    ):
-        """Test conversion with custom parameters."""
-        with (
-            patch(
-                "hexapod.odas.odas_to_picovoice_wav.ODASAudioProcessor",
-                return_value=mock_odas_processor,
-            ),
-            patch("hexapod.odas.odas_to_picovoice_wav.wave.open") as mock_wave_open,
-            patch("hexapod.odas.odas_to_picovoice_wav.time.sleep"),
-        ):
-
-            # Mock the WAV file
-            mock_wav_file = Mock()
-            mock_wave_open.return_value.__enter__.return_value = mock_wav_file
-
-            # Mock file size changes
-            with patch("pathlib.Path.stat") as mock_stat:
-                mock_stat.return_value.st_size = 1000
-
-                # Create a time counter that starts at 0 and increments
-                time_counter = [0]
-
-                def mock_time():
-                    time_counter[0] += 0.1
-                    return time_counter[0]
-
-                # Simulate the processor stopping after a few iterations
-                def stop_processor(*args, **kwargs):
-                    mock_odas_processor.running = False
-
-                with (
-                    patch(
-                        "hexapod.odas.odas_to_picovoice_wav.time.time",
-                        side_effect=mock_time,
-                    ),
-                    patch(
-                        "hexapod.odas.odas_to_picovoice_wav.time.sleep",
-                        side_effect=stop_processor,
-                    ),
-                ):
-                    convert_odas_to_wav(
-                        temp_input_file,
-                        temp_output_file,
-                        sample_rate=48000,
-                        channels=6,
-                        selected_channel=2,
-                    )
-
-            # Verify ODASAudioProcessor was created with custom parameters
-            from hexapod.odas.odas_to_picovoice_wav import ODASAudioProcessor
-
-            call_args = ODASAudioProcessor.call_args
-            assert call_args[1]["sample_rate"] == 48000
-            assert call_args[1]["channels"] == 6
-            assert call_args[1]["selected_channel"] == 2
-
-    def test_convert_odas_to_wav_timeout(
-        self, temp_input_file, temp_output_file, mock_odas_processor
-    ):
-        """Test conversion timeout handling."""
-        with (
-            patch(
-                "hexapod.odas.odas_to_picovoice_wav.ODASAudioProcessor",
-                return_value=mock_odas_processor,
-            ),
-            patch("hexapod.odas.odas_to_picovoice_wav.wave.open") as mock_wave_open,
-            patch("hexapod.odas.odas_to_picovoice_wav.time.sleep"),
-        ):
-
-            # Mock the WAV file
-            mock_wav_file = Mock()
-            mock_wave_open.return_value.__enter__.return_value = mock_wav_file
-
-            # Mock file size changes
-            with patch("pathlib.Path.stat") as mock_stat:
-                mock_stat.return_value.st_size = 1000
-
-                # Create a time counter that simulates timeout
-                time_counter = [0]
-
-                def mock_time():
-                    time_counter[0] += 15  # Increment by 15 seconds each call
-                    return time_counter[0]
-
-                with patch(
-                    "hexapod.odas.odas_to_picovoice_wav.time.time",
-                    side_effect=mock_time,
-                ):
-                    convert_odas_to_wav(temp_input_file, temp_output_file)
-
-            # Verify processor was stopped due to timeout
-            mock_odas_processor.stop.assert_called_once()
 
-    def test_convert_odas_to_wav_no_change_detection(
-        self, temp_input_file, temp_output_file, mock_odas_processor
-    ):
-        """Test conversion stops when no file size change is detected."""
-        with (
-            patch(
-                "hexapod.odas.odas_to_picovoice_wav.ODASAudioProcessor",
-                return_value=mock_odas_processor,
-            ),
-            patch("hexapod.odas.odas_to_picovoice_wav.wave.open") as mock_wave_open,
-            patch("hexapod.odas.odas_to_picovoice_wav.time.sleep"),
-        ):
-
-            # Mock the WAV file
-            mock_wav_file = Mock()
-            mock_wave_open.return_value.__enter__.return_value = mock_wav_file
-
-            # Mock file size staying constant
-            with patch("pathlib.Path.stat") as mock_stat:
-                mock_stat.return_value.st_size = 1000
-
-                # Create a time counter that increments slowly
-                time_counter = [0]
+def write_raw(path, samples):
+    """Write interleaved int16 samples as ODAS does."""
+    path.write_bytes(np.asarray(samples, dtype="<i2").tobytes())
+    return path
 
-                def mock_time():
-                    time_counter[0] += 0.1
-                    return time_counter[0]
 
-                with patch(
-                    "hexapod.odas.odas_to_picovoice_wav.time.time",
-                    side_effect=mock_time,
-                ):
-                    convert_odas_to_wav(temp_input_file, temp_output_file)
+def read_wav(path):
+    """Read a WAV file into its parameters and int16 samples."""
+    with wave.open(str(path), "rb") as wav:
+        params = (wav.getnchannels(), wav.getsampwidth(), wav.getframerate())
+        samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2")
+    return params, samples.reshape(-1, params[0])
 
-            # Verify processor was stopped due to no change
-            mock_odas_processor.stop.assert_called_once()
 
-    def test_convert_odas_to_wav_audio_callback(
-        self, temp_input_file, temp_output_file, mock_odas_processor
-    ):
-        """Test audio callback functionality."""
-        with (
-            patch(
-                "hexapod.odas.odas_to_picovoice_wav.ODASAudioProcessor",
-                return_value=mock_odas_processor,
-            ),
-            patch("hexapod.odas.odas_to_picovoice_wav.wave.open") as mock_wave_open,
-            patch("hexapod.odas.odas_to_picovoice_wav.time.sleep"),
-        ):
+class TestConvertODASToWAV:
+    """Test cases for convert_odas_to_wav function."""
 
-            # Mock the WAV file - wave.open returns the file object directly, not a context manager
-            mock_wav_file = Mock()
-            mock_wave_open.return_value = mock_wav_file
-
-            # Mock file size changes to simulate new data
-            with patch("pathlib.Path.stat") as mock_stat:
-                mock_stat.return_value.st_size = 1000
-
-                # Create a time counter that increments slowly
-                time_counter = [0]
-
-                def mock_time():
-                    time_counter[0] += 0.1
-                    return time_counter[0]
-
-                # Capture the callback and simulate it being called during conversion
-                captured_callback = None
-
-                def capture_callback(callback):
-                    nonlocal captured_callback
-                    captured_callback = callback
-                    return Mock()
-
-                mock_odas_processor.set_audio_callback.side_effect = capture_callback
-
-                # Simulate the processor running and calling the callback
-                call_count = 0
-
-                def stop_processor(*args, **kwargs):
-                    nonlocal call_count
-                    call_count += 1
-                    if call_count >= 3:  # Allow a few iterations
-                        # Simulate the callback being called during conversion
-                        if captured_callback:
-                            sample_audio = np.array([1, 2, 3, 4], dtype=np.int16)
-                            captured_callback(sample_audio)
-                        mock_odas_processor.running = False
-
-                with (
-                    patch(
-                        "hexapod.odas.odas_to_picovoice_wav.time.time",
-                        side_effect=mock_time,
-                    ),
-                    patch(
-                        "hexapod.odas.odas_to_picovoice_wav.time.sleep",
-                        side_effect=stop_processor,
-                    ),
-                ):
-                    convert_odas_to_wav(temp_input_file, temp_output_file)
-
-            # Verify callback was set
-            mock_odas_processor.set_audio_callback.assert_called_once()
-
-            # Verify WAV file write was called
-            mock_wav_file.writeframes.assert_called()
-
-    def test_convert_odas_to_wav_wav_file_configuration(
-        self, temp_input_file, temp_output_file, mock_odas_processor
-    ):
-        """Test WAV file configuration parameters."""
-        with (
-            patch(
-                "hexapod.odas.odas_to_picovoice_wav.ODASAudioProcessor",
-                return_value=mock_odas_processor,
-            ),
-            patch("hexapod.odas.odas_to_picovoice_wav.wave.open") as mock_wave_open,
-            patch("hexapod.odas.odas_to_picovoice_wav.time.sleep"),
-        ):
+    @pytest.fixture
+    def tone_file(self, tmp_path):
+        """One second of 4-channel audio with a different tone on each channel."""
+        t = np.arange(44100) / 44100
+        samples = np.stack(
+            [8000 * np.sin(2 * np.pi * f * t) for f in (300, 500, 700, 900)], axis=1
+        )
+        return write_raw(tmp_path / "separated.raw", np.rint(samples))
+
+    def test_convert_selected_channel(self, tone_file, tmp_path):
+        """Test that the selected channel is resampled to 16 kHz mono 16-bit."""
+        output_file = tmp_path / "out.wav"
+
+        result = convert_odas_to_wav(tone_file, output_file, selected_channel=2)
+
+        params, samples = read_wav(output_file)
+        assert params == (1, 2, 16000)
+        assert len(samples) == 16000
+        t = np.arange(16000) / 16000
+        expected = 8000 * np.sin(2 * np.pi * 700 * t)
+        np.testing.assert_allclose(samples[100:-100, 0], expected[100:-100], atol=3)
+        assert result.input_file == tone_file
+        assert result.output_file == output_file
+        assert result.audio_seconds == pytest.approx(1.0)
+        assert result.realtime_factor > 1
+
+    def test_matches_batch_resampler(self, tone_file, tmp_path):
+        """Test that the output equals resampling the channel in one pass."""
+        output_file = tmp_path / "out.wav"
+
+        convert_odas_to_wav(tone_file, output_file, selected_channel=1)
+
+        raw = np.fromfile(tone_file, dtype="<i2").reshape(-1, 4)
+        expected = np.rint(resample(raw[:, 1], 44100, 16000)).astype(np.int16)
+        np.testing.assert_array_equal(read_wav(output_file)[1][:, 0], expected)
+
+    def test_convert_several_channels(self, tone_file, tmp_path):
+        """Test that several selected channels are written as one multichannel WAV."""
+        output_file = tmp_path / "out.wav"
+
+        convert_odas_to_wav(tone_file, output_file, selected_channel=[3, 0])
+
+        params, samples = read_wav(output_file)
+        single = tmp_path / "single.wav"
+        convert_odas_to_wav(tone_file, single, selected_channel=3)
+        assert params == (2, 2, 16000)
+        np.testing.assert_array_equal(samples[:, 0], read_wav(single)[1][:, 0])
+
+    def test_custom_parameters(self, tmp_path):
+        """Test conversion of 2-channel 48 kHz audio."""
+        input_file = write_raw(tmp_path / "in.raw", np.full((4800, 2), 1000))
+        output_file = tmp_path / "out.wav"
+
+        result = convert_odas_to_wav(
+            input_file, output_file, sample_rate=48000, channels=2, selected_channel=1
+        )
+
+        params, samples = read_wav(output_file)
+        assert params == (1, 2, 16000)
+        assert len(samples) == 1600
+        assert result.audio_seconds == pytest.approx(0.1)
+
+    def test_partial_trailing_frame_ignored(self, tmp_path):
+        """Test that a recording cut off mid-frame is converted up to the last frame."""
+        input_file = write_raw(tmp_path / "in.raw", np.zeros((441, 4)))
+        with open(input_file, "ab") as f:
+            f.write(b"\x01\x02\x03")
+
+        assert read_odas_raw(input_file).shape == (441, 4)
+        convert_odas_to_wav(input_file, tmp_path / "out.wav")
+        assert len(read_wav(tmp_path / "out.wav")[1]) == 160
+
+    def test_empty_file(self, tmp_path):
+        """Test that an empty recording gives an empty WAV file."""
+        input_file = write_raw(tmp_path / "in.raw", np.zeros((0, 4)))
+
+        result = convert_odas_to_wav(input_file, tmp_path / "out.wav")
+
+        assert result.audio_seconds == 0
+        assert len(read_wav(tmp_path / "out.wav")[1]) == 0
+
+    def test_read_is_memory_mapped(self, tone_file):
+        """Test that the raw file is memory-mapped rather than read."""
+        samples = read_odas_raw(tone_file)
+
+        assert isinstance(samples, np.memmap)
+        assert samples.shape == (44100, 4)
+        assert not samples.flags.writeable
+
+    @pytest.mark.parametrize("selected", [4, -1, [0, 5], []])
+    def test_invalid_channel(self, tone_file, tmp_path, selected):
+        """Test that selecting a missing channel is rejected."""
+        with pytest.raises(ValueError):
+            convert_odas_to_wav(
+                tone_file, tmp_path / "out.wav", selected_channel=selected
+            )
 
-            # Mock the WAV file - wave.open returns the file object directly, not a context manager
-            mock_wav_file = Mock()
-            mock_wave_open.return_value = mock_wav_file
-
-            # Mock file size changes to simulate new data
-            with patch("pathlib.Path.stat") as mock_stat:
-                mock_stat.return_value.st_size = 1000
-
-                # Create a time counter that increments slowly
-                time_counter = [0]
-
-                def mock_time():
-                    time_counter[0] += 0.1
-                    return time_counter[0]
-
-                # Simulate the processor running for a few iterations then stopping
-                call_count = 0
-
-                def stop_processor(*args, **kwargs):
-                    nonlocal call_count
-                    call_count += 1
-                    if call_count >= 3:  # Allow a few iterations
-                        mock_odas_processor.running = False
-
-                with (
-                    patch(
-                        "hexapod.odas.odas_to_picovoice_wav.time.time",
-                        side_effect=mock_time,
-                    ),
-                    patch(
-                        "hexapod.odas.odas_to_picovoice_wav.time.sleep",
-                        side_effect=stop_processor,
-                    ),
-                ):
-                    convert_odas_to_wav(temp_input_file, temp_output_file)
-
-            # Verify WAV file configuration
-            mock_wav_file.setnchannels.assert_called_once_with(1)  # Mono
-            mock_wav_file.setsampwidth.assert_called_once_with(2)  # 16-bit
-            mock_wav_file.setframerate.assert_called_once_with(
-                16000
-            )  # Picovoice sample rate
-
-    def test_convert_odas_to_wav_temp_directory_cleanup(
-        self, temp_input_file, temp_output_file, mock_odas_processor
-    ):
-        """Test that temporary directory is properly cleaned up."""
-        with (
-            patch(
-                "hexapod.odas.odas_to_picovoice_wav.ODASAudioProcessor",
-                return_value=mock_odas_processor,
-            ),
-            patch("hexapod.odas.odas_to_picovoice_wav.wave.open") as mock_wave_open,
-            patch("hexapod.odas.odas_to_picovoice_wav.time.sleep"),
-        ):
+    def test_file_not_found(self, tmp_path):
+        """Test handling of non-existent input file."""
+        with pytest.raises(FileNotFoundError):
+            convert_odas_to_wav(tmp_path / "missing.raw", tmp_path / "out.wav")
 
-            # Mock the WAV file
-            mock_wav_file = Mock()
-            mock_wave_open.return_value.__enter__.return_value = mock_wav_file
-
-            # Mock file size changes
-            with patch("pathlib.Path.stat") as mock_stat:
-                mock_stat.return_value.st_size = 1000
-
-                # Create a time counter that increments slowly
-                time_counter = [0]
-
-                def mock_time():
-                    time_counter[0] += 0.1
-                    return time_counter[0]
-
-                # Simulate the processor stopping after a few iterations
-                def stop_processor(*args, **kwargs):
-                    mock_odas_processor.running = False
-
-                with (
-                    patch(
-                        "hexapod.odas.odas_to_picovoice_wav.time.time",
-                        side_effect=mock_time,
-                    ),
-                    patch(
-                        "hexapod.odas.odas_to_picovoice_wav.time.sleep",
-                        side_effect=stop_processor,
-                    ),
-                ):
-                    convert_odas_to_wav(temp_input_file, temp_output_file)
-
-            # Verify ODASAudioProcessor was created with a temporary directory
-            from hexapod.odas.odas_to_picovoice_wav import ODASAudioProcessor
-
-            call_args = ODASAudioProcessor.call_args
-            assert "odas_dir" in call_args[1]
-            assert isinstance(call_args[1]["odas_dir"], Path)
-
-    def test_convert_odas_to_wav_error_handling(
-        self, temp_input_file, temp_output_file, mock_odas_processor
-    ):
-        """Test error handling during conversion."""
-        with (
-            patch(
-                "hexapod.odas.odas_to_picovoice_wav.ODASAudioProcessor",
-                return_value=mock_odas_processor,
-            ),
-            patch("hexapod.odas.odas_to_picovoice_wav.wave.open") as mock_wave_open,
-            patch("hexapod.odas.odas_to_picovoice_wav.time.sleep"),
-        ):
+        assert not (tmp_path / "out.wav").exists()
 
-            # Mock the WAV file
-            mock_wav_file = Mock()
-            mock_wave_open.return_value.__enter__.return_value = mock_wav_file
-
-            # Mock file size changes
-            with patch("pathlib.Path.stat") as mock_stat:
-                mock_stat.return_value.st_size = 1000
-
-                # Create a time counter that increments slowly
-                time_counter = [0]
-
-                def mock_time():
-                    time_counter[0] += 0.1
-                    return time_counter[0]
-
-                # Simulate the processor stopping after a few iterations
-                def stop_processor(*args, **kwargs):
-                    mock_odas_processor.running = False
-
-                with (
-                    patch(
-                        "hexapod.odas.odas_to_picovoice_wav.time.time",
-                        side_effect=mock_time,
-                    ),
-                    patch(
-                        "hexapod.odas.odas_to_picovoice_wav.time.sleep",
-                        side_effect=stop_processor,
-                    ),
-                ):
-                    convert_odas_to_wav(temp_input_file, temp_output_file)
-
-            # Verify processor was properly stopped even if errors occur
-            mock_odas_processor.stop.assert_called_once()
-
-    def test_convert_odas_to_wav_file_not_found(
-        self, temp_output_file, mock_odas_processor
-    ):
-        """Test handling of non-existent input file."""
-        non_existent_file = Path("/non/existent/file.raw")
 
-        with (
-            patch(
-                "hexapod.odas.odas_to_picovoice_wav.ODASAudioProcessor",
-                return_value=mock_odas_processor,
-            ),
-            patch("hexapod.odas.odas_to_picovoice_wav.wave.open") as mock_wave_open,
-            patch("hexapod.odas.odas_to_picovoice_wav.time.sleep"),
-            patch("hexapod.odas.odas_to_picovoice_wav.time.sleep"),
-        ):
+class TestConvertODASFiles:
+    """Test cases for convert_odas_files function."""
 
-            # Mock the WAV file
-            mock_wav_file = Mock()
-            mock_wave_open.return_value.__enter__.return_value = mock_wav_file
+    @pytest.fixture
+    def input_files(self, tmp_path):
+        """Three short recordings with different levels on channel 0."""
+        files = []
+        for index, level in enumerate((1000, 2000, 3000)):
+            samples = np.zeros((4410 * (index + 1), 4))
+            samples[:, 0] = level
+            files.append(write_raw(tmp_path / f"rec{index}.raw", samples))
+        return files
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_converts_all_files(self, input_files, tmp_path, max_workers):
+        """Test that every file is converted in order, inline or on a process pool."""
+        output_dir = tmp_path / "wav"
+
+        batch = convert_odas_files(input_files, output_dir, max_workers=max_workers)
+
+        assert batch.workers == max_workers
+        assert [result.input_file for result in batch.results] == input_files
+        assert [result.output_file.name for result in batch.results] == [
+            "rec0.wav",
+            "rec1.wav",
+            "rec2.wav",
+        ]
+        for index, result in enumerate(batch.results):
+            samples = read_wav(result.output_file)[1][:, 0]
+            assert len(samples) == 1600 * (index + 1)
+            assert samples[len(samples) // 2] == pytest.approx(
+                1000 * (index + 1), abs=2
+            )
+        assert batch.audio_seconds == pytest.approx(0.6)
+        assert batch.realtime_factor > 0
 
-            # Mock file size changes
-            with patch("pathlib.Path.stat") as mock_stat:
-                mock_stat.return_value.st_size = 1000
+    def test_workers_limited_to_files(self, input_files, tmp_path):
+        """Test that no more workers than files are started."""
+        with patch(
+            "hexapod.odas.odas_to_picovoice_wav.ProcessPoolExecutor"
+        ) as mock_pool:
+            mock_pool.return_value.__enter__.return_value.map.return_value = []
+            batch = convert_odas_files(input_files, tmp_path / "wav", max_workers=8)
 
-                # Simulate the processor stopping after a few iterations
-                def stop_processor(*args, **kwargs):
-                    mock_odas_processor.running = False
+        mock_pool.assert_called_once_with(max_workers=3)
+        assert batch.workers == 3
 
-                with patch(
-                    "hexapod.odas.odas_to_picovoice_wav.time.sleep",
-                    side_effect=stop_processor,
-                ):
-                    convert_odas_to_wav(non_existent_file, temp_output_file)
+    def test_no_files(self, tmp_path):
+        """Test that an empty batch creates the output directory only."""
+        batch = convert_odas_files([], tmp_path / "wav")
 
-            # Verify processor was still stopped
-            mock_odas_processor.stop.assert_called_once()
+        assert batch.results == []
+        assert batch.audio_seconds == 0
+        assert (tmp_path / "wav").is_dir()
 
 
 class TestMain:
@@ -513,7 +206,8 @@ class TestMain:
         """Test main function with default arguments."""
         with (
             patch(
-                "hexapod.odas.odas_to_picovoice_wav.convert_odas_to_wav"
+                "hexapod.odas.odas_to_picovoice_wav.convert_odas_to_wav",
+                return_value=RESULT,
             ) as mock_convert,
             patch(
                 "hexapod.odas.odas_to_picovoice_wav.sys.argv",
@@ -536,7 +230,8 @@ class TestMain:
         """Test main function with custom arguments."""
         with (
             patch(
-                "hexapod.odas.odas_to_picovoice_wav.convert_odas_to_wav"
+                "hexapod.odas.odas_to_picovoice_wav.convert_odas_to_wav",
+                return_value=RESULT,
             ) as mock_convert,
             patch(
                 "hexapod.odas.odas_to_picovoice_wav.sys.argv",
@@ -569,7 +264,8 @@ class TestMain:
         """Test that main function properly manipulates sys.path."""
         with (
             patch(
-                "hexapod.odas.odas_to_picovoice_wav.convert_odas_to_wav"
+                "hexapod.odas.odas_to_picovoice_wav.convert_odas_to_wav",
+                return_value=RESULT,
             ) as mock_convert,
             patch(
                 "hexapod.odas.odas_to_picovoice_wav.sys.argv",
@@ -587,7 +283,8 @@ class TestMain:
         """Test that main function correctly calculates script and project paths."""
         with (
             patch(
-                "hexapod.odas.odas_to_picovoice_wav.convert_odas_to_wav"
+                "hexapod.odas.odas_to_picovoice_wav.convert_odas_to_wav",
+                return_value=RESULT,
             ) as mock_convert,
             patch(
                 "hexapod.odas.odas_to_picovoice_wav.sys.argv",
@@ -613,7 +310,8 @@ class TestMain:
         """Test that main function properly parses command line arguments."""
         with (
             patch(
-                "hexapod.odas.odas_to_picovoice_wav.convert_odas_to_wav"
+                "hexapod.odas.odas_to_picovoice_wav.convert_odas_to_wav",
+                return_value=RESULT,
             ) as mock_convert,
             patch(
                 "hexapod.odas.odas_to_picovoice_wav.sys.argv",
@@ -642,6 +340,29 @@ class TestMain:
             assert call_args[0][3] == 2  # channels
             assert call_args[0][4] == 1  # selected_channel
 
+    def test_main_directory_uses_batch(self, tmp_path):
+        """Test that a directory input converts all raw files in parallel."""
+        (tmp_path / "a.raw").write_bytes(b"")
+        (tmp_path / "b.raw").write_bytes(b"")
+        (tmp_path / "notes.txt").write_bytes(b"")
+        with (
+            patch(
+                "hexapod.odas.odas_to_picovoice_wav.convert_odas_files",
+                return_value=BatchConversionResult([RESULT], 0.5, 2),
+            ) as mock_batch,
+            patch(
+                "hexapod.odas.odas_to_picovoice_wav.sys.argv",
+                ["script.py", str(tmp_path), str(tmp_path / "wav"), "--workers", "2"],
+            ),
+        ):
+
+            main()
+
+            call_args = mock_batch.call_args
+            assert call_args[0][0] == [tmp_path / "a.raw", tmp_path / "b.raw"]
+            assert call_args[0][1] == tmp_path / "wav"
+            assert call_args[1]["max_workers"] == 2
+
     def test_main_help_message(self):
         """Test that main function shows help message for invalid arguments."""
         with (
@@ -692,164 +413,3 @@ class TestMain:
             pytest.raises(SystemExit),
         ):
             main()
-
-
-class TestEdgeCases:
-    """Test edge cases and error conditions."""
-
-    @pytest.fixture
-    def temp_output_file(self):
-        """Create a temporary output file path for testing."""
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            return Path(f.name)
-
-    @pytest.fixture
-    def mock_odas_processor(self):
-        """Mock ODASAudioProcessor for testing."""
-        mock_processor = Mock()
-        mock_processor.running = True
-        mock_processor.set_audio_callback = Mock()
-        mock_processor.start = Mock()
-        mock_processor.stop = Mock()
-        return mock_processor
-
-    def test_convert_odas_to_wav_empty_file(
-        self, temp_output_file, mock_odas_processor
-    ):
-        """Test conversion with empty input file."""
-        with tempfile.NamedTemporaryFile(suffix=".raw", delete=False) as f:
-            empty_file = Path(f.name)
-
-        with (
-            patch(
-                "hexapod.odas.odas_to_picovoice_wav.ODASAudioProcessor",
-                return_value=mock_odas_processor,
-            ),
-            patch("hexapod.odas.odas_to_picovoice_wav.wave.open") as mock_wave_open,
-            patch("hexapod.odas.odas_to_picovoice_wav.time.sleep"),
-            patch("hexapod.odas.odas_to_picovoice_wav.time.sleep"),
-        ):
-
-            # Mock the WAV file
-            mock_wav_file = Mock()
-            mock_wave_open.return_value.__enter__.return_value = mock_wav_file
-
-            # Mock file size changes
-            with patch("pathlib.Path.stat") as mock_stat:
-                mock_stat.return_value.st_size = 0
-
-                # Simulate the processor stopping after a few iterations
-                def stop_processor(*args, **kwargs):
-                    mock_odas_processor.running = False
-
-                with patch(
-                    "hexapod.odas.odas_to_picovoice_wav.time.sleep",
-                    side_effect=stop_processor,
-                ):
-                    convert_odas_to_wav(empty_file, temp_output_file)
-
-            # Verify processor was stopped
-            mock_odas_processor.stop.assert_called_once()
-
-    def test_convert_odas_to_wav_large_file(
-        self, temp_output_file, mock_odas_processor
-    ):
-        """Test conversion with large input file."""
-        with tempfile.NamedTemporaryFile(suffix=".raw", delete=False) as f:
-            large_file = Path(f.name)
-            # Write some sample data
-            sample_data = np.random.randint(-32768, 32767, (10000, 4), dtype=np.int16)
-            f.write(sample_data.tobytes())
-
-        with (
-            patch(
-                "hexapod.odas.odas_to_picovoice_wav.ODASAudioProcessor",
-                return_value=mock_odas_processor,
-            ),
-            patch("hexapod.odas.odas_to_picovoice_wav.wave.open") as mock_wave_open,
-            patch("hexapod.odas.odas_to_picovoice_wav.time.sleep"),
-            patch("hexapod.odas.odas_to_picovoice_wav.time.sleep"),
-        ):
-
-            # Mock the WAV file
-            mock_wav_file = Mock()
-            mock_wave_open.return_value.__enter__.return_value = mock_wav_file
-
-            # Mock file size changes
-            with patch("pathlib.Path.stat") as mock_stat:
-                mock_stat.return_value.st_size = 1000000
-
-                # Simulate the processor stopping after a few iterations
-                def stop_processor(*args, **kwargs):
-                    mock_odas_processor.running = False
-
-                with patch(
-                    "hexapod.odas.odas_to_picovoice_wav.time.sleep",
-                    side_effect=stop_processor,
-                ):
-                    convert_odas_to_wav(large_file, temp_output_file)
-
-            # Verify processor was stopped
-            mock_odas_processor.stop.assert_called_once()
-
-    @pytest.fixture
-    def temp_input_file(self):
-        """Create a temporary input file for testing."""
-        with tempfile.NamedTemporaryFile(suffix=".raw", delete=False) as f:
-            # Write some sample audio data
-            sample_data = np.random.randint(-32768, 32767, (1000, 4), dtype=np.int16)
-            f.write(sample_data.tobytes())
-            return Path(f.name)
-
-    def test_convert_odas_to_wav_processor_error(
-        self, temp_input_file, temp_output_file
-    ):
-        """Test conversion when ODASAudioProcessor raises an error."""
-        with (
-            patch(
-                "hexapod.odas.odas_to_picovoice_wav.ODASAudioProcessor"
-            ) as mock_odas_class,
-            patch("hexapod.odas.odas_to_picovoice_wav.wave.open") as mock_wave_open,
-            patch("hexapod.odas.odas_to_picovoice_wav.time.sleep"),
-            patch("hexapod.odas.odas_to_picovoice_wav.time.sleep"),
-        ):
-
-            # Mock ODASAudioProcessor to raise an error
-            mock_odas_class.side_effect = Exception("Processor error")
-
-            # Mock the WAV file
-            mock_wav_file = Mock()
-            mock_wave_open.return_value.__enter__.return_value = mock_wav_file
-
-            # Mock file size changes
-            with patch("pathlib.Path.stat") as mock_stat:
-                mock_stat.return_value.st_size = 1000
-
-                # The function should handle the error gracefully
-                with pytest.raises(Exception, match="Processor error"):
-                    convert_odas_to_wav(temp_input_file, temp_output_file)
-
-    def test_convert_odas_to_wav_wav_file_error(
-        self, temp_input_file, temp_output_file, mock_odas_processor
-    ):
-        """Test conversion when WAV file operations fail."""
-        with (
-            patch(
-                "hexapod.odas.odas_to_picovoice_wav.ODASAudioProcessor",
-                return_value=mock_odas_processor,
-            ),
-            patch("hexapod.odas.odas_to_picovoice_wav.wave.open") as mock_wave_open,
-            patch("hexapod.odas.odas_to_picovoice_wav.time.sleep"),
-            patch("hexapod.odas.odas_to_picovoice_wav.time.sleep"),
-        ):
-
-            # Mock WAV file to raise an error
-            mock_wave_open.side_effect = Exception("WAV file error")
-
-            # Mock file size changes
-            with patch("pathlib.Path.stat") as mock_stat:
-                mock_stat.return_value.st_size = 1000
-
-                # The function should handle the error gracefully
-                with pytest.raises(Exception, match="WAV file error"):
-                    convert_odas_to_wav(temp_input_file, temp_output_file)
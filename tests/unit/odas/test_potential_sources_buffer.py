@@ -0,0 +1,145 @@
+"""
+Unit tests for the ODAS potential sources buffer.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from hexapod.odas.potential_sources_buffer import PotentialSourcesBuffer
+
+
+class TestPotentialSourcesBuffer:
+    """Test cases for PotentialSourcesBuffer class."""
+
+    def test_init_defaults(self):
+        """Test buffer initialization with default parameters."""
+        buffer = PotentialSourcesBuffer()
+
+        assert buffer.capacity == 4096
+        assert buffer.retention_ms == 5000.0
+        assert len(buffer) == 0
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"capacity": 0}, {"capacity": -1}, {"retention_ms": 0}]
+    )
+    def test_init_invalid_parameters(self, kwargs):
+        """Test that non-positive capacity or retention is rejected."""
+        with pytest.raises(ValueError):
+            PotentialSourcesBuffer(**kwargs)
+
+    def test_append_and_recent(self):
+        """Test appending single sources and reading them back in order."""
+        buffer = PotentialSourcesBuffer(capacity=4)
+
+        buffer.append(1.0, 0.0, 0.0, 0.5, timestamp=10.0)
+        buffer.append(0.0, 1.0, 0.0, 0.7, timestamp=10.1)
+
+        recent = buffer.recent(now=10.2)
+        assert len(buffer) == 2
+        assert recent["x"].tolist() == [1.0, 0.0]
+        assert recent["y"].tolist() == [0.0, 1.0]
+        assert recent["E"].tolist() == [0.5, 0.7]
+        assert recent["timestamp"].tolist() == [10.0, 10.1]
+
+    def test_capacity_overwrites_oldest(self):
+        """Test that the oldest entries are overwritten once the buffer is full."""
+        buffer = PotentialSourcesBuffer(capacity=3)
+
+        for i in range(5):
+            buffer.append(float(i), 0.0, 0.0, 1.0, timestamp=100.0 + i)
+
+        recent = buffer.recent(now=105.0)
+        assert len(buffer) == 3
+        assert recent["x"].tolist() == [2.0, 3.0, 4.0]
+
+    def test_extend_larger_than_capacity(self):
+        """Test that a batch larger than the capacity keeps only the newest rows."""
+        buffer = PotentialSourcesBuffer(capacity=2)
+
+        buffer.extend([(float(i), 0.0, 0.0, 1.0) for i in range(5)], timestamp=1.0)
+
+        assert buffer.recent(now=1.0)["x"].tolist() == [3.0, 4.0]
+
+    def test_extend_empty(self):
+        """Test that extending with no rows is a no-op."""
+        buffer = PotentialSourcesBuffer()
+
+        buffer.extend([])
+
+        assert len(buffer) == 0
+
+    def test_extend_from_sources(self):
+        """Test appending parsed ODAS dictionaries with E and activity fallbacks."""
+        buffer = PotentialSourcesBuffer()
+
+        buffer.extend_from_sources(
+            [
+                {"x": 1.0, "y": 0.0, "z": 0.0, "E": 0.4},
+                {"x": 0.0, "y": 1.0, "z": 0.0, "activity": 0.6},
+                {},
+            ],
+            timestamp=5.0,
+        )
+
+        recent = buffer.recent(now=5.0)
+        assert recent["E"].tolist() == [0.4, 0.6, 0.0]
+        assert recent["y"].tolist() == [0.0, 1.0, 0.0]
+
+    def test_recent_window(self):
+        """Test filtering by a window in milliseconds."""
+        buffer = PotentialSourcesBuffer(retention_ms=1000.0)
+        buffer.append(1.0, 0.0, 0.0, 1.0, timestamp=0.0)
+        buffer.append(2.0, 0.0, 0.0, 1.0, timestamp=0.5)
+        buffer.append(3.0, 0.0, 0.0, 1.0, timestamp=0.9)
+
+        assert buffer.recent(200, now=1.0)["x"].tolist() == [3.0]
+        assert buffer.recent(600, now=1.0)["x"].tolist() == [2.0, 3.0]
+        # Window is capped at the retention window
+        assert buffer.recent(10_000, now=1.5)["x"].tolist() == [2.0, 3.0]
+
+    def test_clear(self):
+        """Test clearing the buffer."""
+        buffer = PotentialSourcesBuffer()
+        buffer.append(1.0, 0.0, 0.0, 1.0)
+
+        buffer.clear()
+
+        assert len(buffer) == 0
+        assert buffer.recent()["x"].size == 0
+
+    def test_energy_weighted_direction(self):
+        """Test that the mean direction is weighted by energy."""
+        buffer = PotentialSourcesBuffer()
+        buffer.append(1.0, 0.0, 0.0, 3.0, timestamp=1.0)
+        buffer.append(0.0, 1.0, 0.0, 1.0, timestamp=1.0)
+
+        direction = buffer.energy_weighted_direction(now=1.0)
+
+        expected = np.array([3.0, 1.0, 0.0]) / math.sqrt(10.0)
+        assert np.allclose(direction, expected)
+
+    def test_energy_weighted_direction_empty_or_zero_energy(self):
+        """Test that no direction is returned without energy."""
+        buffer = PotentialSourcesBuffer()
+        assert buffer.energy_weighted_direction() is None
+
+        buffer.append(1.0, 0.0, 0.0, 0.0)
+        assert buffer.energy_weighted_direction() is None
+
+    def test_energy_weighted_direction_cancelling_sources(self):
+        """Test that opposite sources with equal energy yield no direction."""
+        buffer = PotentialSourcesBuffer()
+        buffer.append(1.0, 0.0, 0.0, 1.0, timestamp=1.0)
+        buffer.append(-1.0, 0.0, 0.0, 1.0, timestamp=1.0)
+
+        assert buffer.energy_weighted_direction(now=1.0) is None
+
+    def test_energy_weighted_azimuth(self):
+        """Test the azimuth of the energy-weighted direction."""
+        buffer = PotentialSourcesBuffer()
+        buffer.append(0.0, -1.0, 0.0, 1.0, timestamp=1.0)
+
+        assert buffer.energy_weighted_azimuth(now=1.0) == pytest.approx(270.0)
+        assert PotentialSourcesBuffer().energy_weighted_azimuth() is None
@@ -0,0 +1,168 @@
+"""
+Unit tests for the ODAS raw audio tail reader.
+"""
+
+import os
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from hexapod.odas.raw_audio_tail_reader import RawAudioTailReader
+
+FRAME_BYTES = 64
+
+
+class TestRawAudioTailReader:
+    """Test cases for RawAudioTailReader class."""
+
+    @pytest.fixture
+    def audio_file(self, tmp_path):
+        """Path of a raw audio file inside a temporary ODAS directory."""
+        return tmp_path / "postfiltered.raw"
+
+    @staticmethod
+    def _frames(count, start=0):
+        """Create frames whose bytes identify their index."""
+        return b"".join(
+            bytes([(start + index) % 256]) * FRAME_BYTES for index in range(count)
+        )
+
+    @staticmethod
+    def _read(reader):
+        """Read all available frames as bytes."""
+        return [bytes(frame) for frame in reader.frames()]
+
+    def test_invalid_sizes(self, audio_file):
+        """Test that frame and ring sizes must be positive."""
+        with pytest.raises(ValueError):
+            RawAudioTailReader(audio_file, 0)
+        with pytest.raises(ValueError):
+            RawAudioTailReader(audio_file, FRAME_BYTES, ring_frames=0)
+
+    def test_missing_file(self, audio_file):
+        """Test that a missing file yields nothing and is opened once created."""
+        with RawAudioTailReader(audio_file, FRAME_BYTES) as reader:
+            assert self._read(reader) == []
+            assert not reader.is_open
+
+            audio_file.write_bytes(self._frames(2))
+            assert self._read(reader) == [self._frames(1), self._frames(1, 1)]
+            assert reader.is_open
+
+    def test_backlog_larger_than_ring(self, audio_file):
+        """Test that a backlog many times the ring size is read completely in order."""
+        audio_file.write_bytes(self._frames(1000))
+
+        with RawAudioTailReader(audio_file, FRAME_BYTES, ring_frames=3) as reader:
+            frames = self._read(reader)
+
+        assert len(frames) == 1000
+        assert frames == [self._frames(1, index) for index in range(1000)]
+        assert len(reader._ring) == 3 * FRAME_BYTES
+
+    def test_frames_are_views_of_the_ring(self, audio_file):
+        """Test that frames are zero-copy slices of the ring buffer."""
+        audio_file.write_bytes(self._frames(4))
+
+        with RawAudioTailReader(audio_file, FRAME_BYTES, ring_frames=2) as reader:
+            for frame in reader.frames():
+                assert isinstance(frame, memoryview)
+                assert frame.obj is reader._ring
+                assert len(frame) == FRAME_BYTES
+                samples = np.frombuffer(frame, dtype=np.int16)
+                assert np.shares_memory(samples, np.frombuffer(reader._ring, np.int16))
+
+    def test_partial_frame_is_completed_later(self, audio_file):
+        """Test that a frame split across writes is yielded once complete."""
+        data = self._frames(3)
+        with (
+            open(audio_file, "wb") as writer,
+            RawAudioTailReader(audio_file, FRAME_BYTES, ring_frames=2) as reader,
+        ):
+            writer.write(data[: FRAME_BYTES + 10])
+            writer.flush()
+            assert self._read(reader) == [self._frames(1)]
+
+            writer.write(data[FRAME_BYTES + 10 : 2 * FRAME_BYTES + 5])
+            writer.flush()
+            assert self._read(reader) == [self._frames(1, 1)]
+
+            writer.write(data[2 * FRAME_BYTES + 5 :])
+            writer.flush()
+            assert self._read(reader) == [self._frames(1, 2)]
+            assert reader.position == len(data)
+
+    def test_truncated_file_is_read_from_start(self, audio_file):
+        """Test that truncating the file restarts reading from its beginning."""
+        audio_file.write_bytes(self._frames(3))
+
+        with RawAudioTailReader(audio_file, FRAME_BYTES) as reader:
+            assert len(self._read(reader)) == 3
+
+            audio_file.write_bytes(self._frames(1, 7))
+            assert self._read(reader) == []  # Truncation noticed at end of file
+            assert self._read(reader) == [self._frames(1, 7)]
+
+    def test_replaced_file_is_reopened(self, audio_file):
+        """Test that a file recreated by a restarted ODAS is reopened."""
+        audio_file.write_bytes(self._frames(2))
+
+        with RawAudioTailReader(audio_file, FRAME_BYTES) as reader:
+            assert len(self._read(reader)) == 2
+
+            replacement = audio_file.with_name("postfiltered.tmp")
+            replacement.write_bytes(self._frames(4, 20))
+            os.replace(replacement, audio_file)
+
+            assert self._read(reader) == []  # Replacement noticed at end of file
+            assert self._read(reader) == [self._frames(1, 20 + i) for i in range(4)]
+
+    def test_wait_wakes_on_append(self, audio_file):
+        """Test that waiting returns as soon as the file is written."""
+        audio_file.write_bytes(b"")
+        with RawAudioTailReader(audio_file, FRAME_BYTES) as reader:
+            if not reader.uses_inotify:
+                pytest.skip("inotify not available")
+
+            def append():
+                time.sleep(0.05)
+                with open(audio_file, "ab") as writer:
+                    writer.write(self._frames(1))
+
+            writer_thread = threading.Thread(target=append)
+            start = time.monotonic()
+            writer_thread.start()
+            assert reader.wait(5.0) is True
+            writer_thread.join()
+
+            assert time.monotonic() - start < 2.0
+            assert self._read(reader) == [self._frames(1)]
+
+    def test_wait_ignores_other_files(self, audio_file):
+        """Test that writes to other ODAS files do not wake the reader."""
+        audio_file.write_bytes(b"")
+        with RawAudioTailReader(audio_file, FRAME_BYTES) as reader:
+            if not reader.uses_inotify:
+                pytest.skip("inotify not available")
+
+            audio_file.with_name("separated.raw").write_bytes(b"\x00" * 10)
+            assert reader.wait(0.1) is False
+
+    def test_polling_fallback(self, audio_file):
+        """Test that the reader polls when inotify is disabled."""
+        audio_file.write_bytes(self._frames(1))
+        with RawAudioTailReader(audio_file, FRAME_BYTES, use_inotify=False) as reader:
+            assert not reader.uses_inotify
+            assert reader.wait(0.01) is True
+            assert self._read(reader) == [self._frames(1)]
+
+    def test_close_is_idempotent(self, audio_file):
+        """Test that closing twice is safe."""
+        audio_file.write_bytes(self._frames(1))
+        reader = RawAudioTailReader(audio_file, FRAME_BYTES)
+        assert reader.open()
+        reader.close()
+        reader.close()
+        assert not reader.is_open
@@ -0,0 +1,180 @@
+"""
+Unit tests for the raw audio stream transports.
+"""
+
+import socket
+from unittest.mock import MagicMock
+
+import pytest
+
+from hexapod.odas.raw_stream_transport import (
+    SFTPTransport,
+    LocalFileTransport,
+    TCPTransport,
+)
+
+
+class TestSFTPTransport:
+    """Test cases for SFTPTransport class."""
+
+    @pytest.fixture
+    def remote(self):
+        """Remote file contents and a mocked SSH client serving them."""
+        contents = bytearray(b"x" * 100)
+        position = [0]
+        ssh = MagicMock()
+        sftp = ssh.open_sftp.return_value
+        remote_file = sftp.open.return_value
+
+        def read(size):
+            data = bytes(contents[position[0] : position[0] + size])
+            position[0] += len(data)
+            return data
+
+        def seek(offset):
+            position[0] = offset
+
+        remote_file.read.side_effect = read
+        remote_file.seek.side_effect = seek
+        remote_file.stat.side_effect = lambda: MagicMock(st_size=len(contents))
+        sftp.stat.side_effect = lambda path: MagicMock(st_size=len(contents))
+        return ssh, contents
+
+    def test_reads_only_new_data_through_one_handle(self, remote):
+        """Test that appended data is read without reopening the remote file."""
+        ssh, contents = remote
+        transport = SFTPTransport(ssh, "/odas/postfiltered.raw")
+
+        assert transport.open() is True
+        assert transport.read() == b""
+        contents.extend(b"abc")
+        assert transport.read() == b"abc"
+        contents.extend(b"def")
+        assert transport.read(2) == b"de"
+        assert transport.read() == b"f"
+
+        ssh.open_sftp.assert_called_once()
+        ssh.open_sftp.return_value.open.assert_called_once_with(
+            "/odas/postfiltered.raw", "rb"
+        )
+        assert transport.position == 106
+
+    def test_start_at_beginning(self, remote):
+        """Test that the existing data can be read from the start."""
+        ssh, _ = remote
+        transport = SFTPTransport(ssh, "/odas/postfiltered.raw", start_at_end=False)
+
+        assert transport.read() == b"x" * 100
+
+    def test_truncated_file_is_read_from_start(self, remote):
+        """Test that a truncated remote file is followed from its beginning."""
+        ssh, contents = remote
+        transport = SFTPTransport(ssh, "/odas/postfiltered.raw")
+        transport.open()
+
+        del contents[:]
+        assert transport.read() == b""
+        contents.extend(b"new")
+        assert transport.read() == b"new"
+
+    def test_missing_file(self, remote):
+        """Test that a missing remote file is reported."""
+        ssh, _ = remote
+        ssh.open_sftp.return_value.open.side_effect = FileNotFoundError()
+        transport = SFTPTransport(ssh, "/odas/postfiltered.raw")
+
+        assert transport.open() is False
+        with pytest.raises(FileNotFoundError):
+            transport.read()
+
+    def test_close(self, remote):
+        """Test that closing releases the remote file and the SFTP session."""
+        ssh, _ = remote
+        transport = SFTPTransport(ssh, "/odas/postfiltered.raw")
+        transport.open()
+
+        transport.close()
+
+        assert not transport.is_open
+        ssh.open_sftp.return_value.open.return_value.close.assert_called_once()
+        ssh.open_sftp.return_value.close.assert_called_once()
+
+
+class TestLocalFileTransport:
+    """Test cases for LocalFileTransport class."""
+
+    def test_follows_appended_data(self, tmp_path):
+        """Test that data appended to the file is returned once."""
+        path = tmp_path / "separated.raw"
+        path.write_bytes(b"abc")
+
+        with LocalFileTransport(path, use_inotify=False) as transport:
+            assert transport.read() == b"abc"
+            assert transport.read() == b""
+            with open(path, "ab") as f:
+                f.write(b"def")
+            assert transport.read() == b"def"
+
+    def test_start_at_end(self, tmp_path):
+        """Test that existing data can be skipped."""
+        path = tmp_path / "separated.raw"
+        path.write_bytes(b"old")
+
+        with LocalFileTransport(path, start_at_end=True) as transport:
+            assert transport.read() == b""
+            assert transport.position == 3
+
+    def test_truncated_file_is_read_from_start(self, tmp_path):
+        """Test that a truncated file is followed from its beginning."""
+        path = tmp_path / "separated.raw"
+        path.write_bytes(b"abcdef")
+
+        with LocalFileTransport(path) as transport:
+            transport.read()
+            path.write_bytes(b"")
+            assert transport.read() == b""
+            path.write_bytes(b"gh")
+            assert transport.read() == b"gh"
+
+    def test_missing_file(self, tmp_path):
+        """Test that a missing file is reported."""
+        transport = LocalFileTransport(tmp_path / "missing.raw")
+
+        assert transport.open() is False
+        with pytest.raises(FileNotFoundError):
+            transport.read()
+        transport.close()
+
+
+class TestTCPTransport:
+    """Test cases for TCPTransport class."""
+
+    def test_receives_stream_from_sink(self):
+        """Test that data from a connecting ODAS sink is received."""
+        transport = TCPTransport("127.0.0.1", 0)
+        try:
+            assert transport.open() is False
+            sink = socket.create_connection(transport.address)
+            assert transport.wait(1.0)
+            assert transport.open() is True
+
+            assert transport.read() == b""
+            sink.sendall(b"audio")
+            assert transport.wait(1.0)
+            assert transport.read() == b"audio"
+
+            sink.close()
+            transport.wait(1.0)
+            with pytest.raises(ConnectionError):
+                transport.read()
+            assert not transport.is_open
+        finally:
+            transport.close()
+
+    def test_wait_timeout(self):
+        """Test that waiting without a sink times out."""
+        transport = TCPTransport("127.0.0.1", 0)
+        try:
+            assert transport.wait(0.01) is False
+        finally:
+            transport.close()
@@ -0,0 +1,158 @@
+"""
+Unit tests for the ODAS session log writer.
+"""
+
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from hexapod.odas.session_log_writer import SessionLogWriter
+
+
+class TestSessionLogWriter:
+    """Test cases for SessionLogWriter."""
+
+    def test_init_truncates_file(self, tmp_path):
+        """Test that opening a writer truncates an existing log."""
+        path = tmp_path / "tracked.jsonl"
+        path.write_text("old session\n")
+
+        writer = SessionLogWriter(path)
+        writer.close()
+
+        assert path.read_text() == ""
+
+    def test_init_open_error(self, tmp_path):
+        """Test that errors opening the file are raised to the caller."""
+        with pytest.raises(OSError):
+            SessionLogWriter(tmp_path / "missing" / "tracked.jsonl")
+
+    def test_write_record_compact_jsonl(self, tmp_path):
+        """Test that every record becomes one compact JSON line."""
+        path = tmp_path / "tracked.jsonl"
+        writer = SessionLogWriter(path)
+
+        writer.write_record({"timestamp": 1.0, "sources": [{"id": 1, "x": 0.5}]})
+        writer.write_record({"timestamp": 2.0, "sources": []})
+        writer.close()
+
+        lines = path.read_text().splitlines()
+        assert lines == [
+            '{"timestamp":1.0,"sources":[{"id":1,"x":0.5}]}',
+            '{"timestamp":2.0,"sources":[]}',
+        ]
+        assert writer.written_records == 2
+
+    def test_write_text(self, tmp_path):
+        """Test that preformatted text is written as-is."""
+        path = tmp_path / "tracked.jsonl"
+        writer = SessionLogWriter(path)
+
+        writer.write("[2024-01-01 00:00:00] message\n")
+        writer.close()
+
+        assert path.read_text() == "[2024-01-01 00:00:00] message\n"
+
+    def test_records_batched_until_interval(self, tmp_path):
+        """Test that records are held back until the flush interval elapses."""
+        path = tmp_path / "tracked.jsonl"
+        writer = SessionLogWriter(path, flush_interval=0.2)
+
+        writer.write_record({"timestamp": 1.0})
+        time.sleep(0.05)
+        assert path.read_text() == ""
+
+        deadline = time.time() + 2
+        while time.time() < deadline and not path.read_text():
+            time.sleep(0.01)
+        writer.close()
+
+        assert path.read_text() == '{"timestamp":1.0}\n'
+
+    def test_records_written_at_flush_bytes(self, tmp_path):
+        """Test that a batch reaching flush_bytes is written immediately."""
+        path = tmp_path / "tracked.jsonl"
+        writer = SessionLogWriter(path, flush_bytes=1, flush_interval=60.0)
+
+        writer.write_record({"timestamp": 1.0})
+        deadline = time.time() + 2
+        while time.time() < deadline and not path.read_text():
+            time.sleep(0.01)
+
+        assert path.read_text() == '{"timestamp":1.0}\n'
+        writer.close()
+
+    def test_flush_requests_write(self, tmp_path):
+        """Test that flush() makes the writer write pending records."""
+        path = tmp_path / "tracked.jsonl"
+        writer = SessionLogWriter(path, flush_interval=60.0)
+
+        writer.write_record({"timestamp": 1.0})
+        writer.flush()
+        deadline = time.time() + 2
+        while time.time() < deadline and not path.read_text():
+            time.sleep(0.01)
+
+        assert path.read_text() == '{"timestamp":1.0}\n'
+        writer.close()
+
+    def test_rotation_by_size(self, tmp_path):
+        """Test that the log rotates once it would exceed max_bytes."""
+        path = tmp_path / "tracked.jsonl"
+        writer = SessionLogWriter(path, max_bytes=64, backup_count=2, flush_bytes=1)
+
+        for i in range(20):
+            writer.write_record({"timestamp": float(i), "sources": []})
+        writer.close()
+
+        assert writer.rotations > 0
+        assert (tmp_path / "tracked.jsonl.1").exists()
+        assert (tmp_path / "tracked.jsonl.2").exists()
+        assert not (tmp_path / "tracked.jsonl.3").exists()
+        for log in (path, tmp_path / "tracked.jsonl.1", tmp_path / "tracked.jsonl.2"):
+            assert log.stat().st_size <= 64
+            for line in log.read_text().splitlines():
+                json.loads(line)
+        # The newest record is always in the current file
+        last = json.loads(path.read_text().splitlines()[-1])
+        assert last["timestamp"] == 19.0
+
+    def test_full_queue_drops_records(self, tmp_path):
+        """Test that a full queue drops records instead of blocking."""
+        path = tmp_path / "tracked.jsonl"
+        writer = SessionLogWriter(path, max_queued_records=2)
+
+        # Keep the writer thread from draining the queue
+        with patch.object(writer, "_append", side_effect=lambda *args: time.sleep(0.2)):
+            started = time.monotonic()
+            for i in range(10):
+                writer.write_record({"timestamp": float(i)})
+            elapsed = time.monotonic() - started
+
+            assert elapsed < 0.2
+            assert writer.dropped_records > 0
+            writer.close()
+
+    def test_unserializable_record_skipped(self, tmp_path):
+        """Test that a record that cannot be serialized does not stop the writer."""
+        path = tmp_path / "tracked.jsonl"
+        writer = SessionLogWriter(path)
+
+        writer.write_record({"value": object()})
+        writer.write_record({"value": 1})
+        writer.close()
+
+        assert path.read_text() == '{"value":1}\n'
+
+    def test_write_after_close_ignored(self, tmp_path):
+        """Test that writes after close are ignored and close is idempotent."""
+        path = tmp_path / "tracked.jsonl"
+        writer = SessionLogWriter(path)
+        writer.close()
+
+        writer.write_record({"value": 1})
+        writer.close()
+
+        assert path.read_text() == ""
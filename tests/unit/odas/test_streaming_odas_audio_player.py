@@ -8,10 +8,13 @@ import threading
 import time
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock, call
-import queue
 import numpy as np
 
-from hexapod.odas.streaming_odas_audio_player import StreamingODASAudioPlayer
+from hexapod.odas.streaming_odas_audio_player import (
+    StreamingODASAudioPlayer,
+    RawAudioDownmixer,
+)
+from hexapod.odas.raw_stream_transport import SFTPTransport, LocalFileTransport
 
 
 class TestStreamingODASAudioPlayer:
@@ -24,14 +27,6 @@ class TestStreamingODASAudioPlayer:
         mock_ssh.open_sftp.return_value = MagicMock()
         return mock_ssh
 
-    @pytest.fixture
-    def mock_sftp(self):
-        """Mock SFTP client for testing."""
-        mock_sftp = MagicMock()
-        mock_sftp.stat.return_value = MagicMock(st_size=1024)
-        mock_sftp.open.return_value.__enter__.return_value = MagicMock()
-        return mock_sftp
-
     @pytest.fixture
     def mock_audio_stream(self):
         """Mock audio stream for testing."""
@@ -52,21 +47,6 @@ class TestStreamingODASAudioPlayer:
         audio_data = np.sin(2 * np.pi * frequency * t).astype(np.float32)
         return audio_data.tobytes()
 
-    @pytest.fixture
-    def mock_wav_file(self, tmp_path):
-        """Create a mock WAV file for testing."""
-        wav_file = tmp_path / "test.wav"
-        # Create a simple WAV file with test data
-        import wave
-
-        with wave.open(str(wav_file), "wb") as wav:
-            wav.setnchannels(1)
-            wav.setsampwidth(2)
-            wav.setframerate(44100)
-            # Write 1 second of silence
-            wav.writeframes(b"\x00" * (44100 * 2))
-        return wav_file
-
     def test_init_default_parameters(self, tmp_path):
         """Test StreamingODASAudioPlayer initialization with default parameters."""
         with patch(
@@ -82,11 +62,12 @@ class TestStreamingODASAudioPlayer:
             assert player.sample_rate == 44100
             assert player.channels == 4
             assert player.buffer_size == 1024
-            assert player.check_interval == 0.5
+            assert player.check_interval == 0.05
             assert player.running is True
-            assert player.processes == []
             assert player.ssh_key_path == str(Path.home() / ".ssh" / "id_ed25519")
-            assert player.audio_queue.empty()
+            assert len(player.jitter_buffer) == 0
+            assert player.jitter_buffer.target_latency == 0.1
+            assert player.jitter_buffer.max_latency == 1.0
             assert player.stream is None
             assert player.stream_thread is None
             assert player.is_playing is False
@@ -102,7 +83,6 @@ class TestStreamingODASAudioPlayer:
                 "remote_host": "test-host",
                 "remote_user": "test-user",
                 "remote_dir": "/test/remote",
-                "local_dir": str(tmp_path / "local"),
                 "sample_rate": 48000,
                 "channels": 2,
                 "ssh_key_path": "/test/key",
@@ -115,7 +95,6 @@ class TestStreamingODASAudioPlayer:
             assert player.remote_host == "test-host"
             assert player.remote_user == "test-user"
             assert player.remote_dir == Path("/test/remote")
-            assert player.local_dir == tmp_path / "local"
             assert player.sample_rate == 48000
             assert player.channels == 2
             assert player.ssh_key_path == "/test/key"
@@ -155,68 +134,11 @@ class TestStreamingODASAudioPlayer:
         with pytest.raises(Exception, match="Connection failed"):
             player.connect_ssh()
 
-    def test_transfer_file_success(self, mock_ssh_client, mock_sftp, tmp_path):
-        """Test successful file transfer."""
-        player = StreamingODASAudioPlayer()
-        player.ssh = mock_ssh_client
-        mock_ssh_client.open_sftp.return_value = mock_sftp
-
-        remote_file = "/remote/test.raw"
-        local_file = tmp_path / "test.raw"
-
-        player.transfer_file(remote_file, local_file)
-
-        mock_sftp.get.assert_called_once_with(remote_file, str(local_file))
-        mock_sftp.close.assert_called_once()
-
-    def test_transfer_file_failure(self, mock_ssh_client, mock_sftp):
-        """Test file transfer failure handling."""
-        player = StreamingODASAudioPlayer()
-        player.ssh = mock_ssh_client
-        mock_ssh_client.open_sftp.return_value = mock_sftp
-        mock_sftp.get.side_effect = Exception("Transfer failed")
-
-        with pytest.raises(Exception, match="Transfer failed"):
-            player.transfer_file("/remote/test.raw", Path("/local/test.raw"))
-
-    def test_convert_to_wav_success(self, tmp_path):
-        """Test successful WAV conversion."""
-        player = StreamingODASAudioPlayer()
-        input_file = tmp_path / "input.raw"
-        output_file = tmp_path / "output.wav"
-
-        # Create the input file so it exists
-        input_file.write_bytes(b"test data")
-
-        # Test that the method can be called without errors
-        # (The actual subprocess call may fail in test environment)
-        try:
-            player.convert_to_wav(input_file, output_file)
-            # If we get here, the method executed without crashing
-            assert True, "convert_to_wav method executed successfully"
-        except Exception as e:
-            # This is expected in test environment due to missing sox
-            assert (
-                "sox" in str(e).lower() or "command not found" in str(e).lower()
-            ), f"Expected sox-related error, got: {e}"
-
-    @patch("hexapod.odas.streaming_odas_audio_player.subprocess.run")
-    def test_convert_to_wav_failure(self, mock_subprocess, tmp_path):
-        """Test WAV conversion failure handling."""
-        player = StreamingODASAudioPlayer()
-        input_file = tmp_path / "input.raw"
-        output_file = tmp_path / "output.wav"
-        mock_subprocess.run.side_effect = Exception("Conversion failed")
-
-        # Should not raise exception, just log warning
-        player.convert_to_wav(input_file, output_file)
-
     def test_audio_callback_success(self, sample_audio_data):
         """Test audio callback with data available."""
         player = StreamingODASAudioPlayer()
-        # Create smaller audio data that fits the output buffer
-        small_audio_data = np.random.rand(1024).astype(np.float32).tobytes()
-        player.audio_queue.put(small_audio_data)
+        player.is_playing = True
+        player.jitter_buffer.write(np.random.rand(8192).astype(np.float32) + 0.1)
 
         outdata = np.zeros((1024, 1), dtype=np.float32)
         player.audio_callback(outdata, 1024, None, None)
@@ -224,8 +146,19 @@ class TestStreamingODASAudioPlayer:
         # Check that data was processed (not all zeros)
         assert not np.all(outdata == 0)
 
-    def test_audio_callback_empty_queue(self):
-        """Test audio callback with empty queue."""
+    def test_audio_callback_lagging_outputs_silence(self):
+        """Test that a lagging stream outputs silence instead of stopping."""
+        player = StreamingODASAudioPlayer()
+        player.is_playing = True
+        player.jitter_buffer.write(np.ones(100, dtype=np.float32))
+
+        outdata = np.ones((1024, 1), dtype=np.float32)
+        player.audio_callback(outdata, 1024, None, None)
+
+        assert np.all(outdata == 0)
+
+    def test_audio_callback_not_playing(self):
+        """Test that the callback stops the stream once playback was stopped."""
         player = StreamingODASAudioPlayer()
         player.is_playing = False
 
@@ -237,9 +170,7 @@ class TestStreamingODASAudioPlayer:
     def test_audio_callback_with_status_warning(self, sample_audio_data, caplog):
         """Test audio callback with status warning."""
         player = StreamingODASAudioPlayer()
-        # Create smaller audio data that fits the output buffer
-        small_audio_data = np.random.rand(1024).astype(np.float32).tobytes()
-        player.audio_queue.put(small_audio_data)
+        player.is_playing = True
 
         outdata = np.zeros((1024, 1), dtype=np.float32)
         player.audio_callback(outdata, 1024, None, "warning")
@@ -284,87 +215,159 @@ class TestStreamingODASAudioPlayer:
         assert player.is_playing is False
         assert player.stream is None
 
-    @patch("hexapod.odas.streaming_odas_audio_player.wave.open")
-    def test_play_audio_success(self, mock_wave_open, mock_wav_file, sample_audio_data):
-        """Test successful audio playback."""
-        player = StreamingODASAudioPlayer()
+    @staticmethod
+    def _raw_audio(frames, channels=4, value=1000):
+        """Create interleaved int16 audio with every channel at the given value."""
+        return np.full((frames, channels), value, dtype=np.int16).tobytes()
 
-        # Mock wave file
-        mock_wav = MagicMock()
-        mock_wav.getnchannels.return_value = 1
-        mock_wav.getsampwidth.return_value = 2
-        mock_wav.getframerate.return_value = 44100
-        mock_wav.getnframes.return_value = 1024
-        mock_wav.readframes.return_value = sample_audio_data
-        mock_wave_open.return_value.__enter__.return_value = mock_wav
+    def test_downmixer_averages_and_scales(self):
+        """Test that channels are averaged and scaled to float32 in [-1, 1)."""
+        downmixer = RawAudioDownmixer(4)
+        samples = np.array([[16384, 0, 0, 0], [-32768, -32768, -32768, -32768]])
 
-        player.play_audio(mock_wav_file)
+        mono = downmixer.process(samples.astype(np.int16).tobytes())
 
-        # Check that audio data was added to queue
-        assert not player.audio_queue.empty()
+        assert mono.dtype == np.float32
+        np.testing.assert_allclose(mono, [0.125, -1.0])
 
-    @patch("hexapod.odas.streaming_odas_audio_player.wave.open")
-    def test_play_audio_failure(self, mock_wave_open, mock_wav_file):
-        """Test audio playback failure handling."""
-        player = StreamingODASAudioPlayer()
-        mock_wave_open.side_effect = Exception("File error")
+    def test_downmixer_carries_partial_frames(self):
+        """Test that a sample frame split across reads is decoded once complete."""
+        downmixer = RawAudioDownmixer(4)
+        data = self._raw_audio(3, value=8192)
 
-        # Should not raise exception, just log warning
-        player.play_audio(mock_wav_file)
+        first = downmixer.process(data[:11])
+        second = downmixer.process(data[11:])
 
-    @patch("hexapod.odas.streaming_odas_audio_player.time.sleep")
-    def test_stream_audio_file_not_found(self, mock_sleep, mock_ssh_client, mock_sftp):
-        """Test streaming when remote file is not found."""
-        player = StreamingODASAudioPlayer()
-        player.ssh = mock_ssh_client
-        player.running = True  # Keep running to test the loop
-        mock_ssh_client.open_sftp.return_value = mock_sftp
-        mock_sftp.stat.side_effect = FileNotFoundError()
+        assert len(first) == 1
+        np.testing.assert_allclose(second, [0.25, 0.25])
+        downmixer.process(data[:3])
+        downmixer.reset()
+        assert len(downmixer.process(data)) == 3
 
-        # Mock the while loop to exit after one iteration
-        def side_effect(duration):
-            player.running = False
+    def test_enqueue_audio_writes_jitter_buffer(self):
+        """Test that decoded audio is written to the jitter buffer."""
+        player = StreamingODASAudioPlayer(target_latency=0.01)
 
-        mock_sleep.side_effect = side_effect
+        assert player.enqueue_audio(self._raw_audio(600)) == 600
+        assert player.jitter_buffer.latency == pytest.approx(600 / 44100)
 
-        player.stream_audio("postfiltered")
+        block = player.jitter_buffer.read(441)
+        np.testing.assert_allclose(block, 1000 / 32768)
 
-        mock_sleep.assert_called()
+    def test_burst_is_bounded_by_jitter_buffer(self):
+        """Test that a burst of audio does not grow the playback latency."""
+        player = StreamingODASAudioPlayer()
+
+        player.enqueue_audio(self._raw_audio(44100 * 3))
+
+        stats = player.jitter_buffer.stats()
+        assert stats.latency == pytest.approx(1.0)
+        assert stats.overruns == 1
 
-    @patch("hexapod.odas.streaming_odas_audio_player.time.sleep")
-    def test_stream_audio_success(
-        self, mock_sleep, mock_ssh_client, mock_sftp, tmp_path
-    ):
-        """Test successful audio streaming."""
+        player.is_playing = True
+        outdata = np.zeros((1024, 1), dtype=np.float32)
+        player.audio_callback(outdata, 1024, None, None)
+        assert player.jitter_buffer.latency <= 0.1
+
+    def test_log_playback_stats(self, caplog):
+        """Test that the playback statistics are logged."""
         player = StreamingODASAudioPlayer()
+
+        with caplog.at_level("INFO"):
+            player.log_playback_stats()
+
+        assert "0 underruns, 0 overruns" in caplog.text
+
+    def test_create_transport_defaults_to_sftp(self, mock_ssh_client):
+        """Test that the remote file is followed over SFTP by default."""
+        player = StreamingODASAudioPlayer(remote_dir="/odas")
         player.ssh = mock_ssh_client
-        player.running = True  # Keep running to test the loop
-        player.remote_dir = tmp_path
-        mock_ssh_client.open_sftp.return_value = mock_sftp
 
-        # Mock file stats
-        mock_stat = MagicMock()
-        mock_stat.st_size = 1024
-        mock_sftp.stat.return_value = mock_stat
+        transport = player.create_transport("postfiltered")
+
+        assert isinstance(transport, SFTPTransport)
+        assert transport.remote_file == "/odas/postfiltered.raw"
 
-        # Mock the while loop to exit after one iteration
-        call_count = 0
+    def test_create_transport_configured(self):
+        """Test that a configured transport replaces SFTP."""
+        transport = MagicMock()
+        player = StreamingODASAudioPlayer(transport=transport)
+
+        assert player.create_transport("separated") is transport
+
+    @patch("hexapod.odas.streaming_odas_audio_player.time")
+    def test_stream_audio_file_not_found(self, mock_time, tmp_path):
+        """Test streaming when the audio stream does not exist yet."""
+        mock_time.monotonic.return_value = 0.0
+        mock_sleep = mock_time.sleep
+        transport = LocalFileTransport(tmp_path / "postfiltered.raw")
+        player = StreamingODASAudioPlayer(transport=transport)
 
         def side_effect(duration):
-            nonlocal call_count
-            call_count += 1
-            if call_count >= 1:  # Exit after first sleep call
-                player.running = False
+            player.running = False
 
         mock_sleep.side_effect = side_effect
 
-        player.stream_audio("postfiltered")
+        with patch.object(player, "start_audio_stream"):
+            player.stream_audio("postfiltered")
+
+        mock_sleep.assert_called_once_with(1)
+        assert len(player.jitter_buffer) == 0
+        assert not transport.is_open
+
+    def test_stream_audio_success(self, tmp_path):
+        """Test that appended audio is decoded and queued without temporary files."""
+        raw_file = tmp_path / "postfiltered.raw"
+        raw_file.write_bytes(self._raw_audio(1500))
+        transport = LocalFileTransport(raw_file, use_inotify=False)
+        player = StreamingODASAudioPlayer(transport=transport)
+        waits = []
+
+        def wait(timeout):
+            waits.append(timeout)
+            if len(waits) == 1:
+                with open(raw_file, "ab") as f:
+                    f.write(self._raw_audio(600))
+            else:
+                player.running = False
+            return True
+
+        with (
+            patch.object(transport, "wait", side_effect=wait),
+            patch.object(player, "start_audio_stream") as mock_start,
+        ):
+            player.stream_audio("postfiltered")
+
+        mock_start.assert_called_once()
+        assert waits == [player.check_interval, player.check_interval]
+        assert len(player.jitter_buffer) == 2100
+        assert not transport.is_open
+        assert list(tmp_path.iterdir()) == [raw_file]
+
+    @patch("hexapod.odas.streaming_odas_audio_player.time")
+    def test_stream_audio_reopens_after_stream_lost(self, mock_time):
+        """Test that the transport is reopened after ODAS stopped."""
+        mock_time.monotonic.return_value = 0.0
+        transport = MagicMock()
+        transport.is_open = False
+        transport.open.return_value = True
+        player = StreamingODASAudioPlayer(transport=transport)
+
+        def read():
+            if transport.read.call_count == 1:
+                raise FileNotFoundError()
+            player.running = False
+            return self._raw_audio(1024)
 
-        # Should have called sleep for check interval (0.5)
-        sleep_calls = [call for call in mock_sleep.call_args_list if call[0][0] == 0.5]
-        assert (
-            len(sleep_calls) >= 1
-        ), f"Expected sleep(0.5) call, but got calls: {mock_sleep.call_args_list}"
+        transport.read.side_effect = read
+
+        with patch.object(player, "start_audio_stream"):
+            player.stream_audio("separated")
+
+        assert transport.open.call_count == 2
+        assert transport.close.call_count == 2
+        assert len(player.jitter_buffer) == 1024
+        mock_time.sleep.assert_not_called()
 
     @patch("hexapod.odas.streaming_odas_audio_player.threading.Thread")
     def test_monitor_files_success(self, mock_thread, mock_ssh_client):
@@ -396,14 +399,12 @@ class TestStreamingODASAudioPlayer:
         player = StreamingODASAudioPlayer()
         player.ssh = mock_ssh_client
         player.stream = mock_audio_stream
-        player.processes = [MagicMock()]
 
         player.cleanup()
 
         mock_audio_stream.stop.assert_called_once()
         mock_audio_stream.close.assert_called_once()
         mock_ssh_client.close.assert_called_once()
-        assert player.processes == []
 
     def test_cleanup_ssh_close_failure(self, mock_ssh_client, mock_audio_stream):
         """Test cleanup with SSH close failure."""
@@ -415,87 +416,6 @@ class TestStreamingODASAudioPlayer:
         # Should not raise exception
         player.cleanup()
 
-    def test_get_audio_data_success(self, mock_ssh_client, mock_sftp):
-        """Test successful audio data retrieval."""
-        player = StreamingODASAudioPlayer()
-        player.ssh = mock_ssh_client
-        player.remote_dir = Path("/test")
-        player._last_file_size = 512
-        mock_ssh_client.open_sftp.return_value = mock_sftp
-
-        # Mock file stats
-        mock_stat = MagicMock()
-        mock_stat.st_size = 1024
-        mock_sftp.stat.return_value = mock_stat
-
-        # Mock file read
-        mock_file = MagicMock()
-        mock_file.read.return_value = b"test audio data"
-        mock_sftp.open.return_value.__enter__.return_value = mock_file
-
-        result = player.get_audio_data()
-
-        assert result == b"test audio data"
-        assert player._last_file_size == 1024
-
-    def test_get_audio_data_file_not_found(self, mock_ssh_client, mock_sftp):
-        """Test audio data retrieval when file not found."""
-        player = StreamingODASAudioPlayer()
-        player.ssh = mock_ssh_client
-        player.remote_dir = Path("/test")
-        mock_ssh_client.open_sftp.return_value = mock_sftp
-        mock_sftp.stat.side_effect = FileNotFoundError()
-
-        result = player.get_audio_data()
-
-        assert result is None
-
-    def test_get_audio_data_no_new_data(self, mock_ssh_client, mock_sftp):
-        """Test audio data retrieval when no new data available."""
-        player = StreamingODASAudioPlayer()
-        player.ssh = mock_ssh_client
-        player.remote_dir = Path("/test")
-        player._last_file_size = 1024
-        mock_ssh_client.open_sftp.return_value = mock_sftp
-
-        # Mock file stats - same size as last
-        mock_stat = MagicMock()
-        mock_stat.st_size = 1024
-        mock_sftp.stat.return_value = mock_stat
-
-        result = player.get_audio_data()
-
-        assert result is None
-
-    def test_get_audio_data_first_time(self, mock_ssh_client, mock_sftp):
-        """Test audio data retrieval on first call."""
-        player = StreamingODASAudioPlayer()
-        player.ssh = mock_ssh_client
-        player.remote_dir = Path("/test")
-        mock_ssh_client.open_sftp.return_value = mock_sftp
-
-        # Mock file stats
-        mock_stat = MagicMock()
-        mock_stat.st_size = 1024
-        mock_sftp.stat.return_value = mock_stat
-
-        result = player.get_audio_data()
-
-        assert result is None
-        assert player._last_file_size == 1024
-
-    def test_get_audio_data_error(self, mock_ssh_client, mock_sftp):
-        """Test audio data retrieval with error."""
-        player = StreamingODASAudioPlayer()
-        player.ssh = mock_ssh_client
-        player.remote_dir = Path("/test")
-        mock_ssh_client.open_sftp.return_value = mock_sftp
-        mock_sftp.stat.side_effect = Exception("SFTP error")
-
-        result = player.get_audio_data()
-
-        assert result is None
-
     def test_constants(self):
         """Test that constants are properly defined."""
         from hexapod.odas.streaming_odas_audio_player import (
@@ -518,23 +438,17 @@ class TestStreamingODASAudioPlayer:
         assert DEFAULT_SAMPLE_RATE == 44100
         assert DEFAULT_CHANNELS == 4
         assert DEFAULT_BUFFER_SIZE == 1024
-        assert DEFAULT_CHECK_INTERVAL == 0.5
+        assert DEFAULT_CHECK_INTERVAL == 0.05
 
-    def test_audio_queue_operations(self):
-        """Test audio queue operations."""
+    def test_start_audio_stream_clears_jitter_buffer(self):
+        """Test that a new stream starts from an empty jitter buffer."""
         player = StreamingODASAudioPlayer()
+        player.jitter_buffer.write(np.ones(1000, dtype=np.float32))
 
-        # Test putting data
-        test_data = b"test audio data"
-        player.audio_queue.put(test_data)
-
-        # Test getting data
-        retrieved_data = player.audio_queue.get_nowait()
-        assert retrieved_data == test_data
+        with patch("hexapod.odas.streaming_odas_audio_player.sd.OutputStream"):
+            player.start_audio_stream()
 
-        # Test empty queue
-        with pytest.raises(queue.Empty):
-            player.audio_queue.get_nowait()
+        assert len(player.jitter_buffer) == 0
 
     def test_running_flag_management(self):
         """Test running flag management."""
@@ -544,16 +458,3 @@ class TestStreamingODASAudioPlayer:
 
         player.running = False
         assert player.running is False
-
-    def test_processes_list_management(self):
-        """Test processes list management."""
-        player = StreamingODASAudioPlayer()
-
-        assert player.processes == []
-
-        mock_process = MagicMock()
-        player.processes.append(mock_process)
-        assert len(player.processes) == 1
-
-        player.processes.clear()
-        assert player.processes == []
@@ -0,0 +1,160 @@
+"""
+Unit tests for the streaming polyphase resampler.
+"""
+
+import numpy as np
+import pytest
+
+from hexapod.odas.streaming_resampler import (
+    StreamingResampler,
+    ResamplerBenchmark,
+    resample,
+    benchmark_resampler,
+)
+
+
+class TestStreamingResampler:
+    """Test cases for StreamingResampler class."""
+
+    @pytest.fixture
+    def signal(self):
+        """One second of white noise at 44.1 kHz."""
+        return np.random.default_rng(0).standard_normal(44100) * 1000
+
+    @staticmethod
+    def _stream(resampler, signal, chunk_sizes):
+        """Feed a signal in chunks of the given sizes and flush the resampler."""
+        parts = []
+        start = 0
+        for size in chunk_sizes:
+            parts.append(resampler.process(signal[start : start + size]))
+            start += size
+        parts.append(resampler.process(signal[start:]))
+        parts.append(resampler.flush())
+        return np.concatenate(parts)
+
+    @pytest.mark.parametrize(
+        "source_rate,up,down", [(44100, 160, 441), (48000, 1, 3), (16000, 1, 1)]
+    )
+    def test_rational_factor(self, source_rate, up, down):
+        """Test that the rates are reduced to the smallest integer factors."""
+        resampler = StreamingResampler(source_rate, 16000)
+        assert (resampler.up, resampler.down) == (up, down)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"source_rate": 0, "target_rate": 16000},
+            {"source_rate": 44100, "target_rate": -1},
+            {"source_rate": 44100, "target_rate": 16000, "zero_crossings": 0},
+            {"source_rate": 44100, "target_rate": 16000, "rolloff": 1.5},
+        ],
+    )
+    def test_invalid_parameters(self, kwargs):
+        """Test that invalid rates and filter parameters are rejected."""
+        with pytest.raises(ValueError):
+            StreamingResampler(**kwargs)
+
+    def test_output_independent_of_chunking(self, signal):
+        """Test that the output does not depend on how the input is split."""
+        whole = self._stream(StreamingResampler(44100, 16000), signal, [])
+        chunked = self._stream(
+            StreamingResampler(44100, 16000), signal, [1, 511, 512, 7, 4096, 3000]
+        )
+        np.testing.assert_allclose(chunked, whole, atol=1e-9)
+
+    @pytest.mark.parametrize("source_rate", [44100, 48000])
+    def test_exact_output_count(self, source_rate):
+        """Test that streamed frames produce the exact sample count over time."""
+        resampler = StreamingResampler(source_rate, 16000)
+        produced = 0
+        for frame in range(1, 200):
+            produced += len(resampler.process(np.zeros(512)))
+            # Never more than the exact count, never behind by more than one sample
+            exact = frame * 512 * 16000 / source_rate
+            assert exact - 1 <= produced <= np.ceil(exact)
+
+        produced += len(resampler.flush())
+        assert produced == int(np.ceil(199 * 512 * 16000 / source_rate))
+
+    def test_dc_gain(self):
+        """Test that a constant signal keeps its level."""
+        output = resample(np.full(44100, 1000.0), 44100, 16000)
+        np.testing.assert_allclose(output[100:-100], 1000.0, rtol=1e-3)
+
+    @pytest.mark.parametrize("source_rate", [44100, 48000])
+    def test_batch_matches_ideal_tone(self, source_rate):
+        """Test that the aligned batch output matches an ideally resampled tone."""
+        t = np.arange(source_rate) / source_rate
+        output = resample(np.sin(2 * np.pi * 1000 * t), source_rate, 16000)
+
+        assert len(output) == 16000
+        expected = np.sin(2 * np.pi * 1000 * np.arange(16000) / 16000)
+        np.testing.assert_allclose(output[100:-100], expected[100:-100], atol=1e-3)
+
+    def test_stopband_attenuation(self):
+        """Test that content above the target Nyquist frequency is removed."""
+        t = np.arange(44100) / 44100
+        output = resample(np.sin(2 * np.pi * 12000 * t), 44100, 16000)
+        assert np.max(np.abs(output[100:-100])) < 1e-3
+
+    def test_streaming_delay(self):
+        """Test that streaming output is the batch output delayed by the filter."""
+        t = np.arange(44100) / 44100
+        tone = np.sin(2 * np.pi * 500 * t)
+        resampler = StreamingResampler(44100, 16000)
+        output = self._stream(resampler, tone, [512] * 80)
+
+        t_out = np.arange(len(output)) / 16000 - resampler.delay
+        expected = np.sin(2 * np.pi * 500 * t_out)
+        np.testing.assert_allclose(output[100:-100], expected[100:-100], atol=1e-3)
+        assert StreamingResampler(44100, 16000, align=True).delay == 0.0
+
+    def test_multichannel(self, signal):
+        """Test that channels of a 2-D signal are resampled independently."""
+        stereo = np.stack([signal, -2 * signal], axis=1)
+        output = resample(stereo, 44100, 16000, chunk_size=1000)
+
+        assert output.shape == (16000, 2)
+        mono = resample(signal, 44100, 16000)
+        np.testing.assert_allclose(output[:, 0], mono, atol=1e-9)
+        np.testing.assert_allclose(output[:, 1], -2 * mono, atol=1e-9)
+
+    def test_int16_input(self):
+        """Test that int16 frames as read from ODAS are accepted."""
+        resampler = StreamingResampler(44100, 16000)
+        output = resampler.process(np.full(1411, 1000, dtype=np.int16))
+        assert output.dtype == np.float64
+        assert len(output) == 512
+
+    def test_empty_input_and_flush(self):
+        """Test that empty input and flushing an empty stream return no samples."""
+        resampler = StreamingResampler(44100, 16000)
+        assert len(resampler.process(np.zeros(0))) == 0
+        assert len(resampler.flush()) == 0
+        assert len(resample(np.zeros(0), 44100, 16000)) == 0
+
+    def test_reset(self, signal):
+        """Test that reset starts an independent stream."""
+        resampler = StreamingResampler(44100, 16000)
+        first = resampler.process(signal[:2000])
+        resampler.process(signal[2000:5000])
+        resampler.reset()
+        np.testing.assert_array_equal(resampler.process(signal[:2000]), first)
+
+    def test_benchmark(self):
+        """Test the benchmark against the FFT reference."""
+        result = benchmark_resampler(44100, 16000, duration=1.0, reference="fft")
+
+        assert isinstance(result, ResamplerBenchmark)
+        assert result.reference == "fft"
+        assert result.audio_seconds == pytest.approx(1.0)
+        assert result.streaming_cpu_ms_per_second > 0
+        assert result.batch_cpu_ms_per_second > 0
+        assert result.snr_db > 80
+        assert set(result.as_dict()) >= {"snr_db", "max_abs_error", "taps_per_phase"}
+
+    def test_benchmark_requires_resampy(self):
+        """Test that requesting resampy without it installed fails clearly."""
+        with pytest.raises(ValueError, match="resampy"):
+            benchmark_resampler(duration=0.1, reference="resampy")
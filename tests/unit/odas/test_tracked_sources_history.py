@@ -0,0 +1,159 @@
+"""
+Unit tests for the ODAS tracked sources history.
+"""
+
+import math
+
+import pytest
+
+from hexapod.odas.tracked_sources_history import (
+    TrackedSourcesHistory,
+    angular_distance,
+)
+
+
+def _source(azimuth_degrees, activity=1.0):
+    """Build an ODAS tracked source dictionary pointing at the given azimuth."""
+    radians = math.radians(azimuth_degrees)
+    return {"x": math.cos(radians), "y": math.sin(radians), "activity": activity}
+
+
+class TestAngularDistance:
+    """Test cases for angular_distance function."""
+
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [(0, 0, 0), (10, 350, 20), (350, 10, 20), (90, 270, 180), (0, 720, 0)],
+    )
+    def test_angular_distance(self, a, b, expected):
+        """Test shortest angular distance including wrap-around."""
+        assert angular_distance(a, b) == pytest.approx(expected)
+
+
+class TestTrackedSourcesHistory:
+    """Test cases for TrackedSourcesHistory class."""
+
+    def test_init_defaults(self):
+        """Test history initialization with default parameters."""
+        history = TrackedSourcesHistory()
+
+        assert history.history_length == 64
+        assert history.smoothing_window_ms == 750.0
+        assert history.persistence_ms == 1500.0
+        assert history.stale_ms == 500.0
+        assert len(history) == 0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"history_length": 0}, {"smoothing_window_ms": 0}, {"stale_ms": -1}],
+    )
+    def test_init_invalid_parameters(self, kwargs):
+        """Test that non-positive parameters are rejected."""
+        with pytest.raises(ValueError):
+            TrackedSourcesHistory(**kwargs)
+
+    def test_smoothed_azimuth_unknown_source(self):
+        """Test that unknown sources have no azimuth."""
+        assert TrackedSourcesHistory().smoothed_azimuth(1) is None
+
+    def test_smoothed_azimuth_wraps_around_zero(self):
+        """Test circular mean across the 0/360 boundary."""
+        history = TrackedSourcesHistory()
+        history.update({1: _source(350)}, timestamp=1.0)
+        history.update({1: _source(10)}, timestamp=1.1)
+
+        azimuth = history.smoothed_azimuth(1, now=1.1)
+
+        assert angular_distance(azimuth, 0) < 1e-6
+
+    def test_single_noisy_frame_is_smoothed(self):
+        """Test that one outlier frame barely moves the smoothed azimuth."""
+        history = TrackedSourcesHistory()
+        for i in range(10):
+            history.update({1: _source(90)}, timestamp=1.0 + i * 0.05)
+        history.update({1: _source(270, activity=0.2)}, timestamp=1.5)
+
+        assert angular_distance(history.smoothed_azimuth(1, now=1.5), 90) < 1e-6
+
+    def test_smoothing_window_excludes_old_samples(self):
+        """Test that samples outside the smoothing window are ignored."""
+        history = TrackedSourcesHistory(smoothing_window_ms=100, stale_ms=10_000)
+        history.update({1: _source(0)}, timestamp=1.0)
+        history.update({1: _source(90)}, timestamp=2.0)
+
+        assert history.smoothed_azimuth(1, now=2.0) == pytest.approx(90)
+
+    def test_smoothed_azimuth_falls_back_to_latest_sample(self):
+        """Test that the latest sample is used when the window is empty."""
+        history = TrackedSourcesHistory(smoothing_window_ms=100, stale_ms=10_000)
+        history.update({1: _source(45)}, timestamp=1.0)
+
+        assert history.smoothed_azimuth(1, now=5.0) == pytest.approx(45)
+
+    def test_history_length_is_bounded(self):
+        """Test that each source keeps at most history_length samples."""
+        history = TrackedSourcesHistory(history_length=4)
+        for i in range(20):
+            history.update({1: _source(90)}, timestamp=1.0 + i * 0.01)
+
+        track = history._tracks[1]
+        assert track.size == 4
+        assert track.timestamps.size == 4
+
+    def test_stale_sources_are_dropped(self):
+        """Test that sources not reported for stale_ms are forgotten."""
+        history = TrackedSourcesHistory(stale_ms=200)
+        history.update({1: _source(90), 2: _source(180)}, timestamp=1.0)
+        history.update({1: _source(90)}, timestamp=1.1)
+        assert len(history) == 2
+
+        history.update({1: _source(90)}, timestamp=1.3)
+
+        assert len(history) == 1
+        assert history.smoothed_azimuth(2) is None
+
+    def test_smoothed_azimuths(self):
+        """Test smoothed azimuths for all sources."""
+        history = TrackedSourcesHistory()
+        history.update({1: _source(90), 2: _source(180)}, timestamp=1.0)
+
+        azimuths = history.smoothed_azimuths(now=1.0)
+
+        assert azimuths[1] == pytest.approx(90)
+        assert azimuths[2] == pytest.approx(180)
+
+    def test_dominant_source_none_when_empty(self):
+        """Test that there is no dominant source without tracks."""
+        assert TrackedSourcesHistory().dominant_source() is None
+
+    def test_dominant_source_prefers_activity(self):
+        """Test that the more active of two equally persistent sources wins."""
+        history = TrackedSourcesHistory()
+        for i in range(5):
+            history.update(
+                {1: _source(90, 0.3), 2: _source(180, 0.9)},
+                timestamp=1.0 + i * 0.1,
+            )
+
+        source_id, azimuth = history.dominant_source(now=1.4)
+
+        assert source_id == 2
+        assert azimuth == pytest.approx(180)
+
+    def test_dominant_source_prefers_persistence(self):
+        """Test that a persistent source beats a brief louder newcomer."""
+        history = TrackedSourcesHistory()
+        for i in range(15):
+            history.update({1: _source(90, 0.6)}, timestamp=1.0 + i * 0.1)
+        history.update({1: _source(90, 0.6), 2: _source(270, 1.0)}, timestamp=2.5)
+
+        assert history.dominant_source(now=2.5)[0] == 1
+
+    def test_clear(self):
+        """Test clearing the history."""
+        history = TrackedSourcesHistory()
+        history.update({1: _source(90)})
+
+        history.clear()
+
+        assert len(history) == 0
@@ -34,7 +34,7 @@ class TestFollowTask:
     def mock_odas_processor(self):
         """Create a mock ODAS processor."""
         processor = Mock()
-        processor.get_tracked_sources_azimuths = Mock()
+        processor.get_dominant_source = Mock()
         processor.start = Mock()
         processor.close = Mock()
         return processor
@@ -108,7 +108,7 @@ class TestFollowTask:
         self, follow_task, mock_odas_processor
     ):
         """Test getting movement direction when no sources are available."""
-        mock_odas_processor.get_tracked_sources_azimuths.return_value = {}
+        mock_odas_processor.get_dominant_source.return_value = None
 
         direction = follow_task._get_movement_direction_from_odas()
 
@@ -118,7 +118,7 @@ class TestFollowTask:
         self, follow_task, mock_odas_processor
     ):
         """Test getting movement direction for right sector."""
-        mock_odas_processor.get_tracked_sources_azimuths.return_value = {0: 0}
+        mock_odas_processor.get_dominant_source.return_value = (1, 0)
 
         direction = follow_task._get_movement_direction_from_odas()
 
@@ -128,7 +128,7 @@ class TestFollowTask:
         self, follow_task, mock_odas_processor
     ):
         """Test getting movement direction for forward sector."""
-        mock_odas_processor.get_tracked_sources_azimuths.return_value = {0: 90}
+        mock_odas_processor.get_dominant_source.return_value = (1, 90)
 
         direction = follow_task._get_movement_direction_from_odas()
 
@@ -138,7 +138,7 @@ class TestFollowTask:
         self, follow_task, mock_odas_processor
     ):
         """Test getting movement direction for left sector."""
-        mock_odas_processor.get_tracked_sources_azimuths.return_value = {0: 180}
+        mock_odas_processor.get_dominant_source.return_value = (1, 180)
 
         direction = follow_task._get_movement_direction_from_odas()
 
@@ -148,7 +148,7 @@ class TestFollowTask:
         self, follow_task, mock_odas_processor
     ):
         """Test getting movement direction for backward sector."""
-        mock_odas_processor.get_tracked_sources_azimuths.return_value = {0: 270}
+        mock_odas_processor.get_dominant_source.return_value = (1, 270)
 
         direction = follow_task._get_movement_direction_from_odas()
 
@@ -199,7 +199,7 @@ class TestFollowTask:
             follow_task.stop_event.wait.return_value = None
 
             # Mock ODAS processor to return a direction
-            mock_odas_processor.get_tracked_sources_azimuths.return_value = {0: 90}
+            mock_odas_processor.get_dominant_source.return_value = (1, 90)
 
             follow_task.execute_task()
 
@@ -214,6 +214,12 @@ class TestFollowTask:
             )
             mock_thread_class.assert_called_once()
             mock_thread.start.assert_called_once()
+            mock_odas_processor.add_dominant_source_listener.assert_called_once_with(
+                follow_task._on_dominant_source_changed
+            )
+            mock_odas_processor.remove_dominant_source_listener.assert_called_once_with(
+                follow_task._on_dominant_source_changed
+            )
             mock_odas_processor.close.assert_called_once()
             mock_thread.join.assert_called_once_with(timeout=5)
             mock_logger.info.assert_any_call("FollowTask completed")
@@ -248,7 +254,7 @@ class TestFollowTask:
             follow_task.stop_event.wait.return_value = None
 
             # Mock ODAS processor to raise an exception
-            mock_odas_processor.get_tracked_sources_azimuths.side_effect = Exception(
+            mock_odas_processor.get_dominant_source.side_effect = Exception(
                 "ODAS error"
             )
 
@@ -260,3 +266,41 @@ class TestFollowTask:
             )
             mock_odas_processor.close.assert_called_once()
             mock_logger.info.assert_any_call("FollowTask completed")
+
+    def test_on_dominant_source_changed_wakes_loop(self, follow_task):
+        """Test that a dominant source notification sets the change event."""
+        assert not follow_task._source_changed.is_set()
+
+        follow_task._on_dominant_source_changed((1, 90.0))
+
+        assert follow_task._source_changed.is_set()
+
+    def test_execute_task_requeues_gait_only_on_direction_change(
+        self, follow_task, mock_hexapod, mock_odas_processor
+    ):
+        """Test that the gait is only re-queued when the direction changes."""
+        with (
+            patch("hexapod.task_interface.tasks.follow_task.logger"),
+            patch("hexapod.task_interface.tasks.follow_task.time.sleep"),
+            patch("hexapod.task_interface.tasks.follow_task.threading.Thread"),
+        ):
+            follow_task.stop_event = Mock()
+            follow_task.stop_event.is_set.side_effect = [False] * 4 + [True]
+            follow_task._source_changed = Mock()
+
+            # Noise within the forward sector, then a real change to the left
+            mock_odas_processor.get_dominant_source.side_effect = [
+                (1, 90.0),
+                (1, 95.0),
+                (1, 100.0),
+                (2, 180.0),
+            ]
+
+            follow_task.execute_task()
+
+            queued = [
+                c.args[0]
+                for c in mock_hexapod.gait_generator.queue_direction.call_args_list
+            ]
+            assert queued == ["forward", "left"]
+            assert follow_task._source_changed.wait.call_count == 4
@@ -280,6 +280,44 @@ class TestSoundSourceLocalizationTask:
             mock_lights_handler.off.assert_called_once()
             mock_odas_processor.start.assert_called_once()
 
+    def test_execute_task_leases_audio_device(
+        self, sound_localization_task, mock_lights_handler, mock_odas_processor
+    ):
+        """Test that the audio device lease replaces the fixed Voice Control delay."""
+        broker = Mock()
+        sound_localization_task.audio_device_broker = broker
+
+        with (
+            patch("hexapod.task_interface.tasks.sound_source_localization.logger"),
+            patch(
+                "hexapod.task_interface.tasks.sound_source_localization.time.sleep"
+            ) as mock_sleep,
+        ):
+            sound_localization_task.stop_event.set()
+
+            sound_localization_task.execute_task()
+
+            broker.acquire.assert_called_once_with(
+                "odas", timeout=sound_localization_task.AUDIO_RELEASE_TIMEOUT
+            )
+            mock_sleep.assert_not_called()
+            mock_odas_processor.start.assert_called_once()
+            broker.acquire.return_value.release.assert_called_once()
+
+    def test_execute_task_audio_device_timeout(
+        self, sound_localization_task, mock_odas_processor
+    ):
+        """Test that ODAS is not started when the audio device is not released."""
+        broker = Mock()
+        broker.acquire.side_effect = TimeoutError("busy")
+        sound_localization_task.audio_device_broker = broker
+
+        with patch("hexapod.task_interface.tasks.sound_source_localization.logger"):
+            sound_localization_task.execute_task()
+
+        mock_odas_processor.start.assert_not_called()
+        mock_odas_processor.close.assert_called_once()
+
     def test_execute_task_logging_sequence(
         self,
         sound_localization_task,
@@ -7,6 +7,7 @@ import threading
 from unittest.mock import Mock, patch, MagicMock
 
 from hexapod.task_interface.tasks.stream_odas_audio_task import StreamODASAudioTask
+from hexapod.task_interface import AudioDeviceBroker
 
 
 class TestStreamODASAudioTask:
@@ -123,6 +124,39 @@ class TestStreamODASAudioTask:
             mock_lights_handler.off.assert_called_once()
             mock_odas_processor.start.assert_called_once()
 
+    def test_initialize_odas_processor_leases_audio_device(
+        self, stream_audio_task, mock_lights_handler, mock_odas_processor
+    ):
+        """Test that the audio device lease replaces the fixed Voice Control delay."""
+        stream_audio_task.audio_device_broker = AudioDeviceBroker()
+
+        with patch(
+            "hexapod.task_interface.tasks.stream_odas_audio_task.time.sleep"
+        ) as mock_sleep:
+            stream_audio_task._initialize_odas_processor()
+
+            mock_sleep.assert_not_called()
+            mock_odas_processor.start.assert_called_once()
+            assert stream_audio_task.audio_device_broker.owner == "odas"
+
+        stream_audio_task._cleanup_odas_processor()
+        assert stream_audio_task.audio_device_broker.owner is None
+
+    def test_initialize_odas_processor_audio_device_timeout(
+        self, stream_audio_task, mock_lights_handler, mock_odas_processor
+    ):
+        """Test that ODAS is not started when Voice Control keeps the device."""
+        broker = AudioDeviceBroker()
+        broker.acquire("voice_control")
+        stream_audio_task.audio_device_broker = broker
+        stream_audio_task.AUDIO_RELEASE_TIMEOUT = 0.01
+
+        stream_audio_task._initialize_odas_processor()
+
+        mock_odas_processor.start.assert_not_called()
+        mock_lights_handler.off.assert_called_once()
+        assert broker.owner == "voice_control"
+
     def test_cleanup_odas_processor(self, stream_audio_task, mock_odas_processor):
         """Test ODAS processor cleanup."""
         stream_audio_task._cleanup_odas_processor()
@@ -411,6 +445,35 @@ class TestStreamODASAudioTask:
             mock_logger.info.assert_any_call("StreamODASAudioTask started")
             mock_logger.info.assert_any_call("StreamODASAudioTask completed")
 
+    def test_execute_task_waits_for_odas_ready(
+        self, stream_audio_task, mock_odas_processor
+    ):
+        """Test that remote streaming starts only after ODAS readiness was awaited."""
+        calls = []
+        mock_odas_processor.wait_until_ready.side_effect = lambda timeout: (
+            calls.append("ready") or False
+        )
+        with (
+            patch.object(stream_audio_task, "_initialize_odas_processor"),
+            patch.object(
+                stream_audio_task,
+                "_start_remote_streaming",
+                side_effect=lambda: calls.append("streaming"),
+            ),
+            patch(
+                "hexapod.task_interface.tasks.stream_odas_audio_task.logger"
+            ) as mock_logger,
+        ):
+            stream_audio_task.stop_event.set()
+
+            stream_audio_task.execute_task()
+
+            assert calls == ["ready", "streaming"]
+            mock_odas_processor.wait_until_ready.assert_called_once_with(
+                stream_audio_task.ODAS_READY_TIMEOUT
+            )
+            mock_logger.warning.assert_called_once()
+
     def test_execute_task_exception_handling(
         self, stream_audio_task, mock_hexapod, mock_lights_handler, mock_odas_processor
     ):
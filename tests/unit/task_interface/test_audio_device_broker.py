@@ -0,0 +1,116 @@
+"""
+Unit tests for the audio device ownership broker.
+"""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from hexapod.task_interface.audio_device_broker import (
+    AudioDeviceBroker,
+    AudioDeviceLease,
+)
+
+
+class TestAudioDeviceBroker:
+    """Test cases for AudioDeviceBroker class."""
+
+    @pytest.fixture
+    def broker(self):
+        """Broker with no lease granted."""
+        return AudioDeviceBroker()
+
+    def test_acquire_free_device(self, broker):
+        """Test that a free device is leased immediately."""
+        lease = broker.acquire("voice_control")
+
+        assert isinstance(lease, AudioDeviceLease)
+        assert broker.owner == "voice_control"
+        assert lease.wait_seconds >= 0
+        assert broker.stats()["handoffs"] == 0
+
+    def test_acquire_is_reentrant(self, broker):
+        """Test that the holder gets its existing lease back."""
+        lease = broker.acquire("voice_control")
+
+        assert broker.acquire("voice_control", timeout=0) is lease
+
+    def test_preempt_requests_release(self, broker):
+        """Test that the holder is asked to release and the handoff is measured."""
+        lease = broker.acquire("voice_control")
+        on_release_request = Mock(
+            side_effect=lambda: threading.Timer(0.05, lease.release).start()
+        )
+        broker.register("voice_control", on_release_request)
+
+        odas_lease = broker.acquire("odas", timeout=2.0)
+
+        on_release_request.assert_called_once()
+        assert lease.released
+        assert broker.owner == "odas"
+        assert odas_lease.wait_seconds >= 0.04
+        stats = broker.stats()
+        assert stats["handoffs"] == 1
+        assert stats["last_handoff_ms"] == pytest.approx(odas_lease.wait_seconds * 1000)
+
+    def test_acquire_without_preempt(self, broker):
+        """Test that the holder is not asked to release without preemption."""
+        broker.acquire("odas")
+        on_release_request = Mock()
+        broker.register("odas", on_release_request)
+
+        with pytest.raises(TimeoutError):
+            broker.acquire("voice_control", timeout=0.01, preempt=False)
+
+        on_release_request.assert_not_called()
+        assert broker.owner == "odas"
+
+    def test_failing_release_request(self, broker):
+        """Test that an error in the release callback only costs the timeout."""
+        broker.acquire("voice_control")
+        broker.register("voice_control", Mock(side_effect=RuntimeError("gone")))
+
+        with pytest.raises(TimeoutError):
+            broker.acquire("odas", timeout=0.01)
+
+    def test_unregister(self, broker):
+        """Test that an unregistered consumer is no longer asked to release."""
+        broker.acquire("voice_control")
+        on_release_request = Mock()
+        broker.register("voice_control", on_release_request)
+        broker.unregister("voice_control")
+
+        with pytest.raises(TimeoutError):
+            broker.acquire("odas", timeout=0.01)
+
+        on_release_request.assert_not_called()
+
+    def test_stale_release_ignored(self, broker):
+        """Test that releasing an ended lease does not end the next one."""
+        lease = broker.acquire("voice_control")
+        lease.release()
+        odas_lease = broker.acquire("odas")
+
+        lease.release()
+
+        assert broker.owner == "odas"
+        assert not odas_lease.released
+
+    def test_context_manager(self, broker):
+        """Test that the lease is released when leaving the context."""
+        with broker.acquire("odas") as lease:
+            assert broker.owner == "odas"
+
+        assert lease.released
+        assert broker.owner is None
+
+    def test_stats_without_handoffs(self, broker):
+        """Test the statistics before any handoff."""
+        assert broker.stats() == {
+            "owner": None,
+            "handoffs": 0,
+            "last_handoff_ms": None,
+            "mean_handoff_ms": None,
+            "max_handoff_ms": None,
+        }
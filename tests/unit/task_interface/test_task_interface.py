@@ -511,7 +511,7 @@ class TestTaskInterface:
         task_interface.cleanup()
 
         task_interface.button_handler.cleanup.assert_called_once()
-        task_interface.lights_handler.off.assert_called_once()
+        task_interface.lights_handler.cleanup.assert_called_once()
         task_interface.hexapod.deactivate_all_servos.assert_called_once()
 
     def test_cleanup_with_voice_control(self, task_interface, mock_voice_control):
@@ -521,7 +521,7 @@ class TestTaskInterface:
         task_interface.cleanup()
 
         task_interface.button_handler.cleanup.assert_called_once()
-        task_interface.lights_handler.off.assert_called_once()
+        task_interface.lights_handler.cleanup.assert_called_once()
         task_interface.hexapod.deactivate_all_servos.assert_called_once()
 
     def test_march_in_place(self, task_interface):
@@ -637,9 +637,7 @@ class TestTaskInterface:
             patch(
                 "hexapod.task_interface.task_interface.tasks.FollowTask"
             ) as mock_task_class,
-            patch(
-                "hexapod.odas.odas_doa_ssl_processor.ODASDoASSLProcessor"
-            ) as mock_odas_class,
+            patch("hexapod.odas.ODASDoASSLProcessor") as mock_odas_class,
         ):
             mock_task = MagicMock()
             mock_task_class.return_value = mock_task
@@ -657,9 +655,7 @@ class TestTaskInterface:
             patch(
                 "hexapod.task_interface.task_interface.tasks.SoundSourceLocalizationTask"
             ) as mock_task_class,
-            patch(
-                "hexapod.odas.odas_doa_ssl_processor.ODASDoASSLProcessor"
-            ) as mock_odas_class,
+            patch("hexapod.odas.ODASDoASSLProcessor") as mock_odas_class,
         ):
             mock_task = MagicMock()
             mock_task_class.return_value = mock_task
@@ -671,15 +667,141 @@ class TestTaskInterface:
             mock_task_class.assert_called_once()
             mock_task.start.assert_called_once()
 
+    def test_sound_source_localization_steers_voice_control(
+        self, task_interface, mock_voice_control
+    ):
+        """Test that voice control listens to the sources found by ODAS."""
+        task_interface.set_voice_control(mock_voice_control)
+        with (
+            patch(
+                "hexapod.task_interface.task_interface.tasks.SoundSourceLocalizationTask"
+            ),
+            patch("hexapod.odas.ODASDoASSLProcessor") as mock_odas_class,
+            patch("hexapod.odas.ODASAudioProcessor"),
+            patch("hexapod.odas.MultiChannelKeywordSpotter"),
+        ):
+            task_interface.sound_source_localization()
+
+            mock_odas_class.return_value.add_dominant_source_listener.assert_called_once_with(
+                mock_voice_control.update_doa
+            )
+
+    def test_odas_task_spots_wake_word(self, task_interface, mock_voice_control):
+        """Test that ODAS tasks spot the wake word on the separated channels."""
+        task_interface.set_voice_control(mock_voice_control)
+        with (
+            patch(
+                "hexapod.task_interface.task_interface.tasks.SoundSourceLocalizationTask"
+            ) as mock_task_class,
+            patch("hexapod.odas.ODASDoASSLProcessor") as mock_odas_class,
+            patch("hexapod.odas.ODASAudioProcessor") as mock_reader_class,
+            patch("hexapod.odas.MultiChannelKeywordSpotter") as mock_spotter_class,
+        ):
+            task_interface.sound_source_localization()
+
+            odas_processor = mock_odas_class.return_value
+            reader = mock_reader_class.return_value
+            spotter = mock_spotter_class.return_value
+            assert (
+                mock_spotter_class.call_args.args[1]
+                == task_interface._on_odas_wake_word
+            )
+            assert mock_reader_class.call_args.kwargs["source_file"] == "separated.raw"
+            reader.set_frame_callback.assert_called_once_with(spotter.process_frame)
+            odas_processor.add_tracked_frame_listener.assert_called_once_with(
+                spotter.update_sources
+            )
+            reader.start.assert_called_once()
+
+            mock_task_class.return_value.__class__.__name__ = (
+                "SoundSourceLocalizationTask"
+            )
+            task_interface.stop_task()
+
+            reader.stop.assert_called_once()
+            spotter.close.assert_called_once()
+            assert task_interface.odas_keyword_spotter is None
+
+    def test_odas_task_without_voice_control_spots_nothing(self, task_interface):
+        """Test that no wake word is spotted without the voice control wake word."""
+        with (
+            patch("hexapod.task_interface.task_interface.tasks.FollowTask"),
+            patch("hexapod.odas.ODASDoASSLProcessor"),
+            patch("hexapod.odas.MultiChannelKeywordSpotter") as mock_spotter_class,
+        ):
+            task_interface.follow()
+
+            mock_spotter_class.assert_not_called()
+            assert task_interface.odas_keyword_spotter is None
+
+    def test_odas_wake_word_steers_voice_control(
+        self, task_interface, mock_voice_control
+    ):
+        """Test that the beam is steered at the source that said the wake word."""
+        task_interface.set_voice_control(mock_voice_control)
+        task_interface.task = MagicMock()
+        detection = Mock(channel=1, source={"id": 3, "x": 0.0, "y": 1.0, "z": 0.0})
+
+        with patch.object(task_interface, "stop_task") as mock_stop_task:
+            task_interface._on_odas_wake_word(detection)
+
+        mock_voice_control.update_doa.assert_called_once_with((3, pytest.approx(90.0)))
+        mock_stop_task.assert_not_called()
+
+    def test_odas_wake_word_stops_task_while_paused(
+        self, task_interface, mock_voice_control
+    ):
+        """Test that the ODAS task hands the sound card back on a wake word."""
+        task_interface.set_voice_control(mock_voice_control)
+        task_interface.task = MagicMock()
+        task_interface.request_pause_voice_control()
+        stopped = threading.Event()
+
+        with patch.object(
+            task_interface, "stop_task", side_effect=stopped.set
+        ) as mock_stop_task:
+            task_interface._on_odas_wake_word(Mock(channel=0, source=None))
+            assert stopped.wait(timeout=1.0)
+
+        mock_stop_task.assert_called_once()
+        mock_voice_control.update_doa.assert_not_called()
+
+    def test_odas_task_pauses_voice_control(self, task_interface):
+        """Test that ODAS reading the sound card needs voice control paused."""
+        with (
+            patch("hexapod.task_interface.task_interface.tasks.FollowTask"),
+            patch("hexapod.odas.ODASDoASSLProcessor") as mock_odas_class,
+        ):
+            task_interface.follow()
+
+            assert task_interface.voice_control_paused_event.is_set()
+            assert task_interface.external_control_paused_event.is_set()
+            assert mock_odas_class.call_args.kwargs["config_path"] is None
+
+    def test_odas_task_with_capture_hub(self, task_interface):
+        """Test that voice control keeps listening when the capture hub feeds ODAS."""
+        capture_hub = Mock()
+        task_interface.set_capture_hub(capture_hub)
+        with (
+            patch("hexapod.task_interface.task_interface.tasks.FollowTask"),
+            patch("hexapod.odas.ODASDoASSLProcessor") as mock_odas_class,
+        ):
+            task_interface.follow()
+
+            assert not task_interface.voice_control_paused_event.is_set()
+            assert task_interface.external_control_paused_event.is_set()
+            assert (
+                mock_odas_class.call_args.kwargs["config_path"]
+                == capture_hub.odas_config_path
+            )
+
     def test_stream_odas_audio(self, task_interface):
         """Test stream ODAS audio command."""
         with (
             patch(
                 "hexapod.task_interface.task_interface.tasks.StreamODASAudioTask"
             ) as mock_task_class,
-            patch(
-                "hexapod.odas.odas_doa_ssl_processor.ODASDoASSLProcessor"
-            ) as mock_odas_class,
+            patch("hexapod.odas.ODASDoASSLProcessor") as mock_odas_class,
         ):
             mock_task = MagicMock()
             mock_task_class.return_value = mock_task
@@ -697,9 +819,7 @@ class TestTaskInterface:
             patch(
                 "hexapod.task_interface.task_interface.tasks.StreamODASAudioTask"
             ) as mock_task_class,
-            patch(
-                "hexapod.odas.odas_doa_ssl_processor.ODASDoASSLProcessor"
-            ) as mock_odas_class,
+            patch("hexapod.odas.ODASDoASSLProcessor") as mock_odas_class,
         ):
             mock_task = MagicMock()
             mock_task_class.return_value = mock_task
@@ -1021,9 +1141,7 @@ class TestTaskInterface:
             patch(
                 "hexapod.task_interface.task_interface.tasks.FollowTask"
             ) as mock_task_class,
-            patch(
-                "hexapod.odas.odas_doa_ssl_processor.ODASDoASSLProcessor"
-            ) as mock_odas_class,
+            patch("hexapod.odas.ODASDoASSLProcessor") as mock_odas_class,
         ):
             mock_task_class.side_effect = Exception("Follow error")
 
@@ -1039,9 +1157,7 @@ class TestTaskInterface:
             patch(
                 "hexapod.task_interface.task_interface.tasks.SoundSourceLocalizationTask"
             ) as mock_task_class,
-            patch(
-                "hexapod.odas.odas_doa_ssl_processor.ODASDoASSLProcessor"
-            ) as mock_odas_class,
+            patch("hexapod.odas.ODASDoASSLProcessor") as mock_odas_class,
         ):
             mock_task_class.side_effect = Exception("SSL error")
 
@@ -1057,9 +1173,7 @@ class TestTaskInterface:
             patch(
                 "hexapod.task_interface.task_interface.tasks.StreamODASAudioTask"
             ) as mock_task_class,
-            patch(
-                "hexapod.odas.odas_doa_ssl_processor.ODASDoASSLProcessor"
-            ) as mock_odas_class,
+            patch("hexapod.odas.ODASDoASSLProcessor") as mock_odas_class,
         ):
             mock_task_class.side_effect = Exception("Stream error")
 
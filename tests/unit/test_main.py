@@ -242,6 +242,9 @@ class TestCreateMainParser:
         assert args.log_dir == Path("logs")
         assert args.clean is False
         assert args.print_context is False
+        assert args.capture_hub is False
+        assert args.vad_gate is False
+        assert args.channel_selector is False
 
     def test_parser_log_level_choices(self):
         """Test that log level choices are correct."""
@@ -288,6 +291,9 @@ class TestCreateApplicationComponents:
             log_config_file=Path("config.yaml"),
             log_level="INFO",
             print_context=False,
+            capture_hub=False,
+            vad_gate=False,
+            channel_selector=False,
         )
 
         with (
@@ -318,6 +324,11 @@ class TestCreateApplicationComponents:
             )
             mock_task_interface.wake_up.assert_called_once()
             mock_voice_control.print_context_info.assert_not_called()
+            assert mock_voice_control_class.call_args.kwargs["use_vad_gate"] is False
+            assert (
+                mock_voice_control_class.call_args.kwargs["use_channel_selector"]
+                is False
+            )
 
     def test_create_application_components_with_clean(self):
         """Test creating application components with clean flag."""
@@ -330,6 +341,9 @@ class TestCreateApplicationComponents:
             log_config_file=Path("config.yaml"),
             log_level="INFO",
             print_context=False,
+            capture_hub=False,
+            vad_gate=False,
+            channel_selector=False,
         )
 
         with (
@@ -356,6 +370,9 @@ class TestCreateApplicationComponents:
             log_config_file=Path("config.yaml"),
             log_level="INFO",
             print_context=True,
+            capture_hub=False,
+            vad_gate=False,
+            channel_selector=False,
         )
 
         with (
@@ -377,6 +394,94 @@ class TestCreateApplicationComponents:
                 "Print context flag detected, printing context"
             )
 
+    def test_create_application_components_with_capture_hub(self):
+        """Test that the capture hub is started and shared with voice control."""
+        mock_config = Mock()
+        args = argparse.Namespace(
+            clean=False,
+            log_dir=Path("logs"),
+            log_config_file=Path("config.yaml"),
+            log_level="INFO",
+            print_context=False,
+            capture_hub=True,
+            vad_gate=False,
+            channel_selector=False,
+        )
+
+        with (
+            patch("hexapod.main.setup_logging"),
+            patch("hexapod.main.TaskInterface") as mock_task_interface_class,
+            patch("hexapod.main.VoiceControl") as mock_voice_control_class,
+            patch("hexapod.main.CaptureHub") as mock_capture_hub_class,
+            patch("hexapod.main.logger"),
+            patch("hexapod.main.Path"),
+        ):
+            mock_voice_control_class.find_respeaker6_index.return_value = 2
+
+            create_application_components(mock_config, args)
+
+            mock_capture_hub = mock_capture_hub_class.return_value
+            mock_capture_hub_class.assert_called_once_with(device_index=2)
+            mock_capture_hub.start.assert_called_once()
+            mock_task_interface_class.return_value.set_capture_hub.assert_called_once_with(
+                mock_capture_hub
+            )
+            assert (
+                mock_voice_control_class.call_args.kwargs["capture_hub"]
+                is mock_capture_hub
+            )
+
+    def test_create_application_components_with_vad_gate(self):
+        """Test that the voice-activity gate is only used when requested."""
+        args = argparse.Namespace(
+            clean=False,
+            log_dir=Path("logs"),
+            log_config_file=Path("config.yaml"),
+            log_level="INFO",
+            print_context=False,
+            capture_hub=False,
+            vad_gate=True,
+            channel_selector=False,
+        )
+
+        with (
+            patch("hexapod.main.setup_logging"),
+            patch("hexapod.main.TaskInterface"),
+            patch("hexapod.main.VoiceControl") as mock_voice_control_class,
+            patch("hexapod.main.logger"),
+            patch("hexapod.main.Path"),
+        ):
+            create_application_components(Mock(), args)
+
+            assert mock_voice_control_class.call_args.kwargs["use_vad_gate"] is True
+
+    def test_create_application_components_with_channel_selector(self):
+        """Test that the channel selector is only used when requested."""
+        args = argparse.Namespace(
+            clean=False,
+            log_dir=Path("logs"),
+            log_config_file=Path("config.yaml"),
+            log_level="INFO",
+            print_context=False,
+            capture_hub=False,
+            vad_gate=False,
+            channel_selector=True,
+        )
+
+        with (
+            patch("hexapod.main.setup_logging"),
+            patch("hexapod.main.TaskInterface"),
+            patch("hexapod.main.VoiceControl") as mock_voice_control_class,
+            patch("hexapod.main.logger"),
+            patch("hexapod.main.Path"),
+        ):
+            create_application_components(Mock(), args)
+
+            assert (
+                mock_voice_control_class.call_args.kwargs["use_channel_selector"]
+                is True
+            )
+
 
 class TestInitializeManualController:
     """Test cases for initialize_manual_controller function."""
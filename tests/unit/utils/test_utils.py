@@ -11,6 +11,7 @@ from hexapod.utils.utils import (
     map_range,
     parse_percentage,
     rename_thread,
+    LatestValue,
     euler_rotation_matrix,
     homogeneous_transformation_matrix,
     Vector2D,
@@ -161,6 +162,37 @@ class TestRenameThread:
         assert thread.name == "Worker"
 
 
+class TestLatestValue:
+    """Test cases for LatestValue class."""
+
+    def test_initial_value(self):
+        """Test that a new slot holds its initial value at version 0."""
+        slot = LatestValue({})
+
+        assert slot.read() == (0, {})
+        assert slot.version == 0
+        assert slot.value == {}
+
+    def test_publish_keeps_latest(self):
+        """Test that only the most recent value is kept and the version counts."""
+        slot = LatestValue()
+
+        slot.publish(1)
+        slot.publish(2)
+
+        assert slot.read() == (2, 2)
+
+    def test_publish_from_other_thread(self):
+        """Test that a reader sees values published from another thread."""
+        slot = LatestValue()
+        writer = threading.Thread(target=lambda: [slot.publish(i) for i in range(1000)])
+
+        writer.start()
+        writer.join()
+
+        assert slot.read() == (1000, 999)
+
+
 class TestEulerRotationMatrix:
     """Test cases for euler_rotation_matrix function."""
 